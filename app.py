@@ -2,17 +2,15 @@
 #USE VENV: source venv/bin/activate
 """
 Run script for the Asset Management System
+
+The app package is imported inside main() so --profile-startup can time
+every import, and the build/KPI paths never import the web stack.
 """
 
-from app import create_app
-from app.build import build_database
-from app.logger import get_logger
+import os
 import sys
 import argparse
 
-app = create_app()
-logger = get_logger("asset_management.run")
-
 def parse_arguments():
     """Parse command line arguments for build phases"""
     parser = argparse.ArgumentParser(description='Asset Management System')
@@ -30,12 +28,54 @@ def parse_arguments():
                        help='Enable debug data insertion (default: enabled if flag not present)')
     parser.add_argument('--no-debug-data', action='store_false', dest='enable_debug_data',
                        help='Disable debug data insertion')
+    parser.add_argument('--rebuild-kpi-rollups', action='store_true',
+                       help='Recompute maintenance KPI rollups from maintenance history after building, then exit')
+    parser.add_argument('--preload', action='store_true',
+                       help='Register every route blueprint at startup instead of on first use')
+    parser.add_argument('--profile-startup', action='store_true',
+                       help='Print per-module import times for creating the web application, then exit')
     
     return parser.parse_args()
 
-if __name__ == '__main__':
+def profile_startup(preload=False):
+    """Create the web application under the import profiler and print the report"""
+    import importlib.util
+    import time
+    from pathlib import Path
+    
+    # Load the profiler by path: importing app.utils would import the app
+    # package (Flask, SQLAlchemy) before profiling starts
+    path = Path(__file__).parent / 'app' / 'utils' / 'startup_profile.py'
+    spec = importlib.util.spec_from_file_location('startup_profile', path)
+    startup_profile = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(startup_profile)
+    ImportProfiler = startup_profile.ImportProfiler
+    
+    # Profile the lazy startup unless --preload (or PRELOAD_BLUEPRINTS) asks otherwise
+    os.environ.setdefault('PRELOAD_BLUEPRINTS', '1' if preload else '0')
+    
+    started = time.perf_counter()
+    with ImportProfiler() as profiler:
+        from app import create_app
+        app = create_app()
+        if preload:
+            app.extensions['lazy_blueprints'].load_all()
+    print(profiler.format_report())
+    print(f"Web application ready in {time.perf_counter() - started:.3f}s "
+          f"({len(list(app.url_map.iter_rules()))} routes registered)")
+
+
+def main():
     args = parse_arguments()
     
+    if args.profile_startup:
+        profile_startup(preload=args.preload)
+        sys.exit(0)
+    
+    from app.build import build_database
+    from app.logger import get_logger
+    logger = get_logger("asset_management.run")
+    
     logger.debug("Starting Asset Management System...")
     
     # Determine build phase based on arguments
@@ -99,10 +139,31 @@ if __name__ == '__main__':
         enable_debug_data=args.enable_debug_data if not args.build_only else False
     )
     
+    if args.rebuild_kpi_rollups:
+        from app import create_app
+        from app.buisness.maintenance.kpi import MaintenanceKpiRollupManager
+        with create_app(web=False).app_context():
+            count = MaintenanceKpiRollupManager.rebuild()
+        logger.info(f"Rebuilt {count} maintenance KPI rollup rows. Exiting without starting web server.")
+        sys.exit(0)
+    
     if args.build_only:
         logger.debug("Build completed. Exiting without starting web server.")
         sys.exit(0)
     
+    # The development server below runs in debug mode; let create_app() know,
+    # so route groups register on first use unless --preload
+    os.environ.setdefault('FLASK_DEBUG', '1')
+    from app import create_app
+    app = create_app()
+    if args.preload:
+        app.extensions['lazy_blueprints'].load_all()
+    
     logger.debug("")
     logger.debug("Access the application at: http://localhost:5000")
-    app.run(debug=True, host='127.0.0.1', port=5000) 
\ No newline at end of file
+    app.run(debug=True, host='127.0.0.1', port=5000)
+
+
+if __name__ == '__main__':
+    main()
+ 
\ No newline at end of file
@@ -1,19 +1,32 @@
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
 from flask_login import LoginManager
 import os
 from app.logger import setup_logging_from_config, get_logger
 
 # Initialize extensions
 db = SQLAlchemy()
-migrate = Migrate()
 login_manager = LoginManager()
 
-def create_app():
+def create_app(web=True):
+    """
+    Application factory.
+    
+    Args:
+        web: Set up the web stack (Flask-Migrate, login and blueprints).
+             The build CLI passes False; models are always registered since
+             mapper configuration needs every model class.
+    
+    STARTUP_PROFILE=1 logs per-module import times for the factory.
+    """
     import os
     from pathlib import Path
     
+    profiler = None
+    if os.environ.get('STARTUP_PROFILE', '').lower() in ('1', 'true', 'yes'):
+        from app.utils.startup_profile import ImportProfiler
+        profiler = ImportProfiler().start()
+    
     # Get the base directory (app's parent)
     base_dir = Path(__file__).parent.parent
     
@@ -33,16 +46,24 @@ def create_app():
     app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
     app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///asset_management.db')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['EVENT_ARCHIVE_HORIZON_DAYS'] = int(os.environ.get('EVENT_ARCHIVE_HORIZON_DAYS', 365))
+    # Route groups register lazily only in debug mode: late registration is
+    # not safe while other threads serve requests
+    preload = os.environ.get('PRELOAD_BLUEPRINTS')
+    app.config['PRELOAD_BLUEPRINTS'] = not app.debug if preload is None else preload.lower() in ('1', 'true', 'yes')
     
     logger.debug(f"Database URI: {app.config['SQLALCHEMY_DATABASE_URI']}")
     
     # Initialize extensions with app
     db.init_app(app)
-    migrate.init_app(app, db)
-    login_manager.init_app(app)
-    login_manager.login_view = 'auth.login'
-    login_manager.login_message = 'Please log in to access this page.'
-    login_manager.login_message_category = 'info'
+    if web:
+        # Flask-Migrate pulls in Alembic; only the web app and `flask db` need it
+        from flask_migrate import Migrate
+        Migrate(app, db)
+        login_manager.init_app(app)
+        login_manager.login_view = 'auth.login'
+        login_manager.login_message = 'Please log in to access this page.'
+        login_manager.login_message_category = 'info'
     
     logger.debug("Extensions initialized")
     
@@ -94,6 +115,10 @@ def create_app():
     
     logger.debug("Models imported and registered")
     
+    if not web:
+        logger.info("Flask application initialized without web stack")
+        return _finish_profile(app, profiler, logger)
+    
     # Register blueprints
     from app.auth import auth
     from app.presentation.routes import main
@@ -119,4 +144,12 @@ def create_app():
     
     logger.info("Flask application initialization complete")
     
+    return _finish_profile(app, profiler, logger)
+
+
+def _finish_profile(app, profiler, logger):
+    """Stop the startup profiler (if running) and log its report"""
+    if profiler is not None:
+        profiler.stop()
+        logger.info(profiler.format_report())
     return app 
\ No newline at end of file
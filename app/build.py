@@ -179,7 +179,8 @@ def build_database(build_phase='all', data_phase='all', enable_debug_data=True):
         enable_debug_data (bool): Whether to insert debug data (default: True)
                                   Note: Critical data is ALWAYS checked and inserted regardless of flags
     """
-    app = create_app()
+    # The build needs the database and models only, not routes or login
+    app = create_app(web=False)
     
     with app.app_context():
         logger.info(f"Starting database build - Build Phase: {build_phase}, Data Phase: {data_phase}")
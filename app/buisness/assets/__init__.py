@@ -10,6 +10,7 @@ from .make_model_context import MakeModelDetailsContext
 from .model_detail_context import ModelDetailContext
 from .asset_details.asset_details_struct import AssetDetailsStruct
 from .model_details.model_details_struct import ModelDetailsStruct
+from .detail_presence_index import DetailPresenceIndex
 
 # Import AssetContext from core to access its factory attribute
 from app.buisness.core.asset_context import AssetContext as CoreAssetContext
@@ -80,5 +81,5 @@ else:
 AssetContext = AssetDetailsContext
 MakeModelContext = MakeModelDetailsContext
 
-__all__ = ['AssetDetailsContext', 'MakeModelDetailsContext', 'ModelDetailContext', 'AssetDetailsStruct', 'ModelDetailsStruct', 'AssetContext', 'MakeModelContext']
+__all__ = ['AssetDetailsContext', 'MakeModelDetailsContext', 'ModelDetailContext', 'AssetDetailsStruct', 'ModelDetailsStruct', 'DetailPresenceIndex', 'AssetContext', 'MakeModelContext']
 
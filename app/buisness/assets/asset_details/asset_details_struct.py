@@ -6,7 +6,7 @@ Takes an asset_id and retrieves the top one of each detail type
 (expects only one of each type per asset).
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 from app.data.assets.asset_details import (
     PurchaseInfo,
     VehicleRegistration,
@@ -22,7 +22,10 @@ class AssetDetailsStruct:
     Assumes there is only one record of each detail type per asset.
     """
     
-    def __init__(self, asset_id: int):
+    # Detail table classes, matching the struct attributes below
+    DETAIL_TABLES = (PurchaseInfo, VehicleRegistration, ToyotaWarrantyReceipt)
+    
+    def __init__(self, asset_id: int, records: Optional[Dict[type, Any]] = None):
         """
         Initialize AssetDetailsStruct with an asset_id.
         
@@ -30,9 +33,17 @@ class AssetDetailsStruct:
         
         Args:
             asset_id: The ID of the asset to load details for
+            records: Preloaded records by detail table class (see load_many);
+                nothing is queried when given
         """
         self.asset_id = asset_id
         
+        if records is not None:
+            self.purchase_info: Optional[PurchaseInfo] = records.get(PurchaseInfo)
+            self.vehicle_registration: Optional[VehicleRegistration] = records.get(VehicleRegistration)
+            self.toyota_warranty_receipt: Optional[ToyotaWarrantyReceipt] = records.get(ToyotaWarrantyReceipt)
+            return
+        
         # Load each detail type (expecting only one of each)
         self.purchase_info: Optional[PurchaseInfo] = PurchaseInfo.query.filter_by(
             asset_id=asset_id
@@ -46,6 +57,29 @@ class AssetDetailsStruct:
             asset_id=asset_id
         ).first()
     
+    @classmethod
+    def load_many(cls, asset_ids: Iterable[int]) -> Dict[int, 'AssetDetailsStruct']:
+        """
+        Load the detail structs of many assets with one IN query per detail table.
+        
+        Args:
+            asset_ids: IDs of the assets to load details for
+            
+        Returns:
+            Dictionary mapping asset_id to its AssetDetailsStruct
+        """
+        asset_ids = list(dict.fromkeys(asset_ids))
+        records = {asset_id: {} for asset_id in asset_ids}
+        if asset_ids:
+            for table_class in cls.DETAIL_TABLES:
+                rows = table_class.query.filter(
+                    table_class.asset_id.in_(asset_ids)
+                ).order_by(table_class.id).all()
+                for row in rows:
+                    # Keep the first record of each type, as the single-asset load does
+                    records[row.asset_id].setdefault(table_class, row)
+        return {asset_id: cls(asset_id, records[asset_id]) for asset_id in asset_ids}
+    
     def asdict(self) -> Dict[str, Any]:
         """
         Return a dictionary mapping class names to their instances.
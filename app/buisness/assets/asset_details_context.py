@@ -10,6 +10,7 @@ from app.data.core.asset_info.asset import Asset
 from app.buisness.core.asset_context import AssetContext
 from app.buisness.assets.asset_details.asset_details_struct import AssetDetailsStruct
 from app.buisness.assets.model_details.model_details_struct import ModelDetailsStruct
+from app.buisness.assets.detail_presence_index import DetailPresenceIndex
 from app.data.assets.detail_table_templates.asset_details_from_asset_type import AssetDetailTemplateByAssetType
 from app.data.assets.detail_table_templates.asset_details_from_model_type import AssetDetailTemplateByModelType
 
@@ -220,19 +221,13 @@ class AssetDetailsContext(AssetContext):
         """
         Get total count of all detail records (both asset and model details).
         
+        Read from the asset's detail presence bitmap, so the detail tables
+        are not queried.
+        
         Returns:
             Total number of detail records
         """
-        # Count non-None records from structs
-        asset_struct = self.asset_details_struct
-        asset_detail_count = sum(1 for record in asset_struct.asdict().values() if record is not None)
-        
-        model_detail_count = 0
-        if self._asset.make_model_id:
-            model_struct = ModelDetailsStruct(self._asset.make_model_id)
-            model_detail_count = sum(1 for record in model_struct.asdict().values() if record is not None)
-        
-        return asset_detail_count + model_detail_count
+        return DetailPresenceIndex.count(DetailPresenceIndex.get_bitmap(self._asset))
     
     def refresh(self):
         """Refresh cached data from database"""
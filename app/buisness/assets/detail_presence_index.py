@@ -0,0 +1,230 @@
+"""
+Detail Presence Index
+Per-asset bitmap of which detail tables hold a row, kept in Asset.detail_rows_created.
+
+Asset detail tables use the low bits; model detail tables of the asset's
+make/model use bits from MODEL_DETAIL_SHIFT up, so one integer answers "which
+details does this asset have" and its detail count without touching the
+detail tables. Bit positions are stored in the database and must not be
+reassigned; new tables take the next free bit.
+
+The bitmap is kept current by a flush hook (detail rows added or
+deleted, asset make/model changed). Assets whose bitmap is not set yet (rows
+created before the index existed, Core bulk writes) are computed from the
+detail tables on first read and stored.
+"""
+
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import bindparam, inspect, select, update
+from sqlalchemy.orm.attributes import set_committed_value
+from app import db
+from app.data.core.asset_info.asset import Asset
+from app.data.assets.asset_detail_virtual import AssetDetailVirtual
+from app.data.assets.model_detail_virtual import ModelDetailVirtual
+from app.data.assets.asset_details import PurchaseInfo, VehicleRegistration, ToyotaWarrantyReceipt
+from app.data.assets.model_details import ModelInfo, EmissionsInfo
+from app.buisness.core.asset_summary_manager import AssetSummaryManager
+from app.utils.flush_hooks import on_flush
+
+_assets = Asset.__table__
+
+
+class DetailPresenceIndex:
+    """Reads and maintains the per-asset detail presence bitmap"""
+
+    MODEL_DETAIL_SHIFT = 16
+
+    # Detail table class -> bit (persisted; append only)
+    ASSET_DETAIL_BITS = {
+        PurchaseInfo: 1 << 0,
+        VehicleRegistration: 1 << 1,
+        ToyotaWarrantyReceipt: 1 << 2,
+    }
+    MODEL_DETAIL_BITS = {
+        ModelInfo: 1 << MODEL_DETAIL_SHIFT,
+        EmissionsInfo: 1 << (MODEL_DETAIL_SHIFT + 1),
+    }
+
+    # Asset IDs per IN (...) list
+    ID_CHUNK_SIZE = 900
+
+    @staticmethod
+    def count(bitmap: int) -> int:
+        """Number of detail tables present in a bitmap"""
+        return bin(bitmap).count('1')
+
+    @classmethod
+    def present_tables(cls, bitmap: int) -> List[str]:
+        """Table names of the detail tables present in a bitmap"""
+        return [
+            table_class.__tablename__
+            for table_class, bit in (*cls.ASSET_DETAIL_BITS.items(), *cls.MODEL_DETAIL_BITS.items())
+            if bitmap & bit
+        ]
+
+    @staticmethod
+    def _stored_bitmap(value) -> Optional[int]:
+        # JSON column: unset rows hold NULL (or JSON null)
+        return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+    @classmethod
+    def get_bitmap(cls, asset: Asset) -> int:
+        """Bitmap of a loaded asset, computing and storing it when missing"""
+        bitmap = cls._stored_bitmap(asset.detail_rows_created)
+        if bitmap is None:
+            bitmaps = cls.rebuild([asset.id])
+            cls._apply_to_loaded(db.session, bitmaps)
+            bitmap = bitmaps[asset.id]
+        return bitmap
+
+    @classmethod
+    def get_bitmaps(cls, assets: Iterable) -> Dict[int, int]:
+        """
+        Bitmaps for many assets.
+
+        Args:
+            assets: Asset instances (their loaded detail_rows_created is used)
+                or asset IDs (one query on assets)
+
+        Returns:
+            Dictionary mapping asset_id to its bitmap
+        """
+        assets = list(assets)
+        bitmaps = {}
+        if assets and isinstance(assets[0], Asset):
+            for asset in assets:
+                bitmaps[asset.id] = cls._stored_bitmap(asset.detail_rows_created)
+        else:
+            for chunk in cls._chunks(assets):
+                rows = db.session.execute(
+                    select(_assets.c.id, _assets.c.detail_rows_created).where(_assets.c.id.in_(chunk))
+                )
+                for asset_id, value in rows:
+                    bitmaps[asset_id] = cls._stored_bitmap(value)
+
+        missing = [asset_id for asset_id, bitmap in bitmaps.items() if bitmap is None]
+        if missing:
+            rebuilt = cls.rebuild(missing)
+            cls._apply_to_loaded(db.session, rebuilt)
+            bitmaps.update(rebuilt)
+        return bitmaps
+
+    @classmethod
+    def get_counts(cls, assets: Iterable) -> Dict[int, int]:
+        """Detail counts (asset + model details) for many assets or asset IDs"""
+        return {asset_id: cls.count(bitmap) for asset_id, bitmap in cls.get_bitmaps(assets).items()}
+
+    @classmethod
+    def rebuild(cls, asset_ids: Optional[Iterable[int]] = None, connection=None) -> Dict[int, int]:
+        """
+        Compute bitmaps from the detail tables and store them.
+
+        One query per detail table per chunk of assets. Runs on the given
+        connection (the flush connection inside the listener) or the session's.
+        Detail counts are copied into the assets' summary rows.
+
+        Args:
+            asset_ids: Assets to rebuild (default every asset)
+            connection: Connection to run on
+
+        Returns:
+            Dictionary mapping asset_id to its new bitmap
+        """
+        connection = connection or db.session.connection()
+        if asset_ids is None:
+            asset_ids = connection.execute(select(_assets.c.id)).scalars().all()
+
+        bitmaps = {}
+        for chunk in cls._chunks(asset_ids):
+            make_model_by_asset = dict(connection.execute(
+                select(_assets.c.id, _assets.c.make_model_id).where(_assets.c.id.in_(chunk))
+            ).all())
+            chunk_bitmaps = dict.fromkeys(make_model_by_asset, 0)
+
+            for table_class, bit in cls.ASSET_DETAIL_BITS.items():
+                present = connection.execute(
+                    select(table_class.asset_id).where(table_class.asset_id.in_(chunk)).distinct()
+                ).scalars()
+                for asset_id in present:
+                    if asset_id in chunk_bitmaps:
+                        chunk_bitmaps[asset_id] |= bit
+
+            make_model_ids = {make_model_id for make_model_id in make_model_by_asset.values() if make_model_id}
+            if make_model_ids:
+                model_bits = dict.fromkeys(make_model_ids, 0)
+                for table_class, bit in cls.MODEL_DETAIL_BITS.items():
+                    present = connection.execute(
+                        select(table_class.make_model_id).where(table_class.make_model_id.in_(make_model_ids)).distinct()
+                    ).scalars()
+                    for make_model_id in present:
+                        model_bits[make_model_id] |= bit
+                for asset_id, make_model_id in make_model_by_asset.items():
+                    chunk_bitmaps[asset_id] |= model_bits.get(make_model_id, 0)
+
+            if chunk_bitmaps:
+                connection.execute(
+                    update(_assets).where(_assets.c.id == bindparam('asset_id')).values(
+                        detail_rows_created=bindparam('bitmap')
+                    ),
+                    [{'asset_id': asset_id, 'bitmap': bitmap} for asset_id, bitmap in chunk_bitmaps.items()]
+                )
+                AssetSummaryManager.set_detail_counts(
+                    {asset_id: cls.count(bitmap) for asset_id, bitmap in chunk_bitmaps.items()},
+                    connection=connection
+                )
+            bitmaps.update(chunk_bitmaps)
+        return bitmaps
+
+    @classmethod
+    def rebuild_for_make_models(cls, make_model_ids: Iterable[int], connection=None) -> Dict[int, int]:
+        """Rebuild the bitmaps of every asset of the given make/models"""
+        connection = connection or db.session.connection()
+        make_model_ids = list(make_model_ids)
+        if not make_model_ids:
+            return {}
+        asset_ids = connection.execute(
+            select(_assets.c.id).where(_assets.c.make_model_id.in_(make_model_ids))
+        ).scalars().all()
+        return cls.rebuild(asset_ids, connection=connection)
+
+    @staticmethod
+    def _apply_to_loaded(session, bitmaps: Dict[int, int]):
+        """Keep loaded assets in step with stored bitmaps, without marking them dirty"""
+        for instance in list(session.identity_map.values()):
+            if isinstance(instance, Asset) and instance.id in bitmaps:
+                set_committed_value(instance, 'detail_rows_created', bitmaps[instance.id])
+
+    @classmethod
+    def _chunks(cls, ids: Iterable[int]):
+        ids = list(ids)
+        for start in range(0, len(ids), cls.ID_CHUNK_SIZE):
+            yield ids[start:start + cls.ID_CHUNK_SIZE]
+
+
+@on_flush(AssetDetailVirtual, ModelDetailVirtual, Asset)
+def _maintain_detail_presence(session, changes):
+    """Rebuild bitmaps of assets whose detail rows or make/model changed in this flush"""
+    asset_ids = set()
+    make_model_ids = set()
+    for instance in (*changes.new, *changes.deleted):
+        if isinstance(instance, AssetDetailVirtual):
+            asset_ids.add(instance.asset_id)
+        elif isinstance(instance, ModelDetailVirtual):
+            make_model_ids.add(instance.make_model_id)
+    for instance in changes.dirty:
+        if isinstance(instance, Asset) and inspect(instance).attrs.make_model_id.history.has_changes():
+            asset_ids.add(instance.id)
+        elif isinstance(instance, AssetDetailVirtual) and inspect(instance).attrs.asset_id.history.has_changes():
+            asset_ids.update(value for value in inspect(instance).attrs.asset_id.history.sum() if value)
+
+    if not asset_ids and not make_model_ids:
+        return
+    connection = session.connection()
+    bitmaps = {}
+    if make_model_ids:
+        bitmaps.update(DetailPresenceIndex.rebuild_for_make_models(make_model_ids, connection=connection))
+    asset_ids -= set(bitmaps)
+    if asset_ids:
+        bitmaps.update(DetailPresenceIndex.rebuild(asset_ids, connection=connection))
+
+    DetailPresenceIndex._apply_to_loaded(session, bitmaps)
@@ -110,4 +110,109 @@ class AssetDetailFactory(DetailFactory):
                 
         except Exception as e:
             logger.debug(f"Error creating model type detail rows for asset {asset.id}: {e}")
-
+    
+    @classmethod
+    def build_detail_plans(cls, make_model_ids):
+        """
+        Resolve which asset detail tables to create for each make/model
+        
+        The asset type and model type configurations are loaded once for all
+        make/models instead of per asset.
+        
+        Args:
+            make_model_ids: Iterable of make model IDs (None allowed)
+            
+        Returns:
+            dict: make_model_id -> tuple of detail table types, in creation order
+        """
+        from app.data.core.asset_info.make_model import MakeModel
+        from app.data.assets.detail_table_templates.asset_details_from_asset_type import AssetDetailTemplateByAssetType
+        from app.data.assets.detail_table_templates.asset_details_from_model_type import AssetDetailTemplateByModelType
+        
+        make_model_ids = {make_model_id for make_model_id in make_model_ids if make_model_id}
+        asset_type_by_model = dict(
+            db.session.query(MakeModel.id, MakeModel.asset_type_id).filter(MakeModel.id.in_(make_model_ids))
+        ) if make_model_ids else {}
+        asset_type_ids = {asset_type_id for asset_type_id in asset_type_by_model.values() if asset_type_id}
+        
+        type_configs = db.session.query(
+            AssetDetailTemplateByAssetType.asset_type_id,
+            AssetDetailTemplateByAssetType.detail_table_type
+        ).filter(
+            AssetDetailTemplateByAssetType.asset_type_id.in_(asset_type_ids) |
+            (AssetDetailTemplateByAssetType.asset_type_id == None)
+        ).order_by(AssetDetailTemplateByAssetType.id).all() if asset_type_ids else []
+        model_configs = db.session.query(
+            AssetDetailTemplateByModelType.make_model_id,
+            AssetDetailTemplateByModelType.detail_table_type
+        ).filter(
+            AssetDetailTemplateByModelType.make_model_id.in_(make_model_ids)
+        ).order_by(AssetDetailTemplateByModelType.id).all() if make_model_ids else []
+        
+        # A make/model fixes the asset type, so one plan per make/model covers each (asset type, model) pair
+        plans = {None: ()}
+        for make_model_id in make_model_ids:
+            asset_type_id = asset_type_by_model.get(make_model_id)
+            detail_types = []
+            if asset_type_id:
+                detail_types += [
+                    detail_type for config_type_id, detail_type in type_configs
+                    if config_type_id in (asset_type_id, None)
+                ]
+            detail_types += [
+                detail_type for config_model_id, detail_type in model_configs
+                if config_model_id == make_model_id
+            ]
+            plan = []
+            for detail_type in detail_types:
+                if detail_type in plan:
+                    # One row per detail table, as the existence check does for single assets
+                    continue
+                if detail_type not in cls.DETAIL_TABLE_REGISTRY or not cls.is_asset_detail(detail_type):
+                    logger.warning(f"Skipping '{detail_type}': not a registered asset detail table")
+                    continue
+                plan.append(detail_type)
+            plans[make_model_id] = tuple(plan)
+        return plans
+    
+    @classmethod
+    def create_detail_table_rows_bulk(cls, assets, created_by_id=None):
+        """
+        Create detail table rows for many new assets
+        
+        Detail plans are resolved once per (asset type, model), global detail
+        row IDs are reserved as one block and each detail table is written
+        with one multi-row INSERT. New assets have no detail rows yet, so no
+        per-asset existence checks are made.
+        
+        Args:
+            assets: List of (asset_id, make_model_id, creation_event_id) tuples
+            created_by_id (int, optional): User recorded as creator
+            
+        Returns:
+            int: Number of detail rows created
+        """
+        from sqlalchemy import insert
+        from app.data.core.sequences import AssetDetailIDManager
+        
+        plans = cls.build_detail_plans(make_model_id for _, make_model_id, _ in assets)
+        
+        rows_by_type = {}
+        for asset_id, make_model_id, event_id in assets:
+            for detail_type in plans.get(make_model_id, ()):
+                rows_by_type.setdefault(detail_type, []).append({
+                    'asset_id': asset_id,
+                    'event_id': event_id,
+                    'created_by_id': created_by_id,
+                    'updated_by_id': created_by_id
+                })
+        
+        total = sum(len(rows) for rows in rows_by_type.values())
+        detail_ids = iter(AssetDetailIDManager.get_next_asset_detail_ids(total))
+        for detail_type, rows in rows_by_type.items():
+            for row in rows:
+                row['all_asset_detail_id'] = next(detail_ids)
+            db.session.execute(insert(cls.get_detail_table_class(detail_type)), rows)
+            logger.debug(f"Created {len(rows)} {detail_type} rows")
+        
+        return total
@@ -6,7 +6,7 @@ This factory extends CoreAssetFactory to provide detail table creation
 functionality. It delegates to AssetDetailFactory for the actual detail creation.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from app.buisness.core.factories.core_asset_factory import CoreAssetFactory
 from app.data.core.asset_info.asset import Asset
 from app.logger import get_logger
@@ -79,6 +79,59 @@ class AssetDetailsFactory(CoreAssetFactory):
         
         return asset, created
     
+    def create_assets(
+        self,
+        assets_data: List[Dict[str, Any]],
+        created_by_id: Optional[int] = None,
+        commit: bool = True,
+        enable_detail_insertion: bool = True
+    ) -> List[int]:
+        """
+        Create many assets with detail table rows using batched statements
+        
+        This method:
+        1. Uses parent factory to insert assets and creation events in batches
+        2. Conditionally inserts detail table rows per detail table in batches
+        3. Stores the detail presence bitmaps (Core inserts bypass the flush listener)
+        4. Commits the transaction
+        """
+        asset_rows, asset_ids, event_ids = self._insert_asset_batch(assets_data, created_by_id)
+        
+        if enable_detail_insertion and asset_ids:
+            self._create_detail_rows_bulk(asset_rows, asset_ids, event_ids, created_by_id)
+        
+        if asset_ids:
+            from app.buisness.assets.detail_presence_index import DetailPresenceIndex
+            DetailPresenceIndex.rebuild(asset_ids)
+        
+        if commit:
+            from app import db
+            db.session.commit()
+            logger.info(f"Bulk created {len(asset_ids)} assets with details")
+        
+        return asset_ids
+    
+    def _create_detail_rows_bulk(self, asset_rows, asset_ids, event_ids, created_by_id):
+        """
+        Create detail table rows for a batch of new assets
+        
+        Runs in a savepoint so errors in detail creation are logged but don't
+        fail asset creation, as for single assets.
+        """
+        from app import db
+        from app.buisness.assets.factories.asset_detail_factory import AssetDetailFactory
+        try:
+            with db.session.begin_nested():
+                AssetDetailFactory.create_detail_table_rows_bulk(
+                    [
+                        (asset_id, row['make_model_id'], event_id)
+                        for row, asset_id, event_id in zip(asset_rows, asset_ids, event_ids)
+                    ],
+                    created_by_id=created_by_id
+                )
+        except Exception as e:
+            logger.warning(f"Could not create detail rows for {len(asset_ids)} bulk created assets: {e}")
+    
     def _create_detail_rows(self, asset: Asset):
         """
         Create detail table rows for asset
@@ -6,7 +6,7 @@ Takes a make_model_id and retrieves the top one of each detail type
 (expects only one of each type per model).
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 from app.data.assets.model_details import (
     ModelInfo,
     EmissionsInfo
@@ -21,7 +21,10 @@ class ModelDetailsStruct:
     Assumes there is only one record of each detail type per make/model.
     """
     
-    def __init__(self, make_model_id: int):
+    # Detail table classes, matching the struct attributes below
+    DETAIL_TABLES = (ModelInfo, EmissionsInfo)
+    
+    def __init__(self, make_model_id: int, records: Optional[Dict[type, Any]] = None):
         """
         Initialize ModelDetailsStruct with a make_model_id.
         
@@ -29,9 +32,16 @@ class ModelDetailsStruct:
         
         Args:
             make_model_id: The ID of the make/model to load details for
+            records: Preloaded records by detail table class (see load_many);
+                nothing is queried when given
         """
         self.make_model_id = make_model_id
         
+        if records is not None:
+            self.model_info: Optional[ModelInfo] = records.get(ModelInfo)
+            self.emissions_info: Optional[EmissionsInfo] = records.get(EmissionsInfo)
+            return
+        
         # Load each detail type (expecting only one of each)
         self.model_info: Optional[ModelInfo] = ModelInfo.query.filter_by(
             make_model_id=make_model_id
@@ -41,6 +51,29 @@ class ModelDetailsStruct:
             make_model_id=make_model_id
         ).first()
     
+    @classmethod
+    def load_many(cls, make_model_ids: Iterable[int]) -> Dict[int, 'ModelDetailsStruct']:
+        """
+        Load the detail structs of many make/models with one IN query per detail table.
+        
+        Args:
+            make_model_ids: IDs of the make/models to load details for
+            
+        Returns:
+            Dictionary mapping make_model_id to its ModelDetailsStruct
+        """
+        make_model_ids = list(dict.fromkeys(make_model_ids))
+        records = {make_model_id: {} for make_model_id in make_model_ids}
+        if make_model_ids:
+            for table_class in cls.DETAIL_TABLES:
+                rows = table_class.query.filter(
+                    table_class.make_model_id.in_(make_model_ids)
+                ).order_by(table_class.id).all()
+                for row in rows:
+                    # Keep the first record of each type, as the single-model load does
+                    records[row.make_model_id].setdefault(table_class, row)
+        return {make_model_id: cls(make_model_id, records[make_model_id]) for make_model_id in make_model_ids}
+    
     def asdict(self) -> Dict[str, Any]:
         """
         Return a dictionary mapping class names to their instances.
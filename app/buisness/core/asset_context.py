@@ -14,6 +14,7 @@ Note: Detail table management is handled by AssetDetailsContext in domain.assets
 from typing import List, Optional, Union, Dict, Any, TYPE_CHECKING
 from app.data.core.asset_info.asset import Asset
 from app.data.core.event_info.event import Event
+from app.buisness.core.asset_summary_manager import AssetSummaryManager
 
 if TYPE_CHECKING:
     from app.buisness.core.factories.asset_factory_base import AssetFactoryBase
@@ -191,6 +192,40 @@ class AssetContext:
         
         return cls(asset)
     
+    @classmethod
+    def create_bulk(
+        cls,
+        assets_data: List[Dict[str, Any]],
+        created_by_id: Optional[int] = None,
+        commit: bool = True,
+        enable_detail_insertion: bool = True
+    ) -> List[int]:
+        """
+        Onboard many assets at once using the configured factory.
+        
+        Assets, creation events and detail rows (with AssetDetailsFactory) are
+        written with batched statements instead of one create per asset.
+        
+        Args:
+            assets_data: List of asset field dictionaries (name, serial_number, make_model_id, etc.)
+            created_by_id: ID of the user creating the assets
+            commit: Whether to commit the transaction
+            enable_detail_insertion: Whether to create detail rows (only works with AssetDetailsFactory)
+            
+        Returns:
+            List of created asset IDs in input order
+            
+        Raises:
+            ValueError: If required fields are missing or a serial number is duplicate
+        """
+        cls._check_asset_factory()
+        return cls.asset_factory.create_assets(
+            assets_data,
+            created_by_id=created_by_id,
+            commit=commit,
+            enable_detail_insertion=enable_detail_insertion
+        )
+    
     @classmethod
     def create_from_dict(cls, asset_data: Dict[str, Any], created_by_id: Optional[int] = None, commit: bool = True, lookup_fields: Optional[list] = None) -> 'AssetContext':
         """Create an asset from a dictionary with optional find_or_create behavior"""
@@ -299,6 +334,8 @@ class AssetContext:
                 major_location_id=event_location_id
             )
             db.session.add(event)
+        else:
+            event = None
         
         # Apply all changes (including non-key fields)
         for key, value in kwargs.items():
@@ -309,6 +346,10 @@ class AssetContext:
         if updated_by_id:
             self._asset.updated_by_id = updated_by_id
         
+        # Update the asset summary (meters, change event)
+        db.session.flush()
+        AssetSummaryManager.on_asset_edit(self._asset, event)
+        
         # Commit if requested
         if commit:
             db.session.commit()
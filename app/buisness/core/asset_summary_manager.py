@@ -0,0 +1,350 @@
+"""
+AssetSummaryManager - Asset 360 read model
+
+Maintains one AssetSummary row per asset so the asset page and fleet lists
+read a single row instead of querying events, maintenance, dispatches and
+detail tables per asset.
+
+Rows are updated incrementally by hooks in the write paths:
+- Event.add_event and AssetContext.edit: last event (and meters for edits)
+- MaintenanceActionSetFactory / MaintenanceContext transitions: open
+  maintenance count (+1/-1 as events open and close) and last completed PM
+- DispatchContext: current dispatch assignment of the request's asset
+- MeterReadingManager.ingest: latest meters
+- DetailPresenceIndex: detail count
+A hook that finds no row for its asset builds the row in full instead, and
+reads build (and commit) rows that are still missing; rebuild() recomputes
+rows from the source tables with one grouped query per source.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import bindparam, case, delete, func, insert, or_, select, update
+from app import db
+from app.data.core.asset_info.asset import Asset
+from app.data.core.asset_info.asset_summary import AssetSummary
+from app.data.core.event_info.event import Event
+from app.logger import get_logger
+
+logger = get_logger("asset_management.buisness.core.asset_summary")
+
+_summary = AssetSummary.__table__
+_assets = Asset.__table__
+
+
+class AssetSummaryManager:
+    """
+    Reads, incrementally updates and rebuilds AssetSummary rows.
+
+    Incremental updates are single Core UPDATE statements (counters use
+    col = col + delta). When an update matches no row and the asset has no
+    summary yet, the row is built from the (flushed) source tables instead.
+    """
+
+    OPEN_MAINTENANCE_STATUSES = ('Planned', 'In Progress', 'Delayed')
+    PM_COMPLETE_STATUS = 'Complete'
+    # Dispatch statuses that hold the asset; Active/Dispatched win over Planned
+    ASSIGNED_DISPATCH_STATUSES = ('Planned', 'Active', 'Dispatched')
+    IN_USE_DISPATCH_STATUSES = ('Active', 'Dispatched')
+    METER_COLUMNS = ('meter1', 'meter2', 'meter3', 'meter4')
+
+    # Asset IDs per IN (...) list
+    ID_CHUNK_SIZE = 900
+
+    # Reads
+
+    @classmethod
+    def get(cls, asset_id: int) -> AssetSummary:
+        """Summary row of an asset, built and committed if missing (call from read paths)"""
+        summary = db.session.get(AssetSummary, asset_id)
+        if summary is None:
+            cls.rebuild([asset_id])
+            db.session.commit()
+            summary = db.session.get(AssetSummary, asset_id)
+        return summary
+
+    @classmethod
+    def get_many(cls, assets: Iterable) -> Dict[int, AssetSummary]:
+        """
+        Summary rows of many assets (one query). Missing rows are built and
+        committed, so call from read paths.
+
+        Args:
+            assets: Asset instances or asset IDs
+
+        Returns:
+            Dictionary mapping asset_id to its AssetSummary
+        """
+        asset_ids = list(dict.fromkeys(asset.id if isinstance(asset, Asset) else asset for asset in assets))
+        summaries = {}
+        for chunk in cls._chunks(asset_ids):
+            for summary in AssetSummary.query.filter(AssetSummary.asset_id.in_(chunk)):
+                summaries[summary.asset_id] = summary
+
+        missing = [asset_id for asset_id in asset_ids if asset_id not in summaries]
+        if missing:
+            cls.rebuild(missing)
+            db.session.commit()
+            for chunk in cls._chunks(missing):
+                for summary in AssetSummary.query.filter(AssetSummary.asset_id.in_(chunk)):
+                    summaries[summary.asset_id] = summary
+        return summaries
+
+    # Incremental hooks (do not commit)
+
+    @classmethod
+    def on_event(cls, event: Event):
+        """Record a flushed event as its asset's last event if it is the newest"""
+        if not event.asset_id or event.id is None:
+            return
+        timestamp = event.timestamp or datetime.utcnow()
+        cls._apply(event.asset_id, update(_summary).where(
+            _summary.c.asset_id == event.asset_id,
+            or_(_summary.c.last_event_at.is_(None), _summary.c.last_event_at <= timestamp)
+        ).values(
+            last_event_id=event.id,
+            last_event_type=event.event_type,
+            last_event_at=timestamp,
+            updated_at=datetime.utcnow()
+        ))
+
+    @classmethod
+    def on_asset_edit(cls, asset: Asset, event: Optional[Event] = None):
+        """Copy an edited asset's meters (and its change event) into its summary"""
+        cls._apply(asset.id, update(_summary).where(_summary.c.asset_id == asset.id).values(
+            updated_at=datetime.utcnow(),
+            **{column: getattr(asset, column) for column in cls.METER_COLUMNS}
+        ))
+        if event is not None:
+            cls.on_event(event)
+
+    @classmethod
+    def on_maintenance_status(cls, maintenance_action_set, previous_status: Optional[str]):
+        """
+        Apply a maintenance status transition to the asset's summary.
+
+        Args:
+            maintenance_action_set: MaintenanceActionSet after the transition
+            previous_status: Status before the transition (None when just opened)
+        """
+        asset_id = maintenance_action_set.asset_id
+        if not asset_id:
+            return
+        status = maintenance_action_set.status
+        delta = (status in cls.OPEN_MAINTENANCE_STATUSES) - (previous_status in cls.OPEN_MAINTENANCE_STATUSES)
+        if delta:
+            cls._apply(asset_id, update(_summary).where(_summary.c.asset_id == asset_id).values(
+                open_maintenance_count=_summary.c.open_maintenance_count + delta,
+                updated_at=datetime.utcnow()
+            ))
+
+        completed_at = maintenance_action_set.end_date
+        if status == cls.PM_COMPLETE_STATUS and maintenance_action_set.maintenance_plan_id and completed_at:
+            cls._apply(asset_id, update(_summary).where(
+                _summary.c.asset_id == asset_id,
+                or_(_summary.c.last_pm_completed_at.is_(None), _summary.c.last_pm_completed_at <= completed_at)
+            ).values(
+                last_pm_event_id=maintenance_action_set.event_id,
+                last_pm_completed_at=completed_at,
+                updated_at=datetime.utcnow()
+            ))
+
+    @classmethod
+    def refresh_assignment(cls, asset_id: Optional[int]):
+        """Recompute an asset's current dispatch assignment (one query)"""
+        if not asset_id:
+            return
+        assignment = cls._assignments([asset_id]).get(asset_id, {})
+        cls._apply(asset_id, update(_summary).where(_summary.c.asset_id == asset_id).values(
+            current_dispatch_id=assignment.get('current_dispatch_id'),
+            assignment_status=assignment.get('assignment_status'),
+            assigned_until=assignment.get('assigned_until'),
+            updated_at=datetime.utcnow()
+        ))
+
+    @classmethod
+    def refresh_meters(cls, asset_ids: Iterable[int]):
+        """Copy Asset.meter1-meter4 into the summaries of the given assets"""
+        values = {
+            column: select(_assets.c[column]).where(_assets.c.id == _summary.c.asset_id).scalar_subquery()
+            for column in cls.METER_COLUMNS
+        }
+        for chunk in cls._chunks(sorted(set(asset_ids))):
+            db.session.execute(
+                update(_summary).where(_summary.c.asset_id.in_(chunk)).values(updated_at=datetime.utcnow(), **values)
+            )
+
+    @classmethod
+    def set_detail_counts(cls, detail_counts: Dict[int, int], connection=None):
+        """Store detail counts (asset_id -> count); runs on the given connection inside flush listeners"""
+        if not detail_counts:
+            return
+        connection = connection or db.session.connection()
+        connection.execute(
+            update(_summary).where(_summary.c.asset_id == bindparam('summary_asset_id')).values(
+                detail_count=bindparam('summary_detail_count')
+            ),
+            [
+                {'summary_asset_id': asset_id, 'summary_detail_count': count}
+                for asset_id, count in detail_counts.items()
+            ]
+        )
+
+    @classmethod
+    def delete_asset_summary(cls, asset_id: int) -> int:
+        """Delete an asset's summary (before the asset itself is deleted)"""
+        return db.session.execute(delete(_summary).where(_summary.c.asset_id == asset_id)).rowcount
+
+    # Rebuild
+
+    @classmethod
+    def rebuild(cls, asset_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Recompute summary rows from the source tables (does not commit).
+
+        Args:
+            asset_ids: Assets to rebuild (default every asset)
+
+        Returns:
+            Number of summary rows written
+        """
+        if asset_ids is None:
+            asset_ids = db.session.execute(select(_assets.c.id)).scalars().all()
+        written = 0
+        for chunk in cls._chunks(sorted(set(asset_ids))):
+            rows = cls._compute(chunk)
+            db.session.execute(delete(_summary).where(_summary.c.asset_id.in_(chunk)))
+            if rows:
+                db.session.execute(insert(_summary), rows)
+            written += len(rows)
+        logger.debug(f"Rebuilt {written} asset summaries")
+        return written
+
+    @classmethod
+    def _compute(cls, asset_ids: List[int]) -> List[Dict]:
+        """Summary rows for a chunk of assets, one query per source table"""
+        from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
+
+        now = datetime.utcnow()
+        rows = {}
+        for asset_id, detail_bitmap, *meters in db.session.execute(
+            select(_assets.c.id, _assets.c.detail_rows_created, *(_assets.c[c] for c in cls.METER_COLUMNS))
+            .where(_assets.c.id.in_(asset_ids))
+        ):
+            has_bitmap = isinstance(detail_bitmap, int) and not isinstance(detail_bitmap, bool)
+            rows[asset_id] = {
+                'asset_id': asset_id,
+                'last_event_id': None,
+                'last_event_type': None,
+                'last_event_at': None,
+                'open_maintenance_count': 0,
+                'last_pm_event_id': None,
+                'last_pm_completed_at': None,
+                'current_dispatch_id': None,
+                'assignment_status': None,
+                'assigned_until': None,
+                'detail_count': bin(detail_bitmap).count('1') if has_bitmap else None,
+                'updated_at': now,
+                **dict(zip(cls.METER_COLUMNS, meters)),
+            }
+        if not rows:
+            return []
+
+        # Last event per asset
+        ranked_events = select(
+            Event.asset_id, Event.id, Event.event_type, Event.timestamp,
+            func.row_number().over(
+                partition_by=Event.asset_id, order_by=(Event.timestamp.desc(), Event.id.desc())
+            ).label('rank')
+        ).where(Event.asset_id.in_(asset_ids)).subquery()
+        for asset_id, event_id, event_type, timestamp in db.session.execute(
+            select(ranked_events.c.asset_id, ranked_events.c.id, ranked_events.c.event_type, ranked_events.c.timestamp)
+            .where(ranked_events.c.rank == 1)
+        ):
+            rows[asset_id].update(last_event_id=event_id, last_event_type=event_type, last_event_at=timestamp)
+
+        # Open maintenance per asset
+        for asset_id, count in db.session.execute(
+            select(MaintenanceActionSet.asset_id, func.count())
+            .where(
+                MaintenanceActionSet.asset_id.in_(asset_ids),
+                MaintenanceActionSet.status.in_(cls.OPEN_MAINTENANCE_STATUSES)
+            )
+            .group_by(MaintenanceActionSet.asset_id)
+        ):
+            rows[asset_id]['open_maintenance_count'] = count
+
+        # Last completed preventive maintenance (created from a maintenance plan)
+        ranked_pm = select(
+            MaintenanceActionSet.asset_id, MaintenanceActionSet.event_id, MaintenanceActionSet.end_date,
+            func.row_number().over(
+                partition_by=MaintenanceActionSet.asset_id,
+                order_by=(MaintenanceActionSet.end_date.desc(), MaintenanceActionSet.id.desc())
+            ).label('rank')
+        ).where(
+            MaintenanceActionSet.asset_id.in_(asset_ids),
+            MaintenanceActionSet.status == cls.PM_COMPLETE_STATUS,
+            MaintenanceActionSet.maintenance_plan_id.isnot(None),
+            MaintenanceActionSet.end_date.isnot(None)
+        ).subquery()
+        for asset_id, event_id, end_date in db.session.execute(
+            select(ranked_pm.c.asset_id, ranked_pm.c.event_id, ranked_pm.c.end_date).where(ranked_pm.c.rank == 1)
+        ):
+            rows[asset_id].update(last_pm_event_id=event_id, last_pm_completed_at=end_date)
+
+        for asset_id, assignment in cls._assignments(asset_ids).items():
+            rows[asset_id].update(assignment)
+        return list(rows.values())
+
+    @classmethod
+    def _assignments(cls, asset_ids: List[int]) -> Dict[int, Dict]:
+        """Current dispatch per asset: an active one, else the earliest planned one"""
+        from app.data.dispatching.request import DispatchRequest
+        from app.data.dispatching.outcomes.standard_dispatch import StandardDispatch
+
+        ranked = select(
+            Event.asset_id, StandardDispatch.id, StandardDispatch.status, StandardDispatch.scheduled_end,
+            func.row_number().over(
+                partition_by=Event.asset_id,
+                order_by=(
+                    case((StandardDispatch.status.in_(cls.IN_USE_DISPATCH_STATUSES), 0), else_=1),
+                    StandardDispatch.scheduled_start,
+                    StandardDispatch.id
+                )
+            ).label('rank')
+        ).select_from(StandardDispatch).join(
+            DispatchRequest, StandardDispatch.request_id == DispatchRequest.id
+        ).join(
+            Event, DispatchRequest.event_id == Event.id
+        ).where(
+            Event.asset_id.in_(asset_ids),
+            StandardDispatch.status.in_(cls.ASSIGNED_DISPATCH_STATUSES)
+        ).subquery()
+
+        return {
+            asset_id: {
+                'current_dispatch_id': dispatch_id,
+                'assignment_status': status,
+                'assigned_until': scheduled_end,
+            }
+            for asset_id, dispatch_id, status, scheduled_end in db.session.execute(
+                select(ranked.c.asset_id, ranked.c.id, ranked.c.status, ranked.c.scheduled_end)
+                .where(ranked.c.rank == 1)
+            )
+        }
+
+    @classmethod
+    def _apply(cls, asset_id: int, statement):
+        """Run an incremental UPDATE; build the asset's row from source when it has none"""
+        if db.session.execute(statement).rowcount:
+            return
+        exists = db.session.execute(
+            select(_summary.c.asset_id).where(_summary.c.asset_id == asset_id)
+        ).first()
+        if exists is None:
+            cls.rebuild([asset_id])
+
+    @classmethod
+    def _chunks(cls, ids: List[int]):
+        for start in range(0, len(ids), cls.ID_CHUNK_SIZE):
+            yield ids[start:start + cls.ID_CHUNK_SIZE]
@@ -0,0 +1,13 @@
+"""
+Background Jobs Business Layer
+In-process job queue, runner and the registered job definitions
+"""
+
+from app.buisness.core.background_jobs.background_job_manager import BackgroundJobManager, JobHandle, JobCancelled
+from app.buisness.core.background_jobs import job_definitions
+
+__all__ = [
+    'BackgroundJobManager',
+    'JobHandle',
+    'JobCancelled',
+]
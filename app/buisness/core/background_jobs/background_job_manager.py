@@ -0,0 +1,396 @@
+"""
+BackgroundJobManager - In-process job queue for long-running operations
+
+Responsibilities:
+- Register job functions by name
+- Persist submitted jobs in the background_jobs table (the queue)
+- Claim queued jobs and run them on a thread pool under the Flask app context
+- Report progress, retry failed jobs with backoff and honour cancellation
+
+No external broker is used: the SQLite table is the queue and a claim is a
+single conditional UPDATE, so a job is never run twice. The runner starts
+lazily in the process that submits or views jobs. Live progress is kept in
+memory by the process running the job and written to the table when the
+job finishes, so reporting progress never commits half-done job work.
+"""
+
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sqlalchemy import update
+from app import db
+from app.data.core.background_job import BackgroundJob
+from app.logger import get_logger
+
+logger = get_logger("asset_management.buisness.core.background_jobs")
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation was requested"""
+
+
+class JobHandle:
+    """
+    Passed to every job function as its first argument.
+
+    Jobs call progress() between units of work; it raises JobCancelled once
+    the job has been cancelled, so long loops stop at the next checkpoint.
+    """
+
+    def __init__(self, job_id: int, attempt: int, user_id: Optional[int]):
+        self.job_id = job_id
+        self.attempt = attempt
+        self.user_id = user_id
+
+    @property
+    def cancelled(self) -> bool:
+        return self.job_id in BackgroundJobManager._cancel_flags
+
+    def check_cancelled(self):
+        """Raise JobCancelled if cancellation was requested"""
+        if self.cancelled:
+            raise JobCancelled()
+
+    def progress(self, fraction: float, message: Optional[str] = None):
+        """
+        Report progress and check for cancellation.
+
+        Args:
+            fraction: Completed fraction, 0.0 - 1.0
+            message: Short status line shown while polling
+        """
+        BackgroundJobManager._live[self.job_id] = (max(0.0, min(1.0, fraction)), message)
+        self.check_cancelled()
+
+
+class BackgroundJobManager:
+    """Queue, runner and lookups for BackgroundJob records"""
+
+    # Jobs run concurrently per process
+    WORKER_COUNT = 2
+
+    # Seconds between queue checks when nothing wakes the dispatcher
+    POLL_INTERVAL = 2.0
+
+    # First retry waits this long; each further retry doubles it
+    RETRY_DELAY_SECONDS = 15
+
+    # Registered job functions: job_type -> (function, label, max_attempts)
+    _registry: Dict[str, Tuple[Callable, str, int]] = {}
+
+    _start_lock = threading.Lock()
+    _app = None
+    _executor: Optional[ThreadPoolExecutor] = None
+    _wake = threading.Event()
+
+    # Job IDs running in this process, their live progress and cancel requests
+    _running: set = set()
+    _live: Dict[int, Tuple[float, Optional[str]]] = {}
+    _cancel_flags: set = set()
+
+    @classmethod
+    def job(cls, job_type: str, label: Optional[str] = None, max_attempts: int = 1):
+        """
+        Decorator registering a job function.
+
+        The function receives a JobHandle followed by the job params as
+        keyword arguments and returns a JSON-serializable result.
+
+        Args:
+            job_type: Unique job name
+            label: Default label shown in job lists
+            max_attempts: Total runs before the job is marked Failed
+        """
+        def decorator(func):
+            cls._registry[job_type] = (func, label or job_type, max_attempts)
+            return func
+        return decorator
+
+    @classmethod
+    def job_types(cls) -> Dict[str, str]:
+        """Registered job types mapped to their labels"""
+        return {job_type: entry[1] for job_type, entry in cls._registry.items()}
+
+    @staticmethod
+    def _worker_name() -> str:
+        return f'{socket.gethostname()}:{os.getpid()}'
+
+    # Submission and control
+    @classmethod
+    def submit(
+        cls,
+        app,
+        job_type: str,
+        params: Optional[Dict[str, Any]] = None,
+        user_id: Optional[int] = None,
+        label: Optional[str] = None,
+        max_attempts: Optional[int] = None
+    ) -> BackgroundJob:
+        """
+        Queue a job and make sure the runner is started.
+
+        Args:
+            app: Flask application (use current_app._get_current_object() in routes)
+            job_type: Registered job name
+            params: JSON-serializable keyword arguments for the job function
+            user_id: User submitting the job
+            label: Description shown in job lists (defaults to the registered label)
+            max_attempts: Override the registered attempt count
+
+        Returns:
+            The queued BackgroundJob
+
+        Raises:
+            ValueError: If job_type is not registered
+        """
+        if job_type not in cls._registry:
+            raise ValueError(f"Unknown job type: {job_type}")
+        _, default_label, default_attempts = cls._registry[job_type]
+
+        job = BackgroundJob(
+            job_type=job_type,
+            label=label or default_label,
+            params=params or {},
+            status='Queued',
+            run_after=datetime.utcnow(),
+            max_attempts=max_attempts or default_attempts,
+            created_by_id=user_id,
+            updated_by_id=user_id
+        )
+        db.session.add(job)
+        db.session.commit()
+        logger.info(f"Queued background job {job.id} ({job_type})")
+
+        cls.start(app)
+        cls._wake.set()
+        return job
+
+    @classmethod
+    def cancel(cls, job_id: int, user_id: Optional[int] = None) -> bool:
+        """
+        Cancel a queued job, or ask a running job to stop at its next checkpoint.
+
+        Returns:
+            bool: False if the job already finished
+        """
+        now = datetime.utcnow()
+        cancelled = db.session.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id, BackgroundJob.status == 'Queued')
+            .values(status='Cancelled', cancel_requested=True, finished_at=now, updated_by_id=user_id)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not cancelled:
+            cancelled = db.session.execute(
+                update(BackgroundJob)
+                .where(BackgroundJob.id == job_id, BackgroundJob.status == 'Running')
+                .values(cancel_requested=True, updated_by_id=user_id)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if cancelled:
+                cls._cancel_flags.add(job_id)
+        db.session.commit()
+        return bool(cancelled)
+
+    @classmethod
+    def retry(cls, app, job_id: int, user_id: Optional[int] = None) -> bool:
+        """
+        Queue a failed or cancelled job again with a fresh attempt count.
+
+        Returns:
+            bool: False if the job is not failed or cancelled
+        """
+        requeued = db.session.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id, BackgroundJob.status.in_(('Failed', 'Cancelled')))
+            .values(
+                status='Queued', attempts=0, cancel_requested=False, run_after=datetime.utcnow(),
+                progress=0.0, progress_message=None, error_message=None, result=None,
+                started_at=None, finished_at=None, worker_id=None, updated_by_id=user_id
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+        if requeued:
+            cls._cancel_flags.discard(job_id)
+            cls.start(app)
+            cls._wake.set()
+        return bool(requeued)
+
+    # Lookups
+    @staticmethod
+    def get_job(job_id: int) -> Optional[BackgroundJob]:
+        return BackgroundJob.query.get(job_id)
+
+    @staticmethod
+    def get_recent_jobs(user_id: Optional[int] = None, limit: int = 50) -> List[BackgroundJob]:
+        """
+        Most recent jobs, newest first
+
+        Args:
+            user_id: Only jobs submitted by this user (None for all)
+            limit: Max number of jobs
+        """
+        query = BackgroundJob.query
+        if user_id is not None:
+            query = query.filter(BackgroundJob.created_by_id == user_id)
+        return query.order_by(BackgroundJob.id.desc()).limit(limit).all()
+
+    @classmethod
+    def get_progress(cls, job: BackgroundJob) -> Tuple[float, Optional[str]]:
+        """Live progress for jobs running in this process, stored progress otherwise"""
+        live = cls._live.get(job.id)
+        if live is not None and job.status == 'Running':
+            return live
+        return job.progress or 0.0, job.progress_message
+
+    # Runner
+    @classmethod
+    def start(cls, app):
+        """Start the dispatcher and worker pool once per process"""
+        with cls._start_lock:
+            if cls._executor is not None:
+                return
+            cls._app = app
+            cls._executor = ThreadPoolExecutor(max_workers=cls.WORKER_COUNT, thread_name_prefix='background-job')
+            with app.app_context():
+                cls._recover_orphans()
+            dispatcher = threading.Thread(target=cls._dispatch_loop, name='background-job-dispatcher', daemon=True)
+            dispatcher.start()
+            logger.info(f"Background job runner started with {cls.WORKER_COUNT} workers")
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._executor is not None
+
+    @classmethod
+    def _recover_orphans(cls):
+        """Requeue jobs left Running by a process on this host that no longer exists"""
+        hostname = socket.gethostname()
+        orphaned = []
+        for job in BackgroundJob.query.filter(BackgroundJob.status == 'Running').all():
+            host, _, pid = (job.worker_id or '').rpartition(':')
+            if host != hostname or not pid.isdigit():
+                continue
+            try:
+                os.kill(int(pid), 0)
+                continue
+            except ProcessLookupError:
+                pass
+            except PermissionError:
+                continue
+            job.status = 'Queued'
+            job.worker_id = None
+            job.run_after = datetime.utcnow()
+            orphaned.append(job.id)
+        if orphaned:
+            db.session.commit()
+            logger.warning(f"Requeued orphaned background jobs: {orphaned}")
+
+    @classmethod
+    def _dispatch_loop(cls):
+        while True:
+            cls._wake.wait(cls.POLL_INTERVAL)
+            cls._wake.clear()
+            try:
+                with cls._app.app_context():
+                    cls._claim_and_submit()
+            except Exception as e:
+                logger.error(f"Background job dispatcher error: {e}")
+
+    @classmethod
+    def _claim_and_submit(cls):
+        """Claim as many due jobs as there are free workers"""
+        free = cls.WORKER_COUNT - len(cls._running)
+        if free <= 0:
+            return
+        now = datetime.utcnow()
+        candidate_ids = [
+            row[0] for row in db.session.query(BackgroundJob.id)
+            .filter(BackgroundJob.status == 'Queued', BackgroundJob.run_after <= now)
+            .order_by(BackgroundJob.run_after, BackgroundJob.id)
+            .limit(free)
+            .all()
+        ]
+        for job_id in candidate_ids:
+            claimed = db.session.execute(
+                update(BackgroundJob)
+                .where(BackgroundJob.id == job_id, BackgroundJob.status == 'Queued')
+                .values(
+                    status='Running', worker_id=cls._worker_name(), started_at=now,
+                    attempts=BackgroundJob.attempts + 1
+                )
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.session.commit()
+            if claimed:
+                cls._running.add(job_id)
+                cls._executor.submit(cls._execute, job_id)
+
+    @classmethod
+    def _execute(cls, job_id: int):
+        """Run one claimed job and record its outcome"""
+        try:
+            with cls._app.app_context():
+                job = BackgroundJob.query.get(job_id)
+                entry = cls._registry.get(job.job_type)
+                handle = JobHandle(job_id, job.attempts, job.created_by_id)
+                params = dict(job.params or {})
+                db.session.commit()  # Release the read transaction before the job starts writing
+
+                try:
+                    if entry is None:
+                        raise ValueError(f"Unknown job type: {job.job_type}")
+                    if job.cancel_requested:
+                        raise JobCancelled()
+                    result = entry[0](handle, **params)
+                except JobCancelled:
+                    db.session.rollback()
+                    cls._finish(job_id, status='Cancelled')
+                except Exception as e:
+                    db.session.rollback()
+                    logger.error(f"Background job {job_id} ({job.job_type}) failed: {e}")
+                    cls._fail(job_id, str(e))
+                else:
+                    cls._finish(job_id, status='Succeeded', result=result, progress=1.0)
+        except Exception as e:
+            logger.error(f"Background job {job_id} could not be recorded: {e}")
+        finally:
+            cls._running.discard(job_id)
+            cls._live.pop(job_id, None)
+            cls._cancel_flags.discard(job_id)
+            cls._wake.set()
+
+    @classmethod
+    def _finish(cls, job_id: int, status: str, result: Any = None, progress: Optional[float] = None):
+        job = BackgroundJob.query.get(job_id)
+        live_progress, live_message = cls._live.get(job_id, (job.progress, job.progress_message))
+        job.status = status
+        job.result = result
+        job.progress = progress if progress is not None else live_progress
+        job.progress_message = live_message
+        job.finished_at = datetime.utcnow()
+        db.session.commit()
+
+    @classmethod
+    def _fail(cls, job_id: int, error_message: str):
+        """Requeue with exponential backoff, or mark Failed once attempts are used up"""
+        job = BackgroundJob.query.get(job_id)
+        job.error_message = error_message
+        if job.attempts < job.max_attempts and not job.cancel_requested:
+            delay = cls.RETRY_DELAY_SECONDS * (2 ** (job.attempts - 1))
+            job.status = 'Queued'
+            job.worker_id = None
+            job.run_after = datetime.utcnow() + timedelta(seconds=delay)
+            db.session.commit()
+            logger.info(f"Background job {job_id} will retry in {delay}s (attempt {job.attempts}/{job.max_attempts})")
+            return
+        live_progress, live_message = cls._live.get(job_id, (job.progress, job.progress_message))
+        job.status = 'Failed'
+        job.progress = live_progress
+        job.progress_message = live_message
+        job.finished_at = datetime.utcnow()
+        db.session.commit()
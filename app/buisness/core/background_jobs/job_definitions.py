@@ -0,0 +1,164 @@
+"""
+Job definitions
+Long-running operations that can be submitted to BackgroundJobManager.
+
+Params are stored as JSON, so datetimes are passed as ISO strings. Domain
+modules are imported inside each job to keep this module import-light.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from app.buisness.core.background_jobs.background_job_manager import BackgroundJobManager, JobHandle
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+@BackgroundJobManager.job('maintenance.create_from_template', label='Create maintenance event from template')
+def create_maintenance_from_template(
+    job: JobHandle,
+    template_action_set_id: int,
+    asset_id: int,
+    planned_start_datetime: Optional[str] = None,
+    maintenance_plan_id: Optional[int] = None,
+    assigned_user_id: Optional[int] = None,
+    priority: str = 'Medium',
+    notes: Optional[str] = None
+) -> Dict[str, Any]:
+    """MaintenanceFactory.create_from_template as a job"""
+    from app.buisness.maintenance.factories.maintenance_factory import MaintenanceFactory
+
+    maintenance_action_set = MaintenanceFactory.create_from_template(
+        template_action_set_id=template_action_set_id,
+        asset_id=asset_id,
+        planned_start_datetime=_parse_datetime(planned_start_datetime),
+        maintenance_plan_id=maintenance_plan_id,
+        user_id=job.user_id,
+        assigned_user_id=assigned_user_id,
+        assigned_by_id=job.user_id if assigned_user_id else None,
+        priority=priority,
+        notes=notes
+    )
+    return {
+        'maintenance_action_set_id': maintenance_action_set.id,
+        'event_id': maintenance_action_set.event_id
+    }
+
+
+@BackgroundJobManager.job('maintenance.run_plan', label='Run maintenance plan')
+def run_maintenance_plan(
+    job: JobHandle,
+    maintenance_plan_id: int,
+    asset_ids: Optional[List[int]] = None,
+    planned_start_datetime: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Create a maintenance event from a plan for each asset.
+
+    Defaults to every asset matching the plan. Each event is committed on its
+    own, so a cancelled or failed run keeps the events created before it.
+    """
+    from app.buisness.maintenance.base.maintenance_plan_context import MaintenancePlanContext
+    from app.buisness.maintenance.factories.maintenance_factory import MaintenanceFactory
+
+    if asset_ids is None:
+        asset_ids = [asset.id for asset in MaintenancePlanContext(maintenance_plan_id).get_matching_assets()]
+    planned_start = _parse_datetime(planned_start_datetime)
+
+    created = []
+    for index, asset_id in enumerate(asset_ids):
+        job.progress(index / len(asset_ids), f'Asset {index + 1} of {len(asset_ids)}')
+        maintenance_action_set = MaintenanceFactory.create_from_maintenance_plan(
+            maintenance_plan_id=maintenance_plan_id,
+            asset_id=asset_id,
+            planned_start_datetime=planned_start,
+            user_id=job.user_id
+        )
+        created.append(maintenance_action_set.id)
+    return {'maintenance_action_set_ids': created}
+
+
+@BackgroundJobManager.job('maintenance.submit_template', label='Submit template builder')
+def submit_template_builder(job: JobHandle, builder_id: int) -> Dict[str, Any]:
+    """TemplateBuilderContext.submit_template as a job"""
+    from app.buisness.maintenance.builders.template_builder_context import TemplateBuilderContext
+
+    template_context = TemplateBuilderContext(builder_id).submit_template(user_id=job.user_id)
+    return {'template_action_set_id': template_context.template_action_set_id}
+
+
+@BackgroundJobManager.job('assets.bulk_onboard', label='Onboard assets')
+def bulk_onboard_assets(
+    job: JobHandle,
+    assets: List[Dict[str, Any]],
+    enable_detail_insertion: bool = True
+) -> Dict[str, Any]:
+    """AssetContext.create_bulk as a job"""
+    from app.buisness.core.asset_context import AssetContext
+
+    job.progress(0.0, f'Creating {len(assets)} assets')
+    asset_ids = AssetContext.create_bulk(
+        assets, created_by_id=job.user_id, enable_detail_insertion=enable_detail_insertion
+    )
+    return {'asset_ids': asset_ids}
+
+
+@BackgroundJobManager.job('inventory.purchase_orders_from_recommendations', label='Build purchase orders from recommendations')
+def build_purchase_orders(
+    job: JobHandle,
+    recommendations: Optional[List[Dict[str, Any]]] = None,
+    location_id: Optional[int] = None,
+    vendor_infos: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    PurchaseOrderManager.create_from_recommendations as a job.
+
+    Without recommendations, the current PartDemandManager recommendations
+    are used.
+    """
+    from app.buisness.inventory.managers.part_demand_manager import PartDemandManager
+    from app.buisness.inventory.managers.purchase_order_manager import PurchaseOrderManager
+
+    if recommendations is None:
+        job.progress(0.0, 'Analyzing unfulfilled part demands')
+        recommendations = PartDemandManager.get_purchase_recommendations()
+    job.progress(0.5, f'Creating purchase orders for {len(recommendations)} parts')
+    po_headers = PurchaseOrderManager.create_from_recommendations(
+        recommendations, job.user_id, location_id=location_id, vendor_infos=vendor_infos
+    )
+    return {
+        'purchase_order_ids': [po.id for po in po_headers],
+        'purchase_order_numbers': [po.po_number for po in po_headers]
+    }
+
+
+@BackgroundJobManager.job('core.archive_events', label='Archive old events')
+def archive_events(job: JobHandle, horizon_days: Optional[int] = None) -> Dict[str, Any]:
+    """
+    EventArchiveManager.archive as a job.
+
+    Each batch is committed on its own, so a cancelled run keeps the events
+    already archived.
+    """
+    from app.buisness.core.event_archive_manager import EventArchiveManager
+
+    horizon_days = horizon_days or EventArchiveManager.horizon_days()
+    cutoff = datetime.utcnow() - timedelta(days=horizon_days)
+    archivable = EventArchiveManager.count_archivable(cutoff)
+    job.progress(0.0, f'Archiving {archivable} events older than {cutoff:%Y-%m-%d}')
+
+    def report(totals):
+        job.progress(totals['events'] / archivable if archivable else 1.0,
+                     f"{totals['events']} of {archivable} events archived")
+
+    return EventArchiveManager.archive(cutoff=cutoff, progress=report)
+
+
+@BackgroundJobManager.job('debug.insert_debug_data', label='Load debug data')
+def load_debug_data(job: JobHandle, phase: str = 'all') -> Dict[str, Any]:
+    """debug_data_manager.insert_debug_data as a job"""
+    from app.debug.debug_data_manager import insert_debug_data
+
+    job.progress(0.0, f'Inserting debug data ({phase})')
+    return insert_debug_data(enabled=True, phase=phase)
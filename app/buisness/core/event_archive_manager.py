@@ -0,0 +1,285 @@
+"""
+EventArchiveManager - Time-partitioned event archive
+
+Moves events older than the archive horizon, with their comments and comment
+attachment links, out of the hot events/comments/comment_attachments tables
+into per-year partition tables (see EventArchivePartition). Attachments
+themselves stay where they are; only the links move.
+
+Only standalone events are archived: an event that another table points at
+(maintenance action sets, dispatch requests and outcomes, detail rows,
+purchase orders) stays in the hot table so those foreign keys and ORM
+relationships keep working.
+
+Readers fan out to the archive only when they need it: event_entity() returns
+the plain Event model unless the requested range reaches an archived
+partition (or archived events are asked for), and EventContext falls back to
+get_archived_event() for IDs missing from the hot table. Archived rows load
+as ordinary Event/Comment/CommentAttachment instances and are read-only.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+from flask import current_app
+from sqlalchemy import delete, exists, func, insert, or_, select, union_all
+from sqlalchemy.orm import aliased
+from app import db
+from app.data.core.event_info.event import Event
+from app.data.core.event_info.comment import Comment, CommentAttachment
+from app.data.core.event_info.event_archive import EventArchivePartition, archive_tables
+from app.logger import get_logger
+
+logger = get_logger("asset_management.buisness.core.event_archive")
+
+_events = Event.__table__
+_comments = Comment.__table__
+_comment_attachments = CommentAttachment.__table__
+
+
+class EventArchiveManager:
+    """Archives old events into yearly partitions and reads them back"""
+
+    DEFAULT_HORIZON_DAYS = 365
+    BATCH_SIZE = 500
+
+    # IDs per IN (...) list
+    ID_CHUNK_SIZE = 900
+
+    @classmethod
+    def horizon_days(cls) -> int:
+        """Age in days after which events are archived (EVENT_ARCHIVE_HORIZON_DAYS)"""
+        return int(current_app.config.get('EVENT_ARCHIVE_HORIZON_DAYS', cls.DEFAULT_HORIZON_DAYS))
+
+    # Archiving
+
+    @classmethod
+    def archive(
+        cls,
+        cutoff: Optional[datetime] = None,
+        batch_size: Optional[int] = None,
+        progress: Optional[Callable[[Dict[str, int]], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Move standalone events older than the cutoff into their year's partition.
+
+        Commits after each batch, so an interrupted run keeps the batches
+        already moved.
+
+        Args:
+            cutoff: Archive events with timestamp before this (default now - horizon_days())
+            batch_size: Events moved per batch
+            progress: Called with the running totals after each batch
+
+        Returns:
+            Dictionary with the number of events, comments and comment_attachments moved
+        """
+        cutoff = cutoff or datetime.utcnow() - timedelta(days=cls.horizon_days())
+        batch_size = batch_size or cls.BATCH_SIZE
+        totals = {'events': 0, 'comments': 0, 'comment_attachments': 0}
+
+        while True:
+            rows = db.session.execute(
+                cls._archivable_query(cutoff).limit(batch_size)
+            ).all()
+            if not rows:
+                break
+
+            event_ids_by_year = defaultdict(list)
+            for event_id, timestamp in rows:
+                event_ids_by_year[timestamp.year].append(event_id)
+            for year, event_ids in sorted(event_ids_by_year.items()):
+                for key, count in cls._move(year, event_ids).items():
+                    totals[key] += count
+            db.session.commit()
+
+            if progress:
+                progress(dict(totals))
+            if len(rows) < batch_size:
+                break
+
+        logger.info(f"Archived events before {cutoff:%Y-%m-%d}: {totals}")
+        return totals
+
+    @classmethod
+    def count_archivable(cls, cutoff: Optional[datetime] = None) -> int:
+        """Number of events archive() would move"""
+        cutoff = cutoff or datetime.utcnow() - timedelta(days=cls.horizon_days())
+        return db.session.execute(
+            select(func.count()).select_from(cls._archivable_query(cutoff).subquery())
+        ).scalar()
+
+    @staticmethod
+    def _referencing_columns() -> List:
+        """Foreign key columns, other than comments.event_id, that point at events.id"""
+        columns = []
+        for table in db.metadata.tables.values():
+            if table is _comments:
+                continue
+            for foreign_key in table.foreign_keys:
+                if foreign_key.column.table is _events:
+                    columns.append(foreign_key.parent)
+        return columns
+
+    @classmethod
+    def _archivable_query(cls, cutoff: datetime):
+        """(id, timestamp) of standalone events older than the cutoff, oldest first"""
+        query = select(_events.c.id, _events.c.timestamp).where(_events.c.timestamp < cutoff)
+        for column in cls._referencing_columns():
+            query = query.where(~exists().where(column == _events.c.id))
+        return query.order_by(_events.c.timestamp, _events.c.id)
+
+    @classmethod
+    def _move(cls, year: int, event_ids: List[int]) -> Dict[str, int]:
+        """Copy events, their comments and comment links into a partition and delete them from the hot tables"""
+        connection = db.session.connection()
+        archived_events, archived_comments, archived_links = archive_tables(year)
+        for table in (archived_events, archived_comments, archived_links):
+            table.create(connection, checkfirst=True)
+
+        comment_ids = []
+        for chunk in cls._chunks(event_ids):
+            comment_ids.extend(connection.execute(
+                select(_comments.c.id).where(_comments.c.event_id.in_(chunk))
+            ).scalars())
+
+        counts = {'events': 0, 'comments': 0, 'comment_attachments': 0}
+        for chunk in cls._chunks(comment_ids):
+            counts['comment_attachments'] += cls._copy(
+                connection, _comment_attachments, archived_links, _comment_attachments.c.attached_to_id.in_(chunk)
+            )
+            counts['comments'] += cls._copy(connection, _comments, archived_comments, _comments.c.id.in_(chunk))
+        for chunk in cls._chunks(event_ids):
+            counts['events'] += cls._copy(connection, _events, archived_events, _events.c.id.in_(chunk))
+
+        # Delete children first (comment links, comments, then events)
+        for chunk in cls._chunks(comment_ids):
+            connection.execute(delete(_comment_attachments).where(_comment_attachments.c.attached_to_id.in_(chunk)))
+            connection.execute(delete(_comments).where(_comments.c.id.in_(chunk)))
+        for chunk in cls._chunks(event_ids):
+            connection.execute(delete(_events).where(_events.c.id.in_(chunk)))
+
+        cls._update_partition(year, counts)
+        return counts
+
+    @staticmethod
+    def _copy(connection, source, target, condition) -> int:
+        """INSERT ... SELECT the matching source rows into the target table"""
+        names = [column.name for column in source.columns]
+        return connection.execute(
+            insert(target).from_select(names, select(*source.columns).where(condition))
+        ).rowcount
+
+    @staticmethod
+    def _update_partition(year: int, counts: Dict[str, int]):
+        """Refresh the catalog row of a partition from its tables"""
+        archived_events = archive_tables(year)[0]
+        first_at, last_at, min_id, max_id = db.session.execute(select(
+            func.min(archived_events.c.timestamp), func.max(archived_events.c.timestamp),
+            func.min(archived_events.c.id), func.max(archived_events.c.id)
+        )).one()
+
+        partition = EventArchivePartition.query.filter_by(year=year).first()
+        if partition is None:
+            partition = EventArchivePartition(year=year, event_count=0, comment_count=0, comment_attachment_count=0)
+            db.session.add(partition)
+        partition.event_count += counts['events']
+        partition.comment_count += counts['comments']
+        partition.comment_attachment_count += counts['comment_attachments']
+        partition.first_event_at = first_at
+        partition.last_event_at = last_at
+        partition.min_event_id = min_id
+        partition.max_event_id = max_id
+        partition.updated_at = datetime.utcnow()
+        db.session.flush()
+
+    # Reading
+
+    @staticmethod
+    def partitions(date_from: Optional[datetime] = None, date_to: Optional[datetime] = None) -> List[EventArchivePartition]:
+        """Non-empty partitions holding events in [date_from, date_to), newest first"""
+        query = EventArchivePartition.query.filter(EventArchivePartition.event_count > 0)
+        if date_from is not None:
+            query = query.filter(EventArchivePartition.last_event_at >= date_from)
+        if date_to is not None:
+            query = query.filter(EventArchivePartition.first_event_at < date_to)
+        return query.order_by(EventArchivePartition.year.desc()).all()
+
+    @staticmethod
+    def archived_through() -> Optional[datetime]:
+        """Timestamp of the newest archived event, or None when nothing is archived"""
+        return db.session.query(func.max(EventArchivePartition.last_event_at)).scalar()
+
+    @classmethod
+    def event_entity(
+        cls,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        include_archived: bool = False
+    ):
+        """
+        Entity to query events with: Event itself, or an Event alias over the
+        hot table UNION ALL the partitions the range needs.
+
+        Without include_archived the archive is only read when date_from
+        reaches back into it; an open-ended range stays on the hot table.
+
+        Returns:
+            Event or an aliased Event usable in filters and ordering like Event
+        """
+        if not include_archived and date_from is None:
+            return Event
+        partitions = cls.partitions(date_from, date_to)
+        if not partitions:
+            return Event
+        selects = [select(*_events.columns)]
+        for partition in partitions:
+            archived_events = partition.tables[0]
+            selects.append(select(*[archived_events.c[column.name] for column in _events.columns]))
+        return aliased(Event, union_all(*selects).subquery('events_with_archive'))
+
+    @classmethod
+    def get_archived_event(cls, event_id: int) -> Tuple[Optional[Event], Optional[EventArchivePartition]]:
+        """
+        Load an archived event by ID.
+
+        Returns:
+            Tuple of (Event, partition), or (None, None) when the ID is not archived
+        """
+        partitions = EventArchivePartition.query.filter(
+            EventArchivePartition.min_event_id <= event_id,
+            EventArchivePartition.max_event_id >= event_id
+        ).all()
+        for partition in partitions:
+            archived = aliased(Event, partition.tables[0], adapt_on_names=True)
+            event = db.session.query(archived).filter(archived.id == event_id).first()
+            if event is not None:
+                return event, partition
+        return None, None
+
+    @staticmethod
+    def get_archived_comments(partition: EventArchivePartition, event_id: int, visible_only: bool = True) -> List[Comment]:
+        """Comments of an archived event, oldest first (hidden edits/deletes excluded by default)"""
+        archived = aliased(Comment, partition.tables[1], adapt_on_names=True)
+        query = db.session.query(archived).filter(archived.event_id == event_id)
+        if visible_only:
+            query = query.filter(or_(
+                archived.user_viewable.is_(None),
+                ~archived.user_viewable.in_(['deleted', 'edit'])
+            ))
+        return query.order_by(archived.created_at.asc()).all()
+
+    @classmethod
+    def get_archived_comment_attachments(cls, partition: EventArchivePartition, comment_ids: List[int]) -> List[CommentAttachment]:
+        """Archived comment attachment links of the given comments"""
+        archived = aliased(CommentAttachment, partition.tables[2], adapt_on_names=True)
+        links = []
+        for chunk in cls._chunks(comment_ids):
+            links.extend(db.session.query(archived).filter(archived.attached_to_id.in_(chunk)).all())
+        return links
+
+    @classmethod
+    def _chunks(cls, ids: List[int]):
+        ids = list(ids)
+        for start in range(0, len(ids), cls.ID_CHUNK_SIZE):
+            yield ids[start:start + cls.ID_CHUNK_SIZE]
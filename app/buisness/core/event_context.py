@@ -5,6 +5,7 @@ Handles complex relational logic while using ORM models for basic operations.
 """
 
 from typing import List, Optional, Union
+from flask import abort
 from app import db
 from sqlalchemy import or_, and_
 from app.data.core.event_info.event import Event
@@ -31,8 +32,16 @@ class EventContext:
         Args:
             event: Event instance or event ID
         """
+        # Archive partition holding the event (None for events in the hot table)
+        self._archive_partition = None
         if isinstance(event, int):
-            self._event = Event.query.get_or_404(event)
+            self._event = Event.query.get(event)
+            if self._event is None:
+                # Old events may have been moved to the archive
+                from app.buisness.core.event_archive_manager import EventArchiveManager
+                self._event, self._archive_partition = EventArchiveManager.get_archived_event(event)
+                if self._event is None:
+                    abort(404)
             self._event_id = event
         else:
             self._event = event
@@ -52,6 +61,15 @@ class EventContext:
         """Get the event ID"""
         return self._event_id
     
+    @property
+    def is_archived(self) -> bool:
+        """Whether the event was loaded from the event archive (read-only)"""
+        return self._archive_partition is not None
+    
+    def _require_not_archived(self):
+        if self.is_archived:
+            raise ValueError(f"Event {self._event_id} is archived and cannot be changed")
+    
     @property
     def comments(self) -> List[Comment]:
         """
@@ -61,6 +79,9 @@ class EventContext:
         Returns:
             List of Comment objects (excluding deleted and previous edits), ordered chronologically
         """
+        if self._comments is None and self.is_archived:
+            from app.buisness.core.event_archive_manager import EventArchiveManager
+            self._comments = EventArchiveManager.get_archived_comments(self._archive_partition, self._event_id)
         if self._comments is None:
             query = Comment.query.filter_by(event_id=self._event_id)
             
@@ -164,7 +185,13 @@ class EventContext:
         if self._attachments is None:
             # Get all comment attachments for comments on this event
             comment_ids = [c.id for c in self.comments]
-            if comment_ids:
+            if comment_ids and self.is_archived:
+                from app.buisness.core.event_archive_manager import EventArchiveManager
+                comment_attachments = EventArchiveManager.get_archived_comment_attachments(
+                    self._archive_partition, comment_ids
+                )
+                self._attachments = [ca.attachment for ca in comment_attachments]
+            elif comment_ids:
                 comment_attachments = CommentAttachment.query.filter(
                     CommentAttachment.attached_to_id.in_(comment_ids)
                 ).all()
@@ -192,6 +219,7 @@ class EventContext:
         Returns:
             Created Comment instance
         """
+        self._require_not_archived()
         comment = Comment(
             content=content,
             event_id=self._event_id,
@@ -379,6 +407,7 @@ class EventContext:
         Raises:
             ValueError: If comment doesn't exist or user doesn't have permission
         """
+        self._require_not_archived()
         # Get the original comment
         original_comment = Comment.query.get(comment_id)
         if not original_comment:
@@ -434,6 +463,7 @@ class EventContext:
         Raises:
             ValueError: If comment doesn't exist or user doesn't have permission
         """
+        self._require_not_archived()
         comment = Comment.query.get(comment_id)
         if not comment:
             raise ValueError(f"Comment {comment_id} not found")
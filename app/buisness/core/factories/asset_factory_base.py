@@ -7,7 +7,7 @@ swapped at runtime while maintaining a consistent API.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from app.data.core.asset_info.asset import Asset
 
 
@@ -58,6 +58,28 @@ class AssetFactoryBase(ABC):
         """
         pass
     
+    @abstractmethod
+    def create_assets(
+        self,
+        assets_data: List[Dict[str, Any]],
+        created_by_id: Optional[int] = None,
+        commit: bool = True,
+        enable_detail_insertion: bool = True
+    ) -> List[int]:
+        """
+        Create many assets at once with batched statements
+        
+        Args:
+            assets_data: List of asset field dictionaries (name, serial_number, make_model_id, etc.)
+            created_by_id: ID of the user creating the assets
+            commit: Whether to commit the transaction
+            enable_detail_insertion: Whether to create detail rows (may be ignored by basic factory)
+            
+        Returns:
+            list: Created asset IDs in input order
+        """
+        pass
+    
     def get_factory_type(self) -> str:
         """
         Get the factory type identifier
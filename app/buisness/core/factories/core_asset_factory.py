@@ -10,7 +10,9 @@ This factory provides the minimum functionality needed for asset creation:
 Detail table creation is handled by AssetDetailsFactory in the assets module.
 """
 
-from typing import Optional, Dict, Any
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+from sqlalchemy import insert
 from app.buisness.core.factories.asset_factory_base import AssetFactoryBase
 from app.data.core.asset_info.asset import Asset
 from app.data.core.event_info.event import Event
@@ -88,6 +90,137 @@ class CoreAssetFactory(AssetFactoryBase):
         asset = self.create_asset(created_by_id=created_by_id, commit=commit, **asset_data)
         return asset, True
     
+    def create_assets(
+        self,
+        assets_data: List[Dict[str, Any]],
+        created_by_id: Optional[int] = None,
+        commit: bool = True,
+        enable_detail_insertion: bool = True  # Ignored in core factory
+    ) -> List[int]:
+        """
+        Create many assets and their creation events with batched statements
+        
+        Note: enable_detail_insertion is accepted for API compatibility but
+        is ignored in the core factory. Use AssetDetailsFactory for detail insertion.
+        """
+        asset_rows, asset_ids, _ = self._insert_asset_batch(assets_data, created_by_id)
+        
+        if commit:
+            db.session.commit()
+            logger.info(f"Bulk created {len(asset_ids)} assets")
+        
+        return asset_ids
+    
+    # Asset columns accepted by create_assets
+    BULK_ASSET_FIELDS = (
+        'name', 'serial_number', 'status', 'major_location_id', 'make_model_id',
+        'meter1', 'meter2', 'meter3', 'meter4', 'tags'
+    )
+    
+    # Serial numbers per duplicate-check IN (...) list
+    BULK_LOOKUP_CHUNK_SIZE = 900
+    
+    def _insert_asset_batch(
+        self,
+        assets_data: List[Dict[str, Any]],
+        created_by_id: Optional[int]
+    ) -> Tuple[List[Dict[str, Any]], List[int], List[int]]:
+        """
+        Validate and insert assets and their creation events (nothing is committed)
+        
+        Assets and events are each written with one multi-row INSERT; their IDs
+        come back through RETURNING and are matched on serial number / asset ID.
+        Meter values are recorded as meter readings, as single creation does,
+        and the assets' summary rows are built.
+        
+        Returns:
+            tuple: (asset rows, asset IDs, creation event IDs), all in input order
+            
+        Raises:
+            ValueError: If a row is missing required fields, has unknown fields,
+                or a serial number is duplicated in the batch or already exists
+        """
+        asset_rows = []
+        serial_numbers = set()
+        for index, asset_data in enumerate(assets_data):
+            unknown = set(asset_data) - set(self.BULK_ASSET_FIELDS)
+            if unknown:
+                raise ValueError(f"Row {index}: unknown asset fields {sorted(unknown)}")
+            if not asset_data.get('name'):
+                raise ValueError(f"Row {index}: asset name is required")
+            if not asset_data.get('serial_number'):
+                raise ValueError(f"Row {index}: asset serial number is required")
+            if asset_data['serial_number'] in serial_numbers:
+                raise ValueError(f"Row {index}: serial number '{asset_data['serial_number']}' appears more than once")
+            serial_numbers.add(asset_data['serial_number'])
+            
+            # Same keys for every row so the INSERT runs as one batch (tags, a JSON
+            # column, is left out unless given so it stays SQL NULL)
+            row = {field: None for field in self.BULK_ASSET_FIELDS if field != 'tags'}
+            row['status'] = 'Active'
+            row.update(asset_data)
+            row['created_by_id'] = created_by_id
+            row['updated_by_id'] = created_by_id
+            asset_rows.append(row)
+        
+        if not asset_rows:
+            return [], [], []
+        
+        # Check for duplicate serial numbers
+        ordered_serials = [row['serial_number'] for row in asset_rows]
+        for start in range(0, len(ordered_serials), self.BULK_LOOKUP_CHUNK_SIZE):
+            chunk = ordered_serials[start:start + self.BULK_LOOKUP_CHUNK_SIZE]
+            existing = db.session.query(Asset.serial_number).filter(Asset.serial_number.in_(chunk)).first()
+            if existing:
+                raise ValueError(f"Asset with serial number '{existing.serial_number}' already exists")
+        
+        # Insert assets; RETURNING order is not guaranteed for a batched INSERT,
+        # so IDs are mapped back through the unique serial number
+        result = db.session.execute(insert(Asset).returning(Asset.id, Asset.serial_number), asset_rows)
+        id_by_serial = {serial_number: asset_id for asset_id, serial_number in result}
+        asset_ids = [id_by_serial[row['serial_number']] for row in asset_rows]
+        
+        # Create creation events (business logic)
+        result = db.session.execute(
+            insert(Event).returning(Event.id, Event.asset_id),
+            [
+                {
+                    'event_type': 'Asset Created',
+                    'description': f"Asset '{row['name']}' ({row['serial_number']}) was created",
+                    'user_id': created_by_id,
+                    'asset_id': asset_id,
+                    'major_location_id': row['major_location_id']
+                }
+                for row, asset_id in zip(asset_rows, asset_ids)
+            ]
+        )
+        event_by_asset = {asset_id: event_id for event_id, asset_id in result}
+        event_ids = [event_by_asset[asset_id] for asset_id in asset_ids]
+        
+        # Initial meter values become the first meter readings
+        from app.buisness.core.meter_reading_manager import MeterReadingManager
+        now = datetime.utcnow()
+        MeterReadingManager.ingest(
+            (
+                (asset_id, meter, now, row[f'meter{meter}'])
+                for row, asset_id in zip(asset_rows, asset_ids)
+                for meter in (1, 2, 3, 4)
+                if row[f'meter{meter}'] is not None
+            ),
+            update_current=False
+        )
+        
+        # Core inserts bypass the summary hooks; build the new assets' summaries
+        from app.buisness.core.asset_summary_manager import AssetSummaryManager
+        AssetSummaryManager.rebuild(asset_ids)
+        
+        # Core inserts bypass the typeahead flush hook too; make cached asset picker options stale
+        from app.services.core.typeahead_service import TypeaheadService
+        TypeaheadService.invalidate(TypeaheadService.ASSETS)
+        
+        logger.info(f"Bulk staged {len(asset_ids)} assets with creation events")
+        return asset_rows, asset_ids, event_ids
+    
     def _create_creation_event(self, asset: Asset, user_id: Optional[int]):
         """Create asset creation event"""
         event = Event(
@@ -98,6 +231,11 @@ class CoreAssetFactory(AssetFactoryBase):
             major_location_id=asset.major_location_id
         )
         db.session.add(event)
+        db.session.flush()
+        
+        # Builds the new asset's summary row (none exists yet)
+        from app.buisness.core.asset_summary_manager import AssetSummaryManager
+        AssetSummaryManager.on_event(event)
     
     def get_factory_type(self) -> str:
         """Return factory type identifier"""
@@ -0,0 +1,363 @@
+"""
+MeterReadingManager - Meter reading time series for assets
+
+Responsibilities:
+- Batched ingestion of (asset, meter, timestamp, value) readings
+- Keep Asset.meter1-meter4 at the newest stored reading
+- Record meter edits made through the ORM (asset forms) as readings
+- Daily/weekly rollups for a range of readings
+- Fleet-wide rate of use (units per day) and meter-based due date forecasts
+
+Meters are treated as cumulative counters (odometer, engine hours), so the
+first and last reading of a period are its minimum and maximum. Rates are
+least-squares slopes fitted per asset, vectorized over the whole fleet with
+NumPy.
+"""
+
+from datetime import datetime, timedelta, timezone
+from itertools import chain, islice
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import delete, func, insert, inspect, select, update
+from app import db
+from app.data.core.asset_info.asset import Asset
+from app.data.core.asset_info.meter_reading import MeterReading
+from app.buisness.core.asset_summary_manager import AssetSummaryManager
+from app.logger import get_logger
+from app.utils.flush_hooks import on_flush
+
+logger = get_logger("asset_management.buisness.core.meter_readings")
+
+_readings = MeterReading.__table__
+_assets = Asset.__table__
+
+
+def _chunks(iterable: Iterable, size: int):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class MeterReadingManager:
+    """Ingests and analyzes asset meter readings"""
+
+    # Rows per INSERT executemany batch
+    INGEST_CHUNK_SIZE = 10000
+
+    # Asset IDs per IN (...) list
+    ID_CHUNK_SIZE = 900
+
+    # History used for rates of use
+    RATE_WINDOW_DAYS = 28
+
+    PERIODS = ('day', 'week')
+
+    @staticmethod
+    def _validate_meter(meter: int) -> int:
+        if meter not in MeterReading.METERS:
+            raise ValueError(f"Invalid meter {meter}; expected one of {MeterReading.METERS}")
+        return meter
+
+    @staticmethod
+    def ingest(
+        readings: Iterable[Tuple[int, int, datetime, float]],
+        update_current: bool = True
+    ) -> int:
+        """
+        Append readings in batches.
+
+        Args:
+            readings: Iterable of (asset_id, meter, recorded_at, value) tuples,
+                in any order; aware timestamps are converted to naive UTC
+            update_current: Set Asset.meterN to the newest stored reading of
+                every series touched by this batch
+
+        Returns:
+            Number of readings inserted
+
+        Raises:
+            ValueError: If a reading has an invalid meter or no value
+        """
+        # Rows go to the driver's executemany as plain tuples: at telemetry volume,
+        # SQLAlchemy's per-row parameter processing costs more than the INSERT.
+        # Timestamps use the storage format of SQLAlchemy's SQLite DateTime.
+        statement = f'INSERT INTO {_readings.name} (asset_id, meter, recorded_at, value) VALUES (?, ?, ?, ?)'
+        connection = db.session.connection()
+        meters = MeterReading.METERS
+        inserted = 0
+        touched: Dict[int, set] = {meter: set() for meter in meters}
+        for chunk in _chunks(readings, MeterReadingManager.INGEST_CHUNK_SIZE):
+            rows = []
+            for asset_id, meter, recorded_at, value in chunk:
+                if meter not in meters:
+                    MeterReadingManager._validate_meter(meter)
+                if value is None:
+                    raise ValueError(f"Reading for asset {asset_id} meter{meter} has no value")
+                if recorded_at.tzinfo is not None:
+                    # Stored timestamps are naive UTC
+                    recorded_at = recorded_at.astimezone(timezone.utc).replace(tzinfo=None)
+                rows.append((asset_id, meter, recorded_at.isoformat(' ', 'microseconds'), float(value)))
+                touched[meter].add(asset_id)
+            connection.exec_driver_sql(statement, rows)
+            inserted += len(rows)
+
+        if update_current:
+            for meter, asset_ids in touched.items():
+                if asset_ids:
+                    MeterReadingManager._refresh_current_values(meter, asset_ids)
+            AssetSummaryManager.refresh_meters(set().union(*touched.values()))
+        return inserted
+
+    @staticmethod
+    def _refresh_current_values(meter: int, asset_ids: Iterable[int]):
+        """Set Asset.meterN to the newest reading (one UPDATE per ID chunk)"""
+        newest_value = select(_readings.c.value).where(
+            _readings.c.asset_id == _assets.c.id,
+            _readings.c.meter == meter
+        ).order_by(_readings.c.recorded_at.desc()).limit(1).scalar_subquery()
+        for chunk in _chunks(sorted(asset_ids), MeterReadingManager.ID_CHUNK_SIZE):
+            # Core UPDATE: does not go through the ORM listener below, so no readings are re-recorded
+            db.session.execute(
+                update(_assets).where(_assets.c.id.in_(chunk)).values({f'meter{meter}': newest_value})
+            )
+
+    @staticmethod
+    def delete_asset_readings(asset_id: int) -> int:
+        """Delete an asset's reading history (before the asset itself is deleted)"""
+        return db.session.execute(delete(_readings).where(_readings.c.asset_id == asset_id)).rowcount
+
+    @staticmethod
+    def get_series(
+        asset_id: int,
+        meter: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[Tuple[datetime, float]]:
+        """Raw (recorded_at, value) readings of one series, oldest first"""
+        MeterReadingManager._validate_meter(meter)
+        query = select(_readings.c.recorded_at, _readings.c.value).where(
+            _readings.c.asset_id == asset_id,
+            _readings.c.meter == meter
+        )
+        if start:
+            query = query.where(_readings.c.recorded_at >= start)
+        if end:
+            query = query.where(_readings.c.recorded_at < end)
+        return [tuple(row) for row in db.session.execute(query.order_by(_readings.c.recorded_at))]
+
+    @staticmethod
+    def get_value_at(asset_id: int, meter: int, at: datetime) -> Optional[float]:
+        """Newest reading at or before a point in time"""
+        return db.session.execute(
+            select(_readings.c.value).where(
+                _readings.c.asset_id == asset_id,
+                _readings.c.meter == meter,
+                _readings.c.recorded_at <= at
+            ).order_by(_readings.c.recorded_at.desc()).limit(1)
+        ).scalar()
+
+    @staticmethod
+    def get_latest(asset_id: int, meter: int) -> Optional[Tuple[datetime, float]]:
+        """Newest (recorded_at, value) reading of a series"""
+        row = db.session.execute(
+            select(_readings.c.recorded_at, _readings.c.value).where(
+                _readings.c.asset_id == asset_id,
+                _readings.c.meter == meter
+            ).order_by(_readings.c.recorded_at.desc()).limit(1)
+        ).first()
+        return tuple(row) if row else None
+
+    @staticmethod
+    def rollup(
+        asset_ids: Sequence[int],
+        meter: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        period: str = 'day'
+    ) -> List[Dict]:
+        """
+        Downsample readings to one row per asset and day or week (weeks start Monday).
+
+        Args:
+            asset_ids: Assets to include
+            meter: Meter number (1-4)
+            start: Inclusive start of the range
+            end: Exclusive end of the range
+            period: 'day' or 'week'
+
+        Returns:
+            List of dicts with asset_id, period_start (date string), readings,
+            first_value, last_value and usage, ordered by asset then period.
+            usage is the increase since the previous period's last reading
+            (since the period's first reading for the first period).
+        """
+        MeterReadingManager._validate_meter(meter)
+        if period == 'day':
+            bucket = func.date(_readings.c.recorded_at)
+        elif period == 'week':
+            bucket = func.date(_readings.c.recorded_at, '-6 days', 'weekday 1')
+        else:
+            raise ValueError(f"Invalid period {period!r}; expected one of {MeterReadingManager.PERIODS}")
+        bucket = bucket.label('period_start')
+
+        results = []
+        for chunk in _chunks(asset_ids, MeterReadingManager.ID_CHUNK_SIZE):
+            query = select(
+                _readings.c.asset_id,
+                bucket,
+                func.count().label('readings'),
+                func.min(_readings.c.value).label('first_value'),
+                func.max(_readings.c.value).label('last_value')
+            ).where(
+                _readings.c.asset_id.in_(chunk),
+                _readings.c.meter == meter
+            )
+            if start:
+                query = query.where(_readings.c.recorded_at >= start)
+            if end:
+                query = query.where(_readings.c.recorded_at < end)
+            query = query.group_by(_readings.c.asset_id, bucket).order_by(_readings.c.asset_id, bucket)
+
+            previous_asset_id, previous_last = None, None
+            for row in db.session.execute(query):
+                baseline = previous_last if row.asset_id == previous_asset_id else row.first_value
+                results.append({
+                    'asset_id': row.asset_id,
+                    'period_start': row.period_start,
+                    'readings': row.readings,
+                    'first_value': row.first_value,
+                    'last_value': row.last_value,
+                    'usage': row.last_value - baseline
+                })
+                previous_asset_id, previous_last = row.asset_id, row.last_value
+        return results
+
+    @staticmethod
+    def get_rates_of_use(
+        meter: int,
+        asset_ids: Optional[Sequence[int]] = None,
+        window_days: Optional[int] = None,
+        as_of: Optional[datetime] = None
+    ) -> Dict[int, float]:
+        """
+        Rate of use (meter units per day) per asset over a trailing window.
+
+        One ordered query loads every reading of the window; the least-squares
+        slope of value against time is then computed for all assets at once
+        with segment sums (np.add.reduceat).
+
+        Args:
+            meter: Meter number (1-4)
+            asset_ids: Assets to include (default every asset with readings)
+            window_days: Trailing window (default RATE_WINDOW_DAYS)
+            as_of: End of the window (default now)
+
+        Returns:
+            Dict mapping asset_id to units per day. Assets with fewer than two
+            distinct reading times in the window are omitted.
+        """
+        # NumPy is imported here so asset pages that never compute rates skip its import cost
+        import numpy as np
+
+        MeterReadingManager._validate_meter(meter)
+        end = as_of or datetime.utcnow()
+        start = end - timedelta(days=window_days or MeterReadingManager.RATE_WINDOW_DAYS)
+
+        # julianday() returns days as a float, so no datetime objects are built per row
+        query = select(
+            _readings.c.asset_id,
+            func.julianday(_readings.c.recorded_at),
+            _readings.c.value
+        ).where(
+            _readings.c.meter == meter,
+            _readings.c.recorded_at >= start,
+            _readings.c.recorded_at <= end
+        )
+        if asset_ids is not None:
+            if not asset_ids:
+                return {}
+            query = query.where(_readings.c.asset_id.in_(list(asset_ids)))
+        query = query.order_by(_readings.c.asset_id, _readings.c.recorded_at)
+
+        result = db.session.execute(query)
+        data = np.fromiter(chain.from_iterable(result), dtype=np.float64)
+        if not len(data):
+            return {}
+        data = data.reshape(-1, 3)
+        assets = data[:, 0].astype(np.int64)
+        days = data[:, 1]
+        values = data[:, 2]
+
+        starts = np.flatnonzero(np.r_[True, assets[1:] != assets[:-1]])
+        counts = np.diff(np.r_[starts, len(assets)])
+        # Time relative to each asset's first reading keeps the sums well conditioned
+        days = days - np.repeat(days[starts], counts)
+
+        sum_x = np.add.reduceat(days, starts)
+        sum_y = np.add.reduceat(values, starts)
+        sum_xx = np.add.reduceat(days * days, starts)
+        sum_xy = np.add.reduceat(days * values, starts)
+        denominator = counts * sum_xx - sum_x * sum_x
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slopes = (counts * sum_xy - sum_x * sum_y) / denominator
+
+        valid = (counts > 1) & (denominator > 1e-12)
+        return dict(zip(assets[starts][valid].tolist(), slopes[valid].tolist()))
+
+    @staticmethod
+    def forecast_due_date(
+        asset_id: int,
+        meter: int,
+        last_service_date: datetime,
+        interval: float,
+        rate: Optional[float] = None
+    ) -> Optional[datetime]:
+        """
+        Estimate when a meter-based service interval is reached.
+
+        The meter value at last_service_date plus interval is the target; the
+        date is projected from the newest reading at the asset's rate of use.
+
+        Args:
+            asset_id: Asset ID
+            meter: Meter number (1-4)
+            last_service_date: When the interval last restarted
+            interval: Meter units between services
+            rate: Units per day (default get_rates_of_use for the asset)
+
+        Returns:
+            Projected due datetime, or None without enough history or usage
+        """
+        latest = MeterReadingManager.get_latest(asset_id, meter)
+        if latest is None:
+            return None
+        latest_at, latest_value = latest
+        baseline = MeterReadingManager.get_value_at(asset_id, meter, last_service_date)
+        if baseline is None:
+            baseline = latest_value
+        remaining = baseline + interval - latest_value
+        if remaining <= 0:
+            return latest_at
+
+        if rate is None:
+            rate = MeterReadingManager.get_rates_of_use(meter, [asset_id], as_of=latest_at).get(asset_id)
+        if not rate or rate <= 0:
+            return None
+        return latest_at + timedelta(days=remaining / rate)
+
+
+@on_flush(Asset)
+def _record_asset_meter_changes(session, changes):
+    """Record meter values set through the ORM (asset create/edit) as readings"""
+    rows = []
+    now = datetime.utcnow()
+    for instance in (*changes.new, *changes.dirty):
+        state = inspect(instance)
+        for meter in MeterReading.METERS:
+            added = state.attrs[f'meter{meter}'].history.added
+            if added and added[0] is not None:
+                rows.append({'asset_id': instance.id, 'meter': meter, 'recorded_at': now, 'value': added[0]})
+    if rows:
+        session.connection().execute(insert(_readings), rows)
@@ -0,0 +1,210 @@
+"""
+Reference Data Cache
+Process-level cache of lookup tables used by forms and filters.
+
+Dropdowns only need an id, a label and a few display columns, so each lookup
+table (asset types, major locations, make/models, users) is loaded with one
+column query into a tuple of small NamedTuples, never ORM rows. Tables are
+kept in a VersionedCache with one namespace per table; a flush hook bumps the
+namespace whenever one of its rows is inserted, updated or deleted, and a
+cached table is reused as long as it is current and younger than TTL_SECONDS
+(the TTL picks up writes made by other worker processes).
+"""
+
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+from app import db
+from app.data.core.asset_info.asset_type import AssetType
+from app.data.core.asset_info.make_model import MakeModel
+from app.data.core.major_location import MajorLocation
+from app.data.core.user_info.user import User
+from app.utils.flush_hooks import on_flush
+from app.utils.versioned_cache import VersionedCache
+
+
+class AssetTypeRef(NamedTuple):
+    id: int
+    label: str
+    active: bool
+    name: str
+    category: Optional[str]
+
+
+class MajorLocationRef(NamedTuple):
+    id: int
+    label: str
+    active: bool
+    name: str
+
+
+class MakeModelRef(NamedTuple):
+    id: int
+    label: str
+    active: bool
+    make: str
+    model: str
+    year: Optional[int]
+    asset_type_id: Optional[int]
+
+    @property
+    def asset_type(self) -> Optional[AssetTypeRef]:
+        """Asset type reference, resolved through the cache"""
+        if self.asset_type_id is None:
+            return None
+        return ReferenceDataCache.get(ReferenceDataCache.ASSET_TYPES, self.asset_type_id)
+
+
+class UserRef(NamedTuple):
+    id: int
+    label: str
+    active: bool
+    username: str
+
+
+def _load_asset_types():
+    rows = db.session.query(
+        AssetType.id, AssetType.name, AssetType.is_active, AssetType.category
+    ).order_by(AssetType.name)
+    return [AssetTypeRef(id, name, bool(is_active), name, category) for id, name, is_active, category in rows]
+
+
+def _load_locations():
+    rows = db.session.query(
+        MajorLocation.id, MajorLocation.name, MajorLocation.is_active
+    ).order_by(MajorLocation.name)
+    return [MajorLocationRef(id, name, bool(is_active), name) for id, name, is_active in rows]
+
+
+def _load_make_models():
+    rows = db.session.query(
+        MakeModel.id, MakeModel.make, MakeModel.model, MakeModel.year,
+        MakeModel.is_active, MakeModel.asset_type_id
+    ).order_by(MakeModel.make, MakeModel.model, MakeModel.year)
+    return [
+        MakeModelRef(
+            id,
+            f"{make} {model} ({year})" if year else f"{make} {model}",
+            bool(is_active), make, model, year, asset_type_id
+        )
+        for id, make, model, year, is_active, asset_type_id in rows
+    ]
+
+
+def _load_users():
+    rows = db.session.query(User.id, User.username, User.is_active).order_by(User.username)
+    return [UserRef(id, username, bool(is_active), username) for id, username, is_active in rows]
+
+
+class ReferenceDataCache:
+    """
+    Versioned in-memory copies of the lookup tables.
+
+    Accessors return tuples of (id, label, active, ...) NamedTuples sorted by
+    label. Each worker process keeps its own copy.
+    """
+
+    ASSET_TYPES = 'asset_types'
+    LOCATIONS = 'locations'
+    MAKE_MODELS = 'make_models'
+    USERS = 'users'
+
+    TTL_SECONDS = 300
+
+    _loaders: Dict[str, Callable] = {
+        ASSET_TYPES: _load_asset_types,
+        LOCATIONS: _load_locations,
+        MAKE_MODELS: _load_make_models,
+        USERS: _load_users,
+    }
+
+    # table -> (rows, rows by id)
+    _cache = VersionedCache(max_entries=len(_loaders), ttl_seconds=TTL_SECONDS)
+
+    @classmethod
+    def version(cls, table: str) -> int:
+        """Current version of a lookup table"""
+        return cls._cache.versions((table,))[0]
+
+    @classmethod
+    def _table(cls, table: str) -> Tuple[tuple, dict]:
+        """Cached (rows, rows by id) for a table, loading it when stale"""
+        cached = cls._cache.get(table)
+        if cached is not None:
+            return cached
+
+        versions = cls._cache.versions((table,))
+        rows = tuple(cls._loaders[table]())
+        by_id = {row.id: row for row in rows}
+        # A flush during the load moves the version, so the stored entry is already stale
+        cls._cache.put(table, (rows, by_id), (table,), versions)
+        return rows, by_id
+
+    @classmethod
+    def rows(cls, table: str, active_only: bool = False) -> tuple:
+        """
+        All rows of a lookup table.
+
+        Args:
+            table: One of ASSET_TYPES, LOCATIONS, MAKE_MODELS, USERS
+            active_only: Only rows whose is_active flag is set
+
+        Returns:
+            Tuple of reference NamedTuples sorted by label
+        """
+        rows, _ = cls._table(table)
+        if active_only:
+            return tuple(row for row in rows if row.active)
+        return rows
+
+    @classmethod
+    def get(cls, table: str, id: Optional[int]):
+        """Reference row by ID, or None"""
+        if id is None:
+            return None
+        _, by_id = cls._table(table)
+        return by_id.get(id)
+
+    @classmethod
+    def asset_types(cls, active_only: bool = False) -> Tuple[AssetTypeRef, ...]:
+        return cls.rows(cls.ASSET_TYPES, active_only)
+
+    @classmethod
+    def locations(cls, active_only: bool = False) -> Tuple[MajorLocationRef, ...]:
+        return cls.rows(cls.LOCATIONS, active_only)
+
+    @classmethod
+    def make_models(cls, active_only: bool = False) -> Tuple[MakeModelRef, ...]:
+        return cls.rows(cls.MAKE_MODELS, active_only)
+
+    @classmethod
+    def users(cls, active_only: bool = False) -> Tuple[UserRef, ...]:
+        return cls.rows(cls.USERS, active_only)
+
+    @classmethod
+    def invalidate(cls, table: Optional[str] = None):
+        """Bump the version of one table, or of every table"""
+        cls._cache.bump(*([table] if table else cls._loaders))
+
+
+_REFERENCE_MODELS = (
+    (AssetType, ReferenceDataCache.ASSET_TYPES),
+    (MajorLocation, ReferenceDataCache.LOCATIONS),
+    (MakeModel, ReferenceDataCache.MAKE_MODELS),
+    (User, ReferenceDataCache.USERS),
+)
+
+
+@on_flush(*(model for model, _ in _REFERENCE_MODELS))
+def _bump_reference_data_versions(session, changes):
+    """Bump the version of each lookup table that had rows written in this flush"""
+    changed = set()
+    for instance in (*changes.new, *changes.deleted):
+        for model, table in _REFERENCE_MODELS:
+            if isinstance(instance, model):
+                changed.add(table)
+    for instance in changes.dirty:
+        for model, table in _REFERENCE_MODELS:
+            # Relationship collection changes (e.g. a backref append) do not change the cached columns
+            if isinstance(instance, model) and session.is_modified(instance, include_collections=False):
+                changed.add(table)
+    for table in changed:
+        ReferenceDataCache.invalidate(table)
@@ -14,6 +14,7 @@ from app.data.dispatching.outcomes.contract import Contract
 from app.data.dispatching.outcomes.reimbursement import Reimbursement
 from app.data.dispatching.outcomes.reject import Reject
 from app.buisness.core.event_context import EventContext
+from app.buisness.core.asset_summary_manager import AssetSummaryManager
 
 #pulled a sneaky on you
 class DispatchContext:
@@ -215,6 +216,7 @@ class DispatchContext:
         comment = f"Dispatch created: {dispatch.status} from {dispatch.scheduled_start} to {dispatch.scheduled_end}"
         event_context = EventContext(self.event)
         event_context.add_comment(created_by_id or dispatch.created_by_id, comment)
+        AssetSummaryManager.refresh_assignment(self.event.asset_id)
         
         db.session.commit()
         self._build()  # Rebuild to refresh state
@@ -381,6 +383,9 @@ class DispatchContext:
             event_context = EventContext(self.event)
             event_context.add_comment(user_id or self.dispatch.updated_by_id, comment_text)
         
+        if self.event:
+            AssetSummaryManager.refresh_assignment(self.event.asset_id)
+        
         db.session.commit()
         self._build()  # Rebuild to refresh state
         return self
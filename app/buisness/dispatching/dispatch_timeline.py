@@ -0,0 +1,248 @@
+"""
+DispatchTimeline - Per-asset dispatch timeline with conflict detection
+
+Loads scheduled dispatches and open planned maintenance windows for a time
+range in a single UNION ALL statement, groups them by asset and flags
+overlaps with a sweep line:
+
+- dispatch vs dispatch on the same asset (double booking)
+- dispatch vs planned maintenance window on the same asset
+
+Built timelines are cached per (range, filters) until a dispatch, request,
+maintenance action set or asset is flushed.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import and_, literal, select, union_all
+from app import db
+from app.data.core.asset_info.asset import Asset
+from app.data.core.event_info.event import Event
+from app.data.dispatching.request import DispatchRequest
+from app.data.dispatching.outcomes.standard_dispatch import StandardDispatch
+from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
+from app.utils.flush_hooks import on_flush
+from app.utils.versioned_cache import VersionedCache
+
+
+class DispatchTimeline:
+    """
+    Timeline engine for the dispatch board.
+
+    build() returns {'groups', 'items', 'conflicts'} where groups are assets,
+    items are dispatches and maintenance windows and conflicts are
+    overlapping item pairs.
+    """
+
+    DISPATCH = 'dispatch'
+    MAINTENANCE = 'maintenance'
+
+    # Maintenance action sets that still occupy their planned window
+    OPEN_MAINTENANCE_STATUSES = ('Planned', 'In Progress', 'Delayed')
+    # Window length when a maintenance action set has no estimated_duration
+    DEFAULT_MAINTENANCE_HOURS = 8.0
+    # Longest maintenance window looked up before the range start
+    MAINTENANCE_LOOKBACK = timedelta(days=7)
+
+    # Built timelines keyed by (start, end, asset_type_id, location_id)
+    _cache = VersionedCache(max_entries=64, ttl_seconds=60)
+    CACHE_NAMESPACE = 'timeline'
+
+    @classmethod
+    def build(
+        cls,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        asset_type_id: Optional[int] = None,
+        location_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Timeline for a range, from the cache when possible.
+
+        Args:
+            start: Range start (items ending before it are excluded)
+            end: Range end (items starting after it are excluded)
+            asset_type_id: Only dispatches requested for this asset type
+            location_id: Only dispatches requested at this major location
+
+        Returns:
+            Dictionary with groups, items and conflicts
+        """
+        key = (start, end, asset_type_id, location_id)
+        timeline = cls._cache.get(key)
+        if timeline is not None:
+            return timeline
+
+        versions = cls._cache.versions((cls.CACHE_NAMESPACE,))
+        timeline = cls._compute(start, end, asset_type_id, location_id)
+        cls._cache.put(key, timeline, (cls.CACHE_NAMESPACE,), versions)
+        return timeline
+
+    @classmethod
+    def invalidate(cls):
+        """Drop every cached timeline"""
+        cls._cache.clear()
+
+    @classmethod
+    def _statement(cls, start, end, asset_type_id, location_id):
+        """
+        UNION ALL of scheduled dispatches and the open maintenance windows of
+        the assets those dispatches use.
+        """
+        dispatch_filters = []
+        if start:
+            dispatch_filters.append(StandardDispatch.scheduled_end >= start)
+        if end:
+            dispatch_filters.append(StandardDispatch.scheduled_start <= end)
+        if asset_type_id:
+            dispatch_filters.append(DispatchRequest.asset_type_id == asset_type_id)
+        if location_id:
+            dispatch_filters.append(DispatchRequest.major_location_id == location_id)
+
+        dispatch_from = (
+            select(StandardDispatch.id)
+            .join(DispatchRequest, StandardDispatch.request_id == DispatchRequest.id)
+            .join(Event, DispatchRequest.event_id == Event.id)
+        )
+
+        dispatches = select(
+            literal(cls.DISPATCH).label('kind'),
+            StandardDispatch.id.label('id'),
+            Event.asset_id.label('asset_id'),
+            Asset.name.label('asset_name'),
+            StandardDispatch.scheduled_start.label('start'),
+            StandardDispatch.scheduled_end.label('end'),
+            literal(None).label('duration'),
+            StandardDispatch.status.label('status'),
+            DispatchRequest.asset_subclass_text.label('title'),
+        ).select_from(StandardDispatch).join(
+            DispatchRequest, StandardDispatch.request_id == DispatchRequest.id
+        ).join(
+            Event, DispatchRequest.event_id == Event.id
+        ).outerjoin(
+            Asset, Event.asset_id == Asset.id
+        ).where(*dispatch_filters)
+
+        dispatched_assets = dispatch_from.with_only_columns(Event.asset_id).where(
+            Event.asset_id.isnot(None), *dispatch_filters
+        )
+        maintenance_filters = [
+            MaintenanceActionSet.planned_start_datetime.isnot(None),
+            MaintenanceActionSet.status.in_(cls.OPEN_MAINTENANCE_STATUSES),
+            MaintenanceActionSet.asset_id.in_(dispatched_assets),
+        ]
+        if start:
+            maintenance_filters.append(MaintenanceActionSet.planned_start_datetime >= start - cls.MAINTENANCE_LOOKBACK)
+        if end:
+            maintenance_filters.append(MaintenanceActionSet.planned_start_datetime <= end)
+
+        maintenance = select(
+            literal(cls.MAINTENANCE).label('kind'),
+            MaintenanceActionSet.id.label('id'),
+            MaintenanceActionSet.asset_id.label('asset_id'),
+            Asset.name.label('asset_name'),
+            MaintenanceActionSet.planned_start_datetime.label('start'),
+            MaintenanceActionSet.planned_start_datetime.label('end'),
+            MaintenanceActionSet.estimated_duration.label('duration'),
+            MaintenanceActionSet.status.label('status'),
+            MaintenanceActionSet.task_name.label('title'),
+        ).select_from(MaintenanceActionSet).outerjoin(
+            Asset, MaintenanceActionSet.asset_id == Asset.id
+        ).where(and_(*maintenance_filters))
+
+        return union_all(dispatches, maintenance)
+
+    @classmethod
+    def _compute(cls, start, end, asset_type_id, location_id) -> Dict[str, Any]:
+        """Run the timeline query, group by asset and detect conflicts"""
+        rows = db.session.execute(cls._statement(start, end, asset_type_id, location_id)).all()
+
+        groups: Dict[int, str] = {}
+        items: List[Dict[str, Any]] = []
+        by_asset: Dict[int, List[Dict[str, Any]]] = {}
+        for row in rows:
+            item_start, item_end = row.start, row.end
+            if row.kind == cls.MAINTENANCE:
+                item_end = item_start + timedelta(hours=row.duration or cls.DEFAULT_MAINTENANCE_HOURS)
+                if start and item_end < start:
+                    continue
+                class_name = 'maintenance-window'
+            else:
+                class_name = 'dispatch-active' if row.status in ('Active', 'Dispatched') else 'dispatch-reserved'
+
+            item = {
+                'id': f'{row.kind}-{row.id}' if row.kind == cls.MAINTENANCE else row.id,
+                'kind': row.kind,
+                'record_id': row.id,
+                'group': row.asset_id,
+                'start': item_start.isoformat() if item_start else None,
+                'end': item_end.isoformat() if item_end else None,
+                'type': 'range',
+                'className': class_name,
+                'title': row.title or ('Maintenance' if row.kind == cls.MAINTENANCE else 'Dispatch'),
+                'status': row.status,
+                'conflict': False,
+            }
+            items.append(item)
+
+            if row.asset_id is not None:
+                if row.asset_name is not None:
+                    groups[row.asset_id] = row.asset_name
+                if item_start and item_end:
+                    by_asset.setdefault(row.asset_id, []).append((item_start, item_end, item))
+
+        conflicts = []
+        for asset_id, intervals in by_asset.items():
+            for first, second in cls._overlaps(intervals):
+                for item in (first, second):
+                    if not item['conflict']:
+                        item['conflict'] = True
+                        item['className'] += ' conflict'
+                conflicts.append({
+                    'group': asset_id,
+                    'items': [first['id'], second['id']],
+                    'type': 'double_booking' if first['kind'] == second['kind'] else 'maintenance',
+                })
+
+        return {
+            'groups': [{'id': gid, 'content': label} for gid, label in groups.items()],
+            'items': items,
+            'conflicts': conflicts,
+        }
+
+    @classmethod
+    def _overlaps(cls, intervals: List[Tuple[datetime, datetime, Dict[str, Any]]]):
+        """
+        Sweep line over one asset's intervals.
+
+        Yields (item, item) pairs that overlap and involve at least one
+        dispatch. Intervals that only touch (one ends when the next starts)
+        do not overlap.
+        """
+        # Ends sort before starts at the same instant
+        points = []
+        for index, (item_start, item_end, _) in enumerate(intervals):
+            points.append((item_start, 1, index))
+            points.append((item_end, 0, index))
+        points.sort(key=lambda point: (point[0], point[1]))
+
+        active = set()
+        for _, is_start, index in points:
+            if not is_start:
+                active.discard(index)
+                continue
+            item = intervals[index][2]
+            for other_index in active:
+                other = intervals[other_index][2]
+                if item['kind'] == cls.DISPATCH or other['kind'] == cls.DISPATCH:
+                    yield other, item
+            active.add(index)
+
+
+_TIMELINE_MODELS = (StandardDispatch, DispatchRequest, MaintenanceActionSet, Asset)
+
+
+@on_flush(*_TIMELINE_MODELS)
+def _invalidate_dispatch_timeline(session, changes):
+    """Invalidate cached timelines when a dispatch, request, maintenance action set or asset changes"""
+    DispatchTimeline.invalidate()
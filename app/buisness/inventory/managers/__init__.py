@@ -4,10 +4,16 @@ from app.buisness.inventory.managers.purchase_order_manager import PurchaseOrder
 from app.buisness.inventory.managers.part_arrival_manager import PartArrivalManager
 from app.buisness.inventory.managers.inventory_manager import InventoryManager
 from app.buisness.inventory.managers.part_demand_manager import PartDemandManager
+from app.buisness.inventory.managers.stock_reconciliation_manager import StockReconciliationManager
+from app.buisness.inventory.managers.kit_availability_manager import KitAvailabilityManager
+from app.buisness.inventory.managers.reorder_forecast_manager import ReorderForecastManager
 
 __all__ = [
     'PurchaseOrderManager',
     'PartArrivalManager',
     'InventoryManager',
-    'PartDemandManager'
+    'PartDemandManager',
+    'StockReconciliationManager',
+    'KitAvailabilityManager',
+    'ReorderForecastManager'
 ]
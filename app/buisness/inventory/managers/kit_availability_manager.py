@@ -0,0 +1,342 @@
+"""
+KitAvailabilityManager - Batched inventory availability for maintenance part demands
+
+Responsibilities:
+- Resolve demand locations (action -> maintenance action set -> asset) in one joined query
+- Load active inventory for every demanded part in one query
+- Build a part x location availability matrix with shortfalls
+- Decide which maintenance events can be kitted, earliest planned start first
+- Answer single-demand availability checks with the same fixed query count
+
+The number of queries is fixed (demands, inventory, parts, locations) no matter
+how many events or demands are checked.
+"""
+
+from datetime import datetime
+from app import db
+from app.data.maintenance.base.part_demands import PartDemand
+from app.data.maintenance.base.actions import Action
+from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
+from app.data.inventory.base import ActiveInventory
+from app.data.core.asset_info.asset import Asset
+from app.data.core.major_location import MajorLocation
+from app.data.core.supply.part import Part
+
+
+class KitAvailabilityManager:
+    """Checks whether part demands can be kitted from active inventory"""
+
+    # Demand statuses that still need parts pulled from inventory
+    OPEN_DEMAND_STATUSES = [
+        'Planned',
+        'Pending',
+        'Pending Manager Approval',
+        'Pending Inventory Approval',
+        'Ordered',
+        'Backordered'
+    ]
+
+    @staticmethod
+    def build_availability_matrix(event_ids=None, maintenance_action_set_ids=None, demand_ids=None,
+                                  planned_start=None, planned_end=None, statuses=None):
+        """
+        Build a part x location availability matrix for a set of demands
+
+        Demands are selected by any combination of event IDs, maintenance action
+        set IDs, demand IDs and a planned start window (e.g. a week's schedule).
+
+        Args:
+            event_ids: List of maintenance event IDs (optional)
+            maintenance_action_set_ids: List of maintenance action set IDs (optional)
+            demand_ids: List of part demand IDs (optional)
+            planned_start: Only events planned to start at or after this datetime (optional)
+            planned_end: Only events planned to start before this datetime (optional)
+            statuses: Demand statuses to include (default OPEN_DEMAND_STATUSES,
+                ignored when demand_ids are given)
+
+        Returns:
+            Dict with:
+            - 'parts': {part_id: {'part_number', 'part_name'}}
+            - 'locations': {location_id: location name}
+            - 'matrix': {part_id: {location_id: cell}} where cell has
+              'required', 'available', 'shortfall'
+            - 'part_totals': {part_id: {'required', 'available', 'shortfall'}}
+            - 'events': {event_id: per-event kit status, see _allocate_events()}
+            - 'shortfalls': list of cells with a shortfall, largest first
+            - 'can_kit_all': True if no event has a shortfall
+        """
+        demand_rows = KitAvailabilityManager._load_demand_rows(
+            event_ids=event_ids,
+            maintenance_action_set_ids=maintenance_action_set_ids,
+            demand_ids=demand_ids,
+            planned_start=planned_start,
+            planned_end=planned_end,
+            statuses=statuses
+        )
+
+        part_ids = {row.part_id for row in demand_rows}
+        available = KitAvailabilityManager._load_available(part_ids)
+        parts = KitAvailabilityManager._load_parts(part_ids)
+
+        # Required quantity per (part, location)
+        required = {}
+        for row in demand_rows:
+            key = (row.part_id, row.location_id)
+            required[key] = required.get(key, 0.0) + (row.quantity_required or 0.0)
+
+        location_ids = {location_id for (_, location_id) in required if location_id is not None}
+        location_ids.update(location_id for (_, location_id) in available)
+        locations = KitAvailabilityManager._load_locations(location_ids)
+
+        # Matrix cells for every part at every location it is needed or stocked
+        matrix = {}
+        shortfalls = []
+        for key in set(required) | set(available):
+            part_id, location_id = key
+            cell_required = required.get(key, 0.0)
+            cell_available = available.get(key, 0.0)
+            cell = {
+                'part_id': part_id,
+                'location_id': location_id,
+                'required': cell_required,
+                'available': cell_available,
+                'shortfall': max(0.0, cell_required - cell_available)
+            }
+            matrix.setdefault(part_id, {})[location_id] = cell
+            if cell['shortfall'] > 0:
+                shortfalls.append(cell)
+        shortfalls.sort(key=lambda cell: cell['shortfall'], reverse=True)
+
+        # Totals across all locations
+        part_totals = {}
+        for part_id, cells in matrix.items():
+            total_required = sum(cell['required'] for cell in cells.values())
+            total_available = sum(cell['available'] for cell in cells.values())
+            part_totals[part_id] = {
+                'required': total_required,
+                'available': total_available,
+                'shortfall': max(0.0, total_required - total_available)
+            }
+
+        events = KitAvailabilityManager._allocate_events(demand_rows, available)
+
+        return {
+            'parts': parts,
+            'locations': locations,
+            'matrix': matrix,
+            'part_totals': part_totals,
+            'events': events,
+            'shortfalls': shortfalls,
+            'can_kit_all': all(event['can_kit'] for event in events.values())
+        }
+
+    @staticmethod
+    def check_demands_availability(demand_ids):
+        """
+        Check whether each demand can be fulfilled from inventory
+
+        Returns the same per-demand dict as PartDemandManager.check_inventory_availability,
+        using two queries for the whole batch.
+
+        Args:
+            demand_ids: List of part demand IDs
+
+        Returns:
+            Dict mapping demand_id to availability dict
+        """
+        demand_rows = KitAvailabilityManager._load_demand_rows(demand_ids=demand_ids)
+        inventory_by_part = {}
+        for (part_id, location_id), quantity in KitAvailabilityManager._load_available(
+            {row.part_id for row in demand_rows}
+        ).items():
+            inventory_by_part.setdefault(part_id, {})[location_id] = quantity
+
+        results = {}
+        for row in demand_rows:
+            part_inventory = inventory_by_part.get(row.part_id, {})
+            quantity_required = row.quantity_required
+
+            location_inventory = []
+            if row.location_id and row.location_id in part_inventory:
+                location_inventory.append({
+                    'location_id': row.location_id,
+                    'quantity_available': part_inventory[row.location_id],
+                    'can_fulfill': part_inventory[row.location_id] >= quantity_required
+                })
+
+            other_locations = [
+                {
+                    'location_id': location_id,
+                    'quantity_available': quantity,
+                    'can_fulfill': quantity >= quantity_required
+                }
+                for location_id, quantity in part_inventory.items()
+                if location_id != row.location_id
+            ]
+
+            total_available = sum(part_inventory.values())
+
+            results[row.demand_id] = {
+                'demand_id': row.demand_id,
+                'part_id': row.part_id,
+                'quantity_required': quantity_required,
+                'preferred_location_id': row.location_id,
+                'location_inventory': location_inventory,
+                'other_locations': other_locations,
+                'total_available': total_available,
+                'can_fulfill_from_preferred': any(
+                    inv['can_fulfill'] for inv in location_inventory
+                ) if location_inventory else False,
+                'can_fulfill_from_any': total_available >= quantity_required,
+                'needs_purchase': total_available < quantity_required
+            }
+
+        return results
+
+    @staticmethod
+    def _allocate_events(demand_rows, available):
+        """
+        Allocate stock to events in planned start order and record shortfalls
+
+        Earlier events claim stock first, so later events see what is left.
+        Events without an asset location can only be checked against nothing
+        and are reported with every demand short.
+
+        Returns:
+            Dict mapping event_id to dict with 'maintenance_action_set_id',
+            'location_id', 'planned_start_datetime', 'can_kit', 'demand_count'
+            and 'shortfalls' (list of {'part_id', 'required', 'allocated', 'shortfall'})
+        """
+        remaining = dict(available)
+
+        # Group demand quantities by event, then by part
+        events = {}
+        for row in demand_rows:
+            event = events.get(row.event_id)
+            if event is None:
+                event = events[row.event_id] = {
+                    'maintenance_action_set_id': row.maintenance_action_set_id,
+                    'location_id': row.location_id,
+                    'planned_start_datetime': row.planned_start_datetime,
+                    'demand_count': 0,
+                    '_required': {}
+                }
+            event['demand_count'] += 1
+            event['_required'][row.part_id] = event['_required'].get(row.part_id, 0.0) + (row.quantity_required or 0.0)
+
+        ordered = sorted(
+            events.items(),
+            key=lambda item: (item[1]['planned_start_datetime'] or datetime.max, item[0])
+        )
+
+        for event_id, event in ordered:
+            event_shortfalls = []
+            for part_id, part_required in event.pop('_required').items():
+                key = (part_id, event['location_id'])
+                allocated = min(part_required, max(0.0, remaining.get(key, 0.0)))
+                if key in remaining:
+                    remaining[key] -= allocated
+                if allocated < part_required:
+                    event_shortfalls.append({
+                        'part_id': part_id,
+                        'required': part_required,
+                        'allocated': allocated,
+                        'shortfall': part_required - allocated
+                    })
+            event['shortfalls'] = event_shortfalls
+            event['can_kit'] = not event_shortfalls
+
+        return events
+
+    @staticmethod
+    def _load_demand_rows(event_ids=None, maintenance_action_set_ids=None, demand_ids=None,
+                          planned_start=None, planned_end=None, statuses=None):
+        """
+        Load demand rows with their event and asset location in one joined query
+
+        Returns:
+            List of rows with demand_id, part_id, quantity_required, status,
+            maintenance_action_set_id, event_id, planned_start_datetime, location_id
+        """
+        query = db.session.query(
+            PartDemand.id.label('demand_id'),
+            PartDemand.part_id,
+            PartDemand.quantity_required,
+            PartDemand.status,
+            MaintenanceActionSet.id.label('maintenance_action_set_id'),
+            MaintenanceActionSet.event_id,
+            MaintenanceActionSet.planned_start_datetime,
+            Asset.major_location_id.label('location_id')
+        ).join(
+            Action, PartDemand.action_id == Action.id
+        ).join(
+            MaintenanceActionSet, Action.maintenance_action_set_id == MaintenanceActionSet.id
+        ).outerjoin(
+            Asset, MaintenanceActionSet.asset_id == Asset.id
+        )
+
+        if event_ids is not None:
+            query = query.filter(MaintenanceActionSet.event_id.in_(list(event_ids)))
+        if maintenance_action_set_ids is not None:
+            query = query.filter(MaintenanceActionSet.id.in_(list(maintenance_action_set_ids)))
+        if demand_ids is not None:
+            query = query.filter(PartDemand.id.in_(list(demand_ids)))
+        else:
+            query = query.filter(PartDemand.status.in_(statuses or KitAvailabilityManager.OPEN_DEMAND_STATUSES))
+        if planned_start is not None:
+            query = query.filter(MaintenanceActionSet.planned_start_datetime >= planned_start)
+        if planned_end is not None:
+            query = query.filter(MaintenanceActionSet.planned_start_datetime < planned_end)
+
+        return query.order_by(PartDemand.id).all()
+
+    @staticmethod
+    def _load_available(part_ids):
+        """
+        Load available quantity (on hand minus allocated) per (part, location)
+
+        Returns:
+            Dict mapping (part_id, location_id) to available quantity
+        """
+        if not part_ids:
+            return {}
+        rows = db.session.query(
+            ActiveInventory.part_id,
+            ActiveInventory.major_location_id,
+            ActiveInventory.quantity_on_hand,
+            ActiveInventory.quantity_allocated
+        ).filter(ActiveInventory.part_id.in_(list(part_ids))).all()
+        return {
+            (row.part_id, row.major_location_id): (row.quantity_on_hand or 0.0) - (row.quantity_allocated or 0.0)
+            for row in rows
+        }
+
+    @staticmethod
+    def _load_parts(part_ids):
+        """
+        Load part labels for the matrix
+
+        Returns:
+            Dict mapping part_id to {'part_number', 'part_name'}
+        """
+        if not part_ids:
+            return {}
+        rows = db.session.query(Part.id, Part.part_number, Part.part_name).filter(
+            Part.id.in_(list(part_ids))
+        ).all()
+        return {row.id: {'part_number': row.part_number, 'part_name': row.part_name} for row in rows}
+
+    @staticmethod
+    def _load_locations(location_ids):
+        """
+        Load location names for the matrix
+
+        Returns:
+            Dict mapping location_id to location name
+        """
+        if not location_ids:
+            return {}
+        rows = db.session.query(MajorLocation.id, MajorLocation.name).filter(
+            MajorLocation.id.in_(list(location_ids))
+        ).all()
+        return {row.id: row.name for row in rows}
@@ -78,6 +78,10 @@ class PartDemandManager:
         # Group by part
         grouped = PartDemandManager.group_demands_by_part(demands)
         
+        # Cached consumption forecasts override hand-entered stock levels
+        from app.buisness.inventory.managers.reorder_forecast_manager import ReorderForecastManager
+        forecasts = ReorderForecastManager.get_forecast_map(grouped.keys())
+        
         recommendations = []
         
         for part_id, part_demands in grouped.items():
@@ -96,23 +100,27 @@ class PartDemandManager:
             # Calculate net need
             net_need = max(0, total_needed - inventory_available)
             
-            # Check minimum stock level
-            min_stock = part.minimum_stock_level or 0
+            # Check minimum stock level (forecast reorder point when available)
+            forecast = forecasts.get(part_id)
+            min_stock = forecast.reorder_point if forecast else (part.minimum_stock_level or 0)
+            target_stock = forecast.order_up_to_level if forecast else min_stock
             current_stock = part.current_stock_level or 0
             
             # Recommend ordering if below minimum or net need exists
             if net_need > 0 or current_stock < min_stock:
-                order_quantity = max(net_need, min_stock - current_stock)
+                order_quantity = max(net_need, target_stock - current_stock)
                 
                 recommendations.append({
                     'part_id': part_id,
                     'part_number': part.part_number,
                     'part_name': part.part_name,
+                    'supplier': part.supplier,
                     'total_demand': total_needed,
                     'inventory_available': inventory_available,
                     'net_need': net_need,
                     'current_stock': current_stock,
                     'minimum_stock': min_stock,
+                    'forecasted': forecast is not None,
                     'recommended_order_qty': order_quantity,
                     'unit_cost': part.unit_cost,
                     'estimated_cost': (part.unit_cost or 0) * order_quantity,
@@ -261,65 +269,13 @@ class PartDemandManager:
         Returns:
             Dict with availability info
         """
-        demand = PartDemand.query.get(demand_id)
-        if not demand:
-            return {'error': 'Demand not found'}
-        
-        # Get location from action -> maintenance_action_set -> asset -> major_location_id
-        location_id = None
-        if hasattr(demand, 'action') and demand.action:
-            if hasattr(demand.action, 'maintenance_action_set') and demand.action.maintenance_action_set:
-                from app.data.core.asset_info.asset import Asset
-                asset = Asset.query.get(demand.action.maintenance_action_set.asset_id) if demand.action.maintenance_action_set.asset_id else None
-                if asset:
-                    location_id = asset.major_location_id
-        
-        # Check inventory at this location
-        location_inventory = []
-        if location_id:
-            inv = ActiveInventory.query.filter_by(
-                part_id=demand.part_id,
-                major_location_id=location_id
-            ).first()
-            
-            if inv:
-                location_inventory.append({
-                    'location_id': location_id,
-                    'quantity_available': inv.quantity_available,
-                    'can_fulfill': inv.quantity_available >= demand.quantity_required
-                })
-        
-        # Check inventory at all locations
-        all_inventory = ActiveInventory.query.filter_by(
-            part_id=demand.part_id
-        ).all()
+        from app.buisness.inventory.managers.kit_availability_manager import KitAvailabilityManager
         
-        total_available = sum(inv.quantity_available for inv in all_inventory)
-        
-        other_locations = [
-            {
-                'location_id': inv.major_location_id,
-                'quantity_available': inv.quantity_available,
-                'can_fulfill': inv.quantity_available >= demand.quantity_required
-            }
-            for inv in all_inventory
-            if inv.major_location_id != location_id
-        ]
+        results = KitAvailabilityManager.check_demands_availability([demand_id])
+        if demand_id not in results:
+            return {'error': 'Demand not found'}
         
-        return {
-            'demand_id': demand_id,
-            'part_id': demand.part_id,
-            'quantity_required': demand.quantity_required,
-            'preferred_location_id': location_id,
-            'location_inventory': location_inventory,
-            'other_locations': other_locations,
-            'total_available': total_available,
-            'can_fulfill_from_preferred': any(
-                inv['can_fulfill'] for inv in location_inventory
-            ) if location_inventory else False,
-            'can_fulfill_from_any': total_available >= demand.quantity_required,
-            'needs_purchase': total_available < demand.quantity_required
-        }
+        return results[demand_id]
     
     @staticmethod
     def get_demands_by_purchase_order(po_id):
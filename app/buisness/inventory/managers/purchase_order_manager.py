@@ -12,6 +12,7 @@ Responsibilities:
 
 from pathlib import Path
 from datetime import datetime, date
+from sqlalchemy import insert
 from app import db
 from app.data.inventory.base import (
     PurchaseOrderHeader,
@@ -19,6 +20,8 @@ from app.data.inventory.base import (
     PartDemandPurchaseOrderLine
 )
 from app.data.core.event_info.event import Event
+from app.data.core.sequences import PurchaseOrderNumberManager
+from app.data.core.supply.part import Part
 from app.data.maintenance.base.part_demands import PartDemand
 from app.buisness.core.event_context import EventContext
 
@@ -26,6 +29,9 @@ from app.buisness.core.event_context import EventContext
 class PurchaseOrderManager:
     """Handles all purchase order business logic"""
     
+    # Vendor name used for recommendations whose part has no supplier
+    UNASSIGNED_VENDOR = 'Unassigned Vendor'
+    
     @staticmethod
     def create_from_part_demands(part_demands, vendor_info, user_id, location_id=None):
         """
@@ -40,80 +46,120 @@ class PurchaseOrderManager:
         Returns:
             PurchaseOrderHeader object
         """
-        # Convert IDs to objects if needed
+        # Convert IDs to objects if needed (single IN query, original order kept)
         if part_demands and isinstance(part_demands[0], int):
-            part_demands = [PartDemand.query.get(pd_id) for pd_id in part_demands]
+            demands_by_id = {
+                demand.id: demand
+                for demand in PartDemand.query.filter(PartDemand.id.in_(part_demands)).all()
+            }
+            part_demands = [demands_by_id[pd_id] for pd_id in part_demands if pd_id in demands_by_id]
         
         # Group demands by part
         grouped = PurchaseOrderManager.group_demands_by_part(part_demands)
         
-        # Generate PO number
-        po_number = PurchaseOrderManager._generate_po_number()
-        
-        # Create PO header
-        po_header = PurchaseOrderHeader(
-            po_number=po_number,
-            vendor_name=vendor_info.get('name'),
-            vendor_contact=vendor_info.get('contact'),
-            order_date=date.today(),
-            expected_delivery_date=vendor_info.get('expected_delivery_date'),
-            shipping_cost=vendor_info.get('shipping_cost', 0.0),
-            tax_amount=vendor_info.get('tax_amount', 0.0),
-            notes=vendor_info.get('notes'),
-            major_location_id=location_id,
-            status='Draft',
-            created_by_id=user_id
-        )
+        # Load unit costs for all parts in one query
+        unit_costs = PurchaseOrderManager._get_unit_costs(grouped.keys())
+        
+        line_specs = [
+            {
+                'part_id': part_id,
+                'quantity': sum(d.quantity_required for d in demands),
+                'unit_cost': unit_costs.get(part_id) or 0.0,
+                'demands': [(d.id, d.quantity_required) for d in demands]
+            }
+            for part_id, demands in grouped.items()
+        ]
+        
+        po_number = PurchaseOrderNumberManager.get_next_po_number()
+        po_header = PurchaseOrderManager._build_purchase_orders(
+            [(po_number, vendor_info, line_specs)], user_id, location_id
+        )[0]
+        
+        db.session.commit()
+        
+        return po_header
+    
+    @staticmethod
+    def create_from_recommendations(recommendations, user_id, location_id=None, vendor_infos=None):
+        """
+        Create one purchase order per vendor from purchase recommendations in a single pass
         
-        db.session.add(po_header)
-        db.session.flush()  # Get PO ID
+        Recommendations are grouped by vendor (the part's supplier), PO numbers are
+        reserved as one block from the monthly sequence, and headers, lines and
+        demand links are each inserted in batched statements with one commit.
         
-        # Create PO lines for each part
-        line_number = 1
-        for part_id, demands in grouped.items():
-            total_quantity = sum(d.quantity_required for d in demands)
-            part = demands[0].part
+        Args:
+            recommendations: List of dicts from PartDemandManager.get_purchase_recommendations()
+            user_id: User creating the POs
+            location_id: Delivery location (optional)
+            vendor_infos: Dict mapping vendor name to vendor_info dict (optional)
             
-            po_line = PurchaseOrderLine(
-                purchase_order_id=po_header.id,
-                part_id=part_id,
-                quantity_ordered=total_quantity,
-                unit_cost=part.unit_cost or 0.0,
-                line_number=line_number,
-                expected_delivery_date=vendor_info.get('expected_delivery_date'),
-                status='Pending',
-                created_by_id=user_id
+        Returns:
+            List of PurchaseOrderHeader objects
+        """
+        if not recommendations:
+            return []
+        
+        vendor_infos = vendor_infos or {}
+        grouped = PurchaseOrderManager.group_recommendations_by_vendor(recommendations)
+        
+        # Load quantities for every linked demand in one query
+        demand_ids = {demand_id for rec in recommendations for demand_id in rec.get('demands', [])}
+        demand_quantities = {}
+        if demand_ids:
+            demand_quantities = dict(
+                db.session.query(PartDemand.id, PartDemand.quantity_required)
+                .filter(PartDemand.id.in_(demand_ids))
+                .all()
             )
-            
-            db.session.add(po_line)
-            db.session.flush()
-            
-            # Link demands to this line
-            for demand in demands:
-                PurchaseOrderManager.link_part_demand(
-                    po_line.id, demand.id, demand.quantity_required, user_id
-                )
-            
-            line_number += 1
         
-        # Calculate total
-        po_header.calculate_total()
+        po_numbers = PurchaseOrderNumberManager.get_next_po_numbers(len(grouped))
         
-        # Create event for tracking
-        event = Event(
-            event_type='Purchase Order Created',
-            event_date=datetime.utcnow(),
-            description=f"Purchase Order {po_number} created for {vendor_info.get('name')}",
-            major_location_id=location_id,
-            created_by_id=user_id
-        )
-        db.session.add(event)
-        db.session.flush()
+        orders = []
+        for po_number, (vendor_name, vendor_recommendations) in zip(po_numbers, grouped.items()):
+            vendor_info = dict(vendor_infos.get(vendor_name, {}))
+            vendor_info.setdefault('name', vendor_name)
+            
+            line_specs = [
+                {
+                    'part_id': rec['part_id'],
+                    'quantity': rec['recommended_order_qty'],
+                    'unit_cost': rec.get('unit_cost') or 0.0,
+                    'demands': [
+                        (demand_id, demand_quantities[demand_id])
+                        for demand_id in rec.get('demands', [])
+                        if demand_id in demand_quantities
+                    ]
+                }
+                for rec in vendor_recommendations
+            ]
+            orders.append((po_number, vendor_info, line_specs))
+        
+        po_headers = PurchaseOrderManager._build_purchase_orders(orders, user_id, location_id)
         
-        po_header.event_id = event.id
         db.session.commit()
         
-        return po_header
+        return po_headers
+    
+    @staticmethod
+    def group_recommendations_by_vendor(recommendations):
+        """
+        Group purchase recommendations by vendor name
+        
+        Args:
+            recommendations: List of recommendation dicts
+            
+        Returns:
+            Dict mapping vendor name to list of recommendations
+        """
+        grouped = {}
+        for rec in recommendations:
+            vendor_name = rec.get('supplier') or PurchaseOrderManager.UNASSIGNED_VENDOR
+            if vendor_name not in grouped:
+                grouped[vendor_name] = []
+            grouped[vendor_name].append(rec)
+        
+        return grouped
     
     @staticmethod
     def add_line(po_id, part_id, quantity, unit_cost, user_id, expected_date=None, notes=None):
@@ -401,6 +447,113 @@ class PurchaseOrderManager:
         
         return grouped
     
+    @staticmethod
+    def _get_unit_costs(part_ids):
+        """
+        Load unit costs for a set of parts in one query
+        
+        Returns:
+            Dict mapping part_id to unit_cost
+        """
+        part_ids = list(part_ids)
+        if not part_ids:
+            return {}
+        return dict(
+            db.session.query(Part.id, Part.unit_cost)
+            .filter(Part.id.in_(part_ids))
+            .all()
+        )
+    
+    @staticmethod
+    def _build_purchase_orders(orders, user_id, location_id=None):
+        """
+        Insert purchase orders with their lines, demand links and creation events
+        
+        Each table is written with one batched flush/INSERT regardless of how many
+        orders or lines are given. Does not commit.
+        
+        Args:
+            orders: List of (po_number, vendor_info, line_specs) tuples where each
+                line spec is a dict with 'part_id', 'quantity', 'unit_cost' and
+                'demands' (list of (part_demand_id, quantity) tuples)
+            user_id: User creating the POs
+            location_id: Delivery location (optional)
+            
+        Returns:
+            List of PurchaseOrderHeader objects
+        """
+        now = datetime.utcnow()
+        
+        # Headers and their creation events
+        po_headers = []
+        for po_number, vendor_info, line_specs in orders:
+            po_header = PurchaseOrderHeader(
+                po_number=po_number,
+                vendor_name=vendor_info.get('name'),
+                vendor_contact=vendor_info.get('contact'),
+                order_date=date.today(),
+                expected_delivery_date=vendor_info.get('expected_delivery_date'),
+                shipping_cost=vendor_info.get('shipping_cost', 0.0),
+                tax_amount=vendor_info.get('tax_amount', 0.0),
+                notes=vendor_info.get('notes'),
+                major_location_id=location_id,
+                status='Draft',
+                created_by_id=user_id
+            )
+            po_header.total_cost = (
+                sum(spec['quantity'] * spec['unit_cost'] for spec in line_specs)
+                + (po_header.shipping_cost or 0)
+                + (po_header.tax_amount or 0)
+            )
+            po_header.event = Event(
+                event_type='Purchase Order Created',
+                timestamp=now,
+                description=f"Purchase Order {po_number} created for {vendor_info.get('name')}",
+                user_id=user_id,
+                major_location_id=location_id,
+                created_by_id=user_id
+            )
+            po_headers.append(po_header)
+        
+        db.session.add_all(po_headers)
+        db.session.flush()  # Get PO IDs
+        
+        # Lines for every PO
+        po_lines = []
+        line_demands = []
+        for po_header, (po_number, vendor_info, line_specs) in zip(po_headers, orders):
+            for line_number, spec in enumerate(line_specs, start=1):
+                po_lines.append(PurchaseOrderLine(
+                    purchase_order_id=po_header.id,
+                    part_id=spec['part_id'],
+                    quantity_ordered=spec['quantity'],
+                    unit_cost=spec['unit_cost'],
+                    line_number=line_number,
+                    expected_delivery_date=vendor_info.get('expected_delivery_date'),
+                    status='Pending',
+                    created_by_id=user_id
+                ))
+                line_demands.append(spec['demands'])
+        
+        db.session.add_all(po_lines)
+        db.session.flush()  # Get line IDs
+        
+        # Demand links in one multi-row INSERT
+        link_rows = [
+            {
+                'part_demand_id': part_demand_id,
+                'purchase_order_line_id': po_line.id,
+                'quantity_allocated': quantity,
+                'created_by_id': user_id
+            }
+            for po_line, demands in zip(po_lines, line_demands)
+            for part_demand_id, quantity in demands
+        ]
+        if link_rows:
+            db.session.execute(insert(PartDemandPurchaseOrderLine), link_rows)
+        
+        return po_headers
+    
     @staticmethod
     def _generate_po_number():
         """
@@ -409,24 +562,4 @@ class PurchaseOrderManager:
         Returns:
             String PO number
         """
-        # Get current date
-        today = date.today()
-        prefix = f"PO-{today.year}{today.month:02d}"
-        
-        # Find highest number for this month
-        last_po = PurchaseOrderHeader.query.filter(
-            PurchaseOrderHeader.po_number.like(f"{prefix}%")
-        ).order_by(PurchaseOrderHeader.po_number.desc()).first()
-        
-        if last_po:
-            # Extract number and increment
-            try:
-                last_num = int(last_po.po_number.split('-')[-1])
-                next_num = last_num + 1
-            except (ValueError, IndexError):
-                next_num = 1
-        else:
-            next_num = 1
-        
-        return f"{prefix}-{next_num:04d}"
-
+        return PurchaseOrderNumberManager.get_next_po_number()
@@ -0,0 +1,306 @@
+"""
+ReorderForecastManager - Consumption-based reorder point forecasting
+
+Responsibilities:
+- Build daily consumption series per part/location from Issue movements
+- Estimate supplier lead time per part from purchase order arrivals
+- Compute moving-average and exponentially smoothed daily demand
+- Compute safety stock, reorder points and order-up-to levels
+- Cache results in PartStockForecast for recommendations and low-stock views
+
+Series are built from one aggregated query and all forecast math runs
+vectorized over every part/location at once with NumPy.
+"""
+
+from datetime import datetime, timedelta
+import numpy as np
+from sqlalchemy import func, insert
+from app import db
+from app.data.inventory.base import (
+    InventoryMovement,
+    PartArrival,
+    PurchaseOrderLine,
+    PurchaseOrderHeader,
+    PartStockForecast
+)
+from app.logger import get_logger
+
+logger = get_logger("asset_management.buisness.inventory.reorder_forecast")
+
+
+class ReorderForecastManager:
+    """Forecasts part consumption and tunes reorder points"""
+
+    # History window used to build consumption series
+    WINDOW_DAYS = 90
+
+    # Trailing days used for the simple moving average
+    MOVING_AVERAGE_DAYS = 28
+
+    # Exponential smoothing factor (higher = reacts faster to recent demand)
+    SMOOTHING_ALPHA = 0.1
+
+    # z-score for the target service level (1.65 ~ 95%)
+    SERVICE_LEVEL_Z = 1.65
+
+    # Lead time used for parts with no purchase history
+    DEFAULT_LEAD_TIME_DAYS = 7.0
+
+    # Days of demand ordered on top of the reorder point
+    REVIEW_PERIOD_DAYS = 14.0
+
+    @staticmethod
+    def build_consumption_series(window_days=None, as_of=None):
+        """
+        Build daily consumption series per (part, location)
+
+        Args:
+            window_days: Number of days of history (default WINDOW_DAYS)
+            as_of: Last day of the window (default today)
+
+        Returns:
+            Tuple of (keys, series) where keys is a list of (part_id, location_id)
+            and series is a float array of shape (len(keys), window_days),
+            oldest day first
+        """
+        window_days = window_days or ReorderForecastManager.WINDOW_DAYS
+        end_day = (as_of or datetime.utcnow()).date()
+        start_day = end_day - timedelta(days=window_days - 1)
+
+        day_column = func.date(InventoryMovement.movement_date)
+        rows = db.session.query(
+            InventoryMovement.part_id,
+            InventoryMovement.major_location_id,
+            day_column.label('day'),
+            func.sum(InventoryMovement.quantity).label('quantity')
+        ).filter(
+            InventoryMovement.movement_type == 'Issue',
+            InventoryMovement.movement_date >= datetime.combine(start_day, datetime.min.time()),
+            InventoryMovement.movement_date < datetime.combine(end_day + timedelta(days=1), datetime.min.time())
+        ).group_by(
+            InventoryMovement.part_id,
+            InventoryMovement.major_location_id,
+            day_column
+        ).all()
+
+        key_index = {}
+        row_indexes = np.empty(len(rows), dtype=np.int64)
+        day_indexes = np.empty(len(rows), dtype=np.int64)
+        quantities = np.empty(len(rows), dtype=np.float64)
+        for i, row in enumerate(rows):
+            key = (row.part_id, row.major_location_id)
+            row_indexes[i] = key_index.setdefault(key, len(key_index))
+            day_indexes[i] = (datetime.strptime(row.day, '%Y-%m-%d').date() - start_day).days
+            # Issue quantities are stored negative
+            quantities[i] = -(row.quantity or 0.0)
+
+        series = np.zeros((len(key_index), window_days), dtype=np.float64)
+        np.add.at(series, (row_indexes, day_indexes), quantities)
+        np.clip(series, 0.0, None, out=series)
+
+        return list(key_index), series
+
+    @staticmethod
+    def rollup_fleet_wide(keys, series):
+        """
+        Sum per-location series into one series per part
+
+        Returns:
+            Tuple of (keys, series) with keys as (part_id, None)
+        """
+        part_index = {}
+        rows = np.array([part_index.setdefault(part_id, len(part_index)) for part_id, _ in keys], dtype=np.int64)
+        fleet_series = np.zeros((len(part_index), series.shape[1]), dtype=np.float64)
+        if len(rows):
+            np.add.at(fleet_series, rows, series)
+        return [(part_id, None) for part_id in part_index], fleet_series
+
+    @staticmethod
+    def get_lead_times():
+        """
+        Average days from PO order date to arrival per part
+
+        Returns:
+            Dict mapping part_id to lead time in days
+        """
+        rows = db.session.query(
+            PartArrival.part_id,
+            func.avg(func.julianday(PartArrival.received_date) - func.julianday(PurchaseOrderHeader.order_date))
+        ).join(
+            PurchaseOrderLine, PartArrival.purchase_order_line_id == PurchaseOrderLine.id
+        ).join(
+            PurchaseOrderHeader, PurchaseOrderLine.purchase_order_id == PurchaseOrderHeader.id
+        ).group_by(PartArrival.part_id).all()
+
+        return {part_id: float(days) for part_id, days in rows if days is not None and days >= 0}
+
+    @staticmethod
+    def compute_forecasts(series, lead_times, moving_average_days=None, alpha=None,
+                          service_level_z=None, review_period_days=None):
+        """
+        Compute demand and reorder policy for every series at once
+
+        Args:
+            series: Array of shape (n, days), oldest day first
+            lead_times: Array of shape (n,) with lead time in days
+            moving_average_days: Trailing days for the moving average
+            alpha: Exponential smoothing factor
+            service_level_z: Safety stock z-score
+            review_period_days: Days of demand to order on top of the reorder point
+
+        Returns:
+            Dict of arrays of shape (n,): total_issued, moving_average_demand,
+            smoothed_demand, demand_std_dev, safety_stock, reorder_point,
+            order_up_to_level
+        """
+        moving_average_days = moving_average_days or ReorderForecastManager.MOVING_AVERAGE_DAYS
+        alpha = alpha or ReorderForecastManager.SMOOTHING_ALPHA
+        service_level_z = service_level_z if service_level_z is not None else ReorderForecastManager.SERVICE_LEVEL_Z
+        review_period_days = review_period_days if review_period_days is not None else ReorderForecastManager.REVIEW_PERIOD_DAYS
+
+        days = series.shape[1]
+
+        # Exponential smoothing as a weighted sum: newest day weighs alpha, then decays
+        weights = alpha * (1.0 - alpha) ** np.arange(days - 1, -1, -1, dtype=np.float64)
+        weights /= weights.sum()
+
+        smoothed = series @ weights
+        moving_average = series[:, -min(moving_average_days, days):].mean(axis=1)
+        std_dev = series.std(axis=1)
+
+        safety_stock = service_level_z * std_dev * np.sqrt(lead_times)
+        reorder_point = smoothed * lead_times + safety_stock
+        order_up_to_level = reorder_point + smoothed * review_period_days
+
+        return {
+            'total_issued': series.sum(axis=1),
+            'moving_average_demand': moving_average,
+            'smoothed_demand': smoothed,
+            'demand_std_dev': std_dev,
+            'safety_stock': safety_stock,
+            'reorder_point': reorder_point,
+            'order_up_to_level': order_up_to_level
+        }
+
+    @staticmethod
+    def refresh_forecasts(window_days=None, as_of=None, user_id=None):
+        """
+        Recompute all forecasts and replace the PartStockForecast cache
+
+        Forecasts are stored per (part, location) and fleet-wide per part
+        (null location). Parts with no issues in the window get no row, so
+        their hand-entered minimum stock level stays in effect.
+
+        Args:
+            window_days: Number of days of history (default WINDOW_DAYS)
+            as_of: Last day of the window (default today)
+            user_id: User refreshing the forecasts (optional)
+
+        Returns:
+            int: Number of forecast rows written
+        """
+        window_days = window_days or ReorderForecastManager.WINDOW_DAYS
+        keys, series = ReorderForecastManager.build_consumption_series(window_days, as_of)
+        fleet_keys, fleet_series = ReorderForecastManager.rollup_fleet_wide(keys, series)
+
+        all_keys = keys + fleet_keys
+        all_series = np.vstack([series, fleet_series]) if all_keys else series
+
+        part_lead_times = ReorderForecastManager.get_lead_times()
+        lead_times = np.array(
+            [part_lead_times.get(part_id, ReorderForecastManager.DEFAULT_LEAD_TIME_DAYS) for part_id, _ in all_keys],
+            dtype=np.float64
+        )
+
+        results = ReorderForecastManager.compute_forecasts(all_series, lead_times)
+
+        computed_at = datetime.utcnow()
+        rows = [
+            {
+                'part_id': part_id,
+                'major_location_id': location_id,
+                'computed_at': computed_at,
+                'window_days': window_days,
+                'lead_time_days': float(lead_times[i]),
+                'created_by_id': user_id,
+                **{name: float(values[i]) for name, values in results.items()}
+            }
+            for i, (part_id, location_id) in enumerate(all_keys)
+        ]
+
+        try:
+            db.session.query(PartStockForecast).delete(synchronize_session=False)
+            if rows:
+                db.session.execute(insert(PartStockForecast), rows)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        logger.info(f"Refreshed {len(rows)} part stock forecasts over {window_days} days")
+        return len(rows)
+
+    @staticmethod
+    def get_forecast_map(part_ids=None, location_id=None):
+        """
+        Get cached forecasts keyed by part ID
+
+        Args:
+            part_ids: Limit to these parts (optional)
+            location_id: Location to read (default None = fleet-wide forecasts)
+
+        Returns:
+            Dict mapping part_id to PartStockForecast
+        """
+        query = PartStockForecast.query.filter(PartStockForecast.major_location_id.is_(None)) \
+            if location_id is None else PartStockForecast.query.filter_by(major_location_id=location_id)
+
+        if part_ids is not None:
+            part_ids = list(part_ids)
+            if not part_ids:
+                return {}
+            query = query.filter(PartStockForecast.part_id.in_(part_ids))
+
+        return {forecast.part_id: forecast for forecast in query.all()}
+
+    @staticmethod
+    def reorder_threshold(part_model):
+        """
+        SQL expression for the effective reorder threshold
+
+        Uses the cached forecast reorder point when one exists and falls back
+        to the part's hand-entered minimum stock level. Callers must outer join
+        PartStockForecast first (see join_forecast()).
+
+        Args:
+            part_model: Part model class
+
+        Returns:
+            SQL expression
+        """
+        return func.coalesce(PartStockForecast.reorder_point, part_model.minimum_stock_level)
+
+    @staticmethod
+    def join_forecast(query, part_id_column, location_id_column=None):
+        """
+        Outer join PartStockForecast onto a query
+
+        Args:
+            query: Query to extend
+            part_id_column: Column holding the part ID
+            location_id_column: Column holding the location ID (None = fleet-wide forecast)
+
+        Returns:
+            Query
+        """
+        if location_id_column is None:
+            condition = db.and_(
+                PartStockForecast.part_id == part_id_column,
+                PartStockForecast.major_location_id.is_(None)
+            )
+        else:
+            condition = db.and_(
+                PartStockForecast.part_id == part_id_column,
+                PartStockForecast.major_location_id == location_id_column
+            )
+        return query.outerjoin(PartStockForecast, condition)
@@ -0,0 +1,282 @@
+"""
+StockReconciliationManager - Keeps Part.current_stock_level in line with inventory
+
+Responsibilities:
+- Find parts touched since the last reconciliation watermark
+- Recompute per-part totals from ActiveInventory and the InventoryMovement ledger
+- Report drift between Part.current_stock_level and ActiveInventory
+- Optionally correct drifted Part.current_stock_level values
+- Run reconciliation off-request on a background thread
+
+ActiveInventory is treated as authoritative for on-hand quantity. The signed
+InventoryMovement ledger total is reported alongside it, but never used to
+correct Part values because ActiveInventory clamps at zero.
+"""
+
+import threading
+from datetime import datetime
+from sqlalchemy import func, select, union, update
+from app import db
+from app.data.inventory.base import (
+    ActiveInventory,
+    InventoryMovement,
+    StockReconciliationRun
+)
+from app.data.core.supply.part import Part
+from app.logger import get_logger
+
+logger = get_logger("asset_management.buisness.inventory.stock_reconciliation")
+
+
+class StockReconciliationManager:
+    """Reconciles denormalized Part stock levels with inventory tables"""
+
+    # Differences smaller than this are treated as floating point noise
+    TOLERANCE = 1e-6
+
+    # Max part IDs per IN clause when aggregating
+    CHUNK_SIZE = 500
+
+    # Guards against overlapping background runs
+    _background_lock = threading.Lock()
+
+    @staticmethod
+    def get_last_watermark():
+        """
+        Get the watermark of the most recent completed run
+
+        Returns:
+            datetime or None if no run has completed
+        """
+        return db.session.query(func.max(StockReconciliationRun.watermark)).filter(
+            StockReconciliationRun.status == 'Complete'
+        ).scalar()
+
+    @staticmethod
+    def get_touched_part_ids(since=None):
+        """
+        Get IDs of parts whose stock could have changed since a watermark
+
+        A part is touched if it has a movement, an active inventory row or its
+        own row updated after since. With no watermark every part is returned.
+
+        Args:
+            since: Watermark datetime (optional)
+
+        Returns:
+            List of part IDs
+        """
+        if since is None:
+            return [row[0] for row in db.session.query(Part.id).all()]
+
+        touched = union(
+            select(InventoryMovement.part_id).where(InventoryMovement.created_at > since),
+            select(ActiveInventory.part_id).where(ActiveInventory.updated_at > since),
+            select(Part.id).where(Part.updated_at > since)
+        )
+        return [row[0] for row in db.session.execute(touched).all()]
+
+    @staticmethod
+    def compute_stock_totals(part_ids):
+        """
+        Recompute stock totals for parts with grouped aggregates
+
+        Runs three grouped queries per chunk of part IDs regardless of how many
+        locations or movements each part has.
+
+        Args:
+            part_ids: Iterable of part IDs
+
+        Returns:
+            Dict mapping part_id to dict with 'recorded', 'active_inventory'
+            and 'ledger' totals
+        """
+        part_ids = list(part_ids)
+        totals = {}
+
+        for start in range(0, len(part_ids), StockReconciliationManager.CHUNK_SIZE):
+            chunk = part_ids[start:start + StockReconciliationManager.CHUNK_SIZE]
+
+            recorded = dict(
+                db.session.query(Part.id, Part.current_stock_level)
+                .filter(Part.id.in_(chunk))
+                .all()
+            )
+            active = dict(
+                db.session.query(ActiveInventory.part_id, func.sum(ActiveInventory.quantity_on_hand))
+                .filter(ActiveInventory.part_id.in_(chunk))
+                .group_by(ActiveInventory.part_id)
+                .all()
+            )
+            ledger = dict(
+                db.session.query(InventoryMovement.part_id, func.sum(InventoryMovement.quantity))
+                .filter(InventoryMovement.part_id.in_(chunk))
+                .group_by(InventoryMovement.part_id)
+                .all()
+            )
+
+            for part_id, recorded_level in recorded.items():
+                totals[part_id] = {
+                    'recorded': recorded_level or 0.0,
+                    'active_inventory': active.get(part_id) or 0.0,
+                    'ledger': ledger.get(part_id) or 0.0
+                }
+
+        return totals
+
+    @staticmethod
+    def find_drift(totals):
+        """
+        Build drift entries for parts whose totals disagree
+
+        Args:
+            totals: Dict from compute_stock_totals()
+
+        Returns:
+            List of dicts, one per drifted part
+        """
+        tolerance = StockReconciliationManager.TOLERANCE
+        drift = []
+        for part_id, part_totals in totals.items():
+            stock_drift = part_totals['recorded'] - part_totals['active_inventory']
+            ledger_drift = part_totals['ledger'] - part_totals['active_inventory']
+            if abs(stock_drift) > tolerance or abs(ledger_drift) > tolerance:
+                drift.append({
+                    'part_id': part_id,
+                    'recorded': part_totals['recorded'],
+                    'active_inventory': part_totals['active_inventory'],
+                    'ledger': part_totals['ledger'],
+                    'stock_drift': stock_drift,
+                    'ledger_drift': ledger_drift
+                })
+        return drift
+
+    @staticmethod
+    def reconcile(since=None, incremental=True, auto_correct=False, user_id=None):
+        """
+        Reconcile Part.current_stock_level against inventory
+
+        Args:
+            since: Only check parts touched after this datetime (optional,
+                defaults to the last completed run's watermark)
+            incremental: When False, check every part regardless of watermark
+            auto_correct: Set drifted Part.current_stock_level to the
+                ActiveInventory total
+            user_id: User running the reconciliation (optional)
+
+        Returns:
+            StockReconciliationRun object
+        """
+        if incremental and since is None:
+            since = StockReconciliationManager.get_last_watermark()
+        elif not incremental:
+            since = None
+
+        # Captured before reading so concurrent changes are picked up next run
+        run = StockReconciliationRun(
+            since=since,
+            watermark=datetime.utcnow(),
+            status='Running',
+            auto_correct=auto_correct,
+            created_by_id=user_id
+        )
+        db.session.add(run)
+        db.session.commit()
+
+        try:
+            part_ids = StockReconciliationManager.get_touched_part_ids(since)
+            totals = StockReconciliationManager.compute_stock_totals(part_ids)
+            drift = StockReconciliationManager.find_drift(totals)
+
+            corrected = 0
+            if auto_correct:
+                corrections = [
+                    {
+                        'id': entry['part_id'],
+                        'current_stock_level': entry['active_inventory'],
+                        'updated_by_id': user_id
+                    }
+                    for entry in drift
+                    if abs(entry['stock_drift']) > StockReconciliationManager.TOLERANCE
+                ]
+                if corrections:
+                    db.session.execute(update(Part), corrections)
+                corrected = len(corrections)
+
+            run.parts_checked = len(totals)
+            run.drift_count = len(drift)
+            run.corrected_count = corrected
+            run.drift_report = drift
+            run.status = 'Complete'
+            run.finished_at = datetime.utcnow()
+            db.session.commit()
+
+            logger.info(
+                f"Stock reconciliation {run.id}: checked {run.parts_checked} parts, "
+                f"{run.drift_count} drifted, {run.corrected_count} corrected"
+            )
+        except Exception as e:
+            db.session.rollback()
+            run.status = 'Failed'
+            run.error_message = str(e)
+            run.finished_at = datetime.utcnow()
+            db.session.commit()
+            logger.error(f"Stock reconciliation {run.id} failed: {e}")
+
+        return run
+
+    @staticmethod
+    def start_background_reconciliation(app, incremental=True, auto_correct=False, user_id=None):
+        """
+        Run reconciliation on a daemon thread under the app context
+
+        Returns immediately. Only one background run is allowed at a time.
+
+        Args:
+            app: Flask application (use current_app._get_current_object() in routes)
+            incremental: When False, check every part
+            auto_correct: Correct drifted Part values
+            user_id: User starting the run (optional)
+
+        Returns:
+            bool: True if a run was started, False if one is already running
+        """
+        if not StockReconciliationManager._background_lock.acquire(blocking=False):
+            return False
+
+        def run_job():
+            try:
+                with app.app_context():
+                    StockReconciliationManager.reconcile(
+                        incremental=incremental,
+                        auto_correct=auto_correct,
+                        user_id=user_id
+                    )
+            except Exception as e:
+                logger.error(f"Background stock reconciliation failed: {e}")
+            finally:
+                StockReconciliationManager._background_lock.release()
+
+        thread = threading.Thread(target=run_job, name='stock-reconciliation', daemon=True)
+        thread.start()
+        return True
+
+    @staticmethod
+    def is_background_running():
+        """Check if a background reconciliation is in progress"""
+        return StockReconciliationManager._background_lock.locked()
+
+    @staticmethod
+    def get_recent_runs(limit=10):
+        """
+        Get the most recent reconciliation runs
+
+        Args:
+            limit: Max number of runs
+
+        Returns:
+            List of StockReconciliationRun objects
+        """
+        return StockReconciliationRun.query.order_by(
+            StockReconciliationRun.started_at.desc()
+        ).limit(limit).all()
@@ -7,11 +7,14 @@ Organization:
 - templates/ : Maintenance blueprints (TemplateActionSet, TemplateActionItem, etc.)
 - proto_templates/ : Reusable library (ProtoActionItem, etc.)
 - factories/ : Factory classes for creating maintenance from templates
+- kpi/ : KPI rollups maintained from status transitions
+- technician/ : Per-user technician dashboard cache
 """
 
 # Base maintenance
 from app.buisness.maintenance.base import (
     MaintenanceActionSetStruct,
+    MaintenanceEventGraph,
     ActionStruct,
     PartDemandStruct,
     ActionToolStruct,
@@ -28,6 +31,8 @@ from app.buisness.maintenance.templates import (
     TemplateActionToolStruct,
     TemplateMaintenanceContext,
     TemplateActionContext,
+    TemplateBlueprint,
+    TemplateBlueprintCache,
 )
 
 # Proto template maintenance
@@ -43,9 +48,20 @@ from app.buisness.maintenance.factories import (
     MaintenanceFactory,
 )
 
+# KPI rollups
+from app.buisness.maintenance.kpi import (
+    MaintenanceKpiRollupManager,
+)
+
+# Technician dashboards
+from app.buisness.maintenance.technician import (
+    TechnicianDashboardCache,
+)
+
 __all__ = [
     # Base
     'MaintenanceActionSetStruct',
+    'MaintenanceEventGraph',
     'ActionStruct',
     'PartDemandStruct',
     'ActionToolStruct',
@@ -59,6 +75,8 @@ __all__ = [
     'TemplateActionToolStruct',
     'TemplateMaintenanceContext',
     'TemplateActionContext',
+    'TemplateBlueprint',
+    'TemplateBlueprintCache',
     # Proto
     'ProtoActionItemStruct',
     'ProtoActionContext',
@@ -66,4 +84,8 @@ __all__ = [
     'MaintenanceActionSetFactory',
     'ActionFactory',
     'MaintenanceFactory',
+    # KPI
+    'MaintenanceKpiRollupManager',
+    # Technician
+    'TechnicianDashboardCache',
 ]
@@ -4,6 +4,7 @@ Contains structs, contexts, and business logic for actual maintenance work (base
 """
 
 from app.buisness.maintenance.base.maintenance_action_set_struct import MaintenanceActionSetStruct
+from app.buisness.maintenance.base.maintenance_event_graph import MaintenanceEventGraph
 from app.buisness.maintenance.base.action_struct import ActionStruct
 from app.buisness.maintenance.base.part_demand_struct import PartDemandStruct
 from app.buisness.maintenance.base.action_tool_struct import ActionToolStruct
@@ -13,6 +14,7 @@ from app.buisness.maintenance.base.maintenance_plan_context import MaintenancePl
 
 __all__ = [
     'MaintenanceActionSetStruct',
+    'MaintenanceEventGraph',
     'ActionStruct',
     'PartDemandStruct',
     'ActionToolStruct',
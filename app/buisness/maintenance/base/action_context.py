@@ -6,7 +6,11 @@ Provides action lifecycle management, statistics, and completion tracking.
 
 from typing import List, Optional, Union, Dict, Any
 from datetime import datetime
+from sqlalchemy import update
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.orm.attributes import set_committed_value
 from app import db
+from app.utils.ordering_keys import key_for_insert, spaced_keys
 from app.buisness.maintenance.base.action_struct import ActionStruct
 from app.data.maintenance.base.actions import Action
 from app.data.maintenance.base.part_demands import PartDemand
@@ -314,7 +318,8 @@ class ActionContext:
     def reorder_action(self, new_sequence_order: int) -> 'ActionContext':
         """
         Reorder this action to a new sequence position within its maintenance action set.
-        Shifts other actions as needed.
+        Only this action's order key is written; sibling keys are respaced only
+        when the neighbours at the new position have no free key between them.
         
         Args:
             new_sequence_order: New sequence order position (1-based)
@@ -328,44 +333,61 @@ class ActionContext:
         if new_sequence_order < 1:
             raise ValueError("Sequence order must be at least 1")
         
-        current_order = self.action.sequence_order
-        maintenance_action_set_id = self.action.maintenance_action_set_id
+        # Sibling keys only - avoids loading every action with its part demands and tools
+        siblings = db.session.query(Action.id, Action.order_key).filter(
+            Action.maintenance_action_set_id == self.action.maintenance_action_set_id
+        ).order_by(Action.order_key, Action.id).all()
         
-        # Get all actions in the same maintenance action set, ordered by sequence_order
-        all_actions = Action.query.filter_by(
-            maintenance_action_set_id=maintenance_action_set_id
-        ).order_by(Action.sequence_order).all()
-        
-        max_order = len(all_actions)
+        max_order = len(siblings)
         if new_sequence_order > max_order:
             raise ValueError(f"Sequence order cannot exceed {max_order} (number of actions in set)")
         
+        ordered_ids = [row.id for row in siblings]
+        current_order = ordered_ids.index(self.action.id) + 1
+        
         # If order hasn't changed, do nothing
         if current_order == new_sequence_order:
             return self
         
-        # Remove this action from the list temporarily
-        other_actions = [a for a in all_actions if a.id != self.action.id]
+        others = [row for row in siblings if row.id != self.action.id]
+        new_key = key_for_insert([row.order_key for row in others], new_sequence_order - 1)
         
-        # Reorder: shift actions up or down
-        if new_sequence_order < current_order:
-            # Moving earlier: shift actions from new_position to current_position-1 forward
-            for action in other_actions:
-                if new_sequence_order <= action.sequence_order < current_order:
-                    action.sequence_order += 1
+        if new_key is None:
+            # No gap left between the neighbours - respace the whole set
+            ordered_ids = [row.id for row in others]
+            ordered_ids.insert(new_sequence_order - 1, self.action.id)
+            self.rebalance_order_keys(ordered_ids)
         else:
-            # Moving later: shift actions from current_position+1 to new_position backward
-            for action in other_actions:
-                if current_order < action.sequence_order <= new_sequence_order:
-                    action.sequence_order -= 1
-        
-        # Set new order for this action
-        self.action.sequence_order = new_sequence_order
+            self.action.order_key = new_key
         
         db.session.commit()
         self.refresh()
         return self
     
+    @staticmethod
+    def rebalance_order_keys(ordered_action_ids: List[int]) -> List[int]:
+        """
+        Respace the order keys of actions in the given order (does not commit).
+        
+        Args:
+            ordered_action_ids: Action IDs in their intended order
+            
+        Returns:
+            List of assigned keys, parallel to ordered_action_ids
+        """
+        keys = spaced_keys(len(ordered_action_ids))
+        if ordered_action_ids:
+            db.session.execute(
+                update(Action),
+                [{'id': action_id, 'order_key': key} for action_id, key in zip(ordered_action_ids, keys)]
+            )
+            # Bulk UPDATE by primary key bypasses the identity map
+            for action_id, key in zip(ordered_action_ids, keys):
+                action = db.session.identity_map.get(identity_key(Action, action_id))
+                if action is not None:
+                    set_committed_value(action, 'order_key', key)
+        return keys
+    
     def edit_action(
         self,
         status: Optional[str] = None,
@@ -18,12 +18,14 @@ class ActionStruct:
     For business logic: Use ActionContext
     """
     
-    def __init__(self, action: Union[Action, int]):
+    def __init__(self, action: Union[Action, int], sequence_order: Optional[int] = None):
         """
         Initialize ActionStruct with Action instance or ID.
         
         Args:
             action: Action instance or ID
+            sequence_order: Position among sibling actions, when already known
+                (see MaintenanceActionSetStruct.action_structs)
         """
         if isinstance(action, int):
             self._action = Action.query.get_or_404(action)
@@ -33,6 +35,7 @@ class ActionStruct:
             self._action_id = action.id
         
         # Cache for lazy loading
+        self._sequence_order = sequence_order
         self._part_demands = None
         self._action_tools = None
     
@@ -99,8 +102,10 @@ class ActionStruct:
     
     @property
     def sequence_order(self) -> int:
-        """Get the sequence order"""
-        return self._action.sequence_order
+        """Get the 1-based position among sibling actions"""
+        if self._sequence_order is None:
+            self._sequence_order = self._action.sequence_order
+        return self._sequence_order
     
     @property
     def maintenance_action_set_id(self) -> int:
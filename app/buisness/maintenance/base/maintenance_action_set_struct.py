@@ -7,10 +7,12 @@ Provides cached access and convenience methods - NO business logic.
 from typing import List, Optional, Union, Dict, Any
 from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
 from app.data.maintenance.base.actions import Action
+from app.buisness.maintenance.base.action_struct import ActionStruct
 from app.data.maintenance.base.part_demands import PartDemand
 from app.data.maintenance.base.action_tools import ActionTool
 from app.data.maintenance.base.maintenance_delays import MaintenanceDelay
 from app.data.core.event_info.event import Event
+from app.buisness.maintenance.base.maintenance_event_graph import MaintenanceEventGraph
 
 
 class MaintenanceActionSetStruct:
@@ -36,6 +38,7 @@ class MaintenanceActionSetStruct:
         
         # Cache for lazy loading
         self._actions = None
+        self._action_positions = None
         self._part_demands = None
         self._action_tools = None
         self._delays = None
@@ -75,6 +78,24 @@ class MaintenanceActionSetStruct:
             return cls(maintenance_action_set)
         return None
     
+    @classmethod
+    def from_event_graph(cls, event_id: int) -> Optional['MaintenanceActionSetStruct']:
+        """
+        Create MaintenanceActionSetStruct from event ID with the full event graph
+        (actions, part demands, tools, users, delays, event) eager loaded.
+        Use for pages that render the whole event.
+        
+        Args:
+            event_id: Event ID
+            
+        Returns:
+            MaintenanceActionSetStruct instance or None if not found
+        """
+        maintenance_action_set = MaintenanceEventGraph.load(event_id)
+        if maintenance_action_set:
+            return cls(maintenance_action_set)
+        return None
+    
     
     @property
     def maintenance_action_set(self) -> MaintenanceActionSet:
@@ -106,7 +127,7 @@ class MaintenanceActionSetStruct:
     @property
     def actions(self) -> List[Action]:
         """
-        Get all actions for this maintenance action set, ordered by sequence_order.
+        Get all actions for this maintenance action set, ordered by order_key.
         
         Returns:
             List of Action instances
@@ -114,10 +135,33 @@ class MaintenanceActionSetStruct:
         if self._actions is None:
             self._actions = sorted(
                 self._maintenance_action_set.actions,
-                key=lambda a: a.sequence_order
+                key=lambda a: (a.order_key, a.id)
             )
         return self._actions
     
+    @property
+    def action_positions(self) -> Dict[int, int]:
+        """
+        1-based position of each action by action ID, computed once from the
+        sorted actions (Action.sequence_order recomputes it per read).
+        
+        Returns:
+            Dictionary mapping action ID to position
+        """
+        if self._action_positions is None:
+            self._action_positions = {action.id: position for position, action in enumerate(self.actions, 1)}
+        return self._action_positions
+    
+    @property
+    def action_structs(self) -> List[ActionStruct]:
+        """
+        ActionStructs for the actions in order, with their positions set.
+        
+        Returns:
+            List of ActionStruct instances
+        """
+        return [ActionStruct(action, sequence_order=position) for position, action in enumerate(self.actions, 1)]
+    
     @property
     def part_demands(self) -> List[PartDemand]:
         """
@@ -219,6 +263,7 @@ class MaintenanceActionSetStruct:
         from app import db
         db.session.refresh(self._maintenance_action_set)
         self._actions = None
+        self._action_positions = None
         self._part_demands = None
         self._action_tools = None
         self._delays = None
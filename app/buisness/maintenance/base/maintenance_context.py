@@ -13,6 +13,9 @@ from app.data.maintenance.base.actions import Action
 from app.data.maintenance.base.maintenance_delays import MaintenanceDelay
 from app.data.core.event_info.event import Event
 from app.buisness.core.event_context import EventContext
+from app.buisness.maintenance.kpi.maintenance_kpi_rollup_manager import MaintenanceKpiRollupManager
+from app.buisness.core.asset_summary_manager import AssetSummaryManager
+from app.utils.ordering_keys import key_for_insert, key_for_position
 
 
 class MaintenanceContext:
@@ -57,6 +60,24 @@ class MaintenanceContext:
         
         return cls(MaintenanceActionSetStruct.from_event_id(event_id))
     
+    @classmethod
+    def from_event_graph(cls, event: Union[Event, int]) -> Optional['MaintenanceContext']:
+        """
+        Create MaintenanceContext from Event instance or event_id with the full
+        event graph eager loaded (see MaintenanceEventGraph).
+        
+        Args:
+            event: Event instance or event_id (int)
+            
+        Returns:
+            MaintenanceContext instance or None if no maintenance action set exists for event
+        """
+        event_id = event if isinstance(event, int) else event.id
+        struct = MaintenanceActionSetStruct.from_event_graph(event_id)
+        if struct is None:
+            return None
+        return cls(struct)
+    
     @classmethod
     def from_maintenance_action_set(cls, maintenance_action_set: Union[MaintenanceActionSet, int]) -> 'MaintenanceContext':
         """
@@ -152,6 +173,7 @@ class MaintenanceContext:
             if user_id:
                 self.maintenance_action_set.assigned_by_id = user_id
             self._sync_event_status()
+            MaintenanceKpiRollupManager.on_start(self.maintenance_action_set, user_id=user_id)
             db.session.commit()
             self.refresh()
         return self
@@ -168,6 +190,7 @@ class MaintenanceContext:
             self for chaining
         """
         if self.maintenance_action_set.status in ['Planned', 'In Progress', 'Delayed']:
+            previous_status = self.maintenance_action_set.status
             self.maintenance_action_set.status = 'Complete'
             self.maintenance_action_set.end_date = datetime.utcnow()
             if user_id:
@@ -185,6 +208,8 @@ class MaintenanceContext:
             if notes:
                 self.maintenance_action_set.completion_notes = notes
             self._sync_event_status()
+            MaintenanceKpiRollupManager.on_complete(self.maintenance_action_set, user_id=user_id)
+            AssetSummaryManager.on_maintenance_status(self.maintenance_action_set, previous_status)
             db.session.commit()
             self.refresh()
         return self
@@ -201,11 +226,14 @@ class MaintenanceContext:
             self for chaining
         """
         if self.maintenance_action_set.status in ['Planned', 'In Progress']:
+            previous_status = self.maintenance_action_set.status
             self.maintenance_action_set.status = 'Cancelled'
             self.maintenance_action_set.end_date = datetime.utcnow()
             if notes:
                 self.maintenance_action_set.completion_notes = notes
             self._sync_event_status()
+            MaintenanceKpiRollupManager.on_cancel(self.maintenance_action_set, user_id=user_id)
+            AssetSummaryManager.on_maintenance_status(self.maintenance_action_set, previous_status)
             db.session.commit()
             self.refresh()
         return self
@@ -255,6 +283,7 @@ class MaintenanceContext:
             self._sync_event_status()
         
         db.session.add(delay)
+        MaintenanceKpiRollupManager.on_delay_start(self.maintenance_action_set, delay, user_id=user_id)
         db.session.commit()
         self.refresh()
         
@@ -301,6 +330,7 @@ class MaintenanceContext:
             self.maintenance_action_set.status = 'In Progress'
             self._sync_event_status()
         
+        MaintenanceKpiRollupManager.on_delay_end(self.maintenance_action_set, delay, user_id=user_id)
         db.session.commit()
         self.refresh()
         
@@ -439,6 +469,8 @@ class MaintenanceContext:
         
         # Get ActionContext for the action
         action_context = ActionContext(action)
+        previous_status = action.status
+        previous_billable_hours = action.billable_hours
         
         # Determine which status update function to use based on status transition
         status_changed = new_status != old_status
@@ -512,7 +544,12 @@ class MaintenanceContext:
             if not self.maintenance_action_set.start_date:
                 self.maintenance_action_set.start_date = datetime.utcnow()
             self._sync_event_status()
+            MaintenanceKpiRollupManager.on_start(self.maintenance_action_set, user_id=user_id)
         
+        MaintenanceKpiRollupManager.on_action_status(
+            self.maintenance_action_set, action, previous_status,
+            previous_billable_hours=previous_billable_hours, user_id=user_id
+        )
         db.session.commit()
         
         # Auto-update MaintenanceActionSet billable hours if sum is greater
@@ -567,6 +604,8 @@ class MaintenanceContext:
         
         # Create ActionContext and apply updates
         action_context = ActionContext(action)
+        previous_status = action.status
+        previous_billable_hours = action.billable_hours
         action_context.edit_action(**updates)
         
         # Generate comment if status changed or reset
@@ -607,7 +646,13 @@ class MaintenanceContext:
             if not self.maintenance_action_set.start_date:
                 self.maintenance_action_set.start_date = datetime.utcnow()
             self._sync_event_status()
+            MaintenanceKpiRollupManager.on_start(self.maintenance_action_set, user_id=user_id)
         
+        if action.status != previous_status or action.billable_hours != previous_billable_hours:
+            MaintenanceKpiRollupManager.on_action_status(
+                self.maintenance_action_set, action, previous_status,
+                previous_billable_hours=previous_billable_hours, user_id=user_id
+            )
         db.session.commit()
         
         # Auto-update MaintenanceActionSet billable hours if sum is greater
@@ -745,13 +790,16 @@ class MaintenanceContext:
         safety_review_required: Optional[bool] = None,
         staff_count: Optional[int] = None,
         labor_hours: Optional[float] = None,
-        completion_notes: Optional[str] = None
+        completion_notes: Optional[str] = None,
+        user_id: Optional[int] = None
     ) -> 'MaintenanceContext':
         """
         Update maintenance action set details.
         
         All fields are inherited from VirtualActionSet or defined in MaintenanceActionSet.
         Description is a column from VirtualActionSet and can be set directly.
+        Status and asset changes are applied to the KPI rollups like the
+        start/complete/cancel transitions.
         
         Args:
             task_name: Task name (from VirtualActionSet)
@@ -766,6 +814,7 @@ class MaintenanceContext:
             staff_count: Staff count (from VirtualActionSet)
             labor_hours: Labor hours (from VirtualActionSet)
             completion_notes: Completion notes
+            user_id: ID of user making the change
             
         Returns:
             self for chaining
@@ -791,6 +840,9 @@ class MaintenanceContext:
             'completion_notes': completion_notes,
         }
         
+        previous_status = self.maintenance_action_set.status
+        previous_asset_id = self.maintenance_action_set.asset_id
+        
         # Iterate through mappings and set values
         # Only update fields that were explicitly provided (in field_mappings with non-None value, or nullable fields that can be None)
         for field_name, value in field_mappings.items():
@@ -804,63 +856,107 @@ class MaintenanceContext:
                 if field_name == 'status':
                     self._sync_event_status()
         
+        if self.maintenance_action_set.asset_id != previous_asset_id:
+            MaintenanceKpiRollupManager.on_asset_change(self.maintenance_action_set, previous_asset_id, status=previous_status)
+        if self.maintenance_action_set.status != previous_status:
+            self._record_status_change(previous_status, user_id)
+            AssetSummaryManager.on_maintenance_status(self.maintenance_action_set, previous_status)
+        
         db.session.commit()
         self.refresh()
         return self
     
+    def _record_status_change(self, previous_status: str, user_id: Optional[int] = None) -> None:
+        """
+        Apply a directly set status to the KPI rollups (does not commit).
+        Uses the same hooks (and start/end dates) as start(), complete() and
+        cancel(); leaving Complete/Cancelled reopens the event first.
+        """
+        maintenance_action_set = self.maintenance_action_set
+        status = maintenance_action_set.status
+        if previous_status in MaintenanceKpiRollupManager.CLOSED_STATUSES:
+            MaintenanceKpiRollupManager.on_reopen(
+                maintenance_action_set, previous_status, maintenance_action_set.end_date, user_id=user_id
+            )
+            maintenance_action_set.end_date = None
+        
+        if status in ('In Progress', 'Delayed') and maintenance_action_set.start_date is None:
+            maintenance_action_set.start_date = datetime.utcnow()
+            MaintenanceKpiRollupManager.on_start(maintenance_action_set, user_id=user_id)
+        
+        if status == 'Complete':
+            maintenance_action_set.end_date = datetime.utcnow()
+            if user_id:
+                maintenance_action_set.completed_by_id = user_id
+            MaintenanceKpiRollupManager.on_complete(maintenance_action_set, user_id=user_id)
+        elif status == 'Cancelled':
+            maintenance_action_set.end_date = datetime.utcnow()
+            MaintenanceKpiRollupManager.on_cancel(maintenance_action_set, user_id=user_id)
+    
     def _calculate_sequence_order(
         self,
         insert_position: str = 'end',
         after_action_id: Optional[int] = None
     ) -> int:
         """
-        Calculate sequence order for new action based on insert position.
+        Calculate the order key for a new action based on insert position.
+        Existing actions keep their keys unless the insert point has no free key,
+        in which case the set is respaced first (does not commit).
         
         Args:
             insert_position: 'end', 'beginning', or 'after'
             after_action_id: Action ID to insert after (if 'after')
             
         Returns:
-            Calculated sequence_order
+            Order key for the new action (Action.order_key)
             
         Raises:
             ValueError: If insert_position is invalid or after_action_id not found
         """
-        actions = self._struct.actions
+        actions = sorted(self._struct.actions, key=lambda a: (a.order_key, a.id))
         if not actions:
-            return 1
+            return key_for_position(1)
         
         if insert_position == 'end':
-            max_sequence = max([a.sequence_order for a in actions], default=0)
-            return max_sequence + 1
+            index = len(actions)
         elif insert_position == 'beginning':
-            return 1
+            index = 0
         elif insert_position == 'after':
             if not after_action_id:
                 raise ValueError("after_action_id required when insert_position is 'after'")
             
             # Find target action
-            target_action = None
-            for action in actions:
+            index = None
+            for position, action in enumerate(actions):
                 if action.id == after_action_id:
-                    target_action = action
+                    index = position + 1
                     break
             
-            if not target_action:
+            if index is None:
                 raise ValueError(f"Action {after_action_id} not found in maintenance event")
-            
-            return target_action.sequence_order + 1
         else:
             raise ValueError(f"Invalid insert_position: {insert_position}")
+        
+        keys = [action.order_key for action in actions]
+        order_key = key_for_insert(keys, index)
+        if order_key is None:
+            from app.buisness.maintenance.base.action_context import ActionContext
+            keys = ActionContext.rebalance_order_keys([action.id for action in actions])
+            order_key = key_for_insert(keys, index)
+        return order_key
     
     def _renumber_actions_atomic(self) -> None:
         """
-        Renumber all actions atomically to ensure no gaps or duplicates.
-        Actions are sorted by current sequence_order and assigned consecutive orders starting at 1.
+        Normalize action order keys.
+        Positions are derived from key order, so gaps left by deletes need no
+        writes; keys are only respaced when two actions share a key.
         """
-        actions = sorted(self._struct.actions, key=lambda a: a.sequence_order)
-        for idx, action in enumerate(actions, start=1):
-            action.sequence_order = idx
+        actions = sorted(self._struct.actions, key=lambda a: (a.order_key, a.id))
+        keys = [action.order_key for action in actions]
+        if len(set(keys)) == len(keys):
+            return
+        from app.buisness.maintenance.base.action_context import ActionContext
+        ActionContext.rebalance_order_keys([action.id for action in actions])
         db.session.commit()
         self.refresh()
     
@@ -873,7 +969,8 @@ class MaintenanceContext:
         delay_end_date: Optional[datetime] = None,
         delay_billable_hours: Optional[float] = None,
         delay_notes: Optional[str] = None,
-        priority: Optional[str] = None
+        priority: Optional[str] = None,
+        user_id: Optional[int] = None
     ) -> MaintenanceDelay:
         """
         Update delay details.
@@ -887,6 +984,7 @@ class MaintenanceContext:
             delay_billable_hours: Update billable hours
             delay_notes: Update notes
             priority: Update priority
+            user_id: ID of user updating the delay
             
         Returns:
             Updated MaintenanceDelay instance
@@ -901,6 +999,10 @@ class MaintenanceContext:
         if delay.maintenance_action_set_id != self.maintenance_action_set_id:
             raise ValueError(f"Delay {delay_id} does not belong to this maintenance event")
         
+        previous_start_date, previous_end_date = delay.delay_start_date, delay.delay_end_date
+        if user_id:
+            delay.updated_by_id = user_id
+        
         # Update fields
         if delay_type is not None:
             delay.delay_type = delay_type
@@ -923,6 +1025,14 @@ class MaintenanceContext:
                 self.maintenance_action_set.status = 'In Progress'
                 self._sync_event_status()
         
+        # Ending an open delay adds its hours; other date edits move its counted duration
+        if previous_end_date is None and delay.delay_end_date and delay.delay_start_date == previous_start_date:
+            MaintenanceKpiRollupManager.on_delay_end(self.maintenance_action_set, delay, user_id=user_id)
+        elif (delay.delay_start_date, delay.delay_end_date) != (previous_start_date, previous_end_date):
+            MaintenanceKpiRollupManager.on_delay_change(
+                self.maintenance_action_set, delay, previous_start_date, previous_end_date, user_id=user_id
+            )
+        
         db.session.commit()
         self.refresh()
         
@@ -0,0 +1,78 @@
+"""
+Maintenance Event Graph
+Loads a maintenance event's full object graph in a fixed number of queries.
+
+The maintenance view/work pages walk actions -> part demands -> parts,
+actions -> tools -> tools, assigned users, delays and the event itself.
+Left to default lazy loading that is one query per part, tool and user.
+MaintenanceEventGraph.load() eager loads all of it up front so the struct,
+the context and the templates share one populated identity map.
+"""
+
+from typing import Optional
+from sqlalchemy.orm import joinedload, selectinload, lazyload
+from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
+from app.data.maintenance.base.actions import Action
+from app.data.maintenance.base.part_demands import PartDemand
+from app.data.maintenance.base.action_tools import ActionTool
+
+
+class MaintenanceEventGraph:
+    """
+    Eager loading plan for a MaintenanceActionSet and everything its pages render.
+
+    Query budget (independent of action/part/tool count):
+        1. maintenance action set + event, asset, users, template header (joined)
+        2. actions + assigned users (selectin + joined)
+        3. part demands + parts + requesting users (selectin + joined)
+        4. action tools + tools + assigned users (selectin + joined)
+        5. delays (selectin)
+    """
+
+    # Maximum number of queries load() issues
+    QUERY_BUDGET = 5
+
+    @staticmethod
+    def loader_options():
+        """
+        Loader options for a MaintenanceActionSet query.
+
+        Returns:
+            List of SQLAlchemy loader options
+        """
+        return [
+            joinedload(MaintenanceActionSet.event),
+            joinedload(MaintenanceActionSet.asset),
+            joinedload(MaintenanceActionSet.assigned_user),
+            joinedload(MaintenanceActionSet.assigned_by),
+            joinedload(MaintenanceActionSet.completed_by),
+            # Pages only show the template name; skip its item/attachment collections
+            joinedload(MaintenanceActionSet.template_action_set).options(lazyload('*')),
+            selectinload(MaintenanceActionSet.actions).options(
+                joinedload(Action.assigned_user),
+                selectinload(Action.part_demands).options(
+                    joinedload(PartDemand.part),
+                    joinedload(PartDemand.requested_by)
+                ),
+                selectinload(Action.action_tools).options(
+                    joinedload(ActionTool.tool),
+                    joinedload(ActionTool.assigned_to_user)
+                )
+            ),
+            selectinload(MaintenanceActionSet.delays),
+        ]
+
+    @staticmethod
+    def load(event_id: int) -> Optional[MaintenanceActionSet]:
+        """
+        Load the maintenance action set for an event with its full graph.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            MaintenanceActionSet with relationships populated, or None if not found
+        """
+        return MaintenanceActionSet.query.options(
+            *MaintenanceEventGraph.loader_options()
+        ).filter_by(event_id=event_id).first()
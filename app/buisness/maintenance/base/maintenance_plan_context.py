@@ -98,12 +98,17 @@ class MaintenancePlanContext:
         db.session.commit()
         return self
     
-    def calculate_next_due_date(self, last_maintenance_date: Optional[datetime] = None) -> Optional[datetime]:
+    def calculate_next_due_date(
+        self,
+        last_maintenance_date: Optional[datetime] = None,
+        asset_id: Optional[int] = None
+    ) -> Optional[datetime]:
         """
         Calculate next due date based on plan frequency.
         
         Args:
             last_maintenance_date: Last maintenance date (defaults to now)
+            asset_id: Asset whose meter history projects meter-based frequencies
             
         Returns:
             Next due date or None if cannot be calculated
@@ -115,16 +120,14 @@ class MaintenancePlanContext:
         
         if frequency_type == 'hours' and self._maintenance_plan.delta_hours:
             return last_maintenance_date + timedelta(hours=self._maintenance_plan.delta_hours)
-        elif frequency_type == 'meter1' and self._maintenance_plan.delta_m1:
-            # Meter-based calculations would need current meter reading
-            # This is a simplified version
-            return None
-        elif frequency_type == 'meter2' and self._maintenance_plan.delta_m2:
-            return None
-        elif frequency_type == 'meter3' and self._maintenance_plan.delta_m3:
-            return None
-        elif frequency_type == 'meter4' and self._maintenance_plan.delta_m4:
-            return None
+        elif frequency_type in ('meter1', 'meter2', 'meter3', 'meter4'):
+            meter = int(frequency_type[-1])
+            interval = getattr(self._maintenance_plan, f'delta_m{meter}')
+            if not interval or asset_id is None:
+                return None
+            # Projected from the asset's meter reading history and rate of use
+            from app.buisness.core.meter_reading_manager import MeterReadingManager
+            return MeterReadingManager.forecast_due_date(asset_id, meter, last_maintenance_date, interval)
         elif frequency_type == 'days':
             # Default to 30 days if no specific delta
             delta_days = self._maintenance_plan.delta_hours / 24 if self._maintenance_plan.delta_hours else 30
@@ -7,6 +7,7 @@ from .build_action import BuildAction
 from .build_part_demand import BuildPartDemand
 from .build_action_tool import BuildActionTool
 from .build_attachment import BuildAttachment
+from .template_submission_writer import TemplateSubmissionWriter
 from .template_builder_context import TemplateBuilderContext
 
 __all__ = [
@@ -14,6 +15,7 @@ __all__ = [
     'BuildPartDemand',
     'BuildActionTool',
     'BuildAttachment',
+    'TemplateSubmissionWriter',
     'TemplateBuilderContext',
 ]
 
@@ -7,29 +7,49 @@ from typing import List, Optional, Union, Dict, Any
 from app import db
 from app.data.maintenance.builders.template_builder_memory import TemplateBuilderMemory
 from app.data.maintenance.builders.template_builder_attachment_reference import TemplateBuilderAttachmentReference
+from app.data.maintenance.builders.template_builder_op import TemplateBuilderOp
 from app.data.maintenance.templates.template_action_sets import TemplateActionSet
-from app.data.maintenance.templates.template_action_set_attachments import TemplateActionSetAttachment
-from app.data.maintenance.templates.template_actions import TemplateActionItem
-from app.data.maintenance.templates.template_action_attachments import TemplateActionAttachment
 from app.buisness.maintenance.builders.build_action import BuildAction
 from app.buisness.maintenance.builders.build_part_demand import BuildPartDemand
 from app.buisness.maintenance.builders.build_action_tool import BuildActionTool
 from app.buisness.maintenance.builders.build_attachment import BuildAttachment
+from app.buisness.maintenance.builders.template_submission_writer import TemplateSubmissionWriter
 from app.buisness.maintenance.templates.template_maintenance_context import TemplateMaintenanceContext
+from app.buisness.maintenance.templates.template_blueprint import TemplateBlueprintCache
+from app.utils.json_patch import make_patch
+from app.logger import get_logger
 from datetime import datetime
 import json
 
+logger = get_logger("asset_management.buisness.maintenance.builders")
+
 class TemplateBuilderContext:
     """
     Business logic context manager for building draft templates.
     
     Manages in-memory build state with wrapper classes and provides
     methods to build templates incrementally before submission.
+    
+    Each save appends a JSON patch of what changed (TemplateBuilderOp)
+    instead of rewriting the whole build state. The patches are folded
+    back into TemplateBuilderMemory.build_state every COMPACT_AFTER_OPS
+    saves and on submission.
+    
+    A patch is only valid against the state it was diffed from. When another
+    editor saved since this context loaded (the stored snapshot or op IDs
+    moved), the next save writes a full snapshot instead of a patch, and an
+    op that no longer applies on load is logged and compacted away.
     """
     
     # Valid fields from VirtualActionSet
     _valid_metadata_fields = None
     
+    # Persist edits as patches (False = rewrite build_state on every save)
+    USE_OPERATION_LOG = True
+    
+    # Fold the operation log into build_state after this many patches
+    COMPACT_AFTER_OPS = 25
+    
     def __init__(self, builder_memory: Union[TemplateBuilderMemory, int]):
         """
         Initialize TemplateBuilderContext with TemplateBuilderMemory or ID.
@@ -42,11 +62,32 @@ class TemplateBuilderContext:
         else:
             self._builder_memory = builder_memory
         
-        # Load build state from JSON
-        build_state = self._builder_memory.get_build_state_dict()
+        # Saves are skipped while building in bulk (see copy_from_template)
+        self._defer_saves = False
+        
+        # Load build state from JSON (snapshot plus pending ops)
+        build_state, failed_op = self._builder_memory.replay_ops()
+        self._load_state(build_state)
         
+        # Last persisted state, used to diff the next save, and the stored
+        # (snapshot, op IDs) it was read from
+        self._persisted_state = build_state
+        self._persisted_version = (
+            self._builder_memory.build_state,
+            tuple(op.id for op in self._builder_memory.ops)
+        )
+        
+        if failed_op is not None:
+            logger.warning(
+                f"Template builder {self.builder_id}: op {failed_op.id} no longer applies; "
+                f"compacting the state before it and dropping it and later ops"
+            )
+            self._save(compact=True)
+    
+    def _load_state(self, build_state: Dict[str, Any]):
+        """Build wrapper objects from a build state dict."""
         # Initialize metadata, actions, and attachments
-        self._build_metadata: Dict[str, Any] = build_state.get('metadata', {})
+        self._build_metadata: Dict[str, Any] = dict(build_state.get('metadata', {}))
         self._build_actions: List[BuildAction] = []
         self._build_attachments: List[BuildAttachment] = []
         
@@ -142,7 +183,7 @@ class TemplateBuilderContext:
         context = cls(builder_memory)
         if 'revision' not in context._build_metadata:
             context._build_metadata['revision'] = '0'
-            context._save()
+            context._save(compact=True)
         
         return context
     
@@ -225,7 +266,8 @@ class TemplateBuilderContext:
         if 'is_active' not in context._build_metadata:
             context._build_metadata['is_active'] = True
         
-        # Copy actions
+        # Copy actions and attachments in memory, then save once
+        context._defer_saves = True
         for template_action in template.template_action_items:
             context.add_action_from_template_item(template_action.id)
         
@@ -241,7 +283,8 @@ class TemplateBuilderContext:
                         attachment_data[key] = value
             context.add_attachment(attachment_data)
         
-        context._save()
+        context._defer_saves = False
+        context._save(compact=True)
         return context
     
     # Building functions
@@ -350,14 +393,14 @@ class TemplateBuilderContext:
     # Remove functions
     def remove_action(self, action_index: int):
         """
-        Remove an action and renumber sequence orders.
+        Remove an action. Positions follow list order, so the remaining
+        actions are not renumbered.
         
         Args:
             action_index: Index of action to remove
         """
         if 0 <= action_index < len(self._build_actions):
             self._build_actions.pop(action_index)
-            self._renumber_sequence_orders()
             self._save()
         else:
             raise IndexError(f"Action index {action_index} out of range")
@@ -558,28 +601,96 @@ class TemplateBuilderContext:
         max_order = max((action.sequence_order or 0 for action in self._build_actions), default=0)
         return max_order + 1
     
-    def _renumber_sequence_orders(self):
-        """Renumber all sequence orders to be consecutive starting from 1."""
-        for index, action in enumerate(self._build_actions, start=1):
-            action.sequence_order = index
+    def move_action(self, action_index: int, new_index: int):
+        """
+        Move an action to a new index. List order is the build order; stored
+        sequence orders are only ordering hints and are made consecutive on
+        submit, so a move saves one list change instead of renumbering.
+        
+        Args:
+            action_index: Index of action to move
+            new_index: Target index
+        """
+        if not 0 <= action_index < len(self._build_actions):
+            raise IndexError(f"Action index {action_index} out of range")
+        if not 0 <= new_index < len(self._build_actions):
+            raise IndexError(f"Action index {new_index} out of range")
+        if action_index == new_index:
+            return
+        self._build_actions.insert(new_index, self._build_actions.pop(action_index))
+        self._save()
     
     # Save and serialization
-    def _save(self):
-        """Save current build state to database."""
-        build_state = {
-            'metadata': self._build_metadata,
+    def _serialize_state(self) -> Dict[str, Any]:
+        """Get the current build state as plain JSON-ready data."""
+        return {
+            'metadata': dict(self._build_metadata),
             'actions': [action.to_dict() for action in self._build_actions],
             'attachments': [att.to_dict() for att in self._build_attachments]
         }
-
-        if build_state:
-            self._builder_memory.set_build_state_dict(build_state)
+    
+    def _stored_version(self) -> tuple:
+        """(snapshot, op IDs) currently stored for this builder, read from the database"""
+        build_state = db.session.query(TemplateBuilderMemory.build_state).filter(
+            TemplateBuilderMemory.id == self.builder_id
+        ).scalar()
+        op_ids = db.session.query(TemplateBuilderOp.id).filter(
+            TemplateBuilderOp.template_builder_memory_id == self.builder_id
+        ).order_by(TemplateBuilderOp.id)
+        return build_state, tuple(op_id for op_id, in op_ids)
+    
+    def _save(self, compact: bool = False):
+        """
+        Save current build state to database.
+        
+        Appends a patch against the last persisted state, or writes a full
+        snapshot when compacting (forced, operation log disabled, the log
+        has reached COMPACT_AFTER_OPS, or another editor saved since this
+        context loaded). On failure the in-memory state is restored to what
+        was last persisted.
+        
+        Args:
+            compact: Write a full snapshot and clear the operation log
+        """
+        if self._defer_saves:
+            return
+        
+        build_state = self._serialize_state()
+        
+        try:
+            conflict = self._stored_version() != self._persisted_version
+            if conflict:
+                # A patch against our stale base could land on the wrong item
+                logger.warning(
+                    f"Template builder {self.builder_id} was saved by another editor; "
+                    f"writing a full snapshot"
+                )
+                # Reload the log so ops appended by the other editor are cleared too
+                db.session.expire(self._builder_memory, ['ops'])
+            ops = self._builder_memory.ops
+            
+            if conflict or compact or not self.USE_OPERATION_LOG or len(ops) + 1 >= self.COMPACT_AFTER_OPS:
+                self._builder_memory.set_build_state_dict(build_state)
+                ops.clear()
+            else:
+                patch = make_patch(self._persisted_state, build_state)
+                if patch:
+                    ops.append(TemplateBuilderOp(
+                        patch=json.dumps(patch),
+                        created_by_id=self._builder_memory.updated_by_id,
+                        updated_by_id=self._builder_memory.updated_by_id
+                    ))
             self._builder_memory.updated_at = datetime.utcnow()
-            try:
-                db.session.commit()
-            except Exception:
-                db.session.rollback()
-                raise
+            db.session.flush()
+            version = (self._builder_memory.build_state, tuple(op.id for op in ops))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            self._load_state(self._persisted_state)
+            raise
+        
+        self._persisted_state = build_state
+        self._persisted_version = version
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
@@ -647,120 +758,29 @@ class TemplateBuilderContext:
             db.session.add(template_action_set)
             db.session.flush()  # Get ID
             
-            # Create TemplateActionItems
-            for build_action in self._build_actions:
-                if not build_action.action_name:
-                    raise ValueError(f"Action at sequence_order {build_action.sequence_order} missing action_name")
-                if build_action.sequence_order is None:
-                    raise ValueError(f"Action '{build_action.action_name}' missing sequence_order")
-                
-                template_action_item = TemplateActionItem(
-                    template_action_set_id=template_action_set.id,
-                    action_name=build_action.action_name,
-                    description=build_action.description,
-                    estimated_duration=build_action.estimated_duration,
-                    expected_billable_hours=build_action._data.get('expected_billable_hours'),
-                    safety_notes=build_action._data.get('safety_notes'),
-                    notes=build_action._data.get('notes'),
-                    sequence_order=build_action.sequence_order,
-                    is_required=build_action._data.get('is_required', True),
-                    instructions=build_action._data.get('instructions'),
-                    instructions_type=build_action._data.get('instructions_type'),
-                    minimum_staff_count=build_action._data.get('minimum_staff_count', 1),
-                    required_skills=build_action._data.get('required_skills'),
-                    proto_action_item_id=build_action.proto_action_item_id,
-                    revision=build_action._data.get('revision'),
-                    prior_revision_id=build_action._data.get('prior_revision_id'),
-                    created_by_id=user_id,
-                    updated_by_id=user_id
-                )
-                db.session.add(template_action_item)
-                db.session.flush()  # Get ID
-                
-                # Create TemplatePartDemands
-                for seq, part_demand in enumerate(build_action.part_demands, start=1):
-                    from app.data.maintenance.templates.template_part_demands import TemplatePartDemand
-                    template_part_demand = TemplatePartDemand(
-                        template_action_item_id=template_action_item.id,
-                        part_id=part_demand.part_id,
-                        quantity_required=part_demand.quantity_required,
-                        expected_cost=part_demand.expected_cost,
-                        notes=part_demand.notes,
-                        is_optional=part_demand._data.get('is_optional', False),  # Default to required (not optional)
-                        sequence_order=seq,
-                        created_by_id=user_id,
-                        updated_by_id=user_id
-                    )
-                    db.session.add(template_part_demand)
-                
-                # Create TemplateActionTools
-                for seq, tool in enumerate(build_action.tools, start=1):
-                    from app.data.maintenance.templates.template_action_tools import TemplateActionTool
-                    template_tool = TemplateActionTool(
-                        template_action_item_id=template_action_item.id,
-                        tool_id=tool.tool_id,
-                        quantity_required=tool.quantity_required,
-                        notes=tool.notes,
-                        is_required=tool._data.get('is_required', True),  # Default to required
-                        sequence_order=seq,
-                        created_by_id=user_id,
-                        updated_by_id=user_id
-                    )
-                    db.session.add(template_tool)
-                
-                # Create TemplateActionAttachments
-                for seq, attachment in enumerate(build_action.attachments, start=1):
-                    template_attachment = TemplateActionAttachment(
-                        template_action_item_id=template_action_item.id,
-                        attachment_id=attachment.attachment_id,
-                        all_attachment_references_id=None,  # Will be set by VirtualAttachmentReference.__init__
-                        attached_to_type='TemplateActionItem',
-                        display_order=seq,
-                        attachment_type=attachment.attachment_type or 'Document',
-                        caption=attachment.caption,
-                        description=attachment.description,
-                        sequence_order=attachment.sequence_order or seq,
-                        is_required=attachment.is_required or False,
-                        created_by_id=user_id,
-                        updated_by_id=user_id
-                    )
-                    db.session.add(template_attachment)
-            
-            # Create TemplateActionSetAttachments
-            for seq, attachment in enumerate(self._build_attachments, start=1):
-                template_attachment = TemplateActionSetAttachment(
-                    template_action_set_id=template_action_set.id,
-                    attachment_id=attachment.attachment_id,
-                    all_attachment_references_id=None,  # Will be set by VirtualAttachmentReference.__init__
-                    attached_to_type='TemplateActionSet',
-                    display_order=seq,
-                    attachment_type=attachment.attachment_type or 'Document',
-                    caption=attachment.caption,
-                    description=attachment.description,
-                    sequence_order=attachment.sequence_order or seq,
-                    is_required=attachment.is_required or False,
-                    created_by_id=user_id,
-                    updated_by_id=user_id
-                )
-                db.session.add(template_attachment)
-            
-            # Finalize all TemplateBuilderAttachmentReference records for this builder
-            builder_att_refs = TemplateBuilderAttachmentReference.query.filter_by(
-                template_builder_memory_id=self.builder_id,
-                is_finalized=False
-            ).all()
-            for builder_att_ref in builder_att_refs:
-                builder_att_ref.is_finalized = True
-                builder_att_ref.updated_by_id = user_id
+            # Child records: one multi-row INSERT per table, builder attachment
+            # references finalized in one UPDATE
+            TemplateSubmissionWriter.write(
+                template_action_set.id,
+                self._build_actions,
+                self._build_attachments,
+                self.builder_id,
+                user_id
+            )
             
             # Commit transaction
             db.session.commit()
             
+            # A new revision supersedes any compiled blueprint of the template it revises
+            TemplateBlueprintCache.invalidate(template_action_set.id)
+            if prior_revision_id:
+                TemplateBlueprintCache.invalidate(prior_revision_id)
+            
             # Update builder status and save template reference
             self._builder_memory.build_status = 'Submitted'
             self._builder_memory.template_action_set_id = template_action_set.id
             self._builder_memory.updated_by_id = user_id
-            self._save()
+            self._save(compact=True)
             
             # Return template context
             return TemplateMaintenanceContext(template_action_set.id)
@@ -0,0 +1,187 @@
+"""
+Template Submission Writer
+Bulk insertion of a submitted template's child records.
+"""
+
+from datetime import datetime
+from typing import List
+from sqlalchemy import insert, update
+from app import db
+from app.data.core.sequences import AttachmentIDManager
+from app.data.maintenance.builders.template_builder_attachment_reference import TemplateBuilderAttachmentReference
+from app.data.maintenance.templates.template_action_set_attachments import TemplateActionSetAttachment
+from app.data.maintenance.templates.template_actions import TemplateActionItem
+from app.data.maintenance.templates.template_action_attachments import TemplateActionAttachment
+from app.data.maintenance.templates.template_part_demands import TemplatePartDemand
+from app.data.maintenance.templates.template_action_tools import TemplateActionTool
+from app.buisness.maintenance.builders.build_action import BuildAction
+from app.buisness.maintenance.builders.build_attachment import BuildAttachment
+
+
+class TemplateSubmissionWriter:
+    """
+    Writes the actions, part demands, tools and attachment references of a
+    template being submitted from a builder.
+
+    Each child table is written with one multi-row INSERT. Action item IDs
+    come back from the INSERT (RETURNING) and global attachment reference
+    IDs are reserved as one block from AttachmentIDManager. Nothing is
+    committed here; the caller owns the transaction.
+    """
+
+    @classmethod
+    def write(
+        cls,
+        template_action_set_id: int,
+        build_actions: List[BuildAction],
+        build_attachments: List[BuildAttachment],
+        builder_id: int,
+        user_id: int
+    ) -> List[int]:
+        """
+        Insert all child records of a template and finalize the builder's
+        attachment references.
+
+        Args:
+            template_action_set_id: ID of the flushed TemplateActionSet
+            build_actions: Build actions in sequence order
+            build_attachments: Action set level build attachments
+            builder_id: TemplateBuilderMemory ID whose attachment references are finalized
+            user_id: User ID recorded as creator
+
+        Returns:
+            List of TemplateActionItem IDs in sequence order
+
+        Raises:
+            ValueError: If a build action has no action_name
+        """
+        for position, build_action in enumerate(build_actions, start=1):
+            if not build_action.action_name:
+                raise ValueError(f"Action at sequence_order {position} missing action_name")
+
+        action_item_ids = cls._insert_action_items(template_action_set_id, build_actions, user_id)
+
+        part_demand_rows = []
+        tool_rows = []
+        action_attachments = []
+        for action_item_id, build_action in zip(action_item_ids, build_actions):
+            for seq, part_demand in enumerate(build_action.part_demands, start=1):
+                part_demand_rows.append({
+                    'template_action_item_id': action_item_id,
+                    'part_id': part_demand.part_id,
+                    'quantity_required': part_demand.quantity_required,
+                    'expected_cost': part_demand.expected_cost,
+                    'notes': part_demand.notes,
+                    'is_optional': part_demand._data.get('is_optional', False),  # Default to required (not optional)
+                    'sequence_order': seq,
+                    'created_by_id': user_id,
+                    'updated_by_id': user_id,
+                })
+            for seq, tool in enumerate(build_action.tools, start=1):
+                tool_rows.append({
+                    'template_action_item_id': action_item_id,
+                    'tool_id': tool.tool_id,
+                    'quantity_required': tool.quantity_required,
+                    'notes': tool.notes,
+                    'is_required': tool._data.get('is_required', True),  # Default to required
+                    'sequence_order': seq,
+                    'created_by_id': user_id,
+                    'updated_by_id': user_id,
+                })
+            for seq, attachment in enumerate(build_action.attachments, start=1):
+                action_attachments.append((action_item_id, seq, attachment))
+
+        # One block of global attachment reference IDs for both attachment tables
+        reference_ids = iter(AttachmentIDManager.get_next_attachment_ids(
+            len(action_attachments) + len(build_attachments)
+        ))
+        action_attachment_rows = [
+            dict(
+                cls._attachment_row(attachment, seq, next(reference_ids), 'TemplateActionItem', user_id),
+                template_action_item_id=action_item_id
+            )
+            for action_item_id, seq, attachment in action_attachments
+        ]
+        set_attachment_rows = [
+            dict(
+                cls._attachment_row(attachment, seq, next(reference_ids), 'TemplateActionSet', user_id),
+                template_action_set_id=template_action_set_id
+            )
+            for seq, attachment in enumerate(build_attachments, start=1)
+        ]
+
+        for model, rows in (
+            (TemplatePartDemand, part_demand_rows),
+            (TemplateActionTool, tool_rows),
+            (TemplateActionAttachment, action_attachment_rows),
+            (TemplateActionSetAttachment, set_attachment_rows),
+        ):
+            if rows:
+                db.session.execute(insert(model), rows)
+
+        # Finalize all TemplateBuilderAttachmentReference records for this builder
+        db.session.execute(
+            update(TemplateBuilderAttachmentReference)
+            .where(
+                TemplateBuilderAttachmentReference.template_builder_memory_id == builder_id,
+                TemplateBuilderAttachmentReference.is_finalized == False
+            )
+            .values(is_finalized=True, updated_by_id=user_id, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+
+        return action_item_ids
+
+    @staticmethod
+    def _insert_action_items(template_action_set_id: int, build_actions: List[BuildAction], user_id: int) -> List[int]:
+        """Insert TemplateActionItems (sequence orders follow build list order) and return their IDs"""
+        if not build_actions:
+            return []
+        rows = [
+            {
+                'template_action_set_id': template_action_set_id,
+                'action_name': build_action.action_name,
+                'description': build_action.description,
+                'estimated_duration': build_action.estimated_duration,
+                'expected_billable_hours': build_action._data.get('expected_billable_hours'),
+                'safety_notes': build_action._data.get('safety_notes'),
+                'notes': build_action._data.get('notes'),
+                'sequence_order': position,
+                'is_required': build_action._data.get('is_required', True),
+                'instructions': build_action._data.get('instructions'),
+                'instructions_type': build_action._data.get('instructions_type'),
+                'minimum_staff_count': build_action._data.get('minimum_staff_count', 1),
+                'required_skills': build_action._data.get('required_skills'),
+                'proto_action_item_id': build_action.proto_action_item_id,
+                'revision': build_action._data.get('revision'),
+                'prior_revision_id': build_action._data.get('prior_revision_id'),
+                'created_by_id': user_id,
+                'updated_by_id': user_id,
+            }
+            for position, build_action in enumerate(build_actions, start=1)
+        ]
+        # RETURNING order is not guaranteed for a batched INSERT; map IDs back
+        # through sequence_order, which is unique within the new template
+        result = db.session.execute(
+            insert(TemplateActionItem).returning(TemplateActionItem.id, TemplateActionItem.sequence_order),
+            rows
+        )
+        id_by_position = {sequence_order: action_item_id for action_item_id, sequence_order in result}
+        return [id_by_position[position] for position in range(1, len(rows) + 1)]
+
+    @staticmethod
+    def _attachment_row(attachment: BuildAttachment, seq: int, reference_id: int, attached_to_type: str, user_id: int) -> dict:
+        """Column values shared by action and action set attachment references"""
+        return {
+            'attachment_id': attachment.attachment_id,
+            'all_attachment_references_id': reference_id,
+            'attached_to_type': attached_to_type,
+            'display_order': seq,
+            'attachment_type': attachment.attachment_type or 'Document',
+            'caption': attachment.caption,
+            'description': attachment.description,
+            'sequence_order': attachment.sequence_order or seq,
+            'is_required': attachment.is_required or False,
+            'created_by_id': user_id,
+            'updated_by_id': user_id,
+        }
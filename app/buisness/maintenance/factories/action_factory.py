@@ -16,6 +16,7 @@ from app.data.maintenance.templates.template_action_tools import TemplateActionT
 from app.data.maintenance.proto_templates.proto_actions import ProtoActionItem
 from app.data.maintenance.proto_templates.proto_part_demands import ProtoPartDemand
 from app.data.maintenance.proto_templates.proto_action_tools import ProtoActionTool
+from app.buisness.maintenance.templates.template_blueprint import TemplateBlueprintCache
 
 logger = get_logger("asset_management.buisness.maintenance.factories")
 
@@ -165,6 +166,9 @@ class ActionFactory:
         """
         Create all Actions from TemplateActionItems in a TemplateActionSet.
         
+        Reads the compiled template blueprint and inserts all actions in one
+        flush, then their part demands and tools in another.
+        
         Args:
             template_action_set_id: Template action set ID
             maintenance_action_set_id: Maintenance action set ID to associate with
@@ -174,26 +178,71 @@ class ActionFactory:
         Returns:
             List of created Action instances, ordered by sequence_order
         """
-        # Get template action set
-        from app.data.maintenance.templates.template_action_sets import TemplateActionSet
-        template_action_set = TemplateActionSet.query.get_or_404(template_action_set_id)
-        
-        # Get template action items ordered by sequence_order
-        template_action_items = sorted(
-            template_action_set.template_action_items,
-            key=lambda tai: tai.sequence_order
-        )
-        
-        created_actions = []
+        # Get compiled template blueprint (actions already ordered by sequence_order)
+        blueprint = TemplateBlueprintCache.get(template_action_set_id)
+        if blueprint is None:
+            raise ValueError(f"Template action set {template_action_set_id} not found")
         
-        for template_action_item in template_action_items:
-            action = cls.create_from_template_action_item(
-                template_action_item_id=template_action_item.id,
+        created_actions = [
+            Action(
+                # Parent reference - REQUIRED
                 maintenance_action_set_id=maintenance_action_set_id,
-                user_id=user_id,
-                commit=False  # Don't commit individual actions, commit at end
+                
+                # Template reference
+                template_action_item_id=action_blueprint.template_action_item_id,
+                
+                # Copy sequence_order from template - REQUIRED
+                sequence_order=action_blueprint.sequence_order,
+                
+                # Copy action details from VirtualActionItem
+                action_name=action_blueprint.action_name,
+                description=action_blueprint.description,
+                estimated_duration=action_blueprint.estimated_duration,
+                expected_billable_hours=action_blueprint.expected_billable_hours,
+                safety_notes=action_blueprint.safety_notes,
+                notes=action_blueprint.notes,
+                
+                # Execution tracking - initialize
+                status='Not Started',
+                
+                # Audit fields
+                created_by_id=user_id or action_blueprint.created_by_id,
+                updated_by_id=user_id or action_blueprint.created_by_id
             )
-            created_actions.append(action)
+            for action_blueprint in blueprint.actions
+        ]
+        db.session.add_all(created_actions)
+        db.session.flush()  # Get action IDs for part demands and tools in one flush
+        
+        # Standalone copies of part demands and tools - NO template reference
+        children = []
+        for action, action_blueprint in zip(created_actions, blueprint.actions):
+            for part_demand in action_blueprint.part_demands:
+                children.append(PartDemand(
+                    action_id=action.id,
+                    part_id=part_demand.part_id,
+                    quantity_required=part_demand.quantity_required,
+                    notes=part_demand.notes,
+                    expected_cost=part_demand.expected_cost,
+                    status='Planned',
+                    priority='Medium',
+                    sequence_order=part_demand.sequence_order,
+                    created_by_id=action.created_by_id,
+                    updated_by_id=action.created_by_id
+                ))
+            for tool in action_blueprint.tools:
+                children.append(ActionTool(
+                    action_id=action.id,
+                    tool_id=tool.tool_id,
+                    quantity_required=tool.quantity_required,
+                    notes=tool.notes,
+                    status='Planned',
+                    priority='Medium',
+                    sequence_order=tool.sequence_order,
+                    created_by_id=action.created_by_id,
+                    updated_by_id=action.created_by_id
+                ))
+        db.session.add_all(children)
         
         if commit:
             db.session.commit()
@@ -209,7 +258,7 @@ class ActionFactory:
         cls,
         proto_action_item_id: int,
         maintenance_action_set_id: int,
-        sequence_order: int,
+        sequence_order: Optional[int] = None,
         user_id: Optional[int] = None,
         commit: bool = True,
         copy_part_demands: bool = True,
@@ -219,7 +268,8 @@ class ActionFactory:
         estimated_duration: Optional[float] = None,
         expected_billable_hours: Optional[float] = None,
         safety_notes: Optional[str] = None,
-        notes: Optional[str] = None
+        notes: Optional[str] = None,
+        order_key: Optional[int] = None
     ) -> Action:
         """
         Create Action from ProtoActionItem.
@@ -238,13 +288,18 @@ class ActionFactory:
             expected_billable_hours: Override expected billable hours (default: use proto expected_billable_hours)
             safety_notes: Override safety notes (default: use proto safety_notes)
             notes: Override notes (default: use proto notes)
+            order_key: Explicit order key (from MaintenanceContext._calculate_sequence_order),
+                used instead of sequence_order
             
         Returns:
             Created Action instance
             
         Raises:
-            ValueError: If proto action item not found
+            ValueError: If proto action item not found or no order is given
         """
+        if sequence_order is None and order_key is None:
+            raise ValueError("sequence_order or order_key is required")
+        
         # Get proto action item
         proto_action_item = ProtoActionItem.query.get_or_404(proto_action_item_id)
         
@@ -259,7 +314,7 @@ class ActionFactory:
             # Note: Action model does NOT have proto_action_item_id field
             # Only template_action_item_id exists. Proto actions are standalone.
             # Sequence order - provided as parameter (proto items don't have sequence_order)
-            sequence_order=sequence_order,
+            sequence_order=sequence_order or 1,
             
             # Copy action details from VirtualActionItem, with overrides
             action_name=action_name or proto_action_item.action_name,
@@ -277,6 +332,9 @@ class ActionFactory:
             updated_by_id=user_id
         )
         
+        if order_key is not None:
+            action.order_key = order_key
+        
         db.session.add(action)
         db.session.flush()  # Get action ID for part demands and tools
         
@@ -9,8 +9,10 @@ from datetime import datetime
 from app import db
 from app.logger import get_logger
 from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
-from app.data.maintenance.templates.template_action_sets import TemplateActionSet
 from app.data.core.event_info.event import Event
+from app.buisness.maintenance.templates.template_blueprint import TemplateBlueprintCache
+from app.buisness.maintenance.kpi.maintenance_kpi_rollup_manager import MaintenanceKpiRollupManager
+from app.buisness.core.asset_summary_manager import AssetSummaryManager
 
 logger = get_logger("asset_management.buisness.maintenance.factories")
 
@@ -60,8 +62,10 @@ class MaintenanceActionSetFactory:
         Raises:
             ValueError: If template not found or invalid parameters
         """
-        # Get template action set
-        template_action_set = TemplateActionSet.query.get_or_404(template_action_set_id)
+        # Get compiled template blueprint
+        template_action_set = TemplateBlueprintCache.get(template_action_set_id)
+        if template_action_set is None:
+            raise ValueError(f"Template action set {template_action_set_id} not found")
         
         if not template_action_set.is_active:
             logger.warning(f"Creating maintenance from inactive template: {template_action_set_id}")
@@ -127,12 +131,14 @@ class MaintenanceActionSetFactory:
         )
         
         db.session.add(maintenance_action_set)
+        db.session.flush()
+        MaintenanceKpiRollupManager.on_open(maintenance_action_set, user_id=user_id)
+        AssetSummaryManager.on_maintenance_status(maintenance_action_set, previous_status=None)
         
         if commit:
             db.session.commit()
             logger.info(f"Created MaintenanceActionSet {maintenance_action_set.id} from template {template_action_set_id}")
         else:
-            db.session.flush()
             logger.info(f"Created MaintenanceActionSet {maintenance_action_set.id} from template {template_action_set_id} (not committed)")
         
         return maintenance_action_set
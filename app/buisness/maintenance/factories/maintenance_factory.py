@@ -11,7 +11,7 @@ from app.logger import get_logger
 from app.buisness.maintenance.factories.maintenance_action_set_factory import MaintenanceActionSetFactory
 from app.buisness.maintenance.factories.action_factory import ActionFactory
 from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
-from app.data.maintenance.templates.template_action_sets import TemplateActionSet
+from app.buisness.maintenance.templates.template_blueprint import TemplateBlueprintCache
 
 logger = get_logger("asset_management.buisness.maintenance.factories")
 
@@ -74,8 +74,10 @@ class MaintenanceFactory:
         Raises:
             ValueError: If template not found, invalid parameters, or business rule violation
         """
-        # Validate template exists
-        template_action_set = TemplateActionSet.query.get_or_404(template_action_set_id)
+        # Validate template exists (compiled blueprint is shared with the factories below)
+        template_action_set = TemplateBlueprintCache.get(template_action_set_id)
+        if template_action_set is None:
+            raise ValueError(f"Template action set {template_action_set_id} not found")
         
         if not template_action_set.is_active:
             logger.warning(f"Creating maintenance from inactive template: {template_action_set_id}")
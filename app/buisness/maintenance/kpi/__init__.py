@@ -0,0 +1,10 @@
+"""
+Maintenance KPI Business Layer
+Incremental KPI rollups maintained from maintenance status transitions
+"""
+
+from app.buisness.maintenance.kpi.maintenance_kpi_rollup_manager import MaintenanceKpiRollupManager
+
+__all__ = [
+    'MaintenanceKpiRollupManager',
+]
@@ -0,0 +1,532 @@
+"""
+Maintenance KPI Rollup Manager
+Incremental KPI rollups maintained from maintenance status transitions.
+
+MaintenanceContext emits a change record for each transition (open, start,
+complete, cancel, reopen, delay start/end/edit, action status). The change carries counter
+deltas that are added to at most ten MaintenanceKpiRollup rows (five
+dimensions x flow period + backlog), so each transition costs the same no
+matter how much history exists. rebuild() recomputes every rollup from the
+source tables.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from sqlalchemy import tuple_
+from app import db
+from app.data.core.asset_info.asset import Asset
+from app.data.core.asset_info.make_model import MakeModel
+from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
+from app.data.maintenance.base.actions import Action
+from app.data.maintenance.base.maintenance_delays import MaintenanceDelay
+from app.data.maintenance.base.maintenance_kpi_changes import MaintenanceKpiChange
+from app.data.maintenance.base.maintenance_kpi_rollups import MaintenanceKpiRollup
+from app.logger import get_logger
+
+logger = get_logger("asset_management.buisness.maintenance.kpi")
+
+
+class MaintenanceKpiRollupManager:
+    """
+    Emits change records and applies them to MaintenanceKpiRollup.
+
+    Counters are incremented with SQL expressions (col = col + delta) so
+    concurrent transitions do not overwrite each other. Incremental updates
+    credit the technician assigned at the time of the transition; rebuild()
+    credits the current assignee.
+    """
+
+    DIMENSIONS = ('fleet', 'asset', 'asset_type', 'location', 'technician')
+    # Technician backlog would need assignment changes, which are not transitions
+    BACKLOG_DIMENSIONS = ('fleet', 'asset', 'asset_type', 'location')
+    # Dimensions that follow the event's asset
+    ASSET_DIMENSIONS = ('asset', 'asset_type', 'location')
+    FLEET_ID = 0
+    OPEN_PERIOD = 'open'
+    OPEN_STATUSES = ('Planned', 'In Progress', 'Delayed')
+    CLOSED_STATUSES = ('Complete', 'Cancelled')
+    ACTION_COUNTERS = {
+        'Complete': 'actions_completed',
+        'Failed': 'actions_failed',
+        'Skipped': 'actions_skipped',
+    }
+    COUNTER_COLUMNS = (
+        'opened_count', 'started_count', 'completed_count', 'cancelled_count',
+        'repair_count', 'repair_hours', 'delay_count', 'delay_hours',
+        'actions_completed', 'actions_failed', 'actions_skipped', 'billable_hours',
+        'backlog_count', 'backlog_opened_epoch',
+    )
+
+    @staticmethod
+    def period_for(moment: Optional[datetime]) -> str:
+        """Monthly period key ('YYYY-MM') for a timestamp"""
+        return (moment or datetime.utcnow()).strftime('%Y-%m')
+
+    @staticmethod
+    def _hours_between(start: Optional[datetime], end: Optional[datetime]) -> Optional[float]:
+        """Elapsed hours, or None if either end is missing or negative"""
+        if not start or not end or end < start:
+            return None
+        return (end - start).total_seconds() / 3600.0
+
+    @staticmethod
+    def _opened_at(maintenance_action_set: MaintenanceActionSet) -> datetime:
+        """Timestamp used for backlog age"""
+        return maintenance_action_set.created_at or datetime.utcnow()
+
+    @classmethod
+    def _dimension_keys(cls, maintenance_action_set: MaintenanceActionSet, technician_id: Optional[int]) -> Dict[str, Optional[int]]:
+        """Dimension IDs for an event (one query for asset location and type)"""
+        return dict(
+            cls._asset_keys(maintenance_action_set.asset_id),
+            fleet=cls.FLEET_ID,
+            technician=technician_id,
+        )
+
+    @staticmethod
+    def _asset_keys(asset_id: Optional[int]) -> Dict[str, Optional[int]]:
+        """Asset, asset type and location IDs for an asset (one query)"""
+        location_id = None
+        asset_type_id = None
+        if asset_id:
+            row = db.session.query(Asset.major_location_id, MakeModel.asset_type_id).outerjoin(
+                MakeModel, Asset.make_model_id == MakeModel.id
+            ).filter(Asset.id == asset_id).first()
+            if row:
+                location_id, asset_type_id = row.major_location_id, row.asset_type_id
+        return {'asset': asset_id, 'asset_type': asset_type_id, 'location': location_id}
+
+    @classmethod
+    def record_change(
+        cls,
+        maintenance_action_set: MaintenanceActionSet,
+        change_type: str,
+        flow_deltas: Optional[Dict[str, float]] = None,
+        backlog_deltas: Optional[Dict[str, float]] = None,
+        occurred_at: Optional[datetime] = None,
+        action_id: Optional[int] = None,
+        technician_id: Optional[int] = None,
+        user_id: Optional[int] = None
+    ) -> Optional[MaintenanceKpiChange]:
+        """
+        Emit a change record and apply its deltas to the rollups (does not commit).
+
+        Args:
+            maintenance_action_set: Event the change belongs to
+            change_type: open/start/complete/cancel/reopen/delay_start/delay_end/delay_change/action_status
+            flow_deltas: Counter deltas for the monthly period of occurred_at
+            backlog_deltas: Counter deltas for the 'open' backlog period
+            occurred_at: When the transition happened (defaults to now)
+            action_id: Action ID for action status changes
+            technician_id: Technician dimension (defaults to the event's assigned user)
+            user_id: User making the change
+
+        Returns:
+            Created MaintenanceKpiChange, or None if there was nothing to apply
+        """
+        flow_deltas = {k: v for k, v in (flow_deltas or {}).items() if v}
+        backlog_deltas = {k: v for k, v in (backlog_deltas or {}).items() if v}
+        if not flow_deltas and not backlog_deltas:
+            return None
+
+        occurred_at = occurred_at or datetime.utcnow()
+        if technician_id is None:
+            technician_id = maintenance_action_set.assigned_user_id
+        keys = cls._dimension_keys(maintenance_action_set, technician_id)
+
+        change = MaintenanceKpiChange(
+            maintenance_action_set_id=maintenance_action_set.id,
+            action_id=action_id,
+            change_type=change_type,
+            occurred_at=occurred_at,
+            asset_id=keys['asset'],
+            asset_type_id=keys['asset_type'],
+            major_location_id=keys['location'],
+            technician_id=keys['technician'],
+            flow_deltas=flow_deltas or None,
+            backlog_deltas=backlog_deltas or None,
+            created_by_id=user_id,
+            updated_by_id=user_id
+        )
+        db.session.add(change)
+
+        targets = []
+        for dimension in cls.DIMENSIONS:
+            dimension_id = keys[dimension]
+            if dimension_id is None:
+                continue
+            if flow_deltas:
+                targets.append(((dimension, dimension_id, cls.period_for(occurred_at)), flow_deltas))
+            if backlog_deltas and dimension in cls.BACKLOG_DIMENSIONS:
+                targets.append(((dimension, dimension_id, cls.OPEN_PERIOD), backlog_deltas))
+        cls._apply(targets)
+        return change
+
+    @classmethod
+    def _apply(cls, targets):
+        """Add deltas to rollup rows, creating missing rows (one SELECT for all keys)"""
+        if not targets:
+            return
+        existing = {
+            (row.dimension, row.dimension_id, row.period): row
+            for row in MaintenanceKpiRollup.query.filter(
+                tuple_(
+                    MaintenanceKpiRollup.dimension,
+                    MaintenanceKpiRollup.dimension_id,
+                    MaintenanceKpiRollup.period
+                ).in_([key for key, _ in targets])
+            )
+        }
+        for key, deltas in targets:
+            row = existing.get(key)
+            if row is None:
+                dimension, dimension_id, period = key
+                row = MaintenanceKpiRollup(dimension=dimension, dimension_id=dimension_id, period=period)
+                for column in cls.COUNTER_COLUMNS:
+                    setattr(row, column, deltas.get(column, 0))
+                db.session.add(row)
+                existing[key] = row
+                continue
+            for column, delta in deltas.items():
+                setattr(row, column, getattr(MaintenanceKpiRollup, column) + delta)
+
+    # Transition hooks (called by MaintenanceContext before it commits)
+    @classmethod
+    def on_open(cls, maintenance_action_set: MaintenanceActionSet, user_id: Optional[int] = None):
+        """Maintenance event created"""
+        opened_at = cls._opened_at(maintenance_action_set)
+        return cls.record_change(
+            maintenance_action_set, 'open',
+            flow_deltas={'opened_count': 1},
+            backlog_deltas={'backlog_count': 1, 'backlog_opened_epoch': opened_at.timestamp()},
+            occurred_at=opened_at,
+            user_id=user_id
+        )
+
+    @classmethod
+    def on_start(cls, maintenance_action_set: MaintenanceActionSet, user_id: Optional[int] = None):
+        """Planned -> In Progress"""
+        return cls.record_change(
+            maintenance_action_set, 'start',
+            flow_deltas={'started_count': 1},
+            occurred_at=maintenance_action_set.start_date,
+            user_id=user_id
+        )
+
+    @classmethod
+    def on_complete(cls, maintenance_action_set: MaintenanceActionSet, user_id: Optional[int] = None):
+        """Open -> Complete"""
+        repair_hours = cls._hours_between(maintenance_action_set.start_date, maintenance_action_set.end_date)
+        flow_deltas = {'completed_count': 1}
+        if repair_hours is not None:
+            flow_deltas.update(repair_count=1, repair_hours=repair_hours)
+        return cls.record_change(
+            maintenance_action_set, 'complete',
+            flow_deltas=flow_deltas,
+            backlog_deltas=cls._close_backlog(maintenance_action_set),
+            occurred_at=maintenance_action_set.end_date,
+            user_id=user_id
+        )
+
+    @classmethod
+    def on_cancel(cls, maintenance_action_set: MaintenanceActionSet, user_id: Optional[int] = None):
+        """Open -> Cancelled"""
+        return cls.record_change(
+            maintenance_action_set, 'cancel',
+            flow_deltas={'cancelled_count': 1},
+            backlog_deltas=cls._close_backlog(maintenance_action_set),
+            occurred_at=maintenance_action_set.end_date,
+            user_id=user_id
+        )
+
+    @classmethod
+    def on_delay_start(cls, maintenance_action_set: MaintenanceActionSet, delay: MaintenanceDelay, user_id: Optional[int] = None):
+        """Delay added"""
+        return cls.record_change(
+            maintenance_action_set, 'delay_start',
+            flow_deltas={'delay_count': 1},
+            occurred_at=delay.delay_start_date,
+            user_id=user_id
+        )
+
+    @classmethod
+    def on_delay_end(cls, maintenance_action_set: MaintenanceActionSet, delay: MaintenanceDelay, user_id: Optional[int] = None):
+        """Delay ended"""
+        return cls.record_change(
+            maintenance_action_set, 'delay_end',
+            flow_deltas={'delay_hours': cls._hours_between(delay.delay_start_date, delay.delay_end_date)},
+            occurred_at=delay.delay_end_date,
+            user_id=user_id
+        )
+
+    @classmethod
+    def on_delay_change(
+        cls,
+        maintenance_action_set: MaintenanceActionSet,
+        delay: MaintenanceDelay,
+        previous_start_date: Optional[datetime],
+        previous_end_date: Optional[datetime],
+        user_id: Optional[int] = None
+    ):
+        """
+        Delay dates edited: replace the delay's old delay_count/delay_hours
+        contributions with its new ones. One change is recorded per affected
+        period, dated at the start of that period.
+        """
+        period_deltas: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for sign, start_date, end_date in (
+            (-1, previous_start_date, previous_end_date),
+            (1, delay.delay_start_date, delay.delay_end_date),
+        ):
+            for period, deltas, _ in cls._delay_contributions(start_date, end_date):
+                for column, delta in deltas.items():
+                    period_deltas[period][column] += sign * (delta or 0.0)
+        return [
+            cls.record_change(
+                maintenance_action_set, 'delay_change',
+                flow_deltas=dict(deltas),
+                occurred_at=datetime.strptime(period, '%Y-%m'),
+                user_id=user_id
+            )
+            for period, deltas in period_deltas.items()
+        ]
+
+    @classmethod
+    def on_action_status(
+        cls,
+        maintenance_action_set: MaintenanceActionSet,
+        action: Action,
+        old_status: str,
+        previous_billable_hours: Optional[float] = None,
+        user_id: Optional[int] = None
+    ):
+        """Action status changed; terminal statuses carry billable hours to the technician"""
+        flow_deltas = defaultdict(float)
+        old_counter = cls.ACTION_COUNTERS.get(old_status)
+        if old_counter:
+            flow_deltas[old_counter] -= 1
+            flow_deltas['billable_hours'] -= previous_billable_hours or 0.0
+        new_counter = cls.ACTION_COUNTERS.get(action.status)
+        if new_counter:
+            flow_deltas[new_counter] += 1
+            flow_deltas['billable_hours'] += action.billable_hours or 0.0
+        return cls.record_change(
+            maintenance_action_set, 'action_status',
+            flow_deltas=dict(flow_deltas),
+            occurred_at=action.end_time,
+            action_id=action.id,
+            technician_id=action.assigned_user_id or maintenance_action_set.assigned_user_id,
+            user_id=user_id
+        )
+
+    @classmethod
+    def on_reopen(
+        cls,
+        maintenance_action_set: MaintenanceActionSet,
+        previous_status: str,
+        previous_end_date: Optional[datetime],
+        user_id: Optional[int] = None
+    ):
+        """Complete/Cancelled -> any other status; reverses the close in the period it was counted in"""
+        if previous_status == 'Complete':
+            flow_deltas = {'completed_count': -1}
+            repair_hours = cls._hours_between(maintenance_action_set.start_date, previous_end_date)
+            if repair_hours is not None:
+                flow_deltas.update(repair_count=-1, repair_hours=-repair_hours)
+        else:
+            flow_deltas = {'cancelled_count': -1}
+        opened_at = cls._opened_at(maintenance_action_set)
+        return cls.record_change(
+            maintenance_action_set, 'reopen',
+            flow_deltas=flow_deltas,
+            backlog_deltas={'backlog_count': 1, 'backlog_opened_epoch': opened_at.timestamp()},
+            occurred_at=previous_end_date,
+            user_id=user_id
+        )
+
+    @classmethod
+    def on_asset_change(
+        cls,
+        maintenance_action_set: MaintenanceActionSet,
+        previous_asset_id: Optional[int],
+        status: Optional[str] = None
+    ):
+        """
+        Asset changed: move everything the event contributed to the asset,
+        asset type and location rollups from the old asset's keys to the new
+        ones (does not commit). The contribution is recomputed from the event,
+        its delays and actions the same way rebuild() counts it.
+
+        Args:
+            maintenance_action_set: Event with its new asset_id set
+            previous_asset_id: Asset ID before the change
+            status: Status the event's contribution was counted under (defaults to its current status)
+        """
+        old_keys = cls._asset_keys(previous_asset_id)
+        new_keys = cls._asset_keys(maintenance_action_set.asset_id)
+        dimensions = [dimension for dimension in cls.ASSET_DIMENSIONS if old_keys[dimension] != new_keys[dimension]]
+        if not dimensions:
+            return
+
+        contributions = list(cls._event_contributions(
+            status or maintenance_action_set.status,
+            maintenance_action_set.created_at,
+            maintenance_action_set.start_date,
+            maintenance_action_set.end_date
+        ))
+        for row in db.session.query(MaintenanceDelay.delay_start_date, MaintenanceDelay.delay_end_date).filter(
+            MaintenanceDelay.maintenance_action_set_id == maintenance_action_set.id
+        ):
+            contributions.extend(cls._delay_contributions(row.delay_start_date, row.delay_end_date))
+        for row in db.session.query(Action.status, Action.end_time, Action.updated_at, Action.billable_hours).filter(
+            Action.maintenance_action_set_id == maintenance_action_set.id,
+            Action.status.in_(list(cls.ACTION_COUNTERS))
+        ):
+            contributions.extend(cls._action_contributions(row.status, row.end_time, row.updated_at, row.billable_hours))
+
+        totals: Dict[Tuple[str, int, str], Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for period, deltas, _ in contributions:
+            for dimension in dimensions:
+                for column, delta in deltas.items():
+                    if old_keys[dimension] is not None:
+                        totals[(dimension, old_keys[dimension], period)][column] -= delta
+                    if new_keys[dimension] is not None:
+                        totals[(dimension, new_keys[dimension], period)][column] += delta
+        cls._apply([(key, dict(deltas)) for key, deltas in totals.items()])
+
+    @classmethod
+    def _close_backlog(cls, maintenance_action_set: MaintenanceActionSet) -> Dict[str, float]:
+        """Backlog deltas for an event leaving the open statuses"""
+        return {
+            'backlog_count': -1,
+            'backlog_opened_epoch': -cls._opened_at(maintenance_action_set).timestamp()
+        }
+
+    # Per-row contributions, as (period, deltas, backlog) (shared by rebuild and on_asset_change)
+    @classmethod
+    def _event_contributions(cls, status, created_at, start_date, end_date):
+        """Contributions of a maintenance action set's own lifecycle"""
+        opened_at = created_at or datetime.utcnow()
+        yield cls.period_for(opened_at), {'opened_count': 1}, False
+        if start_date:
+            yield cls.period_for(start_date), {'started_count': 1}, False
+        if status == 'Complete':
+            repair_hours = cls._hours_between(start_date, end_date)
+            deltas = {'completed_count': 1}
+            if repair_hours is not None:
+                deltas.update(repair_count=1, repair_hours=repair_hours)
+            yield cls.period_for(end_date), deltas, False
+        elif status == 'Cancelled':
+            yield cls.period_for(end_date), {'cancelled_count': 1}, False
+        elif status in cls.OPEN_STATUSES:
+            yield cls.OPEN_PERIOD, {'backlog_count': 1, 'backlog_opened_epoch': opened_at.timestamp()}, True
+
+    @classmethod
+    def _delay_contributions(cls, delay_start_date, delay_end_date):
+        """Contributions of one delay"""
+        yield cls.period_for(delay_start_date), {'delay_count': 1}, False
+        if delay_end_date:
+            yield cls.period_for(delay_end_date), {
+                'delay_hours': cls._hours_between(delay_start_date, delay_end_date)
+            }, False
+
+    @classmethod
+    def _action_contributions(cls, status, end_time, updated_at, billable_hours):
+        """Contributions of one action in a terminal status"""
+        counter = cls.ACTION_COUNTERS.get(status)
+        if counter:
+            yield cls.period_for(end_time or updated_at), {counter: 1, 'billable_hours': billable_hours or 0.0}, False
+
+    # Full rebuild
+    @classmethod
+    def rebuild(cls) -> int:
+        """
+        Recompute all rollups from maintenance action sets, actions and delays.
+        Change records are kept; rollup rows are replaced. Commits.
+
+        Returns:
+            Number of rollup rows written
+        """
+        totals: Dict[Tuple[str, int, str], Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+
+        def add(keys, period, deltas, backlog=False):
+            dimensions = cls.BACKLOG_DIMENSIONS if backlog else cls.DIMENSIONS
+            for dimension in dimensions:
+                dimension_id = keys.get(dimension)
+                if dimension_id is None or not deltas:
+                    continue
+                row = totals[(dimension, dimension_id, period)]
+                for column, delta in deltas.items():
+                    if delta:
+                        row[column] += delta
+
+        event_rows = db.session.query(
+            MaintenanceActionSet.id,
+            MaintenanceActionSet.status,
+            MaintenanceActionSet.created_at,
+            MaintenanceActionSet.start_date,
+            MaintenanceActionSet.end_date,
+            MaintenanceActionSet.asset_id,
+            MaintenanceActionSet.assigned_user_id,
+            Asset.major_location_id,
+            MakeModel.asset_type_id
+        ).outerjoin(
+            Asset, MaintenanceActionSet.asset_id == Asset.id
+        ).outerjoin(
+            MakeModel, Asset.make_model_id == MakeModel.id
+        ).execution_options(yield_per=1000)
+
+        event_keys = {}
+        for row in event_rows:
+            keys = {
+                'fleet': cls.FLEET_ID,
+                'asset': row.asset_id,
+                'asset_type': row.asset_type_id,
+                'location': row.major_location_id,
+                'technician': row.assigned_user_id,
+            }
+            event_keys[row.id] = keys
+            for period, deltas, backlog in cls._event_contributions(row.status, row.created_at, row.start_date, row.end_date):
+                add(keys, period, deltas, backlog)
+
+        delay_rows = db.session.query(
+            MaintenanceDelay.maintenance_action_set_id,
+            MaintenanceDelay.delay_start_date,
+            MaintenanceDelay.delay_end_date
+        ).execution_options(yield_per=1000)
+        for row in delay_rows:
+            keys = event_keys.get(row.maintenance_action_set_id)
+            if keys is None:
+                continue
+            for period, deltas, backlog in cls._delay_contributions(row.delay_start_date, row.delay_end_date):
+                add(keys, period, deltas, backlog)
+
+        action_rows = db.session.query(
+            Action.maintenance_action_set_id,
+            Action.status,
+            Action.end_time,
+            Action.updated_at,
+            Action.billable_hours,
+            Action.assigned_user_id
+        ).filter(Action.status.in_(list(cls.ACTION_COUNTERS))).execution_options(yield_per=1000)
+        for row in action_rows:
+            event = event_keys.get(row.maintenance_action_set_id)
+            if event is None:
+                continue
+            keys = dict(event, technician=row.assigned_user_id or event['technician'])
+            for period, deltas, backlog in cls._action_contributions(row.status, row.end_time, row.updated_at, row.billable_hours):
+                add(keys, period, deltas, backlog)
+
+        MaintenanceKpiRollup.query.delete(synchronize_session=False)
+        db.session.bulk_insert_mappings(MaintenanceKpiRollup, [
+            dict(
+                {column: 0 for column in cls.COUNTER_COLUMNS},
+                dimension=dimension, dimension_id=dimension_id, period=period,
+                **counters
+            )
+            for (dimension, dimension_id, period), counters in totals.items()
+        ])
+        db.session.commit()
+        logger.info(f"Rebuilt {len(totals)} maintenance KPI rollup rows from {len(event_keys)} maintenance events")
+        return len(totals)
@@ -0,0 +1,10 @@
+"""
+Technician Maintenance Business Layer
+Per-user technician dashboard summaries
+"""
+
+from app.buisness.maintenance.technician.technician_dashboard_cache import TechnicianDashboardCache
+
+__all__ = [
+    'TechnicianDashboardCache',
+]
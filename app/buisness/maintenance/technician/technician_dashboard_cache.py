@@ -0,0 +1,319 @@
+"""
+Technician Dashboard Cache
+Per-user technician dashboard summaries stored in PortalUserData.maintenance_cache.
+
+The dashboard (assigned work counts, most recent assignment and comment, top
+assets, part demand widgets) is computed once and stored under a versioned key.
+Session hooks drop the entry for every user touched by an assignment, action,
+comment or part demand change, so a dashboard load is one PortalUserData read
+until something relevant to that user changes.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, Set
+from sqlalchemy import asc, desc, event, func, inspect, select
+from sqlalchemy.orm import Session
+from app import db
+from app.data.core.user_info.portal_user_data import PortalUserData
+from app.data.core.event_info.comment import Comment
+from app.data.core.event_info.event import Event
+from app.data.core.asset_info.asset import Asset
+from app.data.core.supply.part import Part
+from app.data.maintenance.base.actions import Action
+from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
+from app.data.maintenance.base.part_demands import PartDemand
+from app.logger import get_logger
+from app.utils.flush_hooks import on_flush
+
+logger = get_logger("asset_management.buisness.maintenance.technician")
+
+
+class TechnicianDashboardCache:
+    """
+    Technician dashboard summaries cached in PortalUserData.maintenance_cache.
+
+    Entries live under CACHE_KEY, which carries the schema version; bumping
+    SCHEMA_VERSION orphans old entries (they are pruned on the next write).
+    Entries are also recomputed once per day because the top-assets window
+    and "completed today" depend on the date.
+    """
+
+    SCHEMA_VERSION = 1
+    CACHE_KEY = f'technician_dashboard:v{SCHEMA_VERSION}'
+    KEY_PREFIX = 'technician_dashboard:'
+
+    TOP_ASSETS_DAYS = 180
+    WIDGET_SIZE = 10
+    NOT_RECEIVED_STATUSES = ('Pending Inventory Approval', 'Ordered', 'Backordered')
+
+    # Stored ISO timestamps converted back to datetimes on read
+    _DATETIME_FIELDS = ('updated_at', 'comment_created_at', 'created_at')
+
+    @classmethod
+    def get(cls, user_id: int) -> Dict[str, Any]:
+        """
+        Dashboard data for a user, computing and storing it on a miss.
+
+        Args:
+            user_id: Technician user ID
+
+        Returns:
+            Dictionary with stats, quick_access, top_assets, recent_part_demands,
+            oldest_part_demands_needing_approval and oldest_part_demands_not_received
+        """
+        portal_data = PortalUserData.query.filter_by(user_id=user_id).first()
+        entry = (portal_data.maintenance_cache or {}).get(cls.CACHE_KEY) if portal_data else None
+        today = datetime.now().date().isoformat()
+
+        if not entry or entry.get('day') != today:
+            data = cls.compute(user_id)
+            cls._store(portal_data, user_id, {'day': today, 'computed_at': datetime.now().isoformat(), 'data': data})
+        else:
+            data = entry['data']
+        return cls._hydrate(data)
+
+    @classmethod
+    def invalidate(cls, user_ids: Iterable[int], session: Optional[Session] = None):
+        """
+        Drop cached dashboards for users (does not commit).
+
+        Args:
+            user_ids: User IDs whose dashboards are stale
+            session: Session to use (defaults to db.session)
+        """
+        user_ids = {user_id for user_id in user_ids if user_id}
+        if not user_ids:
+            return
+        session = session or db.session
+        with session.no_autoflush:
+            rows = session.query(PortalUserData).filter(PortalUserData.user_id.in_(user_ids)).all()
+            for portal_data in rows:
+                cache = portal_data.maintenance_cache or {}
+                if cls.CACHE_KEY in cache:
+                    portal_data.maintenance_cache = {key: value for key, value in cache.items() if key != cls.CACHE_KEY}
+
+    @classmethod
+    def _store(cls, portal_data: Optional[PortalUserData], user_id: int, entry: Dict[str, Any]):
+        """Write an entry, pruning entries of older schema versions"""
+        if portal_data is None:
+            portal_data = PortalUserData(
+                user_id=user_id,
+                general_settings={}, core_settings={}, maintenance_settings={},
+                general_cache={}, core_cache={}, maintenance_cache={}
+            )
+            db.session.add(portal_data)
+        cache = {
+            key: value for key, value in (portal_data.maintenance_cache or {}).items()
+            if not key.startswith(cls.KEY_PREFIX)
+        }
+        cache[cls.CACHE_KEY] = entry
+        portal_data.maintenance_cache = cache
+        db.session.commit()
+
+    @classmethod
+    def _hydrate(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert stored timestamps back to datetimes and compute waiting days"""
+        now = datetime.now()
+
+        def convert(item):
+            if not item:
+                return item
+            item = dict(item)
+            for field in cls._DATETIME_FIELDS:
+                if item.get(field):
+                    item[field] = datetime.fromisoformat(item[field])
+            if 'days_waiting' in item:
+                item['days_waiting'] = (now - item['created_at']).days if item.get('created_at') else 0
+            return item
+
+        return {
+            'stats': dict(data['stats']),
+            'quick_access': {key: convert(value) for key, value in data['quick_access'].items()},
+            'top_assets': [dict(item) for item in data['top_assets']],
+            'recent_part_demands': [convert(item) for item in data['recent_part_demands']],
+            'oldest_part_demands_needing_approval': [convert(item) for item in data['oldest_part_demands_needing_approval']],
+            'oldest_part_demands_not_received': [convert(item) for item in data['oldest_part_demands_not_received']],
+        }
+
+    @staticmethod
+    def _iso(value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value else None
+
+    @classmethod
+    def compute(cls, user_id: int) -> Dict[str, Any]:
+        """
+        Compute dashboard data for a user (uncached, JSON-serializable).
+
+        Args:
+            user_id: Technician user ID
+
+        Returns:
+            Dashboard dictionary with ISO timestamp strings
+        """
+        start_of_today = datetime.combine(datetime.now().date(), datetime.min.time())
+        action_counts = dict(db.session.query(
+            Action.status, func.count(Action.id)
+        ).filter(
+            Action.assigned_user_id == user_id,
+            Action.status.in_(['Not Started', 'In Progress'])
+        ).group_by(Action.status).all())
+        stats = {
+            'assigned_work': sum(action_counts.values()),
+            'in_progress': action_counts.get('In Progress', 0),
+            'completed_today': Action.query.filter(
+                Action.assigned_user_id == user_id,
+                Action.status == 'Complete',
+                Action.end_time >= start_of_today
+            ).count(),
+        }
+
+        quick_access = {
+            'most_recently_assigned_event': None,
+            'most_recently_commented_event': None,
+        }
+        most_recent_assigned = db.session.query(
+            MaintenanceActionSet.event_id, MaintenanceActionSet.task_name, MaintenanceActionSet.updated_at
+        ).filter(
+            MaintenanceActionSet.assigned_user_id == user_id
+        ).order_by(desc(MaintenanceActionSet.updated_at)).first()
+        if most_recent_assigned and most_recent_assigned.event_id:
+            quick_access['most_recently_assigned_event'] = {
+                'event_id': most_recent_assigned.event_id,
+                'task_name': most_recent_assigned.task_name,
+                'updated_at': cls._iso(most_recent_assigned.updated_at),
+            }
+
+        most_recent_comment = db.session.query(Comment, MaintenanceActionSet.task_name).join(
+            Event, Comment.event_id == Event.id
+        ).join(
+            MaintenanceActionSet, Event.id == MaintenanceActionSet.event_id
+        ).filter(
+            Comment.created_by_id == user_id,
+            Comment.user_viewable.is_(None)  # Only visible comments
+        ).order_by(desc(Comment.created_at)).first()
+        if most_recent_comment:
+            comment, task_name = most_recent_comment
+            quick_access['most_recently_commented_event'] = {
+                'event_id': comment.event_id,
+                'task_name': task_name,
+                'comment_created_at': cls._iso(comment.created_at),
+                'comment_preview': comment.get_content_preview(50),
+            }
+
+        # Top five assets with most actions completed in the window
+        window_start = datetime.now() - timedelta(days=cls.TOP_ASSETS_DAYS)
+        top_assets = [
+            {'id': asset_id, 'name': name, 'action_count': count}
+            for asset_id, name, count in db.session.query(
+                Asset.id, Asset.name, func.count(Action.id).label('action_count')
+            ).join(
+                MaintenanceActionSet, Asset.id == MaintenanceActionSet.asset_id
+            ).join(
+                Action, MaintenanceActionSet.id == Action.maintenance_action_set_id
+            ).filter(
+                Action.assigned_user_id == user_id,
+                Action.status == 'Complete',
+                Action.updated_at >= window_start
+            ).group_by(Asset.id, Asset.name).order_by(desc('action_count')).limit(5)
+        ]
+
+        def part_demand_rows(*criteria, order_by):
+            """Part demands on events assigned to the user, with part name and event id"""
+            return db.session.query(
+                PartDemand.id,
+                PartDemand.quantity_required,
+                PartDemand.status,
+                PartDemand.created_at,
+                PartDemand.updated_at,
+                Part.part_name,
+                MaintenanceActionSet.event_id
+            ).join(
+                Action, PartDemand.action_id == Action.id
+            ).join(
+                MaintenanceActionSet, Action.maintenance_action_set_id == MaintenanceActionSet.id
+            ).outerjoin(
+                Part, PartDemand.part_id == Part.id
+            ).filter(
+                MaintenanceActionSet.assigned_user_id == user_id, *criteria
+            ).order_by(order_by).limit(cls.WIDGET_SIZE).all()
+
+        def part_demand_item(row, waiting=False):
+            item = {
+                'id': row.id,
+                'part_name': row.part_name or 'Unknown Part',
+                'quantity': row.quantity_required,
+                'status': row.status,
+                'event_id': row.event_id,
+            }
+            if waiting:
+                item.update(created_at=cls._iso(row.created_at), days_waiting=0)
+            else:
+                item['updated_at'] = cls._iso(row.updated_at)
+            return item
+
+        recent_part_demands = [
+            part_demand_item(row) for row in part_demand_rows(order_by=desc(PartDemand.updated_at))
+        ]
+        oldest_part_demands_needing_approval = [
+            part_demand_item(row, waiting=True) for row in part_demand_rows(
+                db.or_(
+                    PartDemand.status == 'Pending Manager Approval',
+                    PartDemand.maintenance_approval_by_id.is_(None)
+                ),
+                order_by=asc(PartDemand.created_at)
+            )
+        ]
+        oldest_part_demands_not_received = [
+            part_demand_item(row, waiting=True) for row in part_demand_rows(
+                PartDemand.status.in_(cls.NOT_RECEIVED_STATUSES),
+                order_by=asc(PartDemand.created_at)
+            )
+        ]
+
+        return {
+            'stats': stats,
+            'quick_access': quick_access,
+            'top_assets': top_assets,
+            'recent_part_demands': recent_part_demands,
+            'oldest_part_demands_needing_approval': oldest_part_demands_needing_approval,
+            'oldest_part_demands_not_received': oldest_part_demands_not_received,
+        }
+
+
+def _column_values(instance, column: str) -> Set[int]:
+    """Current and previous (pre-flush) values of a column"""
+    values = {getattr(instance, column, None)}
+    history = inspect(instance).attrs[column].history
+    values.update(history.deleted or ())
+    return values
+
+
+@on_flush(Action, MaintenanceActionSet, Comment, PartDemand)
+def _collect_stale_technician_dashboards(session, changes):
+    """Record users whose dashboard is affected by the flushed changes"""
+    user_ids = session.info.setdefault('technician_dashboard_stale_users', set())
+    part_demand_action_ids = session.info.setdefault('technician_dashboard_stale_actions', set())
+    for instance in changes.all:
+        if isinstance(instance, (Action, MaintenanceActionSet)):
+            user_ids.update(_column_values(instance, 'assigned_user_id'))
+        elif isinstance(instance, Comment):
+            user_ids.add(instance.created_by_id)
+        elif isinstance(instance, PartDemand):
+            part_demand_action_ids.add(instance.action_id)
+
+
+@event.listens_for(Session, 'after_flush_postexec')
+def _invalidate_stale_technician_dashboards(session, flush_context):
+    """Drop cached dashboards for the recorded users (flushed with the same transaction)"""
+    user_ids = session.info.pop('technician_dashboard_stale_users', set())
+    action_ids = {action_id for action_id in session.info.pop('technician_dashboard_stale_actions', set()) if action_id}
+    if action_ids:
+        with session.no_autoflush:
+            user_ids.update(session.execute(
+                select(MaintenanceActionSet.assigned_user_id).join(
+                    Action, Action.maintenance_action_set_id == MaintenanceActionSet.id
+                ).where(Action.id.in_(action_ids)).distinct()
+            ).scalars())
+    user_ids.discard(None)
+    if user_ids:
+        TechnicianDashboardCache.invalidate(user_ids, session=session)
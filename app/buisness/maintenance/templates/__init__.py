@@ -9,6 +9,7 @@ from app.buisness.maintenance.templates.template_part_demand_struct import Templ
 from app.buisness.maintenance.templates.template_action_tool_struct import TemplateActionToolStruct
 from app.buisness.maintenance.templates.template_maintenance_context import TemplateMaintenanceContext
 from app.buisness.maintenance.templates.template_action_context import TemplateActionContext
+from app.buisness.maintenance.templates.template_blueprint import TemplateBlueprint, TemplateBlueprintCache
 
 __all__ = [
     'TemplateActionSetStruct',
@@ -17,5 +18,7 @@ __all__ = [
     'TemplateActionToolStruct',
     'TemplateMaintenanceContext',
     'TemplateActionContext',
+    'TemplateBlueprint',
+    'TemplateBlueprintCache',
 ]
 
@@ -0,0 +1,314 @@
+"""
+Template Blueprint
+Compiled, immutable snapshot of a template revision and a process-level LRU cache.
+
+A TemplateActionSet revision does not change once submitted, so instantiation
+(MaintenanceFactory/ActionFactory) and preview paths (summaries) read a compiled
+blueprint instead of walking the ORM graph on every call. A template is compiled
+with four queries (set, items, part demands + parts, tools + tools) and totals
+are computed once at compile time.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from app import db
+from app.data.maintenance.templates.template_action_sets import TemplateActionSet
+from app.data.maintenance.templates.template_actions import TemplateActionItem
+from app.data.maintenance.templates.template_part_demands import TemplatePartDemand
+from app.data.maintenance.templates.template_action_tools import TemplateActionTool
+from app.data.core.supply.part import Part
+from app.data.core.supply.tool import Tool
+from app.logger import get_logger
+
+logger = get_logger("asset_management.buisness.maintenance.templates.blueprint")
+
+
+class _Frozen:
+    """Slotted value object; attributes are set once in __init__"""
+    __slots__ = ()
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values.get(name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__[:3])
+        return f'<{type(self).__name__} {fields}>'
+
+
+class PartDemandBlueprint(_Frozen):
+    """Compiled TemplatePartDemand with part labels"""
+    __slots__ = (
+        'part_id', 'part_number', 'part_name', 'quantity_required', 'expected_cost',
+        'notes', 'is_optional', 'sequence_order'
+    )
+
+
+class ToolBlueprint(_Frozen):
+    """Compiled TemplateActionTool with tool label"""
+    __slots__ = ('tool_id', 'tool_name', 'quantity_required', 'notes', 'is_required', 'sequence_order')
+
+
+class ActionBlueprint(_Frozen):
+    """Compiled TemplateActionItem with its part demands and tools as tuples"""
+    __slots__ = (
+        'template_action_item_id', 'sequence_order', 'action_name', 'description',
+        'estimated_duration', 'expected_billable_hours', 'safety_notes', 'notes',
+        'created_by_id', 'part_demands', 'tools'
+    )
+
+
+class TemplateBlueprint(_Frozen):
+    """
+    Compiled TemplateActionSet revision.
+
+    actions are ordered by sequence_order. parts and tools are the flattened
+    lists across all actions in action order. Totals follow
+    TemplateMaintenanceContext (None when zero).
+    """
+    __slots__ = (
+        'template_action_set_id', 'revision', 'task_name', 'description', 'is_active',
+        'estimated_duration', 'safety_review_required', 'staff_count', 'parts_cost',
+        'labor_hours', 'asset_type_id', 'make_model_id', 'prior_revision_id', 'created_by_id',
+        'actions', 'parts', 'tools',
+        'total_action_items', 'total_estimated_duration', 'total_estimated_cost'
+    )
+
+    @property
+    def key(self) -> Tuple[int, Optional[str]]:
+        """Cache key (template id, revision)"""
+        return (self.template_action_set_id, self.revision)
+
+    def summary(self) -> Dict:
+        """Summary dict matching TemplateMaintenanceContext.summary()"""
+        return {
+            'id': self.template_action_set_id,
+            'task_name': self.task_name,
+            'description': self.description,
+            'revision': self.revision,
+            'is_active': self.is_active,
+            'total_action_items': self.total_action_items,
+            'total_estimated_duration': self.total_estimated_duration,
+            'total_estimated_cost': self.total_estimated_cost,
+        }
+
+
+class TemplateBlueprintCache:
+    """
+    Process-level LRU of compiled template blueprints keyed by (template id, revision).
+
+    Entries are dropped explicitly through invalidate() when a template changes
+    (activation, a new revision). Each worker process keeps its own cache.
+    """
+
+    # Maximum number of blueprints kept per process
+    MAX_SIZE = 256
+
+    _lock = threading.Lock()
+    _blueprints: 'OrderedDict[Tuple[int, Optional[str]], TemplateBlueprint]' = OrderedDict()
+    # Latest cached revision per template id
+    _revisions: Dict[int, Optional[str]] = {}
+
+    @classmethod
+    def get(cls, template_action_set_id: int) -> Optional[TemplateBlueprint]:
+        """
+        Get the blueprint for a template, compiling it on a miss.
+
+        Args:
+            template_action_set_id: Template action set ID
+
+        Returns:
+            TemplateBlueprint or None if the template does not exist
+        """
+        with cls._lock:
+            if template_action_set_id in cls._revisions:
+                key = (template_action_set_id, cls._revisions[template_action_set_id])
+                blueprint = cls._blueprints.get(key)
+                if blueprint is not None:
+                    cls._blueprints.move_to_end(key)
+                    return blueprint
+
+        blueprint = cls.compile(template_action_set_id)
+        if blueprint is None:
+            return None
+
+        with cls._lock:
+            cls._blueprints[blueprint.key] = blueprint
+            cls._blueprints.move_to_end(blueprint.key)
+            cls._revisions[template_action_set_id] = blueprint.revision
+            while len(cls._blueprints) > cls.MAX_SIZE:
+                (evicted_id, evicted_revision), _ = cls._blueprints.popitem(last=False)
+                if cls._revisions.get(evicted_id) == evicted_revision:
+                    del cls._revisions[evicted_id]
+        return blueprint
+
+    @classmethod
+    def invalidate(cls, template_action_set_id: Optional[int] = None):
+        """
+        Drop cached blueprints.
+
+        Args:
+            template_action_set_id: Template to drop (all revisions); None clears the cache
+        """
+        with cls._lock:
+            if template_action_set_id is None:
+                cls._blueprints.clear()
+                cls._revisions.clear()
+                return
+            cls._revisions.pop(template_action_set_id, None)
+            for key in [key for key in cls._blueprints if key[0] == template_action_set_id]:
+                del cls._blueprints[key]
+
+    @staticmethod
+    def compile(template_action_set_id: int) -> Optional[TemplateBlueprint]:
+        """
+        Compile a template into a blueprint (uncached).
+
+        Args:
+            template_action_set_id: Template action set ID
+
+        Returns:
+            TemplateBlueprint or None if the template does not exist
+        """
+        template = db.session.query(
+            TemplateActionSet.id,
+            TemplateActionSet.revision,
+            TemplateActionSet.task_name,
+            TemplateActionSet.description,
+            TemplateActionSet.is_active,
+            TemplateActionSet.estimated_duration,
+            TemplateActionSet.safety_review_required,
+            TemplateActionSet.staff_count,
+            TemplateActionSet.parts_cost,
+            TemplateActionSet.labor_hours,
+            TemplateActionSet.asset_type_id,
+            TemplateActionSet.make_model_id,
+            TemplateActionSet.prior_revision_id,
+            TemplateActionSet.created_by_id
+        ).filter(TemplateActionSet.id == template_action_set_id).first()
+        if template is None:
+            return None
+
+        items = db.session.query(
+            TemplateActionItem.id,
+            TemplateActionItem.sequence_order,
+            TemplateActionItem.action_name,
+            TemplateActionItem.description,
+            TemplateActionItem.estimated_duration,
+            TemplateActionItem.expected_billable_hours,
+            TemplateActionItem.safety_notes,
+            TemplateActionItem.notes,
+            TemplateActionItem.created_by_id
+        ).filter(
+            TemplateActionItem.template_action_set_id == template_action_set_id
+        ).order_by(TemplateActionItem.sequence_order, TemplateActionItem.id).all()
+        item_ids = [item.id for item in items]
+
+        part_demands_by_item = {}
+        tools_by_item = {}
+        if item_ids:
+            part_rows = db.session.query(
+                TemplatePartDemand.template_action_item_id,
+                TemplatePartDemand.part_id,
+                Part.part_number,
+                Part.part_name,
+                TemplatePartDemand.quantity_required,
+                TemplatePartDemand.expected_cost,
+                TemplatePartDemand.notes,
+                TemplatePartDemand.is_optional,
+                TemplatePartDemand.sequence_order
+            ).outerjoin(
+                Part, TemplatePartDemand.part_id == Part.id
+            ).filter(
+                TemplatePartDemand.template_action_item_id.in_(item_ids)
+            ).order_by(TemplatePartDemand.sequence_order, TemplatePartDemand.id).all()
+            for row in part_rows:
+                part_demands_by_item.setdefault(row.template_action_item_id, []).append(PartDemandBlueprint(
+                    part_id=row.part_id,
+                    part_number=row.part_number,
+                    part_name=row.part_name,
+                    quantity_required=row.quantity_required,
+                    expected_cost=row.expected_cost,
+                    notes=row.notes,
+                    is_optional=row.is_optional,
+                    sequence_order=row.sequence_order
+                ))
+
+            tool_rows = db.session.query(
+                TemplateActionTool.template_action_item_id,
+                TemplateActionTool.tool_id,
+                Tool.tool_name,
+                TemplateActionTool.quantity_required,
+                TemplateActionTool.notes,
+                TemplateActionTool.is_required,
+                TemplateActionTool.sequence_order
+            ).outerjoin(
+                Tool, TemplateActionTool.tool_id == Tool.id
+            ).filter(
+                TemplateActionTool.template_action_item_id.in_(item_ids)
+            ).order_by(TemplateActionTool.sequence_order, TemplateActionTool.id).all()
+            for row in tool_rows:
+                tools_by_item.setdefault(row.template_action_item_id, []).append(ToolBlueprint(
+                    tool_id=row.tool_id,
+                    tool_name=row.tool_name,
+                    quantity_required=row.quantity_required,
+                    notes=row.notes,
+                    is_required=row.is_required,
+                    sequence_order=row.sequence_order
+                ))
+
+        actions = tuple(
+            ActionBlueprint(
+                template_action_item_id=item.id,
+                sequence_order=item.sequence_order,
+                action_name=item.action_name,
+                description=item.description,
+                estimated_duration=item.estimated_duration,
+                expected_billable_hours=item.expected_billable_hours,
+                safety_notes=item.safety_notes,
+                notes=item.notes,
+                created_by_id=item.created_by_id,
+                part_demands=tuple(part_demands_by_item.get(item.id, ())),
+                tools=tuple(tools_by_item.get(item.id, ()))
+            )
+            for item in items
+        )
+        parts = tuple(part_demand for action in actions for part_demand in action.part_demands)
+        tools = tuple(tool for action in actions for tool in action.tools)
+
+        duration = (template.estimated_duration or 0.0) + sum(
+            action.estimated_duration for action in actions if action.estimated_duration
+        )
+        cost = (template.parts_cost or 0.0) + sum(
+            part_demand.expected_cost * part_demand.quantity_required
+            for part_demand in parts if part_demand.expected_cost
+        )
+
+        logger.debug(f"Compiled blueprint for template {template.id} revision {template.revision} ({len(actions)} actions)")
+
+        return TemplateBlueprint(
+            template_action_set_id=template.id,
+            revision=template.revision,
+            task_name=template.task_name,
+            description=template.description,
+            is_active=template.is_active,
+            estimated_duration=template.estimated_duration,
+            safety_review_required=template.safety_review_required,
+            staff_count=template.staff_count,
+            parts_cost=template.parts_cost,
+            labor_hours=template.labor_hours,
+            asset_type_id=template.asset_type_id,
+            make_model_id=template.make_model_id,
+            prior_revision_id=template.prior_revision_id,
+            created_by_id=template.created_by_id,
+            actions=actions,
+            parts=parts,
+            tools=tools,
+            total_action_items=len(actions),
+            total_estimated_duration=duration if duration > 0 else None,
+            total_estimated_cost=cost if cost > 0 else None
+        )
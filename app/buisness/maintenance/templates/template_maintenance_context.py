@@ -7,6 +7,7 @@ Provides statistics, grouping methods, attachment access, and template managemen
 from typing import List, Optional, Union, Dict, Any
 from app import db
 from app.buisness.maintenance.templates.template_action_set_struct import TemplateActionSetStruct
+from app.buisness.maintenance.templates.template_blueprint import TemplateBlueprint, TemplateBlueprintCache
 from app.data.maintenance.templates.template_action_sets import TemplateActionSet
 from app.data.maintenance.templates.template_actions import TemplateActionItem
 from app.data.maintenance.templates.template_action_set_attachments import TemplateActionSetAttachment
@@ -52,6 +53,11 @@ class TemplateMaintenanceContext:
         """Get the template action set ID"""
         return self._template_action_set_id
     
+    @property
+    def blueprint(self) -> TemplateBlueprint:
+        """Get the compiled (cached) blueprint for this template revision"""
+        return TemplateBlueprintCache.get(self._template_action_set_id)
+    
     # Statistics
     @property
     def total_action_items(self) -> int:
@@ -149,6 +155,7 @@ class TemplateMaintenanceContext:
         """
         self.template_action_set.is_active = True
         db.session.commit()
+        TemplateBlueprintCache.invalidate(self._template_action_set_id)
         self.refresh()
         return self
     
@@ -161,6 +168,7 @@ class TemplateMaintenanceContext:
         """
         self.template_action_set.is_active = False
         db.session.commit()
+        TemplateBlueprintCache.invalidate(self._template_action_set_id)
         self.refresh()
         return self
     
@@ -208,19 +216,12 @@ class TemplateMaintenanceContext:
         """
         Get summary of template action set.
         
+        Totals come from the compiled blueprint rather than the ORM graph.
+        
         Returns:
             Dictionary with summary information
         """
-        return {
-            'id': self._template_action_set_id,
-            'task_name': self._struct.task_name,
-            'description': self._struct.description,
-            'revision': self._struct.revision,
-            'is_active': self._struct.is_active,
-            'total_action_items': self.total_action_items,
-            'total_estimated_duration': self.total_estimated_duration,
-            'total_estimated_cost': self.total_estimated_cost,
-        }
+        return self.blueprint.summary()
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -7,9 +7,13 @@ from .major_location import MajorLocation
 from .asset_info.asset_type import AssetType
 from .asset_info.make_model import MakeModel
 from .asset_info.asset import Asset
+from .asset_info.meter_reading import MeterReading
+from .asset_info.asset_summary import AssetSummary
 from .event_info.event import Event, EventDetailVirtual
 from .event_info.attachment import Attachment
 from .event_info.comment import Comment, CommentAttachment
+from .event_info.event_archive import EventArchivePartition
+from .background_job import BackgroundJob
 # EventDetailIDManager, AttachmentIDManager, AssetDetailIDManager, ModelDetailIDManager moved to app.models.core.sequences
 # VirtualSequenceGenerator remains in models/core (data layer infrastructure - used by sequence ID managers)
 # DataInsertionMixin moved to app.domain.core.data_insertion_mixin
@@ -20,9 +24,13 @@ __all__ = [
     'AssetType',
     'MakeModel',
     'Asset',
+    'MeterReading',
+    'AssetSummary',
     'Event',
     'EventDetailVirtual',
     'Attachment',
     'Comment',
     'CommentAttachment',
+    'EventArchivePartition',
+    'BackgroundJob',
 ] 
\ No newline at end of file
@@ -0,0 +1,44 @@
+from app import db
+from datetime import datetime
+
+class AssetSummary(db.Model):
+    """
+    Denormalized per-asset read model: one row per asset with the values the
+    asset page and fleet lists show (last event, open maintenance, last
+    completed PM, current dispatch assignment, detail count, latest meters).
+
+    Derived data only; rows are written through AssetSummaryManager, which
+    updates them incrementally and can rebuild them from the source tables.
+    """
+    __tablename__ = 'asset_summary'
+
+    asset_id = db.Column(db.Integer, db.ForeignKey('assets.id'), primary_key=True)
+
+    # Most recent event for the asset
+    last_event_id = db.Column(db.Integer, nullable=True)
+    last_event_type = db.Column(db.String(100), nullable=True)
+    last_event_at = db.Column(db.DateTime, nullable=True)
+
+    # Maintenance
+    open_maintenance_count = db.Column(db.Integer, nullable=False, default=0)
+    last_pm_event_id = db.Column(db.Integer, nullable=True)
+    last_pm_completed_at = db.Column(db.DateTime, nullable=True)
+
+    # Current dispatch assignment (active dispatch, else next planned one)
+    current_dispatch_id = db.Column(db.Integer, nullable=True)
+    assignment_status = db.Column(db.String(50), nullable=True)
+    assigned_until = db.Column(db.DateTime, nullable=True)
+
+    # Detail tables holding a row (None until the asset's detail bitmap is known)
+    detail_count = db.Column(db.Integer, nullable=True)
+
+    # Copy of Asset.meter1-meter4
+    meter1 = db.Column(db.Float, nullable=True)
+    meter2 = db.Column(db.Float, nullable=True)
+    meter3 = db.Column(db.Float, nullable=True)
+    meter4 = db.Column(db.Float, nullable=True)
+
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<AssetSummary asset={self.asset_id} open_maintenance={self.open_maintenance_count}>'
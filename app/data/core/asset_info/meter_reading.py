@@ -0,0 +1,27 @@
+from app import db
+from datetime import datetime
+
+class MeterReading(db.Model):
+    """
+    Append-only meter reading history: one row per (asset, meter, timestamp).
+
+    Kept deliberately narrow (no audit columns) because telemetry can produce
+    millions of rows. Asset.meter1-meter4 remain the current values; rows are
+    written through MeterReadingManager and never updated.
+    """
+    __tablename__ = 'meter_readings'
+
+    id = db.Column(db.Integer, primary_key=True)
+    asset_id = db.Column(db.Integer, db.ForeignKey('assets.id'), nullable=False)
+    meter = db.Column(db.SmallInteger, nullable=False)  # 1-4, matches Asset.meter1-meter4
+    recorded_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    value = db.Column(db.Float, nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_meter_readings_series', 'asset_id', 'meter', 'recorded_at'),
+    )
+
+    METERS = (1, 2, 3, 4)
+
+    def __repr__(self):
+        return f'<MeterReading asset={self.asset_id} meter{self.meter}={self.value} at {self.recorded_at}>'
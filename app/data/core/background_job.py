@@ -0,0 +1,82 @@
+from app import db
+from app.data.core.user_created_base import UserCreatedBase
+from datetime import datetime
+
+class BackgroundJob(UserCreatedBase):
+    """Queued long-running operation executed by the in-process job runner"""
+    __tablename__ = 'background_jobs'
+
+    # Job Definition
+    job_type = db.Column(db.String(100), nullable=False)  # Registered job name, e.g. 'maintenance.run_plan'
+    label = db.Column(db.String(255), nullable=True)  # Human readable description
+    params = db.Column(db.JSON, nullable=True)  # Keyword arguments for the job function
+
+    # Queue State
+    status = db.Column(db.String(20), nullable=False, default='Queued', index=True)  # Queued/Running/Succeeded/Failed/Cancelled
+    run_after = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)  # Not picked up before this time (retry backoff)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=1)
+    cancel_requested = db.Column(db.Boolean, nullable=False, default=False)
+    worker_id = db.Column(db.String(100), nullable=True)  # Process/thread that claimed the job
+
+    # Progress
+    progress = db.Column(db.Float, nullable=False, default=0.0)  # 0.0 - 1.0
+    progress_message = db.Column(db.String(255), nullable=True)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    # Results
+    result = db.Column(db.JSON, nullable=True)
+    error_message = db.Column(db.Text, nullable=True)
+
+    __table_args__ = (
+        db.Index('ix_background_jobs_queue', 'status', 'run_after'),
+    )
+
+    ACTIVE_STATUSES = ('Queued', 'Running')
+    FINISHED_STATUSES = ('Succeeded', 'Failed', 'Cancelled')
+
+    def __repr__(self):
+        return f'<BackgroundJob {self.id}: {self.job_type} - {self.status}>'
+
+    # Properties
+    @property
+    def is_active(self):
+        """Check if the job is queued or running"""
+        return self.status in self.ACTIVE_STATUSES
+
+    @property
+    def is_finished(self):
+        """Check if the job reached a final status"""
+        return self.status in self.FINISHED_STATUSES
+
+    @property
+    def can_retry(self):
+        """Failed and cancelled jobs can be queued again"""
+        return self.status in ('Failed', 'Cancelled')
+
+    @property
+    def progress_percent(self):
+        """Progress as a whole percentage"""
+        return int(round((self.progress or 0.0) * 100))
+
+    def to_dict(self):
+        """Convert to dictionary"""
+        return {
+            'id': self.id,
+            'job_type': self.job_type,
+            'label': self.label,
+            'params': self.params,
+            'status': self.status,
+            'attempts': self.attempts,
+            'max_attempts': self.max_attempts,
+            'cancel_requested': self.cancel_requested,
+            'progress': self.progress,
+            'progress_message': self.progress_message,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'result': self.result,
+            'error_message': self.error_message,
+            'created_by_id': self.created_by_id
+        }
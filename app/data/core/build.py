@@ -19,9 +19,13 @@ def build_models():
     import app.data.core.asset_info.asset_type
     import app.data.core.asset_info.make_model
     import app.data.core.asset_info.asset
+    import app.data.core.asset_info.meter_reading
+    import app.data.core.asset_info.asset_summary
     import app.data.core.event_info.event
     import app.data.core.event_info.attachment
     import app.data.core.event_info.comment
+    import app.data.core.event_info.event_archive
+    import app.data.core.background_job
     
     # Initialize attachment sequence
     from app.data.core.sequences import AttachmentIDManager
@@ -63,7 +63,12 @@ class Event(UserCreatedBase, DataInsertionMixin):
         
         db.session.add(event)
         db.session.flush()  # Get the ID without committing
-        return event.id 
+        
+        if asset_id:
+            # Keep the asset summary's last event current
+            from app.buisness.core.asset_summary_manager import AssetSummaryManager
+            AssetSummaryManager.on_event(event)
+        return event.id
     
 
 # EventDetailIDManager moved to app.models.core.sequences
@@ -0,0 +1,74 @@
+from app import db
+from datetime import datetime
+from sqlalchemy import Column, Index, MetaData, Table
+from app.data.core.event_info.event import Event
+from app.data.core.event_info.comment import Comment, CommentAttachment
+
+# Partition tables are created on demand when a year is first archived, so they
+# live outside db.metadata (create_all does not build them)
+archive_metadata = MetaData()
+
+
+class EventArchivePartition(db.Model):
+    """
+    Catalog of event archive partitions, one row per archived calendar year.
+
+    Each partition is three plain tables holding the archived rows of events,
+    comments and comment_attachments with their original IDs and columns
+    (events_archive_<year>, comments_archive_<year>,
+    comment_attachments_archive_<year>). The timestamp and ID bounds let
+    readers skip partitions a query cannot touch.
+    """
+    __tablename__ = 'event_archive_partitions'
+
+    id = db.Column(db.Integer, primary_key=True)
+    year = db.Column(db.Integer, nullable=False, unique=True)
+
+    event_count = db.Column(db.Integer, nullable=False, default=0)
+    comment_count = db.Column(db.Integer, nullable=False, default=0)
+    comment_attachment_count = db.Column(db.Integer, nullable=False, default=0)
+
+    # Bounds of the archived events in this partition
+    first_event_at = db.Column(db.DateTime, nullable=True)
+    last_event_at = db.Column(db.DateTime, nullable=True)
+    min_event_id = db.Column(db.Integer, nullable=True)
+    max_event_id = db.Column(db.Integer, nullable=True)
+
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    @property
+    def tables(self):
+        """(events, comments, comment_attachments) partition tables"""
+        return archive_tables(self.year)
+
+    def __repr__(self):
+        return f'<EventArchivePartition {self.year}: {self.event_count} events>'
+
+
+def _copy_table(source: Table, name: str, *indexed_columns: str) -> Table:
+    """Partition table with the source table's columns (no foreign keys) and the given indexes"""
+    table = archive_metadata.tables.get(name)
+    if table is not None:
+        return table
+    table = Table(
+        name, archive_metadata,
+        *[Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+          for column in source.columns]
+    )
+    for column_name in indexed_columns:
+        Index(f'ix_{name}_{column_name}', table.c[column_name])
+    return table
+
+
+def archive_tables(year: int):
+    """
+    Partition tables of one archive year.
+
+    Returns:
+        Tuple of (events, comments, comment_attachments) Table objects
+    """
+    return (
+        _copy_table(Event.__table__, f'events_archive_{year}', 'timestamp', 'asset_id'),
+        _copy_table(Comment.__table__, f'comments_archive_{year}', 'event_id'),
+        _copy_table(CommentAttachment.__table__, f'comment_attachments_archive_{year}', 'attached_to_id'),
+    )
@@ -6,12 +6,14 @@ Manages database sequences for various entity types
 from app.data.core.sequences.attachment_id_manager import AttachmentIDManager
 from app.data.core.sequences.event_detail_id_manager import EventDetailIDManager
 from app.data.core.sequences.detail_id_managers import AssetDetailIDManager, ModelDetailIDManager
+from app.data.core.sequences.purchase_order_number_manager import PurchaseOrderNumberManager
 
 __all__ = [
     'AttachmentIDManager',
     'EventDetailIDManager',
     'AssetDetailIDManager',
     'ModelDetailIDManager',
+    'PurchaseOrderNumberManager',
 ]
 
 
@@ -26,6 +26,11 @@ class AttachmentIDManager(VirtualSequenceGenerator):
         Uses the base class method for thread safety
         """
         return cls.get_next_id()
-
-
-
+    
+    @classmethod
+    def get_next_attachment_ids(cls, count):
+        """
+        Reserve count consecutive attachment IDs
+        Used by bulk inserts that write many attachment references at once
+        """
+        return cls.get_next_ids(count)
@@ -26,6 +26,14 @@ class AssetDetailIDManager(VirtualSequenceGenerator):
         Uses the base class method for thread safety
         """
         return cls.get_next_id()
+    
+    @classmethod
+    def get_next_asset_detail_ids(cls, count):
+        """
+        Reserve count consecutive asset detail IDs
+        Used by bulk asset onboarding
+        """
+        return cls.get_next_ids(count)
 
 
 class ModelDetailIDManager(VirtualSequenceGenerator):
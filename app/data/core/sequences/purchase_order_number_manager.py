@@ -0,0 +1,130 @@
+"""
+Purchase Order Number Manager
+Manages the monthly po_number sequence for PurchaseOrderHeader
+"""
+
+from datetime import date
+from sqlalchemy import text
+from app import db
+from app.data.core.virtual_sequence_generator import VirtualSequenceGenerator
+
+
+class PurchaseOrderNumberManager(VirtualSequenceGenerator):
+    """
+    Manages the monthly purchase order number sequence
+    Keeps one counter row per month (id = YYYYMM) so numbering restarts each month
+    """
+
+    @classmethod
+    def get_sequence_table_name(cls):
+        """
+        Return the table name for the purchase order number counter
+        """
+        return "_sequence_purchase_order_number"
+
+    @classmethod
+    def create_sequence_if_not_exists(cls):
+        """
+        Create the counter table if it doesn't exist
+        Month rows are created on first use, so no initial row is inserted
+        """
+        try:
+            db.session.execute(text(f"""
+                CREATE TABLE IF NOT EXISTS {cls.get_sequence_table_name()} (
+                    id INTEGER PRIMARY KEY,
+                    current_value INTEGER DEFAULT 0
+                )
+            """))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise e
+
+    @staticmethod
+    def get_prefix(on_date=None):
+        """
+        Return the PO number prefix for a month (e.g. 'PO-202510')
+        """
+        on_date = on_date or date.today()
+        return f"PO-{on_date.year}{on_date.month:02d}"
+
+    @staticmethod
+    def format_po_number(prefix, value):
+        """
+        Format a sequence value as a PO number
+        """
+        return f"{prefix}-{value:04d}"
+
+    @classmethod
+    def get_next_po_number(cls, on_date=None):
+        """
+        Get the next PO number for the month of on_date (default today)
+        """
+        return cls.get_next_po_numbers(1, on_date)[0]
+
+    @classmethod
+    def get_next_po_numbers(cls, count, on_date=None):
+        """
+        Reserve a block of consecutive PO numbers for the month of on_date
+
+        The counter row is incremented by count in a single UPDATE, so concurrent
+        callers always receive disjoint blocks.
+
+        Args:
+            count: Number of PO numbers to reserve
+            on_date: Date used to pick the month (default today)
+
+        Returns:
+            List of PO number strings
+        """
+        if count <= 0:
+            return []
+
+        on_date = on_date or date.today()
+        period = on_date.year * 100 + on_date.month
+        prefix = cls.get_prefix(on_date)
+        table_name = cls.get_sequence_table_name()
+
+        with cls._lock:
+            exists = db.session.execute(
+                text(f"SELECT 1 FROM {table_name} WHERE id = :period"),
+                {'period': period}
+            ).scalar()
+            if not exists:
+                # Seed from PO numbers issued before this month's counter existed
+                seed = cls._get_highest_existing_number(prefix)
+                db.session.execute(
+                    text(f"INSERT OR IGNORE INTO {table_name} (id, current_value) VALUES (:period, :seed)"),
+                    {'period': period, 'seed': seed}
+                )
+
+            db.session.execute(
+                text(f"UPDATE {table_name} SET current_value = current_value + :count WHERE id = :period"),
+                {'count': count, 'period': period}
+            )
+            last_value = db.session.execute(
+                text(f"SELECT current_value FROM {table_name} WHERE id = :period"),
+                {'period': period}
+            ).scalar()
+
+        first_value = last_value - count + 1
+        return [cls.format_po_number(prefix, value) for value in range(first_value, last_value + 1)]
+
+    @staticmethod
+    def _get_highest_existing_number(prefix):
+        """
+        Find the highest PO number already stored for a month prefix
+        Only used once per month to seed the counter row
+        """
+        from app.data.inventory.base.purchase_order_header import PurchaseOrderHeader
+
+        last_po_number = db.session.query(PurchaseOrderHeader.po_number).filter(
+            PurchaseOrderHeader.po_number.like(f"{prefix}-%")
+        ).order_by(PurchaseOrderHeader.po_number.desc()).limit(1).scalar()
+
+        if not last_po_number:
+            return 0
+        try:
+            return int(last_po_number.split('-')[-1])
+        except (ValueError, IndexError):
+            return 0
@@ -39,6 +39,23 @@ class VirtualSequenceGenerator(ABC):
             result = db.session.execute(text(f"SELECT current_value FROM {cls.get_sequence_table_name()}"))
             return result.scalar()
     
+    @classmethod
+    def get_next_ids(cls, count):
+        """
+        Reserve a block of consecutive IDs from the sequence
+        The counter is incremented by count in a single UPDATE
+        """
+        if count <= 0:
+            return []
+        with cls._lock:
+            db.session.execute(
+                text(f"UPDATE {cls.get_sequence_table_name()} SET current_value = current_value + :count"),
+                {'count': count}
+            )
+            result = db.session.execute(text(f"SELECT current_value FROM {cls.get_sequence_table_name()}"))
+            last_value = result.scalar()
+        return list(range(last_value - count + 1, last_value + 1))
+    
     @classmethod
     def create_sequence_if_not_exists(cls):
         """
@@ -7,6 +7,8 @@ from app.data.inventory.base.package_header import PackageHeader
 from app.data.inventory.base.part_arrival import PartArrival
 from app.data.inventory.base.active_inventory import ActiveInventory
 from app.data.inventory.base.inventory_movement import InventoryMovement
+from app.data.inventory.base.stock_reconciliation_run import StockReconciliationRun
+from app.data.inventory.base.part_stock_forecast import PartStockForecast
 
 __all__ = [
     'PurchaseOrderHeader',
@@ -15,6 +17,8 @@ __all__ = [
     'PackageHeader',
     'PartArrival',
     'ActiveInventory',
-    'InventoryMovement'
+    'InventoryMovement',
+    'StockReconciliationRun',
+    'PartStockForecast'
 ]
 
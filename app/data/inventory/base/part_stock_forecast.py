@@ -0,0 +1,65 @@
+from pathlib import Path
+from app import db
+from app.data.core.user_created_base import UserCreatedBase
+from datetime import datetime
+
+class PartStockForecast(UserCreatedBase):
+    """Cached consumption forecast and reorder point by part and location"""
+    __tablename__ = 'part_stock_forecasts'
+
+    # Foreign Keys
+    part_id = db.Column(db.Integer, db.ForeignKey('parts.id'), nullable=False)
+    # Null location = fleet-wide forecast across all locations
+    major_location_id = db.Column(db.Integer, db.ForeignKey('major_locations.id'), nullable=True)
+
+    # Forecast Window
+    computed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    window_days = db.Column(db.Integer, nullable=False)
+
+    # Daily Demand
+    total_issued = db.Column(db.Float, default=0.0)
+    moving_average_demand = db.Column(db.Float, default=0.0)
+    smoothed_demand = db.Column(db.Float, default=0.0)
+    demand_std_dev = db.Column(db.Float, default=0.0)
+
+    # Reorder Policy
+    lead_time_days = db.Column(db.Float, nullable=False)
+    safety_stock = db.Column(db.Float, default=0.0)
+    reorder_point = db.Column(db.Float, default=0.0)
+    order_up_to_level = db.Column(db.Float, default=0.0)
+
+    __table_args__ = (
+        db.UniqueConstraint('part_id', 'major_location_id', name='uix_forecast_part_location'),
+        db.Index('ix_part_stock_forecasts_location_part', 'major_location_id', 'part_id'),
+    )
+
+    # Relationships
+    part = db.relationship('Part')
+    major_location = db.relationship('MajorLocation')
+
+    def __repr__(self):
+        return f'<PartStockForecast Part:{self.part_id} Location:{self.major_location_id} ROP:{self.reorder_point}>'
+
+    # Properties
+    @property
+    def is_fleet_wide(self):
+        """Check if forecast covers all locations"""
+        return self.major_location_id is None
+
+    def to_dict(self):
+        """Convert to dictionary"""
+        return {
+            'id': self.id,
+            'part_id': self.part_id,
+            'major_location_id': self.major_location_id,
+            'computed_at': self.computed_at.isoformat() if self.computed_at else None,
+            'window_days': self.window_days,
+            'total_issued': self.total_issued,
+            'moving_average_demand': self.moving_average_demand,
+            'smoothed_demand': self.smoothed_demand,
+            'demand_std_dev': self.demand_std_dev,
+            'lead_time_days': self.lead_time_days,
+            'safety_stock': self.safety_stock,
+            'reorder_point': self.reorder_point,
+            'order_up_to_level': self.order_up_to_level
+        }
@@ -0,0 +1,57 @@
+from pathlib import Path
+from app import db
+from app.data.core.user_created_base import UserCreatedBase
+from datetime import datetime
+
+class StockReconciliationRun(UserCreatedBase):
+    """Record of a Part.current_stock_level reconciliation pass against inventory"""
+    __tablename__ = 'stock_reconciliation_runs'
+
+    # Window
+    since = db.Column(db.DateTime, nullable=True)  # Previous watermark (null = full scan)
+    watermark = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)  # Next run starts here
+
+    # Run Details
+    status = db.Column(db.String(20), default='Running')  # Running/Complete/Failed
+    auto_correct = db.Column(db.Boolean, default=False)
+    started_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    # Results
+    parts_checked = db.Column(db.Integer, default=0)
+    drift_count = db.Column(db.Integer, default=0)
+    corrected_count = db.Column(db.Integer, default=0)
+    drift_report = db.Column(db.JSON, nullable=True)  # List of per-part drift dicts
+    error_message = db.Column(db.Text, nullable=True)
+
+    def __repr__(self):
+        return f'<StockReconciliationRun {self.id}: {self.status}, Drift {self.drift_count}>'
+
+    # Properties
+    @property
+    def is_complete(self):
+        """Check if status is Complete"""
+        return self.status == 'Complete'
+
+    @property
+    def is_incremental(self):
+        """Check if run only covered parts touched since a watermark"""
+        return self.since is not None
+
+    def to_dict(self):
+        """Convert to dictionary"""
+        return {
+            'id': self.id,
+            'since': self.since.isoformat() if self.since else None,
+            'watermark': self.watermark.isoformat() if self.watermark else None,
+            'status': self.status,
+            'auto_correct': self.auto_correct,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'parts_checked': self.parts_checked,
+            'drift_count': self.drift_count,
+            'corrected_count': self.corrected_count,
+            'drift_report': self.drift_report,
+            'error_message': self.error_message,
+            'created_by_id': self.created_by_id
+        }
@@ -13,7 +13,9 @@ from app.data.inventory.base import (
     PackageHeader,
     PartArrival,
     ActiveInventory,
-    InventoryMovement
+    InventoryMovement,
+    StockReconciliationRun,
+    PartStockForecast
 )
 
 
@@ -33,9 +35,15 @@ def build_models():
         PackageHeader,
         PartArrival,
         ActiveInventory,
-        InventoryMovement
+        InventoryMovement,
+        StockReconciliationRun,
+        PartStockForecast
     ]
-    
+
+    # Initialize monthly purchase order number sequence
+    from app.data.core.sequences import PurchaseOrderNumberManager
+    PurchaseOrderNumberManager.create_sequence_if_not_exists()
+
     print(f"Phase 6: Registered {len(models)} inventory models")
     return True
 
@@ -155,6 +163,16 @@ def get_model_info():
                 'name': 'InventoryMovement',
                 'table': 'inventory_movements',
                 'description': 'Inventory movement audit trail with traceability'
+            },
+            {
+                'name': 'StockReconciliationRun',
+                'table': 'stock_reconciliation_runs',
+                'description': 'Part stock level reconciliation runs and drift reports'
+            },
+            {
+                'name': 'PartStockForecast',
+                'table': 'part_stock_forecasts',
+                'description': 'Cached consumption forecasts and reorder points'
             }
         ],
         'features': [
@@ -5,7 +5,9 @@ from .base import (
     Action,
     PartDemand,
     ActionTool,
-    MaintenanceDelay
+    MaintenanceDelay,
+    MaintenanceKpiChange,
+    MaintenanceKpiRollup
 )
 
 # Template models
@@ -36,7 +38,8 @@ from .virtual_action_tool import VirtualActionTool
 # Builder models
 from .builders import (
     TemplateBuilderMemory,
-    TemplateBuilderAttachmentReference
+    TemplateBuilderAttachmentReference,
+    TemplateBuilderOp
 )
 
 __all__ = [
@@ -47,6 +50,8 @@ __all__ = [
     'PartDemand',
     'ActionTool',
     'MaintenanceDelay',
+    'MaintenanceKpiChange',
+    'MaintenanceKpiRollup',
     
     # Template models
     'TemplateActionSet',
@@ -73,5 +78,6 @@ __all__ = [
     
     # Builder models
     'TemplateBuilderMemory',
-    'TemplateBuilderAttachmentReference'
+    'TemplateBuilderAttachmentReference',
+    'TemplateBuilderOp'
 ]
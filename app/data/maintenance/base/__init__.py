@@ -4,6 +4,8 @@ from .actions import Action
 from .part_demands import PartDemand
 from .action_tools import ActionTool
 from .maintenance_delays import MaintenanceDelay
+from .maintenance_kpi_changes import MaintenanceKpiChange
+from .maintenance_kpi_rollups import MaintenanceKpiRollup
 
 __all__ = [
     'MaintenancePlan',
@@ -11,5 +13,7 @@ __all__ = [
     'Action',
     'PartDemand',
     'ActionTool',
-    'MaintenanceDelay'
+    'MaintenanceDelay',
+    'MaintenanceKpiChange',
+    'MaintenanceKpiRollup'
 ]
@@ -1,12 +1,22 @@
 from app.data.maintenance.virtual_action_item import VirtualActionItem
 from app import db
-from sqlalchemy.orm import relationship
+from app.utils.ordering_keys import ORDER_KEY_GAP, key_for_position, position_for_key
+from sqlalchemy import func, inspect, tuple_
+from sqlalchemy.orm import object_session, relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from datetime import datetime
 
 class Action(VirtualActionItem):
     """
     Individual action within a maintenance event
     Sequence order is copied from template action item
+
+    Ordering is stored as a sparse key (order_key) in the sequence_order column
+    so inserts and moves write a single row. sequence_order is the dense 1-based
+    position among sibling actions; in SQL expressions it orders by order_key.
+    Lists of actions should sort by (order_key, id) and take positions from
+    MaintenanceActionSetStruct.action_positions rather than reading
+    sequence_order per action.
     """
     __tablename__ = 'actions'
     
@@ -16,8 +26,8 @@ class Action(VirtualActionItem):
     # Template reference
     template_action_item_id = db.Column(db.Integer, db.ForeignKey('template_actions.id'), nullable=True)
     
-    # Sequence ordering - copied from template
-    sequence_order = db.Column(db.Integer, nullable=False, default=1)
+    # Sparse ordering key - spaced by ORDER_KEY_GAP, see app.utils.ordering_keys
+    order_key = db.Column('sequence_order', db.Integer, nullable=False, default=ORDER_KEY_GAP)
     
     # Execution tracking
     status = db.Column(db.String(20), nullable=False, default='Not Started')
@@ -41,5 +51,43 @@ class Action(VirtualActionItem):
     assigned_user = relationship('User', foreign_keys=[assigned_user_id], backref='assigned_actions')
     assigned_by = relationship('User', foreign_keys=[assigned_by_id], backref='assigned_actions_by_me')
     
+    @hybrid_property
+    def sequence_order(self):
+        """1-based position among the actions of the maintenance action set"""
+        session = object_session(self)
+        if self.id is not None and session is not None and self._siblings_unloaded():
+            # Count the lower-keyed siblings instead of loading them all
+            return 1 + session.query(func.count(Action.id)).filter(
+                Action.maintenance_action_set_id == self.maintenance_action_set_id,
+                tuple_(Action.order_key, Action.id) < tuple_(self.order_key, self.id)
+            ).scalar()
+        action_set = self.maintenance_action_set
+        if action_set is None:
+            return position_for_key(self.order_key)
+        own = (self.order_key, self.id or 0)
+        return 1 + sum(
+            1 for action in action_set.actions
+            if action is not self and (action.order_key, action.id or 0) < own
+        )
+
+    @sequence_order.setter
+    def sequence_order(self, position):
+        """
+        Place a new action at a position of a freshly spaced list (factories copying
+        template order). Existing actions move with ActionContext.reorder_action.
+        """
+        self.order_key = key_for_position(position)
+
+    @sequence_order.expression
+    def sequence_order(cls):
+        return cls.order_key
+
+    def _siblings_unloaded(self) -> bool:
+        """True when reading the sibling actions would load them"""
+        if 'maintenance_action_set' in inspect(self).unloaded:
+            return True
+        action_set = self.maintenance_action_set
+        return action_set is not None and 'actions' in inspect(action_set).unloaded
+
     def __repr__(self):
         return f'<Action {self.id}: {self.action_name} - {self.status}>'
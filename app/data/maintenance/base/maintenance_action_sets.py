@@ -43,7 +43,7 @@ class MaintenanceActionSet(EventDetailVirtual, VirtualActionSet):
     asset = relationship('Asset', foreign_keys='MaintenanceActionSet.asset_id', lazy='select')
     maintenance_plan = relationship('MaintenancePlan', back_populates='maintenance_action_sets', lazy='select')
     template_action_set = relationship('TemplateActionSet', foreign_keys=[template_action_set_id], back_populates='maintenance_action_sets', lazy='select', overlaps='maintenance_action_sets')
-    actions = relationship('Action', back_populates='maintenance_action_set', lazy='selectin', order_by='Action.sequence_order', cascade='all, delete-orphan')
+    actions = relationship('Action', back_populates='maintenance_action_set', lazy='selectin', order_by='Action.order_key', cascade='all, delete-orphan')
     delays = relationship('MaintenanceDelay', back_populates='maintenance_action_set', lazy='selectin', cascade='all, delete-orphan')
     
     # User relationships
@@ -0,0 +1,32 @@
+from app.data.core.user_created_base import UserCreatedBase
+from app import db
+from datetime import datetime
+
+
+class MaintenanceKpiChange(UserCreatedBase):
+    """
+    Change record emitted by a maintenance status transition.
+    Holds the dimension keys at the time of the transition and the counter
+    deltas that were applied to MaintenanceKpiRollup.
+    """
+    __tablename__ = 'maintenance_kpi_changes'
+
+    maintenance_action_set_id = db.Column(db.Integer, db.ForeignKey('maintenance_action_sets.id'), nullable=False, index=True)
+    action_id = db.Column(db.Integer, db.ForeignKey('actions.id', ondelete='SET NULL'), nullable=True)
+
+    # open/start/complete/cancel/reopen/delay_start/delay_end/delay_change/action_status
+    change_type = db.Column(db.String(20), nullable=False)
+    occurred_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    # Dimension keys when the change happened
+    asset_id = db.Column(db.Integer, nullable=True)
+    asset_type_id = db.Column(db.Integer, nullable=True)
+    major_location_id = db.Column(db.Integer, nullable=True)
+    technician_id = db.Column(db.Integer, nullable=True)
+
+    # Counter deltas, e.g. {"completed_count": 1, "repair_hours": 3.5}
+    flow_deltas = db.Column(db.JSON, nullable=True)
+    backlog_deltas = db.Column(db.JSON, nullable=True)
+
+    def __repr__(self):
+        return f'<MaintenanceKpiChange {self.id}: {self.change_type} MAS:{self.maintenance_action_set_id}>'
@@ -0,0 +1,50 @@
+from app.data.core.user_created_base import UserCreatedBase
+from app import db
+
+
+class MaintenanceKpiRollup(UserCreatedBase):
+    """
+    Materialized maintenance KPI counters keyed by (dimension, dimension_id, period).
+
+    dimension is fleet/asset/asset_type/location/technician; fleet rows use
+    dimension_id 0. Monthly rows (period 'YYYY-MM') hold flow counters for
+    transitions in that month. The period 'open' holds the current backlog.
+    Ratios (MTTR, completion rate, backlog age) are derived from the sums.
+    """
+    __tablename__ = 'maintenance_kpi_rollups'
+
+    dimension = db.Column(db.String(20), nullable=False)
+    dimension_id = db.Column(db.Integer, nullable=False, default=0)
+    period = db.Column(db.String(7), nullable=False)
+
+    # Event flow
+    opened_count = db.Column(db.Integer, nullable=False, default=0)
+    started_count = db.Column(db.Integer, nullable=False, default=0)
+    completed_count = db.Column(db.Integer, nullable=False, default=0)
+    cancelled_count = db.Column(db.Integer, nullable=False, default=0)
+
+    # Repair time (start to completion) for MTTR
+    repair_count = db.Column(db.Integer, nullable=False, default=0)
+    repair_hours = db.Column(db.Float, nullable=False, default=0.0)
+
+    # Delays
+    delay_count = db.Column(db.Integer, nullable=False, default=0)
+    delay_hours = db.Column(db.Float, nullable=False, default=0.0)
+
+    # Actions
+    actions_completed = db.Column(db.Integer, nullable=False, default=0)
+    actions_failed = db.Column(db.Integer, nullable=False, default=0)
+    actions_skipped = db.Column(db.Integer, nullable=False, default=0)
+    billable_hours = db.Column(db.Float, nullable=False, default=0.0)
+
+    # Backlog ('open' period): open events and the sum of their open timestamps
+    backlog_count = db.Column(db.Integer, nullable=False, default=0)
+    backlog_opened_epoch = db.Column(db.Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        db.UniqueConstraint('dimension', 'dimension_id', 'period', name='uix_kpi_rollup_key'),
+        db.Index('ix_kpi_rollups_dimension_period', 'dimension', 'period'),
+    )
+
+    def __repr__(self):
+        return f'<MaintenanceKpiRollup {self.dimension}:{self.dimension_id} {self.period}>'
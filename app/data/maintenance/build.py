@@ -27,6 +27,8 @@ def build_models():
     import app.data.maintenance.base.maintenance_delays
     import app.data.maintenance.base.part_demands
     import app.data.maintenance.base.action_tools
+    import app.data.maintenance.base.maintenance_kpi_changes
+    import app.data.maintenance.base.maintenance_kpi_rollups
     
     # Import template models
     import app.data.maintenance.templates.template_action_sets
@@ -4,9 +4,11 @@ Template Builder Memory Data Models
 
 from .template_builder_memory import TemplateBuilderMemory
 from .template_builder_attachment_reference import TemplateBuilderAttachmentReference
+from .template_builder_op import TemplateBuilderOp
 
 __all__ = [
     'TemplateBuilderMemory',
     'TemplateBuilderAttachmentReference',
+    'TemplateBuilderOp',
 ]
 
@@ -6,6 +6,8 @@ Data model for storing draft template builds before submission.
 from app.data.core.user_created_base import UserCreatedBase
 from app import db
 from sqlalchemy.orm import relationship
+from app.utils.json_patch import apply_patch
+from typing import Optional, Tuple
 import json
 
 
@@ -34,14 +36,22 @@ class TemplateBuilderMemory(UserCreatedBase):
     template_action_set = relationship('TemplateActionSet', foreign_keys=[template_action_set_id], lazy='select')
     
     # Build state stored as JSON
-    build_state = db.Column(db.Text, nullable=True)  # JSON string containing complete template structure
+    build_state = db.Column(db.Text, nullable=True)  # JSON string containing complete template structure (snapshot)
     
-    def get_build_state_dict(self) -> dict:
+    # Edits saved since the last snapshot, applied on top of build_state in order
+    ops = relationship(
+        'TemplateBuilderOp',
+        order_by='TemplateBuilderOp.id',
+        lazy='select',
+        cascade='all, delete-orphan'
+    )
+    
+    def get_snapshot_dict(self) -> dict:
         """
-        Deserialize build_state JSON to Python dict.
+        Deserialize the build_state snapshot without pending ops.
         
         Returns:
-            dict: Build state as dictionary, or empty dict if None/empty
+            dict: Snapshot as dictionary, or empty dict if None/empty
         """
         if not self.build_state:
             return {}
@@ -50,6 +60,35 @@ class TemplateBuilderMemory(UserCreatedBase):
         except (json.JSONDecodeError, TypeError):
             return {}
     
+    def get_build_state_dict(self) -> dict:
+        """
+        Deserialize build_state JSON to Python dict with pending ops applied.
+        
+        Returns:
+            dict: Build state as dictionary, or empty dict if None/empty
+        """
+        state, _ = self.replay_ops()
+        return state
+    
+    def replay_ops(self) -> Tuple[dict, Optional['TemplateBuilderOp']]:
+        """
+        Apply the pending ops to the snapshot, in order.
+        
+        Returns:
+            tuple: (state with every op up to the first failing one applied,
+                first op that no longer applies or None). Ops after a failing
+                op are not applied; TemplateBuilderContext compacts the log
+                when one fails.
+        """
+        state = self.get_snapshot_dict()
+        for op in self.ops:
+            try:
+                # Not in place, so a patch failing halfway leaves the last good state
+                state = apply_patch(state, op.get_patch_list())
+            except ValueError:
+                return state, op
+        return state, None
+    
     def set_build_state_dict(self, state_dict: dict):
         """
         Serialize build state dict to JSON string.
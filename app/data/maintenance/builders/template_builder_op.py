@@ -0,0 +1,46 @@
+"""
+Template Builder Operation
+Data model for the operation log of a draft template build.
+"""
+
+from app.data.core.user_created_base import UserCreatedBase
+from app import db
+import json
+
+
+class TemplateBuilderOp(UserCreatedBase):
+    """
+    One saved edit to a draft template build, stored as a JSON patch.
+    The current build state is TemplateBuilderMemory.build_state with every
+    op applied in ID order. Ops are folded into build_state and deleted on
+    compaction.
+    """
+    __tablename__ = 'template_builder_ops'
+
+    # Builder reference
+    template_builder_memory_id = db.Column(
+        db.Integer,
+        db.ForeignKey('template_build_memory.id'),
+        nullable=False,
+        index=True
+    )
+
+    # JSON patch (list of add/remove/replace operations)
+    patch = db.Column(db.Text, nullable=False)
+
+    def get_patch_list(self) -> list:
+        """
+        Deserialize patch JSON to a list of operations.
+
+        Returns:
+            list: Patch operations, or empty list if None/invalid
+        """
+        if not self.patch:
+            return []
+        try:
+            return json.loads(self.patch)
+        except (json.JSONDecodeError, TypeError):
+            return []
+
+    def __repr__(self):
+        return f'<TemplateBuilderOp {self.id}: builder={self.template_builder_memory_id}>'
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of moving an action against the number of actions in a set.
+
+Compares ActionContext.reorder_action (sparse order keys) with the previous
+dense renumbering, which rewrote every sibling between the old and new
+position. Runs against a throwaway SQLite database unless DATABASE_URL is set.
+
+Usage:
+    python app/debug/benchmark_action_reorder.py [--sizes 10 100 1000] [--moves 20]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+if 'DATABASE_URL' not in os.environ:
+    _db_file = os.path.join(tempfile.mkdtemp(prefix='armada_bench_'), 'benchmark.db')
+    os.environ['DATABASE_URL'] = f'sqlite:///{_db_file}'
+
+from sqlalchemy import event
+from app import create_app, db
+from app.build import build_models, insert_critical_data
+
+
+class StatementCounter:
+    """Counts UPDATE statements and updated rows on an engine"""
+
+    def __init__(self, engine):
+        self.updates = 0
+        self.rows = 0
+        event.listen(engine, 'after_cursor_execute', self._after_execute)
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('UPDATE'):
+            self.updates += 1
+            self.rows += max(cursor.rowcount, 0)
+
+    def reset(self):
+        self.updates = 0
+        self.rows = 0
+
+
+def _create_action_set(size, user_id):
+    """Create an event with a maintenance action set holding size actions"""
+    from app.data.core.event_info.event import Event
+    from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
+    from app.data.maintenance.base.actions import Action
+
+    event_row = Event(event_type='Maintenance', description=f'Reorder benchmark ({size} actions)', user_id=user_id)
+    db.session.add(event_row)
+    db.session.flush()
+    action_set = MaintenanceActionSet(
+        event_id=event_row.id,
+        task_name=f'Reorder benchmark {size}',
+        created_by_id=user_id,
+        updated_by_id=user_id
+    )
+    db.session.add(action_set)
+    db.session.flush()
+    db.session.add_all([
+        Action(
+            maintenance_action_set_id=action_set.id,
+            sequence_order=position,
+            action_name=f'Step {position}',
+            created_by_id=user_id,
+            updated_by_id=user_id
+        )
+        for position in range(1, size + 1)
+    ])
+    db.session.commit()
+    return action_set.id
+
+
+def _dense_reorder(action, new_position):
+    """Previous behaviour: shift every sibling between the old and new position"""
+    from app.data.maintenance.base.actions import Action
+
+    siblings = Action.query.filter_by(
+        maintenance_action_set_id=action.maintenance_action_set_id
+    ).order_by(Action.order_key).all()
+    positions = {sibling.id: index for index, sibling in enumerate(siblings, start=1)}
+    current = positions[action.id]
+    for sibling in siblings:
+        position = positions[sibling.id]
+        if new_position < current and new_position <= position < current:
+            sibling.order_key = position + 1
+        elif new_position > current and current < position <= new_position:
+            sibling.order_key = position - 1
+        else:
+            sibling.order_key = position
+    action.order_key = new_position
+    db.session.commit()
+
+
+def _run(size, moves, user_id, counter, dense):
+    """Time random moves in a fresh set, returning (ms per move, updates, rows)"""
+    from app.data.maintenance.base.actions import Action
+    from app.buisness.maintenance.base.action_context import ActionContext
+
+    action_set_id = _create_action_set(size, user_id)
+    action_ids = [row.id for row in db.session.query(Action.id).filter_by(maintenance_action_set_id=action_set_id)]
+    rng = random.Random(size)
+
+    if dense:
+        # Dense scheme stores positions 1..n
+        db.session.query(Action).filter_by(maintenance_action_set_id=action_set_id).update(
+            {Action.order_key: Action.id - min(action_ids) + 1}
+        )
+        db.session.commit()
+
+    counter.reset()
+    started = time.perf_counter()
+    for _ in range(moves):
+        action = db.session.get(Action, rng.choice(action_ids))
+        new_position = rng.randint(1, size)
+        if dense:
+            _dense_reorder(action, new_position)
+        else:
+            ActionContext(action).reorder_action(new_position)
+    elapsed = time.perf_counter() - started
+    return elapsed * 1000 / moves, counter.updates / moves, counter.rows / moves
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark action reorder cost against action count')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 50, 200, 1000])
+    parser.add_argument('--moves', type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        build_models('all')
+        insert_critical_data()
+
+        from app.data.core.user_info.user import User
+        user_id = User.query.first().id
+        counter = StatementCounter(db.engine)
+
+        print(f"{'actions':>8} | {'scheme':>6} | {'ms/move':>8} | {'UPDATEs/move':>12} | {'rows/move':>9}")
+        print('-' * 58)
+        for size in args.sizes:
+            for dense in (True, False):
+                ms, updates, rows = _run(size, args.moves, user_id, counter, dense)
+                scheme = 'dense' if dense else 'sparse'
+                print(f"{size:>8} | {scheme:>6} | {ms:>8.2f} | {updates:>12.1f} | {rows:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
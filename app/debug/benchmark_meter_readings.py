@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark: meter reading ingestion, rollups and fleet rate of use.
+
+Generates synthetic odometer readings (one series per asset, readings every
+few hours with noisy daily usage), then times:
+- batched ingestion through MeterReadingManager.ingest
+- weekly rollup of one asset and daily rollup of the fleet for one month
+- fleet-wide rate of use with MeterReadingManager.get_rates_of_use, against
+  a per-asset Python loop over the same rows
+Runs against a throwaway SQLite database unless DATABASE_URL is set.
+
+Usage:
+    python app/debug/benchmark_meter_readings.py [--assets 500] [--readings 2000000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+if 'DATABASE_URL' not in os.environ:
+    _db_file = os.path.join(tempfile.mkdtemp(prefix='armada_bench_'), 'benchmark.db')
+    os.environ['DATABASE_URL'] = f'sqlite:///{_db_file}'
+
+from sqlalchemy import func, insert, select
+from app import create_app, db
+from app.build import build_models, insert_critical_data
+
+
+def _create_assets(count, user_id):
+    """Insert bare assets with one Core INSERT and return their IDs"""
+    from app.data.core.asset_info.asset import Asset
+
+    stamp = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+    db.session.execute(insert(Asset.__table__), [
+        {'name': f'Meter bench {i}', 'serial_number': f'MB-{stamp}-{i}', 'status': 'Active',
+         'created_by_id': user_id, 'updated_by_id': user_id}
+        for i in range(count)
+    ])
+    db.session.commit()
+    return [row.id for row in db.session.query(Asset.id).filter(Asset.serial_number.like(f'MB-{stamp}-%'))]
+
+
+def _generate_readings(asset_ids, total, end, seed=42):
+    """Yield (asset_id, meter, recorded_at, value) in time order per asset"""
+    rng = random.Random(seed)
+    per_asset = max(total // len(asset_ids), 2)
+    step = timedelta(hours=4)
+    start = end - step * per_asset
+    for asset_id in asset_ids:
+        daily_usage = rng.uniform(20, 400)
+        value = rng.uniform(0, 100000)
+        recorded_at = start
+        for _ in range(per_asset):
+            value += max(rng.gauss(daily_usage / 6, daily_usage / 24), 0.0)
+            recorded_at += step
+            yield asset_id, 1, recorded_at, value
+
+
+def _python_rates(meter, start, end):
+    """Baseline: per-asset least squares in plain Python"""
+    from app.data.core.asset_info.meter_reading import MeterReading
+
+    series = {}
+    rows = db.session.execute(
+        select(MeterReading.asset_id, func.julianday(MeterReading.recorded_at), MeterReading.value)
+        .where(MeterReading.meter == meter, MeterReading.recorded_at >= start, MeterReading.recorded_at <= end)
+        .order_by(MeterReading.asset_id, MeterReading.recorded_at)
+    )
+    for asset_id, day, value in rows:
+        series.setdefault(asset_id, []).append((day, value))
+    rates = {}
+    for asset_id, points in series.items():
+        n = len(points)
+        mean_x = sum(x for x, _ in points) / n
+        mean_y = sum(y for _, y in points) / n
+        sxx = sum((x - mean_x) ** 2 for x, _ in points)
+        if n > 1 and sxx:
+            rates[asset_id] = sum((x - mean_x) * (y - mean_y) for x, y in points) / sxx
+    return rates
+
+
+def _timed(label, fn):
+    started = time.perf_counter()
+    result = fn()
+    print(f"{label:<44} {time.perf_counter() - started:>8.2f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark meter reading ingestion and analysis')
+    parser.add_argument('--assets', type=int, default=500)
+    parser.add_argument('--readings', type=int, default=2000000)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        build_models('all')
+        insert_critical_data()
+
+        from app.data.core.user_info.user import User
+        from app.buisness.core.meter_reading_manager import MeterReadingManager
+
+        user_id = User.query.first().id
+        asset_ids = _create_assets(args.assets, user_id)
+        end = datetime.utcnow().replace(microsecond=0)
+
+        readings = _timed('generate readings', lambda: list(_generate_readings(asset_ids, args.readings, end)))
+        inserted = _timed(f'ingest {len(readings):,} readings', lambda: MeterReadingManager.ingest(readings))
+        _timed('commit', db.session.commit)
+        print(f"{'':<44} {inserted:,} rows")
+
+        month_start = end - timedelta(days=30)
+        _timed('weekly rollup, one asset, full history',
+               lambda: MeterReadingManager.rollup([asset_ids[0]], 1, period='week'))
+        rows = _timed('daily rollup, fleet, last 30 days',
+                      lambda: MeterReadingManager.rollup(asset_ids, 1, start=month_start, period='day'))
+        print(f"{'':<44} {len(rows):,} rollup rows")
+
+        for window_days in (28, 365):
+            rates = _timed(f'rates of use, fleet, {window_days} days (NumPy)',
+                           lambda: MeterReadingManager.get_rates_of_use(1, window_days=window_days, as_of=end))
+            baseline = _timed(f'rates of use, fleet, {window_days} days (Python loop)',
+                              lambda: _python_rates(1, end - timedelta(days=window_days), end))
+            worst = max((abs(rates[a] - baseline[a]) for a in baseline), default=0.0)
+            print(f"{'':<44} {len(rates):,} assets, max difference {worst:.2e} units/day")
+
+        _timed('forecast due date, one asset',
+               lambda: MeterReadingManager.forecast_due_date(asset_ids[0], 1, end - timedelta(days=10), 5000))
+
+
+if __name__ == '__main__':
+    main()
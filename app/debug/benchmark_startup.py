@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold application startup.
+
+Each scenario runs in a fresh interpreter, so every import is paid again:
+- web app with lazy route groups (PRELOAD_BLUEPRINTS=0, the debug mode
+  default)
+- web app with every route group preloaded (the default outside debug
+  mode)
+- the build CLI app without the web stack (create_app(web=False))
+- first request to a lazily registered route group
+Prints the median and fastest of several runs. Runs against a throwaway
+SQLite database unless DATABASE_URL is set. Use app.py --profile-startup
+to see which modules the time goes to.
+
+Usage:
+    python app/debug/benchmark_startup.py [--runs 7]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+
+_PRELUDE = f"""
+import json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {str(project_root)!r})
+from app import create_app
+"""
+
+SCENARIOS = {
+    'web app, lazy route groups': _PRELUDE + """
+app = create_app()
+print(json.dumps({'seconds': time.perf_counter() - started, 'routes': len(list(app.url_map.iter_rules()))}))
+""",
+    'web app, all route groups preloaded': _PRELUDE + """
+app = create_app()
+app.extensions['lazy_blueprints'].load_all()
+print(json.dumps({'seconds': time.perf_counter() - started, 'routes': len(list(app.url_map.iter_rules()))}))
+""",
+    'build CLI app (no web stack)': _PRELUDE + """
+app = create_app(web=False)
+print(json.dumps({'seconds': time.perf_counter() - started, 'routes': len(list(app.url_map.iter_rules()))}))
+""",
+    'first request to a lazy route group': _PRELUDE + """
+app = create_app()
+ready = time.perf_counter()
+app.test_client().get('/maintenance/')
+print(json.dumps({'seconds': time.perf_counter() - ready, 'routes': len(list(app.url_map.iter_rules()))}))
+""",
+}
+
+
+def _run(code, env):
+    """Run one scenario in a fresh interpreter and return its JSON result"""
+    result = subprocess.run(
+        [sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark cold application startup')
+    parser.add_argument('--runs', type=int, default=7)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    # Keep route groups lazy; the preloaded scenario loads them explicitly
+    env['PRELOAD_BLUEPRINTS'] = '0'
+    env.pop('STARTUP_PROFILE', None)
+    if 'DATABASE_URL' not in env:
+        _db_file = os.path.join(tempfile.mkdtemp(prefix='armada_bench_'), 'benchmark.db')
+        env['DATABASE_URL'] = f'sqlite:///{_db_file}'
+
+    print(f"{'scenario':<40} {'median':>8} {'fastest':>8} {'routes':>7}")
+    for label, code in SCENARIOS.items():
+        results = [_run(code, env) for _ in range(args.runs)]
+        seconds = [result['seconds'] for result in results]
+        print(f"{label:<40} {statistics.median(seconds):>7.3f}s {min(seconds):>7.3f}s {results[-1]['routes']:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -12,16 +12,23 @@ logger = get_logger("asset_management.routes")
 main = Blueprint('main', __name__)
 
 # Import route modules
-from . import core, assets, main_routes
+from . import core, main_routes
+from .lazy_blueprints import LazyBlueprints
 
 
 def init_app(app):
-    """Initialize all route blueprints with the Flask app"""
+    """
+    Initialize all route blueprints with the Flask app.
+    
+    Core routes are registered now. The asset detail, dispatching,
+    maintenance and supply groups are registered now too when
+    PRELOAD_BLUEPRINTS is set (the default outside debug mode), otherwise
+    on first use (see lazy_blueprints).
+    """
     logger.debug("Initializing route blueprints")
 
     # Don't register main again - it's already registered in app/__init__.py
     app.register_blueprint(core.bp, url_prefix='/core')
-    app.register_blueprint(assets.bp, url_prefix='/assets')
 
     # Register individual core route blueprints
     from .core import assets as core_assets, locations, asset_types, make_models, users, dashboard
@@ -29,6 +36,7 @@ def init_app(app):
     from .core.events import comments as core_comments
     from .core.events import attachments as core_attachments
     from .core.admin import settings_cache_viewer
+    from .core import jobs, typeahead
 
     # Register core dashboard
     app.register_blueprint(dashboard.bp, url_prefix='/core')
@@ -39,6 +47,8 @@ def init_app(app):
     app.register_blueprint(asset_types.bp, url_prefix='/core')
     app.register_blueprint(make_models.bp, url_prefix='/core')
     app.register_blueprint(users.bp, url_prefix='/core')
+    app.register_blueprint(jobs.bp, url_prefix='/core')
+    app.register_blueprint(typeahead.bp, url_prefix='/core')
     
     # Register core admin blueprints
     app.register_blueprint(settings_cache_viewer.bp, url_prefix='/core/users')
@@ -51,10 +61,43 @@ def init_app(app):
     app.register_blueprint(core_comments.bp, url_prefix='')
     app.register_blueprint(core_attachments.bp, url_prefix='')
     
+    # Heavy route groups load on the first request under their prefix or the
+    # first url_for() to one of their endpoints
+    lazy = LazyBlueprints(app)
+    lazy.add('assets', _register_assets, ['/assets'], ['assets'])
+    lazy.add('dispatching', _register_dispatching, ['/dispatching'], ['dispatching'])
+    lazy.add('maintenance', _register_maintenance, ['/maintenance'], [
+        'maintenance', 'maintenance_event', 'action_creator_portal',
+        'maintenance_plans', 'maintenance_action_sets', 'actions', 'part_demands', 'delays',
+        'template_actions', 'proto_action_items', 'template_part_demands', 'template_action_tools',
+        'technician_portal', 'manager_portal', 'template_builder', 'fleet_portal',
+    ])
+    lazy.add('supply', _register_supply, ['/core/supply'], [
+        'core_supply', 'core_supply_parts', 'core_supply_tools',
+        'core_supply_issuable_tools', 'core_supply_inventory_exports',
+    ])
+    
+    if app.config.get('PRELOAD_BLUEPRINTS'):
+        lazy.load_all()
+    
+    logger.info("All route blueprints registered successfully")
+
+
+def _register_assets(app):
+    """Asset detail table routes"""
+    from . import assets
+    app.register_blueprint(assets.bp, url_prefix='/assets')
+
+
+def _register_dispatching(app):
+    """Dispatching routes"""
     # Register dispatching blueprint (new minimal rebuild)
     from .dispatching import dispatching_bp
     app.register_blueprint(dispatching_bp, url_prefix='/dispatching')
-    
+
+
+def _register_maintenance(app):
+    """Maintenance, portal and template builder routes"""
     # Register maintenance blueprints - optional during rebuild
     try:
         from .maintenance.main import maintenance_bp
@@ -153,11 +196,15 @@ def init_app(app):
     except ImportError as e:
         logger.warning(f"Maintenance main blueprint not available during rebuild: {e}")
         pass
-    
+
+
+def _register_supply(app):
+    """Supply routes (parts, tools, issuable tools, inventory exports)"""
     # Register supply blueprints (integrated into core section)
     try:
         from .core.supply.main import supply_bp
         from .core.supply import parts as core_supply_parts, tools as core_supply_tools, issuable_tools as core_supply_issuable_tools
+        from .core.supply import inventory_exports as core_supply_inventory_exports
         
         # Register main supply blueprint with /core prefix
         app.register_blueprint(supply_bp, url_prefix='/core')
@@ -166,9 +213,8 @@ def init_app(app):
         app.register_blueprint(core_supply_parts.bp, url_prefix='/core/supply/parts')
         app.register_blueprint(core_supply_tools.bp, url_prefix='/core/supply/tools')
         app.register_blueprint(core_supply_issuable_tools.bp, url_prefix='/core/supply/issuable-tools')
+        app.register_blueprint(core_supply_inventory_exports.bp, url_prefix='/core/supply/inventory')
         
         logger.info("Registered core supply blueprints")
     except ImportError as e:
         logger.warning(f"Core supply blueprints not available: {e}")
-    
-    logger.info("All route blueprints registered successfully") 
\ No newline at end of file
@@ -3,7 +3,7 @@ Admin routes
 Secret admin panel with links to various admin tools
 """
 
-from flask import Blueprint, render_template, abort
+from flask import Blueprint, render_template, abort, redirect, url_for, flash, request, current_app
 from flask_login import login_required, current_user
 from app.data.core.user_info.user import User
 from app.logger import get_logger
@@ -33,5 +33,98 @@ def index():
     # Get all users for portal data viewer links
     users = User.query.order_by(User.username).all()
     
-    return render_template('admin/index.html', users=users)
+    # Recent stock reconciliation runs
+    from app.buisness.inventory.managers import StockReconciliationManager
+    reconciliation_runs = StockReconciliationManager.get_recent_runs(limit=5)
+    reconciliation_running = StockReconciliationManager.is_background_running()
+    
+    return render_template(
+        'admin/index.html',
+        users=users,
+        reconciliation_runs=reconciliation_runs,
+        reconciliation_running=reconciliation_running
+    )
+
+
+@bp.route('/stock-reconciliation', methods=['POST'])
+@login_required
+@admin_required
+def stock_reconciliation():
+    """Start a background Part stock level reconciliation"""
+    from app.buisness.inventory.managers import StockReconciliationManager
+    
+    auto_correct = request.form.get('auto_correct') == 'on'
+    incremental = request.form.get('full_scan') != 'on'
+    
+    started = StockReconciliationManager.start_background_reconciliation(
+        current_app._get_current_object(),
+        incremental=incremental,
+        auto_correct=auto_correct,
+        user_id=current_user.id
+    )
+    
+    if started:
+        logger.info(f"Admin user {current_user.username} started stock reconciliation (auto_correct={auto_correct}, incremental={incremental})")
+        flash('Stock reconciliation started in the background', 'success')
+    else:
+        flash('A stock reconciliation is already running', 'warning')
+    
+    return redirect(url_for('admin.index'))
+
+
 
+@bp.route('/reorder-forecasts', methods=['POST'])
+@login_required
+@admin_required
+def refresh_reorder_forecasts():
+    """Recompute consumption forecasts and reorder points for all parts"""
+    from app.buisness.inventory.managers import ReorderForecastManager
+    
+    try:
+        count = ReorderForecastManager.refresh_forecasts(user_id=current_user.id)
+        logger.info(f"Admin user {current_user.username} refreshed {count} reorder forecasts")
+        flash(f'Refreshed {count} reorder forecasts', 'success')
+    except Exception as e:
+        logger.error(f"Error refreshing reorder forecasts: {e}")
+        flash(f'Error refreshing reorder forecasts: {str(e)}', 'error')
+    
+    return redirect(url_for('admin.index'))
+
+
+@bp.route('/maintenance-kpi-rollups/rebuild', methods=['POST'])
+@login_required
+@admin_required
+def rebuild_maintenance_kpi_rollups():
+    """Recompute maintenance KPI rollups from maintenance events, actions and delays"""
+    from app.buisness.maintenance.kpi import MaintenanceKpiRollupManager
+    
+    try:
+        count = MaintenanceKpiRollupManager.rebuild()
+        logger.info(f"Admin user {current_user.username} rebuilt {count} maintenance KPI rollups")
+        flash(f'Rebuilt {count} maintenance KPI rollup rows', 'success')
+    except Exception as e:
+        logger.error(f"Error rebuilding maintenance KPI rollups: {e}")
+        flash(f'Error rebuilding maintenance KPI rollups: {str(e)}', 'error')
+    
+    return redirect(url_for('admin.index'))
+
+
+@bp.route('/asset-summaries/rebuild', methods=['POST'])
+@login_required
+@admin_required
+def rebuild_asset_summaries():
+    """Recompute every asset summary row from events, maintenance, dispatches and assets"""
+    from app import db
+    from app.buisness.core.asset_summary_manager import AssetSummaryManager
+    
+    try:
+        count = AssetSummaryManager.rebuild()
+        db.session.commit()
+        logger.info(f"Admin user {current_user.username} rebuilt {count} asset summaries")
+        flash(f'Rebuilt {count} asset summaries', 'success')
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error rebuilding asset summaries: {e}")
+        flash(f'Error rebuilding asset summaries: {str(e)}', 'error')
+    
+    return redirect(url_for('admin.index'))
@@ -9,6 +9,7 @@ and displays detail-related information.
 from flask import Blueprint, render_template
 from flask_login import login_required
 from app.buisness.assets.asset_details_context import AssetDetailsContext
+from app.buisness.core.asset_summary_manager import AssetSummaryManager
 from app.services.core.asset_service import AssetService
 from app.logger import get_logger
 
@@ -26,6 +27,7 @@ def asset_details_card(asset_id=None):
         return render_template('core/assets/asset_details_card.html', asset=None)
     
     asset_context = AssetDetailsContext(asset_id)
+    summary = AssetSummaryManager.get(asset_id)
     
     # Get recent events from service (presentation-specific query)
     events = AssetService.get_recent_events(asset_id, limit=5)
@@ -38,5 +40,6 @@ def asset_details_card(asset_id=None):
                          make_model=asset_context.make_model,
                          location=asset_context.major_location,
                          events=events,
-                         detail_count=asset_context.detail_count)
+                         summary=summary,
+                         detail_count=summary.detail_count if summary.detail_count is not None else asset_context.detail_count)
 
@@ -3,12 +3,16 @@ Asset management routes
 CRUD operations for Asset model
 """
 
-from flask import Blueprint, render_template, redirect, url_for, flash, request, abort
+from datetime import datetime
+from flask import Blueprint, render_template, redirect, url_for, flash, request, abort, jsonify
 from flask_login import login_required, current_user
 from app.data.core.asset_info.asset import Asset
 from app.data.core.event_info.event import Event
 from app.buisness.assets.factories.asset_factory import AssetFactory
 from app.buisness.core.asset_context import AssetContext as CoreAssetContext
+from app.buisness.core.meter_reading_manager import MeterReadingManager
+from app.buisness.core.asset_summary_manager import AssetSummaryManager
+from app.buisness.assets.detail_presence_index import DetailPresenceIndex
 from app.services.core.asset_service import AssetService
 from app import db
 from app.logger import get_logger
@@ -34,8 +38,15 @@ def list():
     
     logger.info(f"Assets list returned {assets.total} assets (page {page})")
     
+    # Detail counts from the presence bitmaps (no detail table queries)
+    detail_counts = DetailPresenceIndex.get_counts(assets.items)
+    # Last event / open maintenance from the summary rows (one query)
+    summaries = AssetSummaryManager.get_many(assets.items)
+    
     return render_template('core/assets/list.html', 
                          assets=assets,
+                         detail_counts=detail_counts,
+                         summaries=summaries,
                          asset_types=filter_options['asset_types'],
                          locations=filter_options['locations'],
                          make_models=filter_options['make_models'],
@@ -59,7 +70,8 @@ def detail(asset_id):
                          asset_type=asset_context.asset_type,
                          make_model=asset_context.make_model,
                          location=asset_context.major_location,
-                         events=events)
+                         events=events,
+                         summary=AssetSummaryManager.get(asset_id))
 
 @bp.route('/assets/create', methods=['GET', 'POST'])
 @login_required
@@ -171,8 +183,77 @@ def delete(asset_id):
         flash('Cannot delete asset with events', 'error')
         return redirect(url_for('core_assets.detail', asset_id=asset.id))
     
+    MeterReadingManager.delete_asset_readings(asset.id)
+    AssetSummaryManager.delete_asset_summary(asset.id)
     db.session.delete(asset)
     db.session.commit()
     
     flash('Asset deleted successfully', 'success')
-    return redirect(url_for('core_assets.list')) 
\ No newline at end of file
+    return redirect(url_for('core_assets.list')) 
+
+def _parse_datetime_arg(name):
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        abort(400, description=f'Invalid {name}')
+
+@bp.route('/assets/<int:asset_id>/meter-readings')
+@login_required
+def meter_readings(asset_id):
+    """Daily or weekly meter rollups and the current rate of use (JSON)"""
+    asset = Asset.query.get_or_404(asset_id)
+    meter = request.args.get('meter', 1, type=int)
+    period = request.args.get('period', 'day')
+    if meter not in (1, 2, 3, 4) or period not in MeterReadingManager.PERIODS:
+        abort(400)
+    
+    rollups = MeterReadingManager.rollup(
+        [asset.id],
+        meter,
+        start=_parse_datetime_arg('start'),
+        end=_parse_datetime_arg('end'),
+        period=period
+    )
+    rate = MeterReadingManager.get_rates_of_use(meter, [asset.id]).get(asset.id)
+    return jsonify({
+        'asset_id': asset.id,
+        'meter': meter,
+        'current_value': getattr(asset, f'meter{meter}'),
+        'rate_per_day': rate,
+        'period': period,
+        'rollups': rollups
+    })
+
+@bp.route('/assets/meter-readings', methods=['POST'])
+@login_required
+def ingest_meter_readings():
+    """
+    Batch ingest meter readings (JSON).
+    
+    Body: {"readings": [{"asset_id": 1, "meter": 1, "recorded_at": "2025-01-01T08:00:00", "value": 1234.5}, ...]}
+    """
+    if not current_user.is_admin:
+        abort(403)
+
+    payload = request.get_json(silent=True) or {}
+    try:
+        readings = [
+            (
+                int(reading['asset_id']),
+                int(reading.get('meter', 1)),
+                datetime.fromisoformat(reading['recorded_at']) if reading.get('recorded_at') else datetime.utcnow(),
+                float(reading['value'])
+            )
+            for reading in payload.get('readings', [])
+        ]
+        inserted = MeterReadingManager.ingest(readings)
+        db.session.commit()
+    except (KeyError, TypeError, ValueError) as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    logger.info(f"User {current_user.username} ingested {inserted} meter readings")
+    return jsonify({'success': True, 'inserted': inserted})
@@ -34,8 +34,8 @@ def list():
         per_page=per_page
     )
 
-    # Get filter options from service
-    filter_options = EventService.get_filter_options()
+    # Get filter options from service (users, assets and make/models load through typeahead)
+    filter_options = EventService.get_filter_options(request.args)
 
     # Choose template based on view type
     template = 'core/events/recent_events/recent_events.html' if condensed_view else 'core/events/list.html'
@@ -43,10 +43,10 @@ def list():
     return render_template(
         template,
         events=events,
-        users=filter_options['users'],
-        assets=filter_options['assets'],
         locations=filter_options['locations'],
-        make_models=filter_options['make_models'],
+        selected_user=filter_options['selected_user'],
+        selected_asset=filter_options['selected_asset'],
+        selected_make_model=filter_options['selected_make_model'],
         filters=filters,
     )
 
@@ -78,10 +78,10 @@ def create():
         # Validate required fields
         if not event_type or not description:
             flash('Event type and description are required', 'error')
-            filter_options = EventService.get_filter_options()
+            filter_options = EventService.get_filter_options(request.form)
             return render_template(
                 'core/events/create.html',
-                assets=filter_options['assets'],
+                selected_asset=filter_options['selected_asset'],
                 locations=filter_options['locations'],
             )
 
@@ -101,11 +101,11 @@ def create():
         return redirect(url_for('events.detail', event_id=event.id))
 
     # Get form options from service
-    filter_options = EventService.get_filter_options()
+    filter_options = EventService.get_filter_options(request.args)
 
     return render_template(
         'core/events/create.html',
-        assets=filter_options['assets'],
+        selected_asset=filter_options['selected_asset'],
         locations=filter_options['locations'],
     )
 
@@ -140,12 +140,12 @@ def edit(event_id):
         return redirect(url_for('events.detail', event_id=event.id))
 
     # Get form options from service
-    filter_options = EventService.get_filter_options()
+    filter_options = EventService.get_filter_options({'asset_id': event.asset_id})
 
     return render_template(
         'core/events/edit.html',
         event=event,
-        assets=filter_options['assets'],
+        selected_asset=filter_options['selected_asset'],
         locations=filter_options['locations'],
     )
 
@@ -0,0 +1,136 @@
+"""
+Background job routes
+Job list, job status polling (HTMX), cancel and retry
+"""
+
+from flask import Blueprint, render_template, redirect, url_for, flash, request, abort, current_app
+from flask_login import login_required, current_user
+from app.buisness.core.background_jobs import BackgroundJobManager
+from app.data.maintenance.base.maintenance_plans import MaintenancePlan
+from app.logger import get_logger
+
+logger = get_logger("asset_management.routes.core.jobs")
+bp = Blueprint('jobs', __name__)
+
+# Job types admins can start from the job list page
+ADMIN_SUBMITTABLE_JOBS = (
+    'maintenance.run_plan',
+    'inventory.purchase_orders_from_recommendations',
+    'core.archive_events',
+    'debug.insert_debug_data',
+)
+
+
+def _get_job_or_404(job_id):
+    """Load a job the current user may see (own jobs, or any job for admins)"""
+    job = BackgroundJobManager.get_job(job_id)
+    if job is None:
+        abort(404)
+    if job.created_by_id != current_user.id and not current_user.is_admin:
+        abort(403)
+    return job
+
+
+def _status_response(job):
+    """Status partial for HTMX requests, job page otherwise"""
+    if request.headers.get('HX-Request'):
+        return render_template('core/jobs/_job_status.html', job=job, manager=BackgroundJobManager)
+    return redirect(url_for('jobs.detail', job_id=job.id))
+
+
+@bp.route('/jobs')
+@login_required
+def index():
+    """Recent background jobs (all jobs for admins)"""
+    # Resume jobs queued before this process started
+    BackgroundJobManager.start(current_app._get_current_object())
+
+    jobs = BackgroundJobManager.get_recent_jobs(
+        user_id=None if current_user.is_admin else current_user.id
+    )
+    job_types = BackgroundJobManager.job_types()
+    plans = MaintenancePlan.query.order_by(MaintenancePlan.name).all() if current_user.is_admin else []
+
+    return render_template(
+        'core/jobs/index.html',
+        jobs=jobs,
+        manager=BackgroundJobManager,
+        submittable_jobs={job_type: job_types[job_type] for job_type in ADMIN_SUBMITTABLE_JOBS},
+        plans=plans
+    )
+
+
+@bp.route('/jobs/<int:job_id>')
+@login_required
+def detail(job_id):
+    """Job page; the status card polls until the job finishes"""
+    BackgroundJobManager.start(current_app._get_current_object())
+    job = _get_job_or_404(job_id)
+    return render_template('core/jobs/detail.html', job=job, manager=BackgroundJobManager)
+
+
+@bp.route('/jobs/<int:job_id>/status')
+@login_required
+def status(job_id):
+    """HTMX status partial"""
+    job = _get_job_or_404(job_id)
+    return render_template('core/jobs/_job_status.html', job=job, manager=BackgroundJobManager)
+
+
+@bp.route('/jobs/<int:job_id>/cancel', methods=['POST'])
+@login_required
+def cancel(job_id):
+    """Cancel a queued job or stop a running one at its next checkpoint"""
+    job = _get_job_or_404(job_id)
+    if BackgroundJobManager.cancel(job.id, user_id=current_user.id):
+        logger.info(f"User {current_user.username} cancelled background job {job.id}")
+    else:
+        flash('Job already finished', 'warning')
+    return _status_response(BackgroundJobManager.get_job(job.id))
+
+
+@bp.route('/jobs/<int:job_id>/retry', methods=['POST'])
+@login_required
+def retry(job_id):
+    """Queue a failed or cancelled job again"""
+    job = _get_job_or_404(job_id)
+    if BackgroundJobManager.retry(current_app._get_current_object(), job.id, user_id=current_user.id):
+        logger.info(f"User {current_user.username} retried background job {job.id}")
+    else:
+        flash('Only failed or cancelled jobs can be retried', 'warning')
+    return _status_response(BackgroundJobManager.get_job(job.id))
+
+
+@bp.route('/jobs/submit', methods=['POST'])
+@login_required
+def submit():
+    """Start one of the admin job types"""
+    if not current_user.is_admin:
+        abort(403)
+
+    job_type = request.form.get('job_type')
+    if job_type not in ADMIN_SUBMITTABLE_JOBS:
+        flash('Unknown job type', 'error')
+        return redirect(url_for('jobs.index'))
+
+    params = {}
+    if job_type == 'maintenance.run_plan':
+        params['maintenance_plan_id'] = request.form.get('maintenance_plan_id', type=int)
+        if not params['maintenance_plan_id']:
+            flash('Maintenance plan is required', 'error')
+            return redirect(url_for('jobs.index'))
+        planned_start = request.form.get('planned_start_datetime')
+        if planned_start:
+            params['planned_start_datetime'] = planned_start
+    elif job_type == 'debug.insert_debug_data':
+        params['phase'] = request.form.get('phase') or 'all'
+
+    job = BackgroundJobManager.submit(
+        current_app._get_current_object(),
+        job_type,
+        params=params,
+        user_id=current_user.id
+    )
+    logger.info(f"Admin user {current_user.username} submitted background job {job.id} ({job_type})")
+    flash(f'{job.label} queued', 'success')
+    return redirect(url_for('jobs.detail', job_id=job.id))
@@ -0,0 +1,98 @@
+"""
+Inventory export routes - integrated into core section
+Streaming CSV/JSONL downloads of inventory movements and active inventory
+"""
+
+from datetime import datetime, time
+from flask import Blueprint, Response, request, abort, stream_with_context
+from flask_login import login_required, current_user
+from app.services.inventory.inventory_movement_service import InventoryMovementService
+from app.services.inventory.active_inventory_service import ActiveInventoryService
+from app.utils.export_streams import EXPORT_FORMATS, iter_export_chunks
+from app.logger import get_logger
+
+logger = get_logger("asset_management.routes.core.supply.inventory_exports")
+bp = Blueprint('core_supply_inventory_exports', __name__)
+
+
+def _get_export_format():
+    """Read ?format=csv|jsonl (default csv), 400 on anything else"""
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_FORMATS:
+        abort(400, description=f"Unsupported export format: {export_format}")
+    return export_format
+
+
+def _parse_date_arg(name, end_of_day=False):
+    """Parse an ISO date/datetime query arg; date-only upper bounds cover the whole day"""
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        abort(400, description=f"Invalid {name}: {value}")
+    if end_of_day and len(value) == 10:
+        parsed = datetime.combine(parsed.date(), time.max)
+    return parsed
+
+
+def _stream_export(name, export_format, columns, rows):
+    """Build a streaming download response for an export generator"""
+    timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+    filename = f"{name}_{timestamp}.{export_format}"
+    return Response(
+        stream_with_context(iter_export_chunks(export_format, columns, rows)),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers={
+            'Content-Disposition': f'attachment; filename="{filename}"',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
+# ROUTE_TYPE: SIMPLE_CRUD (GET)
+# Read-only export; filtering lives in InventoryMovementService so the export matches the list view.
+@bp.route('/movements/export')
+@login_required
+def export_movements():
+    """Stream inventory movements matching the list filters as CSV or JSONL"""
+    export_format = _get_export_format()
+    filters = {
+        'part_id': request.args.get('part_id', type=int),
+        'location_id': request.args.get('location_id', type=int),
+        'movement_type': request.args.get('movement_type') or None,
+        'date_from': _parse_date_arg('date_from'),
+        'date_to': _parse_date_arg('date_to', end_of_day=True)
+    }
+    logger.info(f"User {current_user.username} exporting inventory movements as {export_format} with filters {filters}")
+
+    return _stream_export(
+        'inventory_movements',
+        export_format,
+        InventoryMovementService.EXPORT_COLUMNS,
+        InventoryMovementService.iter_export_rows(**filters)
+    )
+
+
+# ROUTE_TYPE: SIMPLE_CRUD (GET)
+# Read-only export; filtering lives in ActiveInventoryService so the export matches the list view.
+@bp.route('/active/export')
+@login_required
+def export_active_inventory():
+    """Stream active inventory matching the list filters as CSV or JSONL"""
+    export_format = _get_export_format()
+    filters = {
+        'part_id': request.args.get('part_id', type=int),
+        'location_id': request.args.get('location_id', type=int),
+        'low_stock_only': request.args.get('low_stock_only') in ('1', 'true', 'on'),
+        'out_of_stock_only': request.args.get('out_of_stock_only') in ('1', 'true', 'on')
+    }
+    logger.info(f"User {current_user.username} exporting active inventory as {export_format} with filters {filters}")
+
+    return _stream_export(
+        'active_inventory',
+        export_format,
+        ActiveInventoryService.EXPORT_COLUMNS,
+        ActiveInventoryService.iter_export_rows(**filters)
+    )
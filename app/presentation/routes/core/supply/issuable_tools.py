@@ -7,7 +7,8 @@ from flask import Blueprint, render_template, redirect, url_for, flash, request
 from flask_login import login_required, current_user
 from app.data.core.supply.tool import Tool
 from app.data.core.supply.issuable_tool import IssuableTool
-from app.data.core.user_info.user import User
+from app.buisness.core.reference_data_cache import ReferenceDataCache
+from app.services.core.keyset_pagination import KeysetPagination
 from app import db
 from app.logger import get_logger
 from datetime import datetime
@@ -52,11 +53,11 @@ def list():
     query = query.order_by(Tool.tool_name, IssuableTool.serial_number)
     
     # Pagination
-    issuable_tools = query.paginate(page=page, per_page=per_page, error_out=False)
+    issuable_tools = KeysetPagination.paginate(query, page=page, per_page=per_page)
     
     # Get filter options
     tools = Tool.query.order_by(Tool.tool_name).all()
-    users = User.query.all()
+    users = ReferenceDataCache.users()
     statuses = ['Available', 'In Use', 'Out for Repair', 'Retired']
     
     logger.info(f"Issuable tools list returned {issuable_tools.total} tools (page {page})")
@@ -80,7 +81,7 @@ def detail(issuable_tool_id):
     logger.debug(f"User {current_user.username} accessing issuable tool detail for ID: {issuable_tool_id}")
     
     issuable_tool = IssuableTool.query.get_or_404(issuable_tool_id)
-    users = User.query.all()
+    users = ReferenceDataCache.users()
     
     logger.info(f"Issuable tool detail accessed - Tool: {issuable_tool.tool.tool_name if issuable_tool.tool else 'Unknown'} (ID: {issuable_tool_id})")
     
@@ -108,7 +109,7 @@ def create():
         if not tool_id:
             flash('Tool definition is required', 'error')
             tools = Tool.query.order_by(Tool.tool_name).all()
-            users = User.query.all()
+            users = ReferenceDataCache.users()
             return render_template('supply/issuable_tools/create.html', tools=tools, users=users, preselected_tool_id=tool_id)
         
         # Parse dates
@@ -120,7 +121,7 @@ def create():
             except ValueError:
                 flash('Invalid last calibration date format', 'error')
                 tools = Tool.query.order_by(Tool.tool_name).all()
-                users = User.query.all()
+                users = ReferenceDataCache.users()
                 return render_template('supply/issuable_tools/create.html', tools=tools, users=users, preselected_tool_id=tool_id)
         
         if next_calibration_date:
@@ -129,7 +130,7 @@ def create():
             except ValueError:
                 flash('Invalid next calibration date format', 'error')
                 tools = Tool.query.order_by(Tool.tool_name).all()
-                users = User.query.all()
+                users = ReferenceDataCache.users()
                 return render_template('supply/issuable_tools/create.html', tools=tools, users=users, preselected_tool_id=tool_id)
         
         # Create new issuable tool
@@ -153,7 +154,7 @@ def create():
     
     # Get form options
     tools = Tool.query.order_by(Tool.tool_name).all()
-    users = User.query.all()
+    users = ReferenceDataCache.users()
     
     return render_template('supply/issuable_tools/create.html', tools=tools, users=users, preselected_tool_id=preselected_tool_id)
 
@@ -176,7 +177,7 @@ def edit(issuable_tool_id):
         if not tool_id:
             flash('Tool definition is required', 'error')
             tools = Tool.query.order_by(Tool.tool_name).all()
-            users = User.query.all()
+            users = ReferenceDataCache.users()
             return render_template('supply/issuable_tools/edit.html', issuable_tool=issuable_tool, tools=tools, users=users)
         
         # Parse dates
@@ -210,7 +211,7 @@ def edit(issuable_tool_id):
     
     # Get form options
     tools = Tool.query.order_by(Tool.tool_name).all()
-    users = User.query.all()
+    users = ReferenceDataCache.users()
     
     return render_template('supply/issuable_tools/edit.html', issuable_tool=issuable_tool, tools=tools, users=users)
 
@@ -7,6 +7,8 @@ from flask import Blueprint, render_template, redirect, url_for, flash, request,
 from flask_login import login_required, current_user
 from app.data.core.supply.part import Part
 from app.buisness.inventory.part_context import PartContext
+from app.buisness.inventory.managers.reorder_forecast_manager import ReorderForecastManager
+from app.services.core.keyset_pagination import KeysetPagination
 from app import db
 from app.logger import get_logger
 
@@ -51,18 +53,23 @@ def list():
         query = query.filter(Part.part_name.ilike(f'%{part_name}%'))
     
     # Stock status filtering
+    # Low stock threshold is the fleet-wide forecast reorder point, falling back to minimum_stock_level
     if stock_status == 'low':
-        query = query.filter(Part.current_stock_level <= Part.minimum_stock_level)
+        query = ReorderForecastManager.join_forecast(query, Part.id).filter(
+            Part.current_stock_level <= ReorderForecastManager.reorder_threshold(Part)
+        )
     elif stock_status == 'out':
         query = query.filter(Part.current_stock_level <= 0)
     elif stock_status == 'in_stock':
-        query = query.filter(Part.current_stock_level > Part.minimum_stock_level)
+        query = ReorderForecastManager.join_forecast(query, Part.id).filter(
+            Part.current_stock_level > ReorderForecastManager.reorder_threshold(Part)
+        )
     
     # Order by part name
     query = query.order_by(Part.part_name)
     
     # Pagination
-    parts = query.paginate(page=page, per_page=per_page, error_out=False)
+    parts = KeysetPagination.paginate(query, page=page, per_page=per_page)
     
     # Get filter options
     categories = db.session.query(Part.category).distinct().all()
@@ -0,0 +1,51 @@
+"""
+Typeahead option routes
+Paged prefix-matched options for asset, user, part and make/model pickers
+"""
+
+from flask import Blueprint, render_template, request, jsonify, abort
+from flask_login import login_required
+from app.services.core.typeahead_service import TypeaheadService
+from app.logger import get_logger
+
+logger = get_logger("asset_management.routes.core.typeahead")
+bp = Blueprint('typeahead', __name__)
+
+
+@bp.route('/typeahead/<kind>')
+@login_required
+def options(kind):
+    """
+    Options whose label starts with ?q=, one page at a time.
+
+    JSON by default; HTMX requests (or ?format=options) get <option> tags for
+    swapping into a <select>. ?selected= keeps the current value selected and
+    listed even when it does not match the prefix.
+    """
+    if kind not in TypeaheadService.KINDS:
+        abort(404)
+    prefix = request.args.get('q', '')
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', type=int)
+    result = TypeaheadService.search(kind, prefix, page=page, per_page=per_page)
+
+    if request.headers.get('HX-Request') or request.args.get('format') == 'options':
+        selected_id = request.args.get('selected', type=int)
+        selected = None
+        if selected_id and page == 1 and all(option.id != selected_id for option in result.options):
+            selected = TypeaheadService.get_option(kind, selected_id)
+        return render_template(
+            'core/typeahead/options.html',
+            result=result,
+            selected_id=selected_id,
+            selected=selected,
+            blank_label=request.args.get('blank'),
+        )
+
+    return jsonify({
+        'results': [{'id': option.id, 'label': option.label} for option in result.options],
+        'page': result.page,
+        'per_page': result.per_page,
+        'total': result.total,
+        'has_more': result.has_more,
+    })
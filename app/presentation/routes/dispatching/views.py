@@ -6,10 +6,7 @@ from app import db
 from app.data.dispatching.request import DispatchRequest
 from app.buisness.dispatching.dispatch_manager import DispatchManager
 from app.buisness.dispatching.dispatch import DispatchContext
-from app.data.core.asset_info.asset_type import AssetType
-from app.data.core.major_location import MajorLocation
-from app.data.core.asset_info.asset import Asset
-from app.data.core.user_info.user import User
+from app.buisness.core.reference_data_cache import ReferenceDataCache
 
 
 @dispatching_bp.route('/')
@@ -131,31 +128,18 @@ def requests_new():
             flash(f'Error creating request: {str(e)}', 'danger')
             return redirect(url_for('dispatching.requests_new'))
 
-    asset_types = AssetType.query.all()
-    locations = MajorLocation.query.all()
+    asset_types = ReferenceDataCache.asset_types()
+    locations = ReferenceDataCache.locations()
     return render_template('dispatching/requests_form.html', asset_types=asset_types, locations=locations)
 
 
 @dispatching_bp.route('/requests/<int:item_id>')
 def requests_detail(item_id):
     ctx = DispatchContext.from_request_id(item_id)
-    # Get data for outcome forms if no outcome exists
-    assets = None
-    users = None
-    if not ctx.has_outcome:
-        # Get assets matching the request's asset type
-        if ctx.request.asset_type_id:
-            assets = Asset.query.filter(
-                Asset.make_model.has(asset_type_id=ctx.request.asset_type_id)
-            ).all()
-        else:
-            assets = Asset.query.limit(100).all()
-        users = User.query.filter_by(is_active=True).all()
+    # Outcome forms load their asset/user options through the typeahead endpoints
     return render_template('dispatching/requests_detail.html', 
                          ctx=ctx, 
-                         item=ctx.request,
-                         assets=assets,
-                         users=users)
+                         item=ctx.request)
 
 
 # CRUD: Dispatch - Access through request context
@@ -327,24 +311,10 @@ def outcome_create(request_id, outcome_type):
             return redirect(url_for('dispatching.requests_detail', item_id=request_id))
     
     # GET request - show form
-    # Get data for forms
-    assets = None
-    users = None
-    if outcome_type == 'dispatch':
-        # Get assets matching the request's asset type
-        if ctx.request.asset_type_id:
-            assets = Asset.query.filter(
-                Asset.make_model.has(asset_type_id=ctx.request.asset_type_id)
-            ).all()
-        else:
-            assets = Asset.query.limit(100).all()
-        users = User.query.filter_by(is_active=True).all()
-    
+    # User options are loaded by the form's typeahead picker
     return render_template(f'dispatching/outcomes/{outcome_type}_form.html',
                          request_id=request_id,
-                         request=ctx.request,
-                         assets=assets or [],
-                         users=users or [])
+                         request=ctx.request)
 
 
 
@@ -0,0 +1,122 @@
+"""
+Lazy blueprint registration
+Defers importing and registering heavy route groups until they are needed.
+
+A group is a registration function plus the URL prefixes it serves and the
+blueprint names it registers. Pending groups are loaded:
+- by the WSGI middleware, before a request whose path starts with one of
+  the group's prefixes reaches URL matching
+- by the url_for() build error handler, when a template links to an
+  endpoint of one of the group's blueprints
+- all at once by LazyBlueprints.load_all() (PRELOAD_BLUEPRINTS, the
+  default outside debug mode, or app.py --preload)
+
+Registering a group after the first request mutates the URL map while other
+requests may be matching against it, so lazy loading is a development
+convenience for the debug server, not something to run production workers
+with.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+from flask import Flask, url_for
+from app.logger import get_logger
+
+logger = get_logger("asset_management.routes.lazy")
+
+
+class LazyBlueprintGroup:
+    """Route modules registered together on first use"""
+
+    def __init__(self, name: str, register: Callable[[Flask], None], url_prefixes: Sequence[str], blueprints: Sequence[str]):
+        self.name = name
+        self.register = register
+        self.url_prefixes = tuple(url_prefixes)
+        self.blueprints = frozenset(blueprints)
+        self.loaded = False
+
+    def matches_path(self, path: str) -> bool:
+        return any(path == prefix or path.startswith(prefix.rstrip('/') + '/') for prefix in self.url_prefixes)
+
+
+class LazyBlueprints:
+    """
+    Registry of pending route groups for one app (app.extensions['lazy_blueprints']).
+
+    Flask refuses setup methods once the first request has been handled, so
+    late registration lifts that guard for the duration of the group's
+    register function (under a lock, so a group is only registered once).
+    Only debug apps leave groups pending; see PRELOAD_BLUEPRINTS.
+    """
+
+    def __init__(self, app: Flask):
+        self.app = app
+        self.groups: Dict[str, LazyBlueprintGroup] = {}
+        self._lock = threading.RLock()
+        app.extensions['lazy_blueprints'] = self
+        app.wsgi_app = self._middleware(app.wsgi_app)
+        app.url_build_error_handlers.append(self._handle_url_build_error)
+
+    def add(self, name: str, register: Callable[[Flask], None], url_prefixes: Sequence[str], blueprints: Sequence[str]):
+        """Add a route group to load on first use"""
+        self.groups[name] = LazyBlueprintGroup(name, register, url_prefixes, blueprints)
+
+    @property
+    def pending(self) -> List[LazyBlueprintGroup]:
+        return [group for group in self.groups.values() if not group.loaded]
+
+    def load(self, name: str) -> bool:
+        """Import and register a group; returns False if it was already loaded"""
+        group = self.groups[name]
+        if group.loaded:
+            return False
+        with self._lock:
+            if group.loaded:
+                return False
+            started = time.perf_counter()
+            got_first_request = self.app._got_first_request
+            self.app._got_first_request = False
+            try:
+                group.register(self.app)
+            finally:
+                self.app._got_first_request = got_first_request
+            group.loaded = True
+            logger.info(f"Loaded route group '{name}' in {(time.perf_counter() - started) * 1000:.0f} ms")
+            return True
+
+    def load_all(self):
+        """Load every pending group (preload)"""
+        for group in self.pending:
+            self.load(group.name)
+
+    def group_for_path(self, path: str) -> Optional[LazyBlueprintGroup]:
+        for group in self.pending:
+            if group.matches_path(path):
+                return group
+        return None
+
+    def group_for_endpoint(self, endpoint: str) -> Optional[LazyBlueprintGroup]:
+        blueprint = endpoint.split('.', 1)[0] if '.' in endpoint else None
+        for group in self.pending:
+            if blueprint in group.blueprints:
+                return group
+        return None
+
+    def _middleware(self, wsgi_app):
+        def lazy_blueprints_middleware(environ, start_response):
+            if self.pending:
+                script_path = environ.get('PATH_INFO') or '/'
+                group = self.group_for_path(script_path)
+                if group is not None:
+                    self.load(group.name)
+            return wsgi_app(environ, start_response)
+        return lazy_blueprints_middleware
+
+    def _handle_url_build_error(self, error, endpoint, values):
+        """Load the group owning an endpoint of a pending blueprint and build the URL again"""
+        group = self.group_for_endpoint(endpoint)
+        if group is None:
+            return None
+        self.load(group.name)
+        return url_for(endpoint, **values)
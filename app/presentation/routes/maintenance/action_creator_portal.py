@@ -7,19 +7,22 @@ from flask import Blueprint, render_template, request, abort
 from flask_login import login_required, current_user
 
 from app.logger import get_logger
-from app.buisness.maintenance.base.action_struct import ActionStruct
 from app.buisness.maintenance.base.maintenance_action_set_struct import MaintenanceActionSetStruct
 from app.buisness.maintenance.base.maintenance_context import MaintenanceContext
 from app.data.maintenance.base.actions import Action
 from app.data.maintenance.proto_templates.proto_actions import ProtoActionItem
 from app.data.maintenance.templates.template_action_sets import TemplateActionSet
 from app.data.maintenance.templates.template_actions import TemplateActionItem
+from app.services.maintenance.action_creator_search_service import ActionCreatorSearchService
 
 logger = get_logger("asset_management.routes.maintenance.action_creator_portal")
 
 # Create blueprint for action creator portal
 action_creator_portal_bp = Blueprint('action_creator_portal', __name__, url_prefix='/maintenance/action-creator-portal')
 
+# Results rendered into each tab on page load
+INITIAL_RESULT_LIMIT = 25
+
 
 @action_creator_portal_bp.route('/<int:maintenance_action_set_id>')
 @login_required
@@ -39,56 +42,22 @@ def action_creator_portal(maintenance_action_set_id):
         maintenance_context = MaintenanceContext.from_maintenance_action_set(maintenance_action_set_id)
         
         # Get current actions for "From Current Action Set" tab
-        current_actions = [ActionStruct(action) for action in sorted(maintenance_struct.actions, key=lambda a: a.sequence_order)]
-        
-        # Get template action sets for "From Template" tab
-        template_action_sets = TemplateActionSet.query.filter_by(is_active=True).order_by(TemplateActionSet.task_name).all()
-        
-        # Get template action items for "From Template Action" tab
-        template_action_items = TemplateActionItem.query.join(
-            TemplateActionSet
-        ).filter(
-            TemplateActionSet.is_active == True
-        ).order_by(
-            TemplateActionSet.task_name,
-            TemplateActionItem.sequence_order
-        ).all()
-        
-        # Get proto actions for "From Proto Action" tab
-        proto_actions = ProtoActionItem.query.order_by(ProtoActionItem.action_name).all()
+        current_actions = maintenance_struct.action_structs
         
         # Search filter from query params
         search_term = request.args.get('search', '').strip().lower()
         
-        # Filter template action sets by search
-        filtered_template_sets = []
-        if search_term:
-            for tas in template_action_sets:
-                if (search_term in tas.task_name.lower() or 
-                    (tas.description and search_term in tas.description.lower())):
-                    filtered_template_sets.append(tas)
-        else:
-            filtered_template_sets = template_action_sets
-        
-        # Filter template action items by search
-        filtered_template_items = []
-        if search_term:
-            for tai in template_action_items:
-                if (search_term in tai.action_name.lower() or 
-                    (tai.description and search_term in tai.description.lower())):
-                    filtered_template_items.append(tai)
-        else:
-            filtered_template_items = template_action_items
-        
-        # Filter proto actions by search
-        filtered_proto_actions = []
-        if search_term:
-            for pa in proto_actions:
-                if (search_term in pa.action_name.lower() or 
-                    (pa.description and search_term in pa.description.lower())):
-                    filtered_proto_actions.append(pa)
-        else:
-            filtered_proto_actions = proto_actions
+        # Top matches for the "From Template", "From Template Action" and "From Proto Action" tabs;
+        # the tabs' search boxes fetch further matches from the search endpoints
+        template_action_sets, template_action_sets_total = ActionCreatorSearchService.search_template_action_sets(
+            search_term, limit=INITIAL_RESULT_LIMIT
+        )
+        template_action_items, template_action_items_total = ActionCreatorSearchService.search_template_action_items(
+            search_term, limit=INITIAL_RESULT_LIMIT
+        )
+        proto_actions, proto_actions_total = ActionCreatorSearchService.search_proto_actions(
+            search_term, limit=INITIAL_RESULT_LIMIT
+        )
         
         # Filter current actions by search
         filtered_current_actions = []
@@ -109,9 +78,12 @@ def action_creator_portal(maintenance_action_set_id):
             maintenance_context=maintenance_context,
             maintenance_action_set_id=maintenance_action_set_id,
             event_id=event_id,
-            template_action_sets=filtered_template_sets,
-            template_action_items=filtered_template_items,
-            proto_actions=filtered_proto_actions,
+            template_action_sets=template_action_sets,
+            template_action_sets_total=template_action_sets_total,
+            template_action_items=template_action_items,
+            template_action_items_total=template_action_items_total,
+            proto_actions=proto_actions,
+            proto_actions_total=proto_actions_total,
             current_actions=filtered_current_actions,
             search_term=search_term,
         )
@@ -131,25 +103,10 @@ def search_template_action_sets():
     """HTMX endpoint to return template action set search results"""
     try:
         search = request.args.get('search', '').strip().lower()
-        limit = request.args.get('limit', type=int, default=8)
+        limit = request.args.get('limit', type=int, default=ActionCreatorSearchService.DEFAULT_LIMIT)
         maintenance_action_set_id = request.args.get('maintenance_action_set_id', type=int)
         
-        # Get all active template action sets
-        template_sets = TemplateActionSet.query.filter_by(is_active=True).order_by(TemplateActionSet.task_name).all()
-        
-        # Filter by search term
-        filtered_sets = []
-        if search:
-            for tas in template_sets:
-                if (search in tas.task_name.lower() or 
-                    (tas.description and search in tas.description.lower())):
-                    filtered_sets.append(tas)
-        else:
-            filtered_sets = template_sets
-        
-        # Limit results
-        total_count = len(filtered_sets)
-        showing_sets = filtered_sets[:limit]
+        showing_sets, total_count = ActionCreatorSearchService.search_template_action_sets(search, limit=limit)
         
         return render_template(
             'maintenance/action_creator_portal/search_template_action_sets.html',
@@ -177,32 +134,10 @@ def search_template_actions():
     """HTMX endpoint to return template action item search results"""
     try:
         search = request.args.get('search', '').strip().lower()
-        limit = request.args.get('limit', type=int, default=8)
+        limit = request.args.get('limit', type=int, default=ActionCreatorSearchService.DEFAULT_LIMIT)
         maintenance_action_set_id = request.args.get('maintenance_action_set_id', type=int)
         
-        # Get all template action items from active templates
-        template_items = TemplateActionItem.query.join(
-            TemplateActionSet
-        ).filter(
-            TemplateActionSet.is_active == True
-        ).order_by(
-            TemplateActionSet.task_name,
-            TemplateActionItem.sequence_order
-        ).all()
-        
-        # Filter by search term
-        filtered_items = []
-        if search:
-            for tai in template_items:
-                if (search in tai.action_name.lower() or 
-                    (tai.description and search in tai.description.lower())):
-                    filtered_items.append(tai)
-        else:
-            filtered_items = template_items
-        
-        # Limit results
-        total_count = len(filtered_items)
-        showing_items = filtered_items[:limit]
+        showing_items, total_count = ActionCreatorSearchService.search_template_action_items(search, limit=limit)
         
         return render_template(
             'maintenance/action_creator_portal/search_template_actions.html',
@@ -230,25 +165,10 @@ def search_proto_actions():
     """HTMX endpoint to return proto action search results"""
     try:
         search = request.args.get('search', '').strip().lower()
-        limit = request.args.get('limit', type=int, default=8)
+        limit = request.args.get('limit', type=int, default=ActionCreatorSearchService.DEFAULT_LIMIT)
         maintenance_action_set_id = request.args.get('maintenance_action_set_id', type=int)
         
-        # Get all proto actions
-        proto_actions = ProtoActionItem.query.order_by(ProtoActionItem.action_name).all()
-        
-        # Filter by search term
-        filtered_actions = []
-        if search:
-            for pa in proto_actions:
-                if (search in pa.action_name.lower() or 
-                    (pa.description and search in pa.description.lower())):
-                    filtered_actions.append(pa)
-        else:
-            filtered_actions = proto_actions
-        
-        # Limit results
-        total_count = len(filtered_actions)
-        showing_actions = filtered_actions[:limit]
+        showing_actions, total_count = ActionCreatorSearchService.search_proto_actions(search, limit=limit)
         
         return render_template(
             'maintenance/action_creator_portal/search_proto_actions.html',
@@ -301,3 +221,41 @@ def list_template_action_items(template_action_set_id):
             error=str(e)
         ), 500
 
+
+def _modal_context(maintenance_action_set_id):
+    """event_id and ordered current actions for the insert-position options of an action modal"""
+    maintenance_struct = MaintenanceActionSetStruct.from_maintenance_action_set_id(maintenance_action_set_id)
+    if not maintenance_struct:
+        abort(404)
+    current_actions = maintenance_struct.action_structs
+    return maintenance_struct.event_id, current_actions
+
+
+@action_creator_portal_bp.route('/template-action-modal/<int:template_action_item_id>')
+@login_required
+def template_action_modal(template_action_item_id):
+    """HTMX endpoint to render the insert modal for a template action item found by search"""
+    maintenance_action_set_id = request.args.get('maintenance_action_set_id', type=int)
+    template_item = TemplateActionItem.query.get_or_404(template_action_item_id)
+    event_id, current_actions = _modal_context(maintenance_action_set_id)
+    return render_template(
+        'maintenance/action_creator_portal/template_action_modal.html',
+        template_item=template_item,
+        event_id=event_id,
+        current_actions=current_actions
+    )
+
+
+@action_creator_portal_bp.route('/proto-action-modal/<int:proto_action_item_id>')
+@login_required
+def proto_action_modal(proto_action_item_id):
+    """HTMX endpoint to render the insert modal for a proto action found by search"""
+    maintenance_action_set_id = request.args.get('maintenance_action_set_id', type=int)
+    proto_action = ProtoActionItem.query.get_or_404(proto_action_item_id)
+    event_id, current_actions = _modal_context(maintenance_action_set_id)
+    return render_template(
+        'maintenance/action_creator_portal/proto_action_modal.html',
+        proto_action=proto_action,
+        event_id=event_id,
+        current_actions=current_actions
+    )
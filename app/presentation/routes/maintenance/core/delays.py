@@ -206,7 +206,7 @@ def update_delay(delay_id):
         
         # Update delay
         try:
-            maintenance_context.update_delay(delay_id=delay_id, **update_kwargs)
+            maintenance_context.update_delay(delay_id=delay_id, user_id=current_user.id, **update_kwargs)
         except ValueError as e:
             flash(str(e), 'error')
             return redirect(url_for('maintenance_event.render_edit_page', event_id=event_id))
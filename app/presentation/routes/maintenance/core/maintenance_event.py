@@ -10,7 +10,6 @@ from flask_login import login_required, current_user
 from app import db
 from app.logger import get_logger
 from app.buisness.core.event_context import EventContext
-from app.buisness.maintenance.base.action_struct import ActionStruct
 from app.buisness.maintenance.base.maintenance_action_set_struct import MaintenanceActionSetStruct
 from app.buisness.maintenance.base.maintenance_context import MaintenanceContext
 from app.buisness.maintenance.factories.action_factory import ActionFactory
@@ -42,24 +41,21 @@ def view_maintenance_event(event_id):
     logger.info(f"Viewing maintenance event for event_id={event_id}")
     
     try:
-        # Get the event
-        event = Event.query.get(event_id)
-        if not event:
-            logger.warning(f"Event {event_id} not found")
-            abort(404)
-        
-        # Get the maintenance action set by event_id (ONE-TO-ONE relationship)
-        maintenance_context = MaintenanceContext.from_event(event_id)
+        # Load the maintenance action set and its full graph (ONE-TO-ONE relationship)
+        maintenance_context = MaintenanceContext.from_event_graph(event_id)
         if not maintenance_context:
             logger.warning(f"No maintenance action set found for event_id={event_id}")
             abort(404)
         maintenance_struct = maintenance_context.struct
-        if not maintenance_struct:
-            logger.warning(f"No maintenance action set found for event_id={event_id}")
+        
+        # Get the event (loaded with the graph)
+        event = maintenance_struct.event
+        if not event:
+            logger.warning(f"Event {event_id} not found")
             abort(404)
         
         # Get actions with their structs for convenient access
-        action_structs = [ActionStruct(action) for action in maintenance_struct.actions]
+        action_structs = maintenance_struct.action_structs
         
         # Calculate action status counts
         completed_count = sum(1 for a in action_structs if a.action.status == 'Complete')
@@ -96,20 +92,22 @@ def work_maintenance_event(event_id):
     logger.info(f"Working on maintenance event for event_id={event_id}")
     
     try:
-        # Get the maintenance action set by event_id (ONE-TO-ONE relationship)
-        maintenance_struct = MaintenanceActionSetStruct.from_event_id(event_id)
+        # Load the maintenance action set and its full graph (ONE-TO-ONE relationship);
+        # struct, context and template all share it
+        maintenance_context = MaintenanceContext.from_event_graph(event_id)
         
-        if not maintenance_struct:
+        if not maintenance_context:
             logger.warning(f"No maintenance action set found for event_id={event_id}")
             abort(404)
+        maintenance_struct = maintenance_context.struct
         
         # Check if maintenance is in Delayed status - redirect to view page
         if maintenance_struct.status == 'Delayed':
             flash('Work is paused due to delay. Please end the delay to continue work.', 'warning')
             return redirect(url_for('maintenance_event.view_maintenance_event', event_id=event_id))
         
-        # Get the event
-        event = Event.query.get(event_id)
+        # Get the event (loaded with the graph)
+        event = maintenance_struct.event
         if not event:
             logger.warning(f"Event {event_id} not found")
             abort(404)
@@ -119,10 +117,7 @@ def work_maintenance_event(event_id):
             return redirect(url_for('maintenance_event.view_maintenance_event', event_id=event_id))
         
         # Get actions with their structs
-        action_structs = [ActionStruct(action) for action in maintenance_struct.actions]
-        
-        # Get context for business logic
-        maintenance_context = MaintenanceContext.from_event(event_id)
+        action_structs = maintenance_struct.action_structs
         
         # Get asset if available
         asset = maintenance_struct.asset if hasattr(maintenance_struct, 'asset') else None
@@ -168,7 +163,7 @@ def work_maintenance_event(event_id):
 
 def _create_action_common_logic(event_id, action_name, description, estimated_duration, expected_billable_hours,
                                 safety_notes, notes, insert_position, after_action_id, copy_part_demands, copy_tools):
-    """Common logic for creating actions - handles sequence order calculation and shifting"""
+    """Common logic for creating actions - handles order key calculation (existing actions are not shifted)"""
     # Get maintenance struct
     maintenance_struct = MaintenanceActionSetStruct.from_event_id(event_id)
     if not maintenance_struct:
@@ -177,34 +172,13 @@ def _create_action_common_logic(event_id, action_name, description, estimated_du
     
     maintenance_context = MaintenanceContext.from_event(event_id)
     
-    # Calculate sequence order based on insert position
-    sequence_order = maintenance_context._calculate_sequence_order(
+    # Calculate order key based on insert position (sparse keys leave room between neighbours)
+    order_key = maintenance_context._calculate_sequence_order(
         insert_position=insert_position,
         after_action_id=after_action_id
     )
     
-    # If inserting at beginning or after, need to shift existing actions
-    if insert_position in ['beginning', 'after']:
-        actions = maintenance_struct.actions
-        if insert_position == 'beginning':
-            # Shift all actions up by 1
-            for action in actions:
-                action.sequence_order += 1
-            sequence_order = 1
-        else:  # after
-            # Shift actions after target down by 1
-            target_sequence = None
-            for action in actions:
-                if action.id == after_action_id:
-                    target_sequence = action.sequence_order
-                    break
-            if target_sequence is not None:
-                for action in actions:
-                    if action.sequence_order > target_sequence:
-                        action.sequence_order += 1
-                sequence_order = target_sequence + 1
-    
-    return maintenance_struct, sequence_order
+    return maintenance_struct, order_key
 
 
 @maintenance_event_bp.route('/<int:event_id>/create-blank-action', methods=['POST'])
@@ -260,7 +234,7 @@ def create_blank_action(event_id):
                 pass
         
         # ===== BUSINESS LOGIC SECTION =====
-        maintenance_struct, sequence_order = _create_action_common_logic(
+        maintenance_struct, order_key = _create_action_common_logic(
             event_id, action_name, description, estimated_duration, expected_billable_hours,
             safety_notes, notes, insert_position, after_action_id, False, False
         )
@@ -271,7 +245,7 @@ def create_blank_action(event_id):
         # Create blank action
         action = Action(
             maintenance_action_set_id=maintenance_struct.maintenance_action_set_id,
-            sequence_order=sequence_order,
+            order_key=order_key,
             action_name=action_name,
             description=description if description else None,
             estimated_duration=estimated_duration,
@@ -375,7 +349,7 @@ def create_from_proto_action(event_id):
                 pass
         
         # ===== BUSINESS LOGIC SECTION =====
-        maintenance_struct, sequence_order = _create_action_common_logic(
+        maintenance_struct, order_key = _create_action_common_logic(
             event_id, action_name, description, estimated_duration, expected_billable_hours,
             safety_notes, notes, insert_position, after_action_id, copy_part_demands, copy_tools
         )
@@ -387,7 +361,7 @@ def create_from_proto_action(event_id):
         action = ActionFactory.create_from_proto_action_item(
             proto_action_item_id=proto_action_item_id,
             maintenance_action_set_id=maintenance_struct.maintenance_action_set_id,
-            sequence_order=sequence_order,
+            order_key=order_key,
             user_id=current_user.id,
             commit=False,
             copy_part_demands=copy_part_demands,
@@ -492,7 +466,7 @@ def create_from_template_action(event_id):
                 pass
         
         # ===== BUSINESS LOGIC SECTION =====
-        maintenance_struct, sequence_order = _create_action_common_logic(
+        maintenance_struct, order_key = _create_action_common_logic(
             event_id, action_name, description, estimated_duration, expected_billable_hours,
             safety_notes, notes, insert_position, after_action_id, copy_part_demands, copy_tools
         )
@@ -509,8 +483,8 @@ def create_from_template_action(event_id):
             copy_part_demands=copy_part_demands,
             copy_tools=copy_tools
         )
-        # Update sequence order (factory uses template's sequence_order, but we may need a different one)
-        action.sequence_order = sequence_order
+        # Update order key (factory uses template's sequence_order, but we may need a different one)
+        action.order_key = order_key
         
         db.session.commit()
         
@@ -603,7 +577,7 @@ def create_from_current_action(event_id):
                 pass
         
         # ===== BUSINESS LOGIC SECTION =====
-        maintenance_struct, sequence_order = _create_action_common_logic(
+        maintenance_struct, order_key = _create_action_common_logic(
             event_id, action_name, description, estimated_duration, expected_billable_hours,
             safety_notes, notes, insert_position, after_action_id, copy_part_demands, copy_tools
         )
@@ -620,7 +594,7 @@ def create_from_current_action(event_id):
         action = Action(
             maintenance_action_set_id=maintenance_struct.maintenance_action_set_id,
             template_action_item_id=source_action.template_action_item_id,
-            sequence_order=sequence_order,
+            order_key=order_key,
             action_name=action_name or source_action.action_name,
             description=description or source_action.description,
             estimated_duration=estimated_duration if estimated_duration is not None else source_action.estimated_duration,
@@ -813,8 +787,8 @@ def render_edit_page(event_id):
             logger.warning(f"Event {event_id} not found")
             abort(404)
         
-        # Get actions with their structs (ordered by sequence_order)
-        action_structs = [ActionStruct(action) for action in sorted(maintenance_struct.actions, key=lambda a: a.sequence_order)]
+        # Get actions with their structs (ordered, with positions computed once)
+        action_structs = maintenance_struct.action_structs
         
         # Get selected action ID from query parameter (for action editor panel)
         selected_action_id = request.args.get('action_id', type=int)
@@ -982,7 +956,8 @@ def edit_template_action_set(event_id):
             safety_review_required=safety_review_required,
             staff_count=staff_count,
             labor_hours=labor_hours,
-            completion_notes=completion_notes
+            completion_notes=completion_notes,
+            user_id=current_user.id
         )
         
         flash('Maintenance event updated successfully', 'success')
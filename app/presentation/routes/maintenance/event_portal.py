@@ -73,7 +73,7 @@ def render_view_events_module(
     )
     
     # Get filter options for dropdowns
-    filter_options = EventPortalService.get_filter_options()
+    filter_options = EventPortalService.get_filter_options(filters)
     
     # Get active filters for display
     active_filters = EventPortalService.get_active_filters(filters)
@@ -7,6 +7,8 @@ from app.presentation.routes.maintenance.user_views.manager.main import manager_
 from app.presentation.routes.maintenance.user_views.manager.template_builder import template_builder_bp
 # Import create_assign routes to register them with manager_bp
 from app.presentation.routes.maintenance.user_views.manager import create_assign
+# Import KPI routes to register them with manager_bp
+from app.presentation.routes.maintenance.user_views.manager import kpis
 
 __all__ = ['manager_bp', 'template_builder_bp']
 
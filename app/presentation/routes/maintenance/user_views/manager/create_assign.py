@@ -3,10 +3,11 @@ Create & Assign Portal Routes
 Routes for creating maintenance events from templates and assigning them to technicians
 """
 
-from flask import Blueprint, render_template, request, flash, redirect, url_for, jsonify
+from flask import Blueprint, render_template, request, flash, redirect, url_for, jsonify, current_app
 from flask_login import login_required, current_user
 from datetime import datetime
 from app.logger import get_logger
+from app.buisness.core.background_jobs import BackgroundJobManager
 from app.services.maintenance.assign_monitor_service import AssignMonitorService
 from app.data.core.asset_info.asset_type import AssetType
 from app.data.core.asset_info.make_model import MakeModel
@@ -116,25 +117,24 @@ def create_event():
             flash('Asset is required', 'error')
             return redirect(url_for('manager_portal.create_event'))
         
-        # Create event
-        maintenance_action_set = AssignMonitorService.create_event_from_template(
-            template_action_set_id=template_action_set_id,
-            asset_id=asset_id,
-            planned_start_datetime=planned_start_datetime,
-            user_id=current_user.id,
-            assigned_user_id=assigned_user_id,
-            assigned_by_id=current_user.id if assigned_user_id else None,
-            priority=priority,
-            notes=notes
-        )
-        
-        flash(
-            f'Maintenance event {maintenance_action_set.id} created successfully!',
-            'success'
+        # Validate here, create in the maintenance.create_from_template job
+        AssignMonitorService.validate_event_from_template(template_action_set_id, asset_id, assigned_user_id)
+        job = BackgroundJobManager.submit(
+            current_app._get_current_object(),
+            'maintenance.create_from_template',
+            params={
+                'template_action_set_id': template_action_set_id,
+                'asset_id': asset_id,
+                'planned_start_datetime': planned_start_datetime.isoformat() if planned_start_datetime else None,
+                'assigned_user_id': assigned_user_id,
+                'priority': priority,
+                'notes': notes
+            },
+            user_id=current_user.id
         )
         
-        # Redirect back to portal homepage
-        return redirect(url_for('manager_portal.create_assign'))
+        flash('Maintenance event creation queued', 'success')
+        return redirect(url_for('jobs.detail', job_id=job.id))
         
     except ValueError as e:
         logger.warning(f"Validation error creating event: {e}")
@@ -0,0 +1,83 @@
+"""
+Maintenance KPI Routes
+Manager KPI dashboard served from the maintenance KPI rollups
+"""
+
+from flask import render_template, request, jsonify
+from flask_login import login_required, current_user
+from app.logger import get_logger
+from app.services.maintenance.maintenance_kpi_service import MaintenanceKpiService
+from app.buisness.maintenance.kpi import MaintenanceKpiRollupManager
+
+logger = get_logger("asset_management.routes.maintenance.manager.kpis")
+
+# Use the existing manager_bp from main.py
+from app.presentation.routes.maintenance.user_views.manager.main import manager_bp
+
+
+def _period_range():
+    """period_from/period_to query args, defaulting to the last twelve months"""
+    default_from, default_to = MaintenanceKpiService.default_period_range()
+    return (
+        request.args.get('period_from') or default_from,
+        request.args.get('period_to') or default_to,
+    )
+
+
+@manager_bp.route('/kpis')
+@login_required
+def kpis():
+    """Maintenance KPI dashboard page"""
+    logger.info(f"Maintenance KPI dashboard accessed by {current_user.username}")
+    dimension = request.args.get('dimension', 'fleet')
+    if dimension not in MaintenanceKpiRollupManager.DIMENSIONS:
+        dimension = 'fleet'
+    period_from, period_to = _period_range()
+
+    return render_template(
+        'maintenance/manager/kpis.html',
+        dimension=dimension,
+        dimensions=MaintenanceKpiRollupManager.DIMENSIONS,
+        period_from=period_from,
+        period_to=period_to,
+        kpis=MaintenanceKpiService.get_kpis(dimension, period_from, period_to),
+        trend=MaintenanceKpiService.get_trend('fleet', MaintenanceKpiRollupManager.FLEET_ID, period_from, period_to),
+    )
+
+
+@manager_bp.route('/kpis/data')
+@login_required
+def kpis_data():
+    """KPIs per dimension member as JSON"""
+    dimension = request.args.get('dimension', 'fleet')
+    period_from, period_to = _period_range()
+    try:
+        kpis = MaintenanceKpiService.get_kpis(dimension, period_from, period_to)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({
+        'dimension': dimension,
+        'period_from': period_from,
+        'period_to': period_to,
+        'kpis': kpis,
+    })
+
+
+@manager_bp.route('/kpis/trend')
+@login_required
+def kpis_trend():
+    """Monthly KPI series for one dimension member as JSON"""
+    dimension = request.args.get('dimension', 'fleet')
+    dimension_id = request.args.get('dimension_id', MaintenanceKpiRollupManager.FLEET_ID, type=int)
+    period_from, period_to = _period_range()
+    try:
+        trend = MaintenanceKpiService.get_trend(dimension, dimension_id, period_from, period_to)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({
+        'dimension': dimension,
+        'dimension_id': dimension_id,
+        'period_from': period_from,
+        'period_to': period_to,
+        'trend': trend,
+    })
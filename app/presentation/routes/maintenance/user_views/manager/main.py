@@ -11,6 +11,7 @@ from app.buisness.maintenance import (
     TemplateMaintenanceContext,
     ProtoActionContext,
 )
+from app.services.core.keyset_pagination import KeysetPagination
 
 logger = get_logger("asset_management.routes.maintenance.manager")
 
@@ -90,11 +91,7 @@ def view_maintenance():
                 query = query.filter_by(asset_id=asset_id)
             
             try:
-                maintenance_events = query.paginate(
-                    page=page,
-                    per_page=per_page,
-                    error_out=False
-                )
+                maintenance_events = KeysetPagination.paginate(query, page=page, per_page=per_page)
             except Exception as e:
                 logger.warning(f"Error paginating maintenance events: {e}")
                 # Create an empty pagination-like object or set to None
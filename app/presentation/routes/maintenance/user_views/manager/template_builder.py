@@ -3,13 +3,16 @@ Template Builder Routes
 Routes for building and editing maintenance templates before submission.
 """
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash, session, jsonify
+from flask import Blueprint, render_template, request, redirect, url_for, flash, session, jsonify, current_app
 from flask_login import login_required, current_user
+from sqlalchemy.orm import selectinload
 from app import db
 from app.logger import get_logger
+from app.buisness.core.background_jobs import BackgroundJobManager
 from app.buisness.maintenance.builders.template_builder_context import TemplateBuilderContext
 from app.data.maintenance.builders.template_builder_memory import TemplateBuilderMemory
 from app.data.maintenance.builders.template_builder_attachment_reference import TemplateBuilderAttachmentReference
+from app.data.maintenance.builders.template_builder_op import TemplateBuilderOp
 from app.data.maintenance.templates.template_action_sets import TemplateActionSet
 from app.services.maintenance.template_builder_service import TemplateBuilderService
 
@@ -154,11 +157,16 @@ def view_drafts():
         if search_name:
             query = query.filter(TemplateBuilderMemory.name.ilike(f'%{search_name}%'))
         if search_content:
-            # Search in build_state JSON content
-            query = query.filter(TemplateBuilderMemory.build_state.ilike(f'%{search_content}%'))
+            # Search in build_state JSON content and edits not yet compacted into it
+            query = query.filter(db.or_(
+                TemplateBuilderMemory.build_state.ilike(f'%{search_content}%'),
+                TemplateBuilderMemory.ops.any(TemplateBuilderOp.patch.ilike(f'%{search_content}%'))
+            ))
         
-        # Order by most recently updated
-        drafts = query.order_by(TemplateBuilderMemory.updated_at.desc()).all()
+        # Order by most recently updated, loading pending ops with the drafts
+        drafts = query.options(selectinload(TemplateBuilderMemory.ops)).order_by(
+            TemplateBuilderMemory.updated_at.desc()
+        ).all()
         
         # Get user information for display
         from app.data.core.user_info.user import User
@@ -222,7 +230,7 @@ def get_actions_list(builder_id):
 def add_action(builder_id):
     """Add an action to the builder."""
     try:
-        context = TemplateBuilderContext(builder_id)
+        context = TemplateBuilderService.get_context(builder_id)
         action_type = request.form.get('action_type')
         
         if action_type == 'custom':
@@ -275,7 +283,7 @@ def add_action(builder_id):
 def delete_action(builder_id, action_index):
     """Delete an action from the builder."""
     try:
-        context = TemplateBuilderContext(builder_id)
+        context = TemplateBuilderService.get_context(builder_id)
         context.remove_action(action_index)
         flash('Action deleted successfully', 'success')
     except IndexError:
@@ -295,21 +303,13 @@ def delete_action(builder_id, action_index):
 def move_action(builder_id, action_index):
     """Move an action up or down in the sequence."""
     try:
-        context = TemplateBuilderContext(builder_id)
+        context = TemplateBuilderService.get_context(builder_id)
         direction = request.form.get('direction')  # 'up' or 'down'
         
         if direction == 'up' and action_index > 0:
-            # Swap with previous action
-            actions = context.build_actions
-            actions[action_index], actions[action_index - 1] = actions[action_index - 1], actions[action_index]
-            context._renumber_sequence_orders()
-            context._save()
+            context.move_action(action_index, action_index - 1)
         elif direction == 'down' and action_index < len(context.build_actions) - 1:
-            # Swap with next action
-            actions = context.build_actions
-            actions[action_index], actions[action_index + 1] = actions[action_index + 1], actions[action_index]
-            context._renumber_sequence_orders()
-            context._save()
+            context.move_action(action_index, action_index + 1)
     except Exception as e:
         logger.error(f"Error moving action in builder {builder_id}: {e}")
         # Only flash on error for non-HTMX requests
@@ -349,7 +349,7 @@ def add_part_demand(builder_id, action_index):
     print(f"request.method: {request.method}")
     print(f"request.headers.get('HX-Request'): {request.headers.get('HX-Request')}")
     try:
-        context = TemplateBuilderContext(builder_id)
+        context = TemplateBuilderService.get_context(builder_id)
         part_dict = TemplateBuilderService.convert_form_to_part_dict(request.form)
         context.add_part_demand_to_action(action_index, part_dict)
         print(f"context: {context.to_dict()}")
@@ -369,7 +369,7 @@ def add_part_demand(builder_id, action_index):
 def delete_part_demand(builder_id, action_index, part_index):
     """Delete a part demand from an action."""
     try:
-        context = TemplateBuilderContext(builder_id)
+        context = TemplateBuilderService.get_context(builder_id)
         context.remove_part_demand_from_action(action_index, part_index)
         flash('Part demand deleted successfully', 'success')
     except IndexError:
@@ -396,7 +396,7 @@ def add_tool(builder_id, action_index):
     print(f"request.headers.get('HX-Request'): {request.headers.get('HX-Request')}")
     
     try:
-        context = TemplateBuilderContext(builder_id)
+        context = TemplateBuilderService.get_context(builder_id)
         logger.info(f"ADD TOOL - request.form: {request.form}")
         logger.debug(f"ADD TOOL - builder_id: {builder_id}, action_index: {action_index}")
         
@@ -426,7 +426,7 @@ def add_tool(builder_id, action_index):
 def delete_tool(builder_id, action_index, tool_index):
     """Delete a tool from an action."""
     try:
-        context = TemplateBuilderContext(builder_id)
+        context = TemplateBuilderService.get_context(builder_id)
         context.remove_tool_from_action(action_index, tool_index)
         flash('Tool deleted successfully', 'success')
     except IndexError:
@@ -446,7 +446,7 @@ def delete_tool(builder_id, action_index, tool_index):
 def update_metadata(builder_id):
     """Update template metadata."""
     try:
-        context = TemplateBuilderContext(builder_id)
+        context = TemplateBuilderService.get_context(builder_id)
         builder_memory = TemplateBuilderMemory.query.get_or_404(builder_id)
         
         # Update common fields
@@ -492,13 +492,26 @@ def update_metadata(builder_id):
 @template_builder_bp.route('/<int:builder_id>/submit', methods=['POST'])
 @login_required
 def submit_template(builder_id):
-    """Submit template builder and create actual TemplateActionSet."""
+    """
+    Submit template builder as a background job (maintenance.submit_template).
+    The job creates the TemplateActionSet; the job page links to it when done.
+    """
     try:
-        context = TemplateBuilderContext(builder_id)
-        template_context = context.submit_template(user_id=current_user.id)
+        context = TemplateBuilderService.get_context(builder_id)
+        if context.build_status == 'Submitted':
+            raise ValueError("This template has already been submitted")
+        if not context.get_metadata('task_name'):
+            raise ValueError("task_name is required")
         
-        flash(f'Template created successfully! Template ID: {template_context.template_action_set_id}', 'success')
-        return redirect(url_for('maintenance.view_maintenance_template', template_set_id=template_context.template_action_set_id))
+        job = BackgroundJobManager.submit(
+            current_app._get_current_object(),
+            'maintenance.submit_template',
+            params={'builder_id': builder_id},
+            user_id=current_user.id,
+            label=f'Submit template builder: {context.name}'
+        )
+        flash('Template submission queued', 'success')
+        return redirect(url_for('jobs.detail', job_id=job.id))
     except ValueError as e:
         logger.error(f"Validation error submitting builder {builder_id}: {e}")
         flash(f'Validation error: {str(e)}', 'error')
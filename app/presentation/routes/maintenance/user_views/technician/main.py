@@ -22,205 +22,19 @@ def dashboard():
     """Technician dashboard with assigned work"""
     logger.info(f"Technician dashboard accessed by {current_user.username}")
     
-    # Get basic stats
-    stats = {
-        'assigned_work': 0,
-        'in_progress': 0,
-        'completed_today': 0,
+    # Assigned work, quick access and part demand widgets come from the
+    # per-user cache in PortalUserData.maintenance_cache (recomputed on change)
+    dashboard_data = {
+        'stats': {'assigned_work': 0, 'in_progress': 0, 'completed_today': 0},
+        'quick_access': {'most_recently_assigned_event': None, 'most_recently_commented_event': None},
+        'top_assets': [],
+        'recent_part_demands': [],
+        'oldest_part_demands_needing_approval': [],
+        'oldest_part_demands_not_received': [],
     }
-    
-    # Quick access features
-    quick_access = {
-        'most_recently_assigned_event': None,
-        'most_recently_commented_event': None,
-    }
-    
-    # Additional widgets data
-    top_assets = []
-    recent_part_demands = []
-    oldest_part_demands_needing_approval = []
-    oldest_part_demands_not_received = []
-    
     try:
-        from app.data.maintenance.base.actions import Action
-        from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
-        from app.data.core.event_info.comment import Comment
-        from app.data.core.event_info.event import Event
-        from app.data.maintenance.base.part_demands import PartDemand
-        from app.data.core.asset_info.asset import Asset
-        from sqlalchemy import desc, func, asc
-        
-        # Get work assigned to current user
-        stats['assigned_work'] = Action.query.filter_by(
-            assigned_user_id=current_user.id
-        ).filter(Action.status.in_(['Not Started', 'In Progress'])).count()
-        
-        stats['in_progress'] = Action.query.filter_by(
-            assigned_user_id=current_user.id,
-            status='In Progress'
-        ).count()
-        
-        # Feature #1: Most Recently Assigned Event
-        # Use updated_at since assigned_at doesn't exist
-        most_recent_assigned = MaintenanceActionSet.query.filter_by(
-            assigned_user_id=current_user.id
-        ).order_by(desc(MaintenanceActionSet.updated_at)).first()
-        
-        if most_recent_assigned and most_recent_assigned.event_id:
-            quick_access['most_recently_assigned_event'] = {
-                'event_id': most_recent_assigned.event_id,
-                'task_name': most_recent_assigned.task_name,
-                'updated_at': most_recent_assigned.updated_at,
-            }
-        
-        # Feature #2: Most Recently Commented On Event
-        # Join Comment with Event and MaintenanceActionSet
-        most_recent_comment = Comment.query.join(
-            Event, Comment.event_id == Event.id
-        ).join(
-            MaintenanceActionSet, Event.id == MaintenanceActionSet.event_id
-        ).filter(
-            Comment.created_by_id == current_user.id,
-            Comment.user_viewable.is_(None)  # Only visible comments
-        ).order_by(desc(Comment.created_at)).first()
-        
-        if most_recent_comment:
-            # Get the maintenance action set for this event
-            maintenance_action_set = MaintenanceActionSet.query.filter_by(
-                event_id=most_recent_comment.event_id
-            ).first()
-            
-            if maintenance_action_set:
-                quick_access['most_recently_commented_event'] = {
-                    'event_id': most_recent_comment.event_id,
-                    'task_name': maintenance_action_set.task_name,
-                    'comment_created_at': most_recent_comment.created_at,
-                    'comment_preview': most_recent_comment.get_content_preview(50),
-                }
-        
-        # Feature #8: Top Five Assets with Most Actions Completed (last 6 months)
-        six_months_ago = datetime.now() - timedelta(days=180)
-        top_assets_query = db.session.query(
-            Asset.id,
-            Asset.name,
-            func.count(Action.id).label('action_count')
-        ).join(
-            MaintenanceActionSet, Asset.id == MaintenanceActionSet.asset_id
-        ).join(
-            Action, MaintenanceActionSet.id == Action.maintenance_action_set_id
-        ).filter(
-            Action.assigned_user_id == current_user.id,
-            Action.status == 'Complete',
-            Action.updated_at >= six_months_ago
-        ).group_by(
-            Asset.id, Asset.name
-        ).order_by(
-            desc('action_count')
-        ).limit(5).all()
-        
-        top_assets = [
-            {'id': asset_id, 'name': name, 'action_count': count}
-            for asset_id, name, count in top_assets_query
-        ]
-        
-        # Feature #9: Ten Most Recent Part Demands with Status Updates
-        recent_part_demands_query = PartDemand.query.join(
-            Action, PartDemand.action_id == Action.id
-        ).join(
-            MaintenanceActionSet, Action.maintenance_action_set_id == MaintenanceActionSet.id
-        ).filter(
-            MaintenanceActionSet.assigned_user_id == current_user.id
-        ).order_by(
-            desc(PartDemand.updated_at)
-        ).limit(10).all()
-        
-        recent_part_demands = []
-        for pd in recent_part_demands_query:
-            # Get event_id from the action's maintenance_action_set
-            event_id = None
-            if pd.action and pd.action.maintenance_action_set:
-                event_id = pd.action.maintenance_action_set.event_id
-            
-            recent_part_demands.append({
-                'id': pd.id,
-                'part_name': pd.part.name if pd.part else 'Unknown Part',
-                'quantity': pd.quantity_required,
-                'status': pd.status,
-                'updated_at': pd.updated_at,
-                'event_id': event_id,
-            })
-        
-        # Feature #10: Ten Oldest Part Demands Needing Approval
-        oldest_part_demands_needing_approval_query = PartDemand.query.join(
-            Action, PartDemand.action_id == Action.id
-        ).join(
-            MaintenanceActionSet, Action.maintenance_action_set_id == MaintenanceActionSet.id
-        ).filter(
-            MaintenanceActionSet.assigned_user_id == current_user.id,
-            db.or_(
-                PartDemand.status == 'Pending Manager Approval',
-                PartDemand.maintenance_approval_by_id.is_(None)
-            )
-        ).order_by(
-            asc(PartDemand.created_at)
-        ).limit(10).all()
-        
-        oldest_part_demands_needing_approval = []
-        for pd in oldest_part_demands_needing_approval_query:
-            # Get event_id from the action's maintenance_action_set
-            event_id = None
-            if pd.action and pd.action.maintenance_action_set:
-                event_id = pd.action.maintenance_action_set.event_id
-            
-            days_waiting = 0
-            if pd.created_at:
-                days_waiting = (datetime.now() - pd.created_at).days
-            
-            oldest_part_demands_needing_approval.append({
-                'id': pd.id,
-                'part_name': pd.part.name if pd.part else 'Unknown Part',
-                'quantity': pd.quantity_required,
-                'status': pd.status,
-                'created_at': pd.created_at,
-                'days_waiting': days_waiting,
-                'event_id': event_id,
-            })
-        
-        # Feature #11: Ten Oldest Not Issued/Rejected/Pending Part Demands
-        # Parts that were approved but haven't been received
-        statuses_not_received = ['Pending Inventory Approval', 'Ordered', 'Backordered']
-        oldest_part_demands_not_received_query = PartDemand.query.join(
-            Action, PartDemand.action_id == Action.id
-        ).join(
-            MaintenanceActionSet, Action.maintenance_action_set_id == MaintenanceActionSet.id
-        ).filter(
-            MaintenanceActionSet.assigned_user_id == current_user.id,
-            PartDemand.status.in_(statuses_not_received)
-        ).order_by(
-            asc(PartDemand.created_at)
-        ).limit(10).all()
-        
-        oldest_part_demands_not_received = []
-        for pd in oldest_part_demands_not_received_query:
-            # Get event_id from the action's maintenance_action_set
-            event_id = None
-            if pd.action and pd.action.maintenance_action_set:
-                event_id = pd.action.maintenance_action_set.event_id
-            
-            days_waiting = 0
-            if pd.created_at:
-                days_waiting = (datetime.now() - pd.created_at).days
-            
-            oldest_part_demands_not_received.append({
-                'id': pd.id,
-                'part_name': pd.part.name if pd.part else 'Unknown Part',
-                'quantity': pd.quantity_required,
-                'status': pd.status,
-                'created_at': pd.created_at,
-                'days_waiting': days_waiting,
-                'event_id': event_id,
-            })
-        
+        from app.buisness.maintenance.technician import TechnicianDashboardCache
+        dashboard_data = TechnicianDashboardCache.get(current_user.id)
     except ImportError as e:
         logger.warning(f"Could not load technician stats: {e}")
     except Exception as e:
@@ -235,14 +49,14 @@ def dashboard():
     
     return render_template(
         'maintenance/technician/dashboard.html',
-        stats=stats,
-        quick_access=quick_access,
+        stats=dashboard_data['stats'],
+        quick_access=dashboard_data['quick_access'],
         start_of_week=start_of_week,
         end_of_week=end_of_week,
-        top_assets=top_assets,
-        recent_part_demands=recent_part_demands,
-        oldest_part_demands_needing_approval=oldest_part_demands_needing_approval,
-        oldest_part_demands_not_received=oldest_part_demands_not_received,
+        top_assets=dashboard_data['top_assets'],
+        recent_part_demands=dashboard_data['recent_part_demands'],
+        oldest_part_demands_needing_approval=dashboard_data['oldest_part_demands_needing_approval'],
+        oldest_part_demands_not_received=dashboard_data['oldest_part_demands_not_received'],
     )
 
 
@@ -15,6 +15,9 @@ from .location_service import LocationService
 from .make_model_service import MakeModelService
 from .user_service import UserService
 from .event_service import EventService
+from .count_annotation import CountAnnotation
+from .typeahead_service import TypeaheadService
+from .keyset_pagination import KeysetPagination
 
 __all__ = [
     'AssetService',
@@ -23,5 +26,8 @@ __all__ = [
     'MakeModelService',
     'UserService',
     'EventService',
+    'CountAnnotation',
+    'TypeaheadService',
+    'KeysetPagination',
 ]
 
@@ -12,10 +12,9 @@ from typing import Dict, List, Optional, Tuple
 from flask import Request
 from flask_sqlalchemy.pagination import Pagination
 from app.data.core.asset_info.asset import Asset
-from app.data.core.asset_info.asset_type import AssetType
-from app.data.core.asset_info.make_model import MakeModel
-from app.data.core.major_location import MajorLocation
 from app.data.core.event_info.event import Event
+from app.buisness.core.reference_data_cache import ReferenceDataCache
+from app.services.core.keyset_pagination import KeysetPagination
 
 
 class AssetService:
@@ -113,13 +112,13 @@ class AssetService:
         )
         
         # Paginate
-        assets = query.paginate(page=page, per_page=per_page, error_out=False)
+        assets = KeysetPagination.paginate(query, page=page, per_page=per_page)
         
         # Get filter options
         filter_options = {
-            'asset_types': AssetType.query.all(),
-            'locations': MajorLocation.query.all(),
-            'make_models': MakeModel.query.all()
+            'asset_types': ReferenceDataCache.asset_types(),
+            'locations': ReferenceDataCache.locations(),
+            'make_models': ReferenceDataCache.make_models()
         }
         
         # Current filters for template
@@ -143,8 +142,8 @@ class AssetService:
             Dictionary with 'locations' and 'make_models' keys
         """
         return {
-            'locations': MajorLocation.query.all(),
-            'make_models': MakeModel.query.all()
+            'locations': ReferenceDataCache.locations(),
+            'make_models': ReferenceDataCache.make_models()
         }
     
     @staticmethod
@@ -14,7 +14,7 @@ from flask_sqlalchemy.pagination import Pagination
 from app import db
 from app.data.core.asset_info.asset_type import AssetType
 from app.data.core.asset_info.make_model import MakeModel
-from app.data.core.asset_info.asset import Asset
+from app.services.core.count_annotation import CountAnnotation
 
 
 class AssetTypeService:
@@ -84,20 +84,9 @@ class AssetTypeService:
         # Paginate
         asset_types = query.paginate(page=page, per_page=per_page, error_out=False)
         
-        # Pre-calculate asset counts for each asset type to avoid N+1 queries
-        asset_type_counts = {}
-        make_model_counts = {}
-        
-        for asset_type in asset_types.items:
-            # Count make/models for this asset type
-            make_model_count = MakeModel.query.filter_by(asset_type_id=asset_type.id).count()
-            make_model_counts[asset_type.id] = make_model_count
-            
-            # Count assets for this asset type (through make/models)
-            asset_count = db.session.query(Asset).join(MakeModel).filter(
-                MakeModel.asset_type_id == asset_type.id
-            ).count()
-            asset_type_counts[asset_type.id] = asset_count
+        # Make/model and asset counts for the page, one grouped query each
+        make_model_counts = CountAnnotation.for_page(asset_types, AssetType.make_models)
+        asset_type_counts = CountAnnotation.for_page(asset_types, AssetType.make_models, MakeModel.assets)
         
         # Get unique categories for filter
         categories = db.session.query(AssetType.category).distinct().all()
@@ -0,0 +1,87 @@
+"""
+Count Annotation
+Child counts for a page of list rows with one grouped query.
+
+List pages show per-row counts (assets per make/model, assets per location,
+make/models and assets per asset type). Counting row by row costs one query
+per row; CountAnnotation counts the children of every row on the page with a
+single GROUP BY on the child table's foreign key.
+"""
+
+from typing import Dict, Iterable, Union
+from flask_sqlalchemy.pagination import Pagination
+from sqlalchemy import func, select
+from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from app import db
+
+
+class CountAnnotation:
+    """
+    Grouped child counts for list pages.
+
+    Children are named by relationship attributes. A single relationship
+    counts direct children (MakeModel.assets); a chain counts through
+    intermediate tables (AssetType.make_models, MakeModel.assets counts the
+    assets of each asset type). Each relationship must be a plain one-to-many
+    (foreign key on the child, no secondary table).
+    """
+
+    @staticmethod
+    def _foreign_key(relationship: InstrumentedAttribute):
+        """Child foreign key column of a one-to-many relationship"""
+        prop = relationship.property
+        if not isinstance(prop, RelationshipProperty) or prop.secondary is not None or not prop.uselist:
+            raise ValueError(f"{relationship} is not a one-to-many relationship")
+        pairs = prop.local_remote_pairs
+        if len(pairs) != 1:
+            raise ValueError(f"{relationship} must join on a single column")
+        return pairs[0][1]
+
+    @staticmethod
+    def counts(parent_ids: Iterable[int], *relationships: InstrumentedAttribute) -> Dict[int, int]:
+        """
+        Count children of many parents with one grouped query.
+
+        Args:
+            parent_ids: Primary keys of the parent rows
+            relationships: Relationship attribute, or chain of relationship
+                attributes, from the parent to the children to count
+
+        Returns:
+            Dictionary mapping every parent ID to its child count (0 when none)
+        """
+        if not relationships:
+            raise ValueError("At least one relationship is required")
+        parent_ids = list(dict.fromkeys(parent_ids))
+        counts = dict.fromkeys(parent_ids, 0)
+        if not parent_ids:
+            return counts
+
+        group_column = CountAnnotation._foreign_key(relationships[0])
+        child_mapper = relationships[-1].property.mapper
+        query = select(group_column, func.count(child_mapper.primary_key[0]))
+        query = query.select_from(relationships[0].property.mapper)
+        for relationship in relationships[1:]:
+            CountAnnotation._foreign_key(relationship)
+            query = query.join(relationship)
+        query = query.where(group_column.in_(parent_ids)).group_by(group_column)
+
+        for parent_id, count in db.session.execute(query):
+            counts[parent_id] = count
+        return counts
+
+    @staticmethod
+    def for_page(page: Union[Pagination, Iterable], *relationships: InstrumentedAttribute) -> Dict[int, int]:
+        """
+        Child counts for the rows of a page.
+
+        Args:
+            page: Pagination object (its items are used) or a list of rows
+            relationships: Relationship chain from the row to the children to count
+
+        Returns:
+            Dictionary mapping row ID to its child count
+        """
+        items = page.items if isinstance(page, Pagination) else page
+        return CountAnnotation.counts((item.id for item in items), *relationships)
@@ -8,13 +8,16 @@ Handles:
 """
 
 from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
 from flask import Request
 import json
+from app import db
 from app.data.core.event_info.event import Event
 from app.data.core.asset_info.asset import Asset
 from app.data.core.event_info.comment import Comment
 from app.buisness.core.event_context import EventContext
 from app.data.core.event_info.attachment import Attachment
+from app.services.core.keyset_pagination import KeysetPagination
 
 
 class EventService:
@@ -26,6 +29,14 @@ class EventService:
     - Extracting filter parameters from requests
     """
     
+    @staticmethod
+    def _parse_date(value: Optional[str]) -> Optional[datetime]:
+        """Parse a YYYY-MM-DD filter value (None when empty or invalid)"""
+        try:
+            return datetime.strptime(value, '%Y-%m-%d') if value else None
+        except ValueError:
+            return None
+    
     @staticmethod
     def build_event_query(
         event_type: Optional[str] = None,
@@ -33,11 +44,18 @@ class EventService:
         asset_id: Optional[str] = None,
         major_location_id: Optional[str] = None,
         make_model_id: Optional[int] = None,
-        row_count: int = 50
+        row_count: int = 50,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        include_archived: bool = False
     ) -> Tuple:
         """
         Build event query with filters.
         
+        Archived events are included only when date_from reaches back into
+        the event archive or include_archived is set; otherwise only the hot
+        events table is queried.
+        
         Args:
             event_type: Filter by event type
             user_id: Filter by user ID
@@ -45,40 +63,53 @@ class EventService:
             major_location_id: Filter by location ID (can be 'null' string or ID)
             make_model_id: Filter by make/model ID (filters events related to assets of this make/model)
             row_count: Limit for results (default: 50)
+            date_from: Only events on or after this date
+            date_to: Only events on or before this date (whole day included)
+            include_archived: Search the event archive even without a date range
             
         Returns:
             Tuple of (query object, filters dict)
         """
-        query = Event.query
+        from app.buisness.core.event_archive_manager import EventArchiveManager
+        
+        # End of the requested range (exclusive)
+        date_until = date_to + timedelta(days=1) if date_to else None
+        event_entity = EventArchiveManager.event_entity(date_from, date_until, include_archived)
+        query = db.session.query(event_entity)
         
         if event_type:
-            query = query.filter(Event.event_type == event_type)
+            query = query.filter(event_entity.event_type == event_type)
         
         if user_id:
-            query = query.filter(Event.user_id == user_id)
+            query = query.filter(event_entity.user_id == user_id)
         
         # Handle asset filtering (including null)
         if asset_id is not None:
             if asset_id == 'null':
-                query = query.filter(Event.asset_id.is_(None))
+                query = query.filter(event_entity.asset_id.is_(None))
             elif asset_id != '':
-                query = query.filter(Event.asset_id == int(asset_id))
+                query = query.filter(event_entity.asset_id == int(asset_id))
         
         # Handle location filtering (including null)
         if major_location_id is not None:
             if major_location_id == 'null':
-                query = query.filter(Event.major_location_id.is_(None))
+                query = query.filter(event_entity.major_location_id.is_(None))
             elif major_location_id != '':
-                query = query.filter(Event.major_location_id == int(major_location_id))
+                query = query.filter(event_entity.major_location_id == int(major_location_id))
         
         # Handle make/model filtering - filter events related to assets of this make/model
         if make_model_id:
-            query = query.join(Asset, Event.asset_id == Asset.id).filter(
+            query = query.join(Asset, event_entity.asset_id == Asset.id).filter(
                 Asset.make_model_id == make_model_id
             )
         
+        if date_from:
+            query = query.filter(event_entity.timestamp >= date_from)
+        if date_until:
+            query = query.filter(event_entity.timestamp < date_until)
+        
         # Order by timestamp (newest first)
-        query = query.order_by(Event.timestamp.desc())
+        query = query.order_by(event_entity.timestamp.desc())
         
         filters = {
             'event_type': event_type,
@@ -87,6 +118,10 @@ class EventService:
             'major_location_id': major_location_id,
             'make_model_id': make_model_id,
             'row_count': row_count,
+            'date_from': date_from.strftime('%Y-%m-%d') if date_from else None,
+            'date_to': date_to.strftime('%Y-%m-%d') if date_to else None,
+            'include_archived': include_archived,
+            'archived_through': EventArchiveManager.archived_through(),
         }
         
         return query, filters
@@ -114,6 +149,9 @@ class EventService:
         asset_id = request.args.get('asset_id')
         major_location_id = request.args.get('major_location_id')
         make_model_id = request.args.get('make_model_id', type=int)
+        date_from = EventService._parse_date(request.args.get('date_from'))
+        date_to = EventService._parse_date(request.args.get('date_to'))
+        include_archived = request.args.get('include_archived', False, type=bool)
         
         # Build query using service method
         query, filters = EventService.build_event_query(
@@ -122,11 +160,14 @@ class EventService:
             asset_id=asset_id,
             major_location_id=major_location_id,
             make_model_id=make_model_id,
+            date_from=date_from,
+            date_to=date_to,
+            include_archived=include_archived,
             row_count=per_page
         )
         
         # Paginate
-        events = query.paginate(page=page, per_page=per_page, error_out=False)
+        events = KeysetPagination.paginate(query, page=page, per_page=per_page)
         
         return events, filters
     
@@ -153,6 +194,9 @@ class EventService:
         asset_id = request.args.get('asset_id')
         major_location_id = request.args.get('major_location_id')
         make_model_id = request.args.get('make_model_id', type=int)
+        date_from = EventService._parse_date(request.args.get('date_from'))
+        date_to = EventService._parse_date(request.args.get('date_to'))
+        include_archived = request.args.get('include_archived', False, type=bool)
         
         # Build query using service method
         query, filters = EventService.build_event_query(
@@ -161,6 +205,9 @@ class EventService:
             asset_id=asset_id,
             major_location_id=major_location_id,
             make_model_id=make_model_id,
+            date_from=date_from,
+            date_to=date_to,
+            include_archived=include_archived,
             row_count=row_count
         )
         
@@ -173,22 +220,29 @@ class EventService:
         return events, filters
     
     @staticmethod
-    def get_filter_options() -> Dict:
+    def get_filter_options(values: Optional[Dict] = None) -> Dict:
         """
         Get filter options for event list views.
-        
+
+        Users, assets and make/models are picked through typeahead endpoints,
+        so only the currently selected option of each is loaded here.
+
+        Args:
+            values: Current filter/form values (request.args or request.form)
+
         Returns:
-            Dictionary with users, assets, locations, and make_models
+            Dictionary with locations and selected_user, selected_asset and
+            selected_make_model (typeahead Options or None)
         """
-        from app.data.core.user_info.user import User
-        from app.data.core.major_location import MajorLocation
-        from app.data.core.asset_info.make_model import MakeModel
-        
+        from app.buisness.core.reference_data_cache import ReferenceDataCache
+        from app.services.core.typeahead_service import TypeaheadService
+
+        values = values or {}
         return {
-            'users': User.query.all(),
-            'assets': Asset.query.all(),
-            'locations': MajorLocation.query.all(),
-            'make_models': MakeModel.query.all()
+            'locations': ReferenceDataCache.locations(),
+            'selected_user': TypeaheadService.get_option(TypeaheadService.USERS, values.get('user_id')),
+            'selected_asset': TypeaheadService.get_option(TypeaheadService.ASSETS, values.get('asset_id')),
+            'selected_make_model': TypeaheadService.get_option(TypeaheadService.MAKE_MODELS, values.get('make_model_id')),
         }
     
     @staticmethod
@@ -0,0 +1,307 @@
+"""
+Keyset Pagination
+Seek-based pagination for list pages, with cached or estimated totals.
+
+query.paginate() runs LIMIT/OFFSET plus a COUNT(*) on every page view, so
+deep pages and large tables get linearly slower. KeysetPagination keeps the
+Pagination interface the list templates use (items, has_next, iter_pages,
+prev_num, next_num, total) but:
+
+- Next/previous pages seek from the sort key of the neighbouring page's
+  edge row, carried in an opaque ?cursor= token, instead of scanning OFFSET
+  rows. Numbered page links without a cursor fall back to OFFSET.
+- has_next comes from fetching one row past the page, not from the total.
+- Totals are counted once and cached per query. A write to one of the
+  query's tables makes the cached total an estimate (total_is_estimate);
+  ?exact_count=1 recounts on demand. The last page knows its total exactly
+  without counting.
+"""
+
+import base64
+import hashlib
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from flask import has_request_context, request
+from flask_sqlalchemy.pagination import QueryPagination
+from sqlalchemy import Table, and_, false, inspect, or_
+from sqlalchemy.orm import Query
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
+from sqlalchemy.sql.util import find_tables
+from app.utils.flush_hooks import on_flush
+from app.utils.versioned_cache import VersionedCache
+
+
+# Process-level LRU of list totals keyed by the compiled count query, with the
+# query's tables as namespaces. An entry whose tables were written since it
+# was stored is still returned (flagged as stale) so it can be shown as an
+# estimate.
+_count_cache = VersionedCache(max_entries=256, ttl_seconds=60)
+
+
+class KeysetPagination(QueryPagination):
+    """
+    Pagination object for a query ordered by a keyset.
+
+    Don't create instances directly; use KeysetPagination.paginate(). The
+    sort key is the query's ORDER BY (or the order_by passed in) followed by
+    the primary key, so every row has a unique position. NULL sorts below
+    every value (first ascending, last descending, as SQLite orders it); the
+    ORDER BY says so explicitly and the seek condition includes or excludes
+    NULL rows to match.
+    """
+
+    total_is_estimate = False
+
+    @classmethod
+    def paginate(
+        cls,
+        query: Query,
+        page: int = 1,
+        per_page: int = 20,
+        order_by: Optional[Sequence] = None,
+        cursor: Optional[str] = None,
+        exact_count: Optional[bool] = None
+    ) -> 'KeysetPagination':
+        """
+        Paginate a query by keyset.
+
+        Args:
+            query: Query returning one entity per row
+            page: Page number (1-based)
+            per_page: Items per page
+            order_by: Sort columns or expressions (default: the query's ORDER BY)
+            cursor: Cursor token (default: the ?cursor= request arg)
+            exact_count: Count even when a cached total exists (default: the ?exact_count= request arg)
+
+        Returns:
+            KeysetPagination object
+        """
+        if order_by is None:
+            order_by = query._order_by_clauses
+        keys = cls._sort_keys(query, order_by)
+        if has_request_context():
+            if cursor is None:
+                cursor = request.args.get('cursor')
+            if exact_count is None:
+                exact_count = request.args.get('exact_count', False, type=bool)
+        return cls(
+            page=page,
+            per_page=per_page,
+            error_out=False,
+            query=query.order_by(None),
+            keys=keys,
+            cursor=cursor,
+            exact_count=bool(exact_count),
+        )
+
+    @staticmethod
+    def _sort_keys(query: Query, order_by: Sequence) -> List[Tuple[Any, bool]]:
+        """(expression, descending) pairs for the ORDER BY plus the primary key"""
+        keys = []
+        for clause in order_by:
+            clause = getattr(clause, 'expression', clause)
+            if isinstance(clause, UnaryExpression) and clause.modifier in (operators.desc_op, operators.asc_op):
+                keys.append((clause.element, clause.modifier is operators.desc_op))
+            else:
+                keys.append((clause, False))
+
+        entity = query.column_descriptions[0]['entity']
+        mapper = inspect(entity).mapper
+        for column in mapper.primary_key:
+            attribute = getattr(entity, mapper.get_property_by_column(column).key)
+            if not any(expression.compare(attribute.expression) for expression, _ in keys):
+                keys.append((attribute, False))
+        return keys
+
+    # Cursors
+
+    @property
+    def _signature(self) -> str:
+        """Fingerprint of the sort key, so a cursor only applies to the ordering it came from"""
+        keys = self._query_args['keys']
+        text = '|'.join(f"{expression}:{descending}" for expression, descending in keys)
+        return hashlib.sha1(text.encode()).hexdigest()[:8]
+
+    def _encode_cursor(self, page: int, direction: str, values: Optional[Tuple]) -> Optional[str]:
+        if values is None:
+            return None
+        encoded = []
+        for value in values:
+            if value is None:
+                encoded.append(None)
+            elif isinstance(value, datetime):
+                encoded.append({'dt': value.isoformat()})
+            elif isinstance(value, date):
+                encoded.append({'d': value.isoformat()})
+            elif isinstance(value, Decimal):
+                encoded.append({'dec': str(value)})
+            elif isinstance(value, (bool, int, float, str)):
+                encoded.append(value)
+            else:
+                return None
+        payload = json.dumps({'s': self._signature, 'p': page, 'd': direction, 'v': encoded}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def _decode_cursor(self) -> Optional[Tuple[str, List]]:
+        """(direction, key values) of the cursor for this page, or None when unusable"""
+        token = self._query_args.get('cursor')
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+            if payload['s'] != self._signature or payload['p'] != self.page or payload['d'] not in ('n', 'p'):
+                return None
+            values = []
+            for value in payload['v']:
+                if isinstance(value, dict):
+                    if 'dt' in value:
+                        value = datetime.fromisoformat(value['dt'])
+                    elif 'd' in value:
+                        value = date.fromisoformat(value['d'])
+                    else:
+                        value = Decimal(value['dec'])
+                values.append(value)
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return None
+        if len(values) != len(self._query_args['keys']):
+            return None
+        return payload['d'], values
+
+    @staticmethod
+    def _order(expression, ascending: bool):
+        """ORDER BY term with NULL as the lowest value"""
+        return expression.asc().nulls_first() if ascending else expression.desc().nulls_last()
+
+    @staticmethod
+    def _seek(keys: List[Tuple[Any, bool]], values: List, forward: bool):
+        """Rows after (forward) or before the given key values in sort order"""
+        def equal(expression, value):
+            return expression.is_(None) if value is None else expression == value
+
+        def beyond(expression, value, greater):
+            # NULL is the lowest value: nothing is below it, and it is below every value
+            if value is None:
+                return expression.isnot(None) if greater else false()
+            return expression > value if greater else or_(expression < value, expression.is_(None))
+
+        conditions = []
+        for index, (expression, descending) in enumerate(keys):
+            equals = [equal(keys[i][0], values[i]) for i in range(index)]
+            conditions.append(and_(*equals, beyond(expression, values[index], descending != forward)))
+        return or_(*conditions)
+
+    # Pagination hooks
+
+    def _query_items(self) -> List[Any]:
+        query = self._query_args['query']
+        keys = self._query_args['keys']
+        expressions = [expression.label(f'_keyset_{index}') for index, (expression, _) in enumerate(keys)]
+        query = query.add_columns(*expressions)
+
+        cursor = self._decode_cursor()
+        forward = cursor is None or cursor[0] == 'n'
+        order = [self._order(expression, descending != forward) for expression, descending in keys]
+        query = query.order_by(*order)
+        if cursor is not None:
+            query = query.filter(self._seek(keys, cursor[1], forward))
+        else:
+            query = query.offset(self._query_offset)
+        rows = query.limit(self.per_page + 1).all()
+
+        if forward:
+            self._has_more = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+        else:
+            # Walked backwards from the next page's first row
+            self._has_more = True
+            rows = list(reversed(rows[:self.per_page]))
+        self._edges = (tuple(rows[0][1:]), tuple(rows[-1][1:])) if rows else None
+        return [row[0] for row in rows]
+
+    def _query_count(self) -> int:
+        lower_bound = self._query_offset + len(self.items)
+        if not self._has_more and (self.items or self.page == 1):
+            # Last page: the total is known without counting
+            return lower_bound
+
+        count_query = self._query_args['query']
+        statement = count_query.statement
+        compiled = statement.compile(dialect=count_query.session.get_bind().dialect)
+        key = (str(compiled), repr(sorted(compiled.params.items())))
+        tables = sorted({table.name for table in find_tables(statement, include_joins=True, include_aliases=True)
+                         if isinstance(table, Table)})
+
+        if not self._query_args['exact_count']:
+            cached = _count_cache.lookup(key)
+            if cached is not None:
+                total, current = cached
+                if current:
+                    return total
+                self.total_is_estimate = True
+                return max(total, lower_bound + 1)
+
+        versions = _count_cache.versions(tables)
+        total = count_query.count()
+        _count_cache.put(key, total, tables, versions)
+        return total
+
+    # Navigation
+
+    @property
+    def pages(self) -> int:
+        pages = super().pages
+        if self._has_more:
+            return max(pages, self.page + 1)
+        return self.page if self.items else pages
+
+    @property
+    def has_next(self) -> bool:
+        return self._has_more
+
+    @property
+    def next_cursor(self) -> Optional[str]:
+        """Cursor token for the next page"""
+        if not self._has_more or self._edges is None:
+            return None
+        return self._encode_cursor(self.page + 1, 'n', self._edges[1])
+
+    @property
+    def prev_cursor(self) -> Optional[str]:
+        """Cursor token for the previous page (page 1 needs none)"""
+        if self.page <= 2 or self._edges is None:
+            return None
+        return self._encode_cursor(self.page - 1, 'p', self._edges[0])
+
+    def page_args(self, page: Optional[int]) -> Dict[str, Any]:
+        """
+        url_for() arguments for a page of this list: the current request
+        args with page replaced and, for the next/previous page, a cursor.
+        """
+        args = request.args.to_dict(flat=False) if has_request_context() else {}
+        for name in ('page', 'cursor', 'exact_count'):
+            args.pop(name, None)
+        args['page'] = page
+        if page == self.page + 1:
+            cursor = self.next_cursor
+        elif page == self.page - 1:
+            cursor = self.prev_cursor
+        else:
+            cursor = None
+        if cursor:
+            args['cursor'] = cursor
+        return args
+
+    def exact_count_args(self) -> Dict[str, Any]:
+        """url_for() arguments for this page with an exact total"""
+        args = request.args.to_dict(flat=False) if has_request_context() else {}
+        args['exact_count'] = 1
+        return args
+
+
+@on_flush()
+def _invalidate_count_cache(session, changes):
+    """Mark cached totals over the tables written in this flush as stale"""
+    _count_cache.bump(*{table.name for cls in changes.classes for table in inspect(cls).tables})
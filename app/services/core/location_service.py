@@ -14,6 +14,7 @@ from flask_sqlalchemy.pagination import Pagination
 from app.data.core.major_location import MajorLocation
 from app.data.core.asset_info.asset import Asset
 from app.data.core.event_info.event import Event
+from app.services.core.count_annotation import CountAnnotation
 
 
 class LocationService:
@@ -75,11 +76,8 @@ class LocationService:
         # Paginate
         locations = query.paginate(page=page, per_page=per_page, error_out=False)
         
-        # Pre-calculate asset counts for each location to avoid N+1 queries
-        asset_counts = {}
-        for location in locations.items:
-            asset_count = Asset.query.filter_by(major_location_id=location.id).count()
-            asset_counts[location.id] = asset_count
+        # Asset counts for the page in one grouped query
+        asset_counts = CountAnnotation.for_page(locations, MajorLocation.assets)
         
         return locations, {'asset_counts': asset_counts}
     
@@ -12,7 +12,8 @@ from typing import Dict, Optional, Tuple
 from flask import Request
 from flask_sqlalchemy.pagination import Pagination
 from app.data.core.asset_info.make_model import MakeModel
-from app.data.core.asset_info.asset_type import AssetType
+from app.buisness.core.reference_data_cache import ReferenceDataCache
+from app.services.core.count_annotation import CountAnnotation
 from app.buisness.assets.make_model_context import MakeModelDetailsContext as MakeModelContext
 
 
@@ -22,7 +23,7 @@ class MakeModelService:
     
     Provides methods for:
     - Building filtered make/model queries
-    - Aggregating counts (assets) using context managers
+    - Aggregating counts (assets) with grouped count queries
     - Retrieving form options (asset_types)
     - Paginating make/model lists
     """
@@ -93,15 +94,12 @@ class MakeModelService:
         # Paginate
         make_models = query.paginate(page=page, per_page=per_page, error_out=False)
         
-        # Pre-calculate asset counts for each make/model using context managers
-        asset_counts = {}
-        for make_model in make_models.items:
-            make_model_context = MakeModelContext(make_model)
-            asset_counts[make_model.id] = make_model_context.asset_count
+        # Asset counts for the page in one grouped query
+        asset_counts = CountAnnotation.for_page(make_models, MakeModel.assets)
         
         # Get filter options
         filter_options = {
-            'asset_types': AssetType.query.all()
+            'asset_types': ReferenceDataCache.asset_types()
         }
         
         return make_models, {'asset_counts': asset_counts}, filter_options
@@ -136,6 +134,6 @@ class MakeModelService:
             Dictionary with 'asset_types' key
         """
         return {
-            'asset_types': AssetType.query.all()
+            'asset_types': ReferenceDataCache.asset_types()
         }
 
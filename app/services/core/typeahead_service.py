@@ -0,0 +1,230 @@
+"""
+Typeahead Service
+Paged, prefix-matched options for asset, user, part and make/model pickers.
+
+Filter and form dropdowns used to render every row of these tables as an
+<option>. Pickers now ask the typeahead endpoints for the options whose label
+starts with what the user typed, one page at a time. Matches are ranked per
+prefix and cached: when a user types "tr" -> "tru" -> "truc", each longer
+prefix is answered by filtering the cached matches of a shorter one, as long
+as that shorter prefix's match list was complete.
+"""
+
+from typing import List, NamedTuple, Optional, Tuple
+from sqlalchemy import func, or_
+from app import db
+from app.data.core.asset_info.asset import Asset
+from app.data.core.asset_info.make_model import MakeModel
+from app.data.core.supply.part import Part
+from app.data.core.user_info.user import User
+from app.utils.flush_hooks import on_flush
+from app.utils.versioned_cache import VersionedCache
+
+
+class Option(NamedTuple):
+    """One picker option: value, display label and the lowercased keys matched by prefix"""
+    id: int
+    label: str
+    keys: Tuple[str, ...]
+
+    def matches(self, prefix: str) -> bool:
+        return any(key.startswith(prefix) for key in self.keys)
+
+
+class OptionPage(NamedTuple):
+    options: List[Option]
+    page: int
+    per_page: int
+    total: int
+
+    @property
+    def has_more(self) -> bool:
+        return self.page * self.per_page < self.total
+
+
+# Process-level LRU of matches keyed by (kind, prefix); each kind is its own
+# namespace, so an asset write does not drop cached user options
+_option_cache = VersionedCache(max_entries=512, ttl_seconds=60)
+
+
+def _asset_option(id, name, serial_number):
+    label = f"{name} ({serial_number})" if serial_number else name
+    return Option(id, label, tuple(value.lower() for value in (name, serial_number) if value))
+
+
+def _user_option(id, username):
+    return Option(id, username, (username.lower(),))
+
+
+def _part_option(id, part_number, part_name):
+    return Option(id, f"{part_number} - {part_name}", (part_number.lower(), part_name.lower()))
+
+
+def _make_model_option(id, make, model, year):
+    label = f"{make} {model} ({year})" if year else f"{make} {model}"
+    return Option(id, label, (f"{make} {model}".lower(), model.lower()))
+
+
+class TypeaheadService:
+    """
+    Service for typeahead option endpoints.
+
+    Each kind names its model, the columns matched by prefix (case
+    insensitive), the columns loaded to build an option, the label ordering
+    and the filter applied to every query.
+    """
+
+    ASSETS = 'assets'
+    USERS = 'users'
+    PARTS = 'parts'
+    MAKE_MODELS = 'make_models'
+
+    KINDS = {
+        ASSETS: dict(
+            model=Asset,
+            prefix_columns=(Asset.name, Asset.serial_number),
+            columns=(Asset.id, Asset.name, Asset.serial_number),
+            order_by=(func.lower(Asset.name), Asset.id),
+            where=(),
+            build=_asset_option,
+        ),
+        USERS: dict(
+            model=User,
+            prefix_columns=(User.username,),
+            columns=(User.id, User.username),
+            order_by=(func.lower(User.username), User.id),
+            where=(User.is_active == True,),
+            build=_user_option,
+        ),
+        PARTS: dict(
+            model=Part,
+            prefix_columns=(Part.part_number, Part.part_name),
+            columns=(Part.id, Part.part_number, Part.part_name),
+            order_by=(func.lower(Part.part_number), Part.id),
+            where=(Part.status == 'Active',),
+            build=_part_option,
+        ),
+        MAKE_MODELS: dict(
+            model=MakeModel,
+            prefix_columns=(MakeModel.make + ' ' + MakeModel.model, MakeModel.model),
+            columns=(MakeModel.id, MakeModel.make, MakeModel.model, MakeModel.year),
+            order_by=(func.lower(MakeModel.make), func.lower(MakeModel.model), MakeModel.year, MakeModel.id),
+            where=(MakeModel.is_active == True,),
+            build=_make_model_option,
+        ),
+    }
+
+    # Matches kept per cached prefix; pages past the window are read from SQL
+    CANDIDATE_WINDOW = 500
+    DEFAULT_PER_PAGE = 20
+    MAX_PER_PAGE = 100
+
+    @staticmethod
+    def _normalize(prefix: Optional[str]) -> str:
+        return (prefix or '').strip().lower()
+
+    @staticmethod
+    def _like_pattern(prefix: str) -> str:
+        escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return f'{escaped}%'
+
+    @classmethod
+    def _spec(cls, kind: str) -> dict:
+        if kind not in cls.KINDS:
+            raise ValueError(f"Unknown typeahead kind: {kind}")
+        return cls.KINDS[kind]
+
+    @classmethod
+    def _query(cls, spec: dict, prefix: str):
+        query = db.session.query(*spec['columns']).filter(*spec['where'])
+        if prefix:
+            pattern = cls._like_pattern(prefix)
+            query = query.filter(or_(*(
+                func.lower(column).like(pattern, escape='\\') for column in spec['prefix_columns']
+            )))
+        return query
+
+    @classmethod
+    def _matches(cls, kind: str, prefix: str) -> Tuple[bool, int, List[Option]]:
+        """(complete, total, first CANDIDATE_WINDOW options) for a prefix, cached"""
+        cached = _option_cache.longest_prefix(kind, prefix, usable=lambda entry: entry[0])
+        if cached is not None:
+            cached_prefix, (complete, total, options) = cached
+            if cached_prefix == prefix:
+                return complete, total, options
+            # Narrow the complete match list of a shorter prefix
+            narrowed = [option for option in options if option.matches(prefix)]
+            return True, len(narrowed), narrowed
+
+        versions = _option_cache.versions((kind,))
+        spec = cls._spec(kind)
+        query = cls._query(spec, prefix)
+        rows = query.order_by(*spec['order_by']).limit(cls.CANDIDATE_WINDOW + 1).all()
+        complete = len(rows) <= cls.CANDIDATE_WINDOW
+        options = [spec['build'](*row) for row in rows[:cls.CANDIDATE_WINDOW]]
+        total = len(options) if complete else query.order_by(None).count()
+
+        _option_cache.put((kind, prefix), (complete, total, options), (kind,), versions)
+        return complete, total, options
+
+    @classmethod
+    def search(cls, kind: str, prefix: Optional[str] = None, page: int = 1, per_page: Optional[int] = None) -> OptionPage:
+        """
+        One page of options whose label keys start with a prefix.
+
+        Args:
+            kind: One of ASSETS, USERS, PARTS, MAKE_MODELS
+            prefix: Typed text (case insensitive; empty matches everything)
+            page: 1-based page number
+            per_page: Options per page (capped at MAX_PER_PAGE)
+
+        Returns:
+            OptionPage with the options of the page and the total match count
+        """
+        prefix = cls._normalize(prefix)
+        page = max(1, page or 1)
+        per_page = max(1, min(per_page or cls.DEFAULT_PER_PAGE, cls.MAX_PER_PAGE))
+        start = (page - 1) * per_page
+
+        _, total, options = cls._matches(kind, prefix)
+        if start + per_page <= len(options) or len(options) >= total:
+            return OptionPage(options[start:start + per_page], page, per_page, total)
+
+        # Past the cached window: read the page directly
+        spec = cls._spec(kind)
+        rows = cls._query(spec, prefix).order_by(*spec['order_by']).offset(start).limit(per_page).all()
+        return OptionPage([spec['build'](*row) for row in rows], page, per_page, total)
+
+    @classmethod
+    def get_option(cls, kind: str, id) -> Optional[Option]:
+        """Option for a selected value (so a picker can render its current selection), or None"""
+        try:
+            id = int(id)
+        except (TypeError, ValueError):
+            return None
+        spec = cls._spec(kind)
+        row = db.session.query(*spec['columns']).filter(spec['model'].id == id).first()
+        return spec['build'](*row) if row else None
+
+    @classmethod
+    def invalidate(cls, *kinds: str):
+        """
+        Make cached options of the given kinds (every kind when none given)
+        stale, for writes that bypass the ORM flush (Core bulk inserts).
+        """
+        _option_cache.bump(*(kinds or cls.KINDS))
+
+
+_OPTION_MODELS = (
+    (Asset, TypeaheadService.ASSETS),
+    (User, TypeaheadService.USERS),
+    (Part, TypeaheadService.PARTS),
+    (MakeModel, TypeaheadService.MAKE_MODELS),
+)
+
+
+@on_flush(*(model for model, _ in _OPTION_MODELS))
+def _invalidate_option_cache(session, changes):
+    """Make cached options of each kind that had rows written in this flush stale"""
+    classes = changes.classes
+    _option_cache.bump(*{kind for model, kind in _OPTION_MODELS if any(issubclass(cls, model) for cls in classes)})
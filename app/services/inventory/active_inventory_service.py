@@ -3,11 +3,16 @@ Active Inventory Service
 Presentation service for active inventory list and queries.
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from flask_sqlalchemy.pagination import Pagination
+from sqlalchemy import func
+from app import db
 from app.data.inventory.base import ActiveInventory
 from app.data.core.major_location import MajorLocation
 from app.data.core.supply.part import Part
+from app.buisness.core.reference_data_cache import ReferenceDataCache
+from app.buisness.inventory.managers.reorder_forecast_manager import ReorderForecastManager
+from app.services.core.keyset_pagination import KeysetPagination
 
 
 class ActiveInventoryService:
@@ -16,65 +21,175 @@ class ActiveInventoryService:
     
     Provides methods for:
     - Building filtered active inventory queries
+    - Streaming filtered active inventory for export
     - Getting stock level information
     - Finding low stock and out of stock items
     """
     
+    # Columns yielded by iter_export_rows(), in order
+    EXPORT_COLUMNS = [
+        'id', 'part_id', 'part_number', 'part_name', 'major_location_id', 'location_name',
+        'quantity_on_hand', 'quantity_allocated', 'quantity_available',
+        'reorder_threshold', 'unit_cost_avg', 'last_movement_date'
+    ]
+    
+    # Rows fetched per round trip while streaming an export
+    EXPORT_BATCH_SIZE = 1000
+    
     @staticmethod
-    def get_list_data(
-        page: int = 1,
-        per_page: int = 20,
+    def build_query(
+        query=None,
         part_id: Optional[int] = None,
         location_id: Optional[int] = None,
         low_stock_only: bool = False,
-        out_of_stock_only: bool = False
-    ) -> Tuple[Pagination, Dict[str, Any]]:
+        out_of_stock_only: bool = False,
+        part_joined: bool = False
+    ):
         """
-        Get paginated active inventory with filters.
+        Apply the list view filters to an active inventory query.
         
         Args:
-            page: Page number
-            per_page: Items per page
+            query: Query to filter (defaults to ActiveInventory.query)
             part_id: Filter by part
             location_id: Filter by location
             low_stock_only: Filter for low stock items only
             out_of_stock_only: Filter for out of stock items only
+            part_joined: True if the query already joins Part and PartStockForecast
             
         Returns:
-            Tuple of (pagination_object, form_options_dict)
+            Filtered query
         """
-        query = ActiveInventory.query
+        if query is None:
+            query = ActiveInventory.query
         
         if part_id:
-            query = query.filter_by(part_id=part_id)
+            query = query.filter(ActiveInventory.part_id == part_id)
         
         if location_id:
-            query = query.filter_by(major_location_id=location_id)
+            query = query.filter(ActiveInventory.major_location_id == location_id)
         
         if low_stock_only:
-            # Join with Part to access minimum_stock_level
-            query = query.join(Part).filter(
-                ActiveInventory.quantity_on_hand <= Part.minimum_stock_level,
+            if not part_joined:
+                # Join with Part and the cached forecast for this location to get the reorder threshold
+                query = ReorderForecastManager.join_forecast(
+                    query.join(Part), ActiveInventory.part_id, ActiveInventory.major_location_id
+                )
+            query = query.filter(
+                ActiveInventory.quantity_on_hand <= ReorderForecastManager.reorder_threshold(Part),
                 ActiveInventory.quantity_on_hand > 0
             )
         
         if out_of_stock_only:
             query = query.filter(ActiveInventory.quantity_on_hand <= 0)
         
+        return query
+    
+    @staticmethod
+    def get_list_data(
+        page: int = 1,
+        per_page: int = 20,
+        part_id: Optional[int] = None,
+        location_id: Optional[int] = None,
+        low_stock_only: bool = False,
+        out_of_stock_only: bool = False
+    ) -> Tuple[Pagination, Dict[str, Any]]:
+        """
+        Get paginated active inventory with filters.
+        
+        Args:
+            page: Page number
+            per_page: Items per page
+            part_id: Filter by part
+            location_id: Filter by location
+            low_stock_only: Filter for low stock items only
+            out_of_stock_only: Filter for out of stock items only
+            
+        Returns:
+            Tuple of (pagination_object, form_options_dict)
+        """
+        query = ActiveInventoryService.build_query(
+            part_id=part_id,
+            location_id=location_id,
+            low_stock_only=low_stock_only,
+            out_of_stock_only=out_of_stock_only
+        )
+        
         # Order by quantity_on_hand ascending (lowest first)
         query = query.order_by(ActiveInventory.quantity_on_hand.asc())
         
         # Pagination
-        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+        pagination = KeysetPagination.paginate(query, page=page, per_page=per_page)
         
         # Get form options
         form_options = {
-            'locations': MajorLocation.query.all()
+            'locations': ReferenceDataCache.locations()
             # Parts can be very large, consider pagination or search for form options
         }
         
         return pagination, form_options
     
+    @staticmethod
+    def iter_export_rows(
+        part_id: Optional[int] = None,
+        location_id: Optional[int] = None,
+        low_stock_only: bool = False,
+        out_of_stock_only: bool = False
+    ) -> Iterator[Tuple]:
+        """
+        Stream filtered active inventory as plain row tuples (see EXPORT_COLUMNS).
+        
+        Rows are fetched EXPORT_BATCH_SIZE at a time from one joined query,
+        ordered like the list view (lowest quantity on hand first).
+        
+        Args:
+            part_id: Filter by part
+            location_id: Filter by location
+            low_stock_only: Filter for low stock items only
+            out_of_stock_only: Filter for out of stock items only
+            
+        Yields:
+            Row tuples in EXPORT_COLUMNS order
+        """
+        query = db.session.query(
+            ActiveInventory.id,
+            ActiveInventory.part_id,
+            Part.part_number,
+            Part.part_name,
+            ActiveInventory.major_location_id,
+            MajorLocation.name,
+            ActiveInventory.quantity_on_hand,
+            ActiveInventory.quantity_allocated,
+            (
+                func.coalesce(ActiveInventory.quantity_on_hand, 0.0)
+                - func.coalesce(ActiveInventory.quantity_allocated, 0.0)
+            ),
+            ReorderForecastManager.reorder_threshold(Part),
+            ActiveInventory.unit_cost_avg,
+            ActiveInventory.last_movement_date
+        ).join(
+            Part, ActiveInventory.part_id == Part.id
+        ).outerjoin(
+            MajorLocation, ActiveInventory.major_location_id == MajorLocation.id
+        )
+        query = ReorderForecastManager.join_forecast(
+            query, ActiveInventory.part_id, ActiveInventory.major_location_id
+        )
+        
+        query = ActiveInventoryService.build_query(
+            query,
+            part_id=part_id,
+            location_id=location_id,
+            low_stock_only=low_stock_only,
+            out_of_stock_only=out_of_stock_only,
+            part_joined=True
+        ).order_by(
+            ActiveInventory.quantity_on_hand.asc(),
+            ActiveInventory.id.asc()
+        ).execution_options(yield_per=ActiveInventoryService.EXPORT_BATCH_SIZE)
+        
+        for row in query:
+            yield tuple(row)
+    
     @staticmethod
     def get_by_part_and_location(part_id: int, location_id: int) -> Optional[ActiveInventory]:
         """
@@ -98,7 +213,8 @@ class ActiveInventoryService:
         Get items that are low on stock.
         
         Args:
-            threshold: Optional custom threshold (uses part.minimum_stock_level if None)
+            threshold: Optional custom threshold (uses the forecast reorder point,
+                falling back to part.minimum_stock_level, if None)
             
         Returns:
             List of ActiveInventory objects
@@ -111,8 +227,10 @@ class ActiveInventoryService:
                 ActiveInventory.quantity_on_hand > 0
             )
         else:
-            query = query.filter(
-                ActiveInventory.quantity_on_hand <= Part.minimum_stock_level,
+            query = ReorderForecastManager.join_forecast(
+                query, ActiveInventory.part_id, ActiveInventory.major_location_id
+            ).filter(
+                ActiveInventory.quantity_on_hand <= ReorderForecastManager.reorder_threshold(Part),
                 ActiveInventory.quantity_on_hand > 0
             )
         
@@ -3,12 +3,14 @@ Inventory Movement Service
 Presentation service for inventory movement history and traceability queries.
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from datetime import datetime
 from flask_sqlalchemy.pagination import Pagination
+from app import db
 from app.data.inventory.base import InventoryMovement
 from app.data.core.major_location import MajorLocation
 from app.data.core.supply.part import Part
+from app.services.core.keyset_pagination import KeysetPagination
 
 
 class InventoryMovementService:
@@ -17,26 +19,37 @@ class InventoryMovementService:
     
     Provides methods for:
     - Building filtered movement queries
+    - Streaming filtered movements for export
     - Getting movement history
     - Getting traceability chains (read-only view)
     """
     
+    # Columns yielded by iter_export_rows(), in order
+    EXPORT_COLUMNS = [
+        'id', 'movement_date', 'movement_type', 'part_id', 'part_number', 'part_name',
+        'major_location_id', 'location_name', 'quantity', 'unit_cost',
+        'from_location_id', 'to_location_id', 'reference_type', 'reference_id',
+        'part_arrival_id', 'part_demand_id', 'initial_arrival_id', 'previous_movement_id',
+        'notes'
+    ]
+    
+    # Rows fetched per round trip while streaming an export
+    EXPORT_BATCH_SIZE = 1000
+    
     @staticmethod
-    def get_list_data(
-        page: int = 1,
-        per_page: int = 20,
+    def build_query(
+        query=None,
         part_id: Optional[int] = None,
         location_id: Optional[int] = None,
         movement_type: Optional[str] = None,
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None
-    ) -> Tuple[Pagination, Dict[str, Any]]:
+    ):
         """
-        Get paginated inventory movements with filters.
+        Apply the list view filters to a movement query.
         
         Args:
-            page: Page number
-            per_page: Items per page
+            query: Query to filter (defaults to InventoryMovement.query)
             part_id: Filter by part
             location_id: Filter by location
             movement_type: Filter by movement type (Arrival, Issue, Transfer, etc.)
@@ -44,18 +57,19 @@ class InventoryMovementService:
             date_to: Filter by date to
             
         Returns:
-            Tuple of (pagination_object, form_options_dict)
+            Filtered query
         """
-        query = InventoryMovement.query
+        if query is None:
+            query = InventoryMovement.query
         
         if part_id:
-            query = query.filter_by(part_id=part_id)
+            query = query.filter(InventoryMovement.part_id == part_id)
         
         if location_id:
-            query = query.filter_by(major_location_id=location_id)
+            query = query.filter(InventoryMovement.major_location_id == location_id)
         
         if movement_type:
-            query = query.filter_by(movement_type=movement_type)
+            query = query.filter(InventoryMovement.movement_type == movement_type)
         
         if date_from:
             query = query.filter(InventoryMovement.movement_date >= date_from)
@@ -63,11 +77,46 @@ class InventoryMovementService:
         if date_to:
             query = query.filter(InventoryMovement.movement_date <= date_to)
         
+        return query
+    
+    @staticmethod
+    def get_list_data(
+        page: int = 1,
+        per_page: int = 20,
+        part_id: Optional[int] = None,
+        location_id: Optional[int] = None,
+        movement_type: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> Tuple[Pagination, Dict[str, Any]]:
+        """
+        Get paginated inventory movements with filters.
+        
+        Args:
+            page: Page number
+            per_page: Items per page
+            part_id: Filter by part
+            location_id: Filter by location
+            movement_type: Filter by movement type (Arrival, Issue, Transfer, etc.)
+            date_from: Filter by date from
+            date_to: Filter by date to
+            
+        Returns:
+            Tuple of (pagination_object, form_options_dict)
+        """
+        query = InventoryMovementService.build_query(
+            part_id=part_id,
+            location_id=location_id,
+            movement_type=movement_type,
+            date_from=date_from,
+            date_to=date_to
+        )
+        
         # Order by movement date (most recent first)
         query = query.order_by(InventoryMovement.movement_date.desc())
         
         # Pagination
-        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+        pagination = KeysetPagination.paginate(query, page=page, per_page=per_page)
         
         # Get form options
         form_options = {
@@ -76,6 +125,72 @@ class InventoryMovementService:
         
         return pagination, form_options
     
+    @staticmethod
+    def iter_export_rows(
+        part_id: Optional[int] = None,
+        location_id: Optional[int] = None,
+        movement_type: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> Iterator[Tuple]:
+        """
+        Stream filtered movements as plain row tuples (see EXPORT_COLUMNS).
+        
+        Rows come straight from the cursor in ledger order (oldest first) and
+        are fetched EXPORT_BATCH_SIZE at a time, so memory stays flat no matter
+        how many movements match. No ORM objects are built.
+        
+        Args:
+            part_id: Filter by part
+            location_id: Filter by location
+            movement_type: Filter by movement type
+            date_from: Filter by date from
+            date_to: Filter by date to
+            
+        Yields:
+            Row tuples in EXPORT_COLUMNS order
+        """
+        query = db.session.query(
+            InventoryMovement.id,
+            InventoryMovement.movement_date,
+            InventoryMovement.movement_type,
+            InventoryMovement.part_id,
+            Part.part_number,
+            Part.part_name,
+            InventoryMovement.major_location_id,
+            MajorLocation.name,
+            InventoryMovement.quantity,
+            InventoryMovement.unit_cost,
+            InventoryMovement.from_location_id,
+            InventoryMovement.to_location_id,
+            InventoryMovement.reference_type,
+            InventoryMovement.reference_id,
+            InventoryMovement.part_arrival_id,
+            InventoryMovement.part_demand_id,
+            InventoryMovement.initial_arrival_id,
+            InventoryMovement.previous_movement_id,
+            InventoryMovement.notes
+        ).outerjoin(
+            Part, InventoryMovement.part_id == Part.id
+        ).outerjoin(
+            MajorLocation, InventoryMovement.major_location_id == MajorLocation.id
+        )
+        
+        query = InventoryMovementService.build_query(
+            query,
+            part_id=part_id,
+            location_id=location_id,
+            movement_type=movement_type,
+            date_from=date_from,
+            date_to=date_to
+        ).order_by(
+            InventoryMovement.movement_date.asc(),
+            InventoryMovement.id.asc()
+        ).execution_options(yield_per=InventoryMovementService.EXPORT_BATCH_SIZE)
+        
+        for row in query:
+            yield tuple(row)
+    
     @staticmethod
     def get_movement_history(
         part_id: Optional[int] = None,
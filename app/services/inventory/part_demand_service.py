@@ -3,10 +3,12 @@ Part Demand Inventory Service
 Presentation service for part demand inventory availability and fulfillment queries.
 """
 
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 from app.data.maintenance.base.part_demands import PartDemand
 from app.data.inventory.base import ActiveInventory, InventoryMovement
 from app.data.core.asset_info.asset import Asset
+from app.buisness.inventory.managers.kit_availability_manager import KitAvailabilityManager
 
 
 class PartDemandInventoryService:
@@ -30,64 +32,53 @@ class PartDemandInventoryService:
         Returns:
             Dictionary with detailed availability info
         """
-        demand = PartDemand.query.get(demand_id)
-        if not demand:
+        results = KitAvailabilityManager.check_demands_availability([demand_id])
+        if demand_id not in results:
             return {'error': 'Demand not found'}
         
-        # Get location from action -> maintenance_action_set -> asset -> major_location_id
-        location_id = None
-        if hasattr(demand, 'action') and demand.action:
-            if hasattr(demand.action, 'maintenance_action_set') and demand.action.maintenance_action_set:
-                asset = Asset.query.get(demand.action.maintenance_action_set.asset_id) if demand.action.maintenance_action_set.asset_id else None
-                if asset:
-                    location_id = asset.major_location_id
-        
-        # Check inventory at this location
-        location_inventory = []
-        if location_id:
-            inv = ActiveInventory.query.filter_by(
-                part_id=demand.part_id,
-                major_location_id=location_id
-            ).first()
+        return results[demand_id]
+    
+    @staticmethod
+    def check_demands_availability(demand_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Check inventory availability for many demands at once (read-only).
+        
+        Args:
+            demand_ids: List of part demand IDs
             
-            if inv:
-                location_inventory.append({
-                    'location_id': location_id,
-                    'quantity_available': inv.quantity_available,
-                    'can_fulfill': inv.quantity_available >= demand.quantity_required
-                })
-        
-        # Check inventory at all locations
-        all_inventory = ActiveInventory.query.filter_by(
-            part_id=demand.part_id
-        ).all()
-        
-        total_available = sum(inv.quantity_available for inv in all_inventory)
-        
-        other_locations = [
-            {
-                'location_id': inv.major_location_id,
-                'quantity_available': inv.quantity_available,
-                'can_fulfill': inv.quantity_available >= demand.quantity_required
-            }
-            for inv in all_inventory
-            if inv.major_location_id != location_id
-        ]
+        Returns:
+            Dictionary mapping demand ID to availability info
+        """
+        return KitAvailabilityManager.check_demands_availability(demand_ids)
+    
+    @staticmethod
+    def get_kit_availability(
+        event_ids: Optional[List[int]] = None,
+        demand_ids: Optional[List[int]] = None,
+        planned_start: Optional[datetime] = None,
+        planned_end: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the part x location availability matrix for events or demands (read-only).
         
-        return {
-            'demand_id': demand_id,
-            'part_id': demand.part_id,
-            'quantity_required': demand.quantity_required,
-            'preferred_location_id': location_id,
-            'location_inventory': location_inventory,
-            'other_locations': other_locations,
-            'total_available': total_available,
-            'can_fulfill_from_preferred': any(
-                inv['can_fulfill'] for inv in location_inventory
-            ) if location_inventory else False,
-            'can_fulfill_from_any': total_available >= demand.quantity_required,
-            'needs_purchase': total_available < demand.quantity_required
-        }
+        Use planned_start/planned_end without event_ids to check a whole
+        schedule window, e.g. the coming week.
+        
+        Args:
+            event_ids: Optional maintenance event IDs
+            demand_ids: Optional part demand IDs
+            planned_start: Optional start of planned start window
+            planned_end: Optional end of planned start window
+            
+        Returns:
+            Availability matrix dictionary (see KitAvailabilityManager.build_availability_matrix)
+        """
+        return KitAvailabilityManager.build_availability_matrix(
+            event_ids=event_ids,
+            demand_ids=demand_ids,
+            planned_start=planned_start,
+            planned_end=planned_end
+        )
     
     @staticmethod
     def get_demands_by_purchase_order(po_id: int) -> List[PartDemand]:
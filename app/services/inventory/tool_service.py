@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 from flask_sqlalchemy.pagination import Pagination
 from app.data.core.supply.tool import Tool
 from app.data.core.supply.issuable_tool import IssuableTool
-from app.data.core.user_info.user import User
+from app.buisness.core.reference_data_cache import ReferenceDataCache
 
 
 class ToolService:
@@ -95,7 +95,7 @@ class ToolService:
         form_options = {
             'tool_types': tool_types,
             'manufacturers': manufacturers,
-            'users': User.query.all()
+            'users': ReferenceDataCache.users()
         }
         
         return pagination, form_options
@@ -0,0 +1,221 @@
+"""
+Action Creator Search Service
+Server-side typeahead for the action creator portal.
+
+Template action sets, template action items and proto actions are matched in
+SQL (name prefix first, then name/description substring) and only the top
+results are loaded. Ranked candidate IDs are cached per query: when a user
+types "hyd" -> "hydr" -> "hydra", every longer query is answered by filtering
+the cached candidates of its prefix, as long as that prefix's candidate list
+was complete.
+"""
+
+from typing import Any, List, Optional, Tuple
+from sqlalchemy import case, func, literal, or_
+from sqlalchemy.orm import joinedload, lazyload
+from app import db
+from app.data.maintenance.templates.template_action_sets import TemplateActionSet
+from app.data.maintenance.templates.template_actions import TemplateActionItem
+from app.data.maintenance.proto_templates.proto_actions import ProtoActionItem
+from app.utils.flush_hooks import on_flush
+from app.utils.versioned_cache import VersionedCache
+
+
+class _Candidate:
+    """Ranked match: id, lowercased name/description and the tie-break sort key"""
+
+    __slots__ = ('id', 'name', 'description', 'sort_key')
+
+    def __init__(self, id, name, description, sort_key):
+        self.id = id
+        self.name = name or ''
+        self.description = description or ''
+        self.sort_key = sort_key
+
+    def rank(self, search: str) -> Optional[int]:
+        """0 for a name prefix match, 1 for a name/description substring match, None otherwise"""
+        if self.name.startswith(search):
+            return 0
+        if search in self.name or search in self.description:
+            return 1
+        return None
+
+
+# Process-level LRU of ranked candidates keyed by (kind, search)
+_candidate_cache = VersionedCache(max_entries=256, ttl_seconds=60)
+
+_SEARCHABLE_MODELS = (TemplateActionSet, TemplateActionItem, ProtoActionItem)
+
+# Tables each kind's candidates are read from (cache namespaces)
+_KIND_TABLES = {
+    'template_action_sets': (TemplateActionSet.__tablename__,),
+    'template_action_items': (TemplateActionItem.__tablename__, TemplateActionSet.__tablename__),
+    'proto_actions': (ProtoActionItem.__tablename__,),
+}
+
+
+@on_flush(*_SEARCHABLE_MODELS)
+def _invalidate_candidate_cache(session, changes):
+    """Make cached candidates read from a written searchable table stale"""
+    _candidate_cache.bump(*{instance.__tablename__ for instance in changes.all})
+
+
+class ActionCreatorSearchService:
+    """
+    Service for action creator portal searches.
+
+    Each search returns (objects, total_count) for at most `limit` objects.
+    """
+
+    # Ranked candidates kept per cached query; longer lists are truncated
+    CANDIDATE_WINDOW = 200
+    DEFAULT_LIMIT = 8
+    MAX_LIMIT = 50
+
+    @staticmethod
+    def _normalize(search: Optional[str]) -> str:
+        return (search or '').strip().lower()
+
+    @staticmethod
+    def _like_pattern(search: str, prefix_only: bool = False) -> str:
+        escaped = search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return f'{escaped}%' if prefix_only else f'%{escaped}%'
+
+    @classmethod
+    def _candidates(cls, kind: str, search: str, model, query, name_column, description_column, sort_columns):
+        """
+        Ranked candidates for a search, from the cache or from SQL.
+
+        Args:
+            kind: Cache scope (a key of _KIND_TABLES)
+            search: Normalized search term
+            model: Model whose IDs are returned
+            query: Base query (filters such as is_active already applied)
+            name_column: Column matched by prefix and substring
+            description_column: Column matched by substring
+            sort_columns: Tie-break ordering within a rank
+
+        Returns:
+            Tuple of (total count, candidates)
+        """
+        cached = _candidate_cache.longest_prefix(kind, search, usable=lambda entry: entry[0])
+        if cached is not None:
+            prefix, (complete, total, candidates) = cached
+            if prefix == search:
+                return total, candidates
+            # Narrow the complete candidate list of a shorter prefix
+            ranked = []
+            for candidate in candidates:
+                rank = candidate.rank(search)
+                if rank is not None:
+                    ranked.append((rank, candidate.sort_key, candidate))
+            ranked.sort(key=lambda item: (item[0], item[1]))
+            return len(ranked), [candidate for _, _, candidate in ranked]
+
+        tables = _KIND_TABLES[kind]
+        versions = _candidate_cache.versions(tables)
+        name = func.lower(name_column)
+        description = func.lower(func.coalesce(description_column, ''))
+        if search:
+            rank = case((name.like(cls._like_pattern(search, prefix_only=True), escape='\\'), 0), else_=1)
+            query = query.filter(or_(
+                name.like(cls._like_pattern(search), escape='\\'),
+                description.like(cls._like_pattern(search), escape='\\')
+            ))
+        else:
+            rank = literal(0)
+
+        rows = query.with_entities(
+            model.id, name, description, rank.label('rank'), *sort_columns
+        ).order_by(rank, *sort_columns).limit(cls.CANDIDATE_WINDOW + 1).all()
+
+        complete = len(rows) <= cls.CANDIDATE_WINDOW
+        rows = rows[:cls.CANDIDATE_WINDOW]
+        candidates = [_Candidate(row[0], row[1], row[2], tuple(row[4:])) for row in rows]
+        total = len(candidates) if complete else query.order_by(None).count()
+
+        _candidate_cache.put((kind, search), (complete, total, candidates), tables, versions)
+        return total, candidates
+
+    @staticmethod
+    def _load(model, ids: List[int], options) -> List[Any]:
+        """Load objects by ID preserving the given order"""
+        if not ids:
+            return []
+        by_id = {obj.id: obj for obj in model.query.options(*options).filter(model.id.in_(ids)).all()}
+        return [by_id[obj_id] for obj_id in ids if obj_id in by_id]
+
+    @classmethod
+    def _limit(cls, limit: Optional[int]) -> int:
+        return max(1, min(limit or cls.DEFAULT_LIMIT, cls.MAX_LIMIT))
+
+    @classmethod
+    def search_template_action_sets(cls, search: Optional[str] = None, limit: Optional[int] = None) -> Tuple[List[TemplateActionSet], int]:
+        """
+        Active template action sets matching a search term.
+
+        Args:
+            search: Matches task name (prefix first) or description
+            limit: Maximum number of results (capped at MAX_LIMIT)
+
+        Returns:
+            Tuple of (template action sets, total matches)
+        """
+        search = cls._normalize(search)
+        query = db.session.query(TemplateActionSet).filter(TemplateActionSet.is_active == True)
+        total, candidates = cls._candidates(
+            'template_action_sets', search, TemplateActionSet, query,
+            TemplateActionSet.task_name, TemplateActionSet.description,
+            [func.lower(TemplateActionSet.task_name), TemplateActionSet.id]
+        )
+        ids = [candidate.id for candidate in candidates[:cls._limit(limit)]]
+        return cls._load(TemplateActionSet, ids, []), total
+
+    @classmethod
+    def search_template_action_items(cls, search: Optional[str] = None, limit: Optional[int] = None) -> Tuple[List[TemplateActionItem], int]:
+        """
+        Template action items of active templates matching a search term.
+
+        Args:
+            search: Matches action name (prefix first) or description
+            limit: Maximum number of results (capped at MAX_LIMIT)
+
+        Returns:
+            Tuple of (template action items, total matches)
+        """
+        search = cls._normalize(search)
+        query = db.session.query(TemplateActionItem).join(
+            TemplateActionSet, TemplateActionItem.template_action_set_id == TemplateActionSet.id
+        ).filter(TemplateActionSet.is_active == True)
+        total, candidates = cls._candidates(
+            'template_action_items', search, TemplateActionItem, query,
+            TemplateActionItem.action_name, TemplateActionItem.description,
+            [func.lower(TemplateActionSet.task_name), TemplateActionItem.sequence_order, TemplateActionItem.id]
+        )
+        ids = [candidate.id for candidate in candidates[:cls._limit(limit)]]
+        # Results only show the template name; skip the template's own collections
+        return cls._load(TemplateActionItem, ids, [
+            joinedload(TemplateActionItem.template_action_set).options(lazyload('*'))
+        ]), total
+
+    @classmethod
+    def search_proto_actions(cls, search: Optional[str] = None, limit: Optional[int] = None) -> Tuple[List[ProtoActionItem], int]:
+        """
+        Proto actions matching a search term.
+
+        Args:
+            search: Matches action name (prefix first) or description
+            limit: Maximum number of results (capped at MAX_LIMIT)
+
+        Returns:
+            Tuple of (proto actions, total matches)
+        """
+        search = cls._normalize(search)
+        query = db.session.query(ProtoActionItem)
+        total, candidates = cls._candidates(
+            'proto_actions', search, ProtoActionItem, query,
+            ProtoActionItem.action_name, ProtoActionItem.description,
+            [func.lower(ProtoActionItem.action_name), ProtoActionItem.id]
+        )
+        ids = [candidate.id for candidate in candidates[:cls._limit(limit)]]
+        return cls._load(ProtoActionItem, ids, []), total
@@ -8,7 +8,9 @@ from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from app.buisness.maintenance.factories.maintenance_factory import MaintenanceFactory
 from app.buisness.maintenance.base.maintenance_context import MaintenanceContext
+from app.services.core.keyset_pagination import KeysetPagination
 from app.buisness.maintenance.templates.template_maintenance_context import TemplateMaintenanceContext
+from app.buisness.maintenance.templates.template_blueprint import TemplateBlueprintCache
 from app.data.maintenance.templates.template_action_sets import TemplateActionSet
 from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
 from app.data.core.asset_info.asset import Asset
@@ -66,8 +68,7 @@ class AssignMonitorService:
         result = []
         
         for template in templates:
-            template_context = TemplateMaintenanceContext(template.id)
-            summary = template_context.summary()
+            blueprint = TemplateBlueprintCache.get(template.id)
             
             result.append({
                 'id': template.id,
@@ -75,8 +76,8 @@ class AssignMonitorService:
                 'description': template.description,
                 'revision': template.revision,
                 'estimated_duration': template.estimated_duration,
-                'total_actions': summary.get('total_action_items', 0),
-                'estimated_cost': summary.get('total_estimated_cost', 0),
+                'total_actions': blueprint.total_action_items,
+                'estimated_cost': blueprint.total_estimated_cost,
             })
         
         return result, total_count
@@ -92,57 +93,44 @@ class AssignMonitorService:
         Returns:
             Dictionary with detailed template information or None if not found
         """
-        template = TemplateActionSet.query.get(template_id)
-        if not template or not template.is_active:
+        blueprint = TemplateBlueprintCache.get(template_id)
+        if not blueprint or not blueprint.is_active:
             return None
         
-        template_context = TemplateMaintenanceContext(template.id)
-        summary = template_context.summary()
-        
-        # Get actions with details
-        from app.buisness.maintenance.templates.template_action_context import TemplateActionContext
-        actions = TemplateActionContext.get_by_template_action_set(template_id)
-        
-        # Get parts summary
-        parts_summary = []
-        for action in actions:
-            for part_demand in action.part_demands:
-                if part_demand.part:
-                    parts_summary.append({
-                        'part_name': part_demand.part.part_name,
-                        'quantity': part_demand.quantity_required,
-                        'expected_cost': part_demand.expected_cost,
-                    })
-        
-        # Get tools summary
-        tools_summary = []
-        for action in actions:
-            for tool in action.action_tools:
-                if tool.tool:
-                    tools_summary.append({
-                        'tool_name': tool.tool.tool_name,
-                        'quantity': tool.quantity_required,
-                    })
-        
         return {
-            'id': template.id,
-            'task_name': template.task_name,
-            'description': template.description,
-            'revision': template.revision,
-            'estimated_duration': template.estimated_duration,
-            'total_actions': summary.get('total_action_items', 0),
-            'estimated_cost': summary.get('total_estimated_cost', 0),
+            'id': blueprint.template_action_set_id,
+            'task_name': blueprint.task_name,
+            'description': blueprint.description,
+            'revision': blueprint.revision,
+            'estimated_duration': blueprint.estimated_duration,
+            'total_actions': blueprint.total_action_items,
+            'estimated_cost': blueprint.total_estimated_cost,
             'actions': [
                 {
-                    'sequence_order': action._struct.sequence_order,
-                    'action_name': action._struct.action_name,
-                    'description': action._struct.description,
-                    'estimated_duration': action._struct.template_action_item.estimated_duration if action._struct.template_action_item else None,
+                    'sequence_order': action.sequence_order,
+                    'action_name': action.action_name,
+                    'description': action.description,
+                    'estimated_duration': action.estimated_duration,
+                }
+                for action in blueprint.actions
+            ],
+            'parts_summary': [
+                {
+                    'part_name': part_demand.part_name,
+                    'quantity': part_demand.quantity_required,
+                    'expected_cost': part_demand.expected_cost,
+                }
+                for part_demand in blueprint.parts
+                if part_demand.part_name is not None
+            ],
+            'tools_summary': [
+                {
+                    'tool_name': tool.tool_name,
+                    'quantity': tool.quantity_required,
                 }
-                for action in actions
+                for tool in blueprint.tools
+                if tool.tool_name is not None
             ],
-            'parts_summary': parts_summary,
-            'tools_summary': tools_summary,
         }
     
     @staticmethod
@@ -272,6 +260,37 @@ class AssignMonitorService:
         
         return result, total_count
     
+    @staticmethod
+    def validate_event_from_template(
+        template_action_set_id: int,
+        asset_id: int,
+        assigned_user_id: Optional[int] = None
+    ) -> None:
+        """
+        Check the inputs of create_event_from_template without creating anything.
+        Used before queueing the maintenance.create_from_template job.
+        
+        Raises:
+            ValueError: If template not found or inactive, asset not found, or technician not active
+        """
+        # Validate template exists and is active
+        template = TemplateActionSet.query.get(template_action_set_id)
+        if not template:
+            raise ValueError(f"Template {template_action_set_id} not found")
+        if not template.is_active:
+            raise ValueError(f"Template {template_action_set_id} is not active")
+        
+        # Validate asset exists
+        asset = Asset.query.get(asset_id)
+        if not asset:
+            raise ValueError(f"Asset {asset_id} not found")
+        
+        # Validate technician if assigned
+        if assigned_user_id:
+            technician = User.query.get(assigned_user_id)
+            if not technician or not technician.is_active:
+                raise ValueError(f"Technician {assigned_user_id} not found or not active")
+    
     @staticmethod
     def create_event_from_template(
         template_action_set_id: int,
@@ -304,23 +323,7 @@ class AssignMonitorService:
         Raises:
             ValueError: If template not found, asset not found, or invalid parameters
         """
-        # Validate template exists and is active
-        template = TemplateActionSet.query.get(template_action_set_id)
-        if not template:
-            raise ValueError(f"Template {template_action_set_id} not found")
-        if not template.is_active:
-            raise ValueError(f"Template {template_action_set_id} is not active")
-        
-        # Validate asset exists
-        asset = Asset.query.get(asset_id)
-        if not asset:
-            raise ValueError(f"Asset {asset_id} not found")
-        
-        # Validate technician if assigned
-        if assigned_user_id:
-            technician = User.query.get(assigned_user_id)
-            if not technician or not technician.is_active:
-                raise ValueError(f"Technician {assigned_user_id} not found or not active")
+        AssignMonitorService.validate_event_from_template(template_action_set_id, asset_id, assigned_user_id)
         
         # Create event using factory
         maintenance_action_set = MaintenanceFactory.create_from_template(
@@ -452,7 +455,7 @@ class AssignMonitorService:
         )
         
         # Paginate
-        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+        pagination = KeysetPagination.paginate(query, page=page, per_page=per_page)
         
         # Format results
         result = []
@@ -476,12 +479,14 @@ class AssignMonitorService:
                 self.page = pagination_obj.page
                 self.per_page = pagination_obj.per_page
                 self.total = pagination_obj.total
+                self.total_is_estimate = pagination_obj.total_is_estimate
                 self.pages = pagination_obj.pages
                 self.has_prev = pagination_obj.has_prev
                 self.has_next = pagination_obj.has_next
                 self.prev_num = pagination_obj.prev_num
                 self.next_num = pagination_obj.next_num
                 self.iter_pages = pagination_obj.iter_pages
+                self.page_args = pagination_obj.page_args
         
         return PaginatedResults(result, pagination)
     
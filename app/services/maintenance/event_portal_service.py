@@ -22,7 +22,7 @@ from app.data.core.event_info.comment import Comment
 from app.data.core.asset_info.asset import Asset
 from app.data.core.asset_info.make_model import MakeModel
 from app.data.core.major_location import MajorLocation
-from app.data.core.user_info.user import User
+from app.services.core.keyset_pagination import KeysetPagination
 
 
 class EventPortalService:
@@ -170,11 +170,7 @@ class EventPortalService:
         )
         
         # Paginate
-        pagination = query.paginate(
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        pagination = KeysetPagination.paginate(query, page=page, per_page=per_page)
         
         # Get event IDs for batch queries
         event_ids = [event.event_id for event in pagination.items if event.event_id]
@@ -326,18 +322,28 @@ class EventPortalService:
         }
     
     @staticmethod
-    def get_filter_options() -> Dict:
+    def get_filter_options(filters: Optional[Dict] = None) -> Dict:
         """
         Get all available filter options for dropdowns.
         
+        User and asset pickers load their options through the typeahead
+        endpoints; only the currently selected user/asset options are loaded.
+        
+        Args:
+            filters: Current filter values (from extract_filters_from_request)
+        
         Returns:
             Dictionary with filter options
         """
+        from app.services.core.typeahead_service import TypeaheadService
+        
+        filters = filters or {}
         return {
             'statuses': ['Planned', 'In Progress', 'Delayed', 'Complete'],
             'priorities': ['Low', 'Medium', 'High', 'Critical'],
-            'users': User.query.filter_by(is_active=True).order_by(User.username).all(),
-            'assets': Asset.query.filter_by(status='Active').order_by(Asset.name).all(),
+            'selected_assigned_user': TypeaheadService.get_option(TypeaheadService.USERS, filters.get('assigned_user_id')),
+            'selected_created_by_user': TypeaheadService.get_option(TypeaheadService.USERS, filters.get('created_by_user_id')),
+            'selected_asset': TypeaheadService.get_option(TypeaheadService.ASSETS, filters.get('asset_id')),
             'make_models': MakeModel.query.filter_by(is_active=True).order_by(MakeModel.make, MakeModel.model).all(),
             'major_locations': MajorLocation.query.filter_by(is_active=True).order_by(MajorLocation.name).all(),
         }
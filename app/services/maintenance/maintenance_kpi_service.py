@@ -0,0 +1,182 @@
+"""
+Maintenance KPI Service
+Presentation service for maintenance KPI dashboards.
+Reads only the MaintenanceKpiRollup table; never scans maintenance events.
+"""
+
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+from sqlalchemy import func
+from app import db
+from app.data.maintenance.base.maintenance_kpi_rollups import MaintenanceKpiRollup
+from app.data.core.asset_info.asset import Asset
+from app.data.core.asset_info.asset_type import AssetType
+from app.data.core.major_location import MajorLocation
+from app.data.core.user_info.user import User
+from app.buisness.maintenance.kpi.maintenance_kpi_rollup_manager import MaintenanceKpiRollupManager
+
+
+class MaintenanceKpiService:
+    """
+    Service for maintenance KPI dashboard presentation.
+
+    KPIs per dimension member: MTTR, completion rate, backlog size and age,
+    delay hours and billable hours.
+    """
+
+    # Dimension -> (model, label column) used to label rollup rows
+    DIMENSION_LABELS = {
+        'asset': (Asset, Asset.name),
+        'asset_type': (AssetType, AssetType.name),
+        'location': (MajorLocation, MajorLocation.name),
+        'technician': (User, User.username),
+    }
+
+    FLOW_COLUMNS = (
+        'opened_count', 'started_count', 'completed_count', 'cancelled_count',
+        'repair_count', 'repair_hours', 'delay_count', 'delay_hours',
+        'actions_completed', 'actions_failed', 'actions_skipped', 'billable_hours',
+    )
+
+    @staticmethod
+    def default_period_range() -> tuple:
+        """Last twelve months (inclusive) as (period_from, period_to)"""
+        now = datetime.utcnow()
+        year, month = now.year, now.month - 11
+        if month < 1:
+            year, month = year - 1, month + 12
+        return f'{year:04d}-{month:02d}', now.strftime('%Y-%m')
+
+    @classmethod
+    def _period_filter(cls, query, period_from: Optional[str], period_to: Optional[str]):
+        """Restrict a rollup query to monthly periods in [period_from, period_to]"""
+        query = query.filter(MaintenanceKpiRollup.period != MaintenanceKpiRollupManager.OPEN_PERIOD)
+        if period_from:
+            query = query.filter(MaintenanceKpiRollup.period >= period_from)
+        if period_to:
+            query = query.filter(MaintenanceKpiRollup.period <= period_to)
+        return query
+
+    @staticmethod
+    def _derive(row: Dict[str, Any], now_epoch: float) -> Dict[str, Any]:
+        """Add derived KPIs to a dictionary of summed counters"""
+        repair_count = row.get('repair_count') or 0
+        closed = (row.get('completed_count') or 0) + (row.get('cancelled_count') or 0)
+        backlog_count = row.get('backlog_count') or 0
+        row['mttr_hours'] = round(row['repair_hours'] / repair_count, 2) if repair_count else None
+        row['completion_rate'] = round(row['completed_count'] / closed, 4) if closed else None
+        row['backlog_age_days'] = (
+            round((backlog_count * now_epoch - (row.get('backlog_opened_epoch') or 0)) / backlog_count / 86400, 1)
+            if backlog_count else None
+        )
+        return row
+
+    @classmethod
+    def get_kpis(
+        cls,
+        dimension: str = 'fleet',
+        period_from: Optional[str] = None,
+        period_to: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        KPIs per member of a dimension over a period range.
+
+        Args:
+            dimension: fleet, asset, asset_type, location or technician
+            period_from: First period ('YYYY-MM'), inclusive
+            period_to: Last period ('YYYY-MM'), inclusive
+
+        Returns:
+            List of KPI dictionaries, largest backlog first
+
+        Raises:
+            ValueError: If dimension is unknown
+        """
+        if dimension not in MaintenanceKpiRollupManager.DIMENSIONS:
+            raise ValueError(f"Unknown KPI dimension: {dimension}")
+
+        sums = [func.sum(getattr(MaintenanceKpiRollup, column)).label(column) for column in cls.FLOW_COLUMNS]
+        flow_query = db.session.query(MaintenanceKpiRollup.dimension_id, *sums).filter(
+            MaintenanceKpiRollup.dimension == dimension
+        )
+        flow_rows = cls._period_filter(flow_query, period_from, period_to).group_by(
+            MaintenanceKpiRollup.dimension_id
+        ).all()
+
+        backlog_rows = db.session.query(
+            MaintenanceKpiRollup.dimension_id,
+            MaintenanceKpiRollup.backlog_count,
+            MaintenanceKpiRollup.backlog_opened_epoch
+        ).filter(
+            MaintenanceKpiRollup.dimension == dimension,
+            MaintenanceKpiRollup.period == MaintenanceKpiRollupManager.OPEN_PERIOD
+        ).all()
+
+        results: Dict[int, Dict[str, Any]] = {}
+        for row in flow_rows:
+            results[row.dimension_id] = {column: getattr(row, column) or 0 for column in cls.FLOW_COLUMNS}
+        for row in backlog_rows:
+            entry = results.setdefault(row.dimension_id, {column: 0 for column in cls.FLOW_COLUMNS})
+            entry['backlog_count'] = row.backlog_count or 0
+            entry['backlog_opened_epoch'] = row.backlog_opened_epoch or 0
+
+        labels = cls._labels(dimension, list(results))
+        now_epoch = datetime.utcnow().timestamp()
+        kpis = []
+        for dimension_id, entry in results.items():
+            entry.setdefault('backlog_count', 0)
+            entry.setdefault('backlog_opened_epoch', 0)
+            cls._derive(entry, now_epoch)
+            entry.pop('backlog_opened_epoch')
+            entry['dimension'] = dimension
+            entry['dimension_id'] = dimension_id
+            entry['label'] = labels.get(dimension_id, f'#{dimension_id}')
+            kpis.append(entry)
+        kpis.sort(key=lambda entry: (-entry['backlog_count'], -entry['opened_count'], entry['label']))
+        return kpis
+
+    @classmethod
+    def get_trend(
+        cls,
+        dimension: str = 'fleet',
+        dimension_id: int = MaintenanceKpiRollupManager.FLEET_ID,
+        period_from: Optional[str] = None,
+        period_to: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Monthly KPI series for one dimension member.
+
+        Args:
+            dimension: fleet, asset, asset_type, location or technician
+            dimension_id: Member ID (0 for fleet)
+            period_from: First period ('YYYY-MM'), inclusive
+            period_to: Last period ('YYYY-MM'), inclusive
+
+        Returns:
+            List of KPI dictionaries ordered by period
+        """
+        if dimension not in MaintenanceKpiRollupManager.DIMENSIONS:
+            raise ValueError(f"Unknown KPI dimension: {dimension}")
+
+        query = MaintenanceKpiRollup.query.filter_by(dimension=dimension, dimension_id=dimension_id)
+        rows = cls._period_filter(query, period_from, period_to).order_by(MaintenanceKpiRollup.period).all()
+
+        now_epoch = datetime.utcnow().timestamp()
+        trend = []
+        for row in rows:
+            entry = {column: getattr(row, column) or 0 for column in cls.FLOW_COLUMNS}
+            entry['backlog_count'] = 0
+            cls._derive(entry, now_epoch)
+            entry['period'] = row.period
+            trend.append(entry)
+        return trend
+
+    @classmethod
+    def _labels(cls, dimension: str, dimension_ids: List[int]) -> Dict[int, str]:
+        """Display labels for dimension members (one IN query)"""
+        if dimension == 'fleet':
+            return {MaintenanceKpiRollupManager.FLEET_ID: 'Fleet'}
+        if not dimension_ids:
+            return {}
+        model, label_column = cls.DIMENSION_LABELS[dimension]
+        return dict(db.session.query(model.id, label_column).filter(model.id.in_(dimension_ids)).all())
@@ -4,8 +4,9 @@ Service layer for template builder presentation operations.
 Handles form data conversion and data preparation for templates.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable
 import json
+from flask import g, has_app_context
 from app.buisness.maintenance.builders.template_builder_context import TemplateBuilderContext
 from app.data.maintenance.builders.template_builder_memory import TemplateBuilderMemory
 from app.data.maintenance.templates.template_action_sets import TemplateActionSet
@@ -19,6 +20,29 @@ class TemplateBuilderService:
     Handles form data conversion and prepares data for templates.
     """
     
+    @staticmethod
+    def get_context(builder_id: int) -> TemplateBuilderContext:
+        """
+        Get the builder context for this request.
+        
+        The build state is parsed once per request; the edit and the
+        re-render that follows it share the same context.
+        
+        Args:
+            builder_id: ID of the template builder
+            
+        Returns:
+            TemplateBuilderContext for the builder
+        """
+        if not has_app_context():
+            return TemplateBuilderContext(builder_id)
+        
+        contexts = g.setdefault('template_builder_contexts', {})
+        context = contexts.get(builder_id)
+        if context is None:
+            context = contexts[builder_id] = TemplateBuilderContext(builder_id)
+        return context
+    
     @staticmethod
     def get_builder_data(builder_id: int) -> Dict[str, Any]:
         """
@@ -30,14 +54,22 @@ class TemplateBuilderService:
         Returns:
             Dictionary with builder data formatted for template
         """
-        context = TemplateBuilderContext(builder_id)
+        context = TemplateBuilderService.get_context(builder_id)
+        
+        # Load part and tool info for every action in two queries
+        parts_info = TemplateBuilderService._get_parts_info(
+            pd.part_id for action in context.build_actions for pd in action.part_demands
+        )
+        tools_info = TemplateBuilderService._get_tools_info(
+            tool.tool_id for action in context.build_actions for tool in action.tools
+        )
         
         # Format actions for template
         actions_data = []
         for idx, action in enumerate(context.build_actions):
             actions_data.append({
                 'index': idx,
-                'sequence_order': action.sequence_order,
+                'sequence_order': idx + 1,
                 'action_name': action.action_name or 'Unnamed Action',
                 'description': action.description or '',
                 'estimated_duration': action.estimated_duration,
@@ -50,7 +82,7 @@ class TemplateBuilderService:
                         'quantity_required': pd.quantity_required,
                         'expected_cost': pd.expected_cost,
                         'notes': pd.notes,
-                        'part': TemplateBuilderService._get_part_info(pd.part_id) if pd.part_id else None,
+                        'part': parts_info.get(pd.part_id),
                     }
                     for pd in action.part_demands
                 ],
@@ -59,7 +91,7 @@ class TemplateBuilderService:
                         'tool_id': tool.tool_id,
                         'quantity_required': tool.quantity_required,
                         'notes': tool.notes,
-                        'tool': TemplateBuilderService._get_tool_info(tool.tool_id) if tool.tool_id else None,
+                        'tool': tools_info.get(tool.tool_id),
                     }
                     for tool in action.tools
                 ],
@@ -77,7 +109,7 @@ class TemplateBuilderService:
             })
         
         # Get builder memory to access revision fields
-        builder_memory = TemplateBuilderMemory.query.get(builder_id)
+        builder_memory = context.builder_memory
         is_revision = builder_memory.is_revision if builder_memory else False
         
         # Get revision from metadata, default to '0' for new builds
@@ -108,55 +140,57 @@ class TemplateBuilderService:
         }
     
     @staticmethod
-    def _get_part_info(part_id: int) -> Optional[Dict[str, Any]]:
+    def _get_parts_info(part_ids: Iterable[Optional[int]]) -> Dict[int, Dict[str, Any]]:
         """
-        Get part information by ID.
+        Get part information for many parts in one query.
         
         Args:
-            part_id: Part ID
+            part_ids: Part IDs (None values are ignored)
             
         Returns:
-            Dictionary with part information or None if not found
+            Dictionary mapping part ID to part information
         """
-        try:
-            part = Part.query.get(part_id)
-            if part:
-                return {
-                    'id': part.id,
-                    'part_number': part.part_number,
-                    'part_name': part.part_name,
-                    'description': part.description,
-                    'unit_cost': part.unit_cost,
-                }
-        except Exception:
-            pass
-        return None
+        part_ids = {part_id for part_id in part_ids if part_id}
+        if not part_ids:
+            return {}
+        parts = Part.query.filter(Part.id.in_(part_ids)).all()
+        return {
+            part.id: {
+                'id': part.id,
+                'part_number': part.part_number,
+                'part_name': part.part_name,
+                'description': part.description,
+                'unit_cost': part.unit_cost,
+            }
+            for part in parts
+        }
     
     @staticmethod
-    def _get_tool_info(tool_id: int) -> Optional[Dict[str, Any]]:
+    def _get_tools_info(tool_ids: Iterable[Optional[int]]) -> Dict[int, Dict[str, Any]]:
         """
-        Get tool information by ID.
+        Get tool information for many tools in one query.
         
         Args:
-            tool_id: Tool ID
+            tool_ids: Tool IDs (None values are ignored)
             
         Returns:
-            Dictionary with tool information or None if not found
+            Dictionary mapping tool ID to tool information
         """
-        try:
-            tool = Tool.query.get(tool_id)
-            if tool:
-                return {
-                    'id': tool.id,
-                    'tool_name': tool.tool_name,
-                    'description': tool.description,
-                    'tool_type': tool.tool_type,
-                    'manufacturer': tool.manufacturer,
-                    'model_number': tool.model_number,
-                }
-        except Exception:
-            pass
-        return None
+        tool_ids = {tool_id for tool_id in tool_ids if tool_id}
+        if not tool_ids:
+            return {}
+        tools = Tool.query.filter(Tool.id.in_(tool_ids)).all()
+        return {
+            tool.id: {
+                'id': tool.id,
+                'tool_name': tool.tool_name,
+                'description': tool.description,
+                'tool_type': tool.tool_type,
+                'manufacturer': tool.manufacturer,
+                'model_number': tool.model_number,
+            }
+            for tool in tools
+        }
     
     @staticmethod
     def get_builder_json(builder_id: int) -> str:
@@ -169,7 +203,7 @@ class TemplateBuilderService:
         Returns:
             Formatted JSON string representation of the builder context
         """
-        context = TemplateBuilderContext(builder_id)
+        context = TemplateBuilderService.get_context(builder_id)
         context_dict = context.to_dict()
         return json.dumps(context_dict, indent=2, default=str)
     
@@ -186,13 +220,13 @@ class TemplateBuilderService:
             Dictionary with action detail data or None if not found
         """
         try:
-            context = TemplateBuilderContext(builder_id)
+            context = TemplateBuilderService.get_context(builder_id)
             if 0 <= action_index < len(context.build_actions):
                 action = context.build_actions[action_index]
                 
                 return {
                     'index': action_index,
-                    'sequence_order': action.sequence_order,
+                    'sequence_order': action_index + 1,
                     'action_name': action.action_name or '',
                     'description': action.description or '',
                     'estimated_duration': action.estimated_duration,
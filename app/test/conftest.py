@@ -0,0 +1,70 @@
+"""
+Shared fixtures for the app tests
+Each test module gets its own throwaway SQLite database with critical and
+debug data, a client logged in as the first user, and a query counter.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture(scope='module')
+def app(tmp_path_factory, request):
+    """App on a throwaway SQLite database with critical and debug data"""
+    os.environ['DATABASE_URL'] = f"sqlite:///{tmp_path_factory.mktemp('db') / f'{request.module.__name__}.db'}"
+    from app import create_app, db
+    from app.build import build_models, insert_critical_data
+    from app.debug.debug_data_manager import insert_debug_data
+
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.app_context():
+        build_models('all')
+        insert_critical_data()
+        insert_debug_data(enabled=True, phase='all')
+        db.session.remove()
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Test client logged in as the first user"""
+    from app.data.core.user_info.user import User
+    client = app.test_client()
+    with app.app_context():
+        user_id = User.query.first().id
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+        session['_fresh'] = True
+    return client
+
+
+@pytest.fixture
+def count_queries(app, client):
+    """count_queries(url): GET url in its own app context and return (status code, query count)"""
+    from app import db
+
+    def _count_queries(url):
+        statements = []
+
+        def _before_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', _before_execute)
+        try:
+            response = client.get(url)
+        finally:
+            event.remove(engine, 'before_cursor_execute', _before_execute)
+        return response.status_code, len(statements)
+
+    return _count_queries
@@ -0,0 +1,76 @@
+"""
+JSON patch tests
+make_patch/apply_patch must round-trip, and paths into lists must name an
+existing item (or the end, for add).
+"""
+
+import random
+
+import pytest
+
+
+@pytest.mark.parametrize('old, new', [
+    ({}, {'a': 1}),
+    ({'a': 1, 'b': 2}, {'b': 3, 'c': [1, 2]}),
+    ({'a/b': 1, 'c~d': 2}, {'a/b': 2}),
+    ([1, 2, 3], [1, 3]),
+    ([1, 2, 3], [0, 1, 2, 3, 4]),
+    ([1, 2, 3], []),
+    ({'actions': [{'name': 'a', 'parts': [1]}, {'name': 'b'}]},
+     {'actions': [{'name': 'b', 'parts': []}, {'name': 'c'}, {'name': 'a'}]}),
+    ([1], {'a': 1}),
+])
+def test_round_trip(old, new):
+    """Applying make_patch(old, new) to old gives new and leaves old untouched"""
+    from app.utils.json_patch import apply_patch, make_patch
+
+    before = repr(old)
+    assert apply_patch(old, make_patch(old, new)) == new
+    assert repr(old) == before
+
+
+def test_round_trip_random_lists():
+    """Random list edits (inserts, removals, changes) round-trip"""
+    from app.utils.json_patch import apply_patch, make_patch
+
+    rng = random.Random(31)
+    for _ in range(200):
+        old = [{'id': rng.randint(0, 5), 'items': [rng.randint(0, 3) for _ in range(rng.randint(0, 3))]}
+               for _ in range(rng.randint(0, 6))]
+        new = [dict(item) for item in old]
+        for _ in range(rng.randint(1, 4)):
+            edit = rng.choice(('insert', 'remove', 'change'))
+            if edit == 'insert' or not new:
+                new.insert(rng.randint(0, len(new)), {'id': rng.randint(0, 5), 'items': []})
+            elif edit == 'remove':
+                new.pop(rng.randrange(len(new)))
+            else:
+                new[rng.randrange(len(new))] = {'id': rng.randint(0, 5), 'items': [rng.randint(0, 3)]}
+        assert apply_patch(old, make_patch(old, new)) == new
+
+
+@pytest.mark.parametrize('op', [
+    {'op': 'remove', 'path': '/actions/2'},
+    {'op': 'replace', 'path': '/actions/2', 'value': 'x'},
+    {'op': 'add', 'path': '/actions/3', 'value': 'x'},
+    {'op': 'remove', 'path': '/actions/-1'},
+    {'op': 'replace', 'path': '/actions/-1', 'value': 'x'},
+    {'op': 'add', 'path': '/actions/one', 'value': 'x'},
+    {'op': 'replace', 'path': '/actions/5/name', 'value': 'x'},
+    {'op': 'replace', 'path': '/missing/name', 'value': 'x'},
+])
+def test_invalid_list_paths_raise(op):
+    """Out-of-range, negative and non-numeric list indexes raise ValueError"""
+    from app.utils.json_patch import apply_patch
+
+    with pytest.raises(ValueError, match='Invalid patch path'):
+        apply_patch({'actions': ['a', 'b']}, [op])
+
+
+def test_add_at_end_and_dash():
+    """add may target len(list) or '-' to append"""
+    from app.utils.json_patch import apply_patch
+
+    document = {'actions': ['a', 'b']}
+    assert apply_patch(document, [{'op': 'add', 'path': '/actions/2', 'value': 'c'}]) == {'actions': ['a', 'b', 'c']}
+    assert apply_patch(document, [{'op': 'add', 'path': '/actions/-', 'value': 'c'}]) == {'actions': ['a', 'b', 'c']}
@@ -0,0 +1,70 @@
+"""
+Keyset pagination tests
+Walking a list page by page with cursors must reach every row exactly once,
+including rows whose sort column is NULL.
+"""
+
+import pytest
+
+PER_PAGE = 2
+STATUSES = ['Complete', None, 'Open', None, 'Archived', None, None]
+
+
+@pytest.fixture(scope='module')
+def event_query(app):
+    """Query for a set of events where most statuses are NULL"""
+    from app import db
+    from app.data.core.event_info.event import Event
+    from app.data.core.user_info.user import User
+
+    with app.app_context():
+        user_id = User.query.first().id
+        db.session.add_all([
+            Event(event_type='Keyset', description=f'Keyset event {index}', status=status,
+                  created_by_id=user_id, updated_by_id=user_id)
+            for index, status in enumerate(STATUSES)
+        ])
+        db.session.commit()
+    return lambda: Event.query.filter(Event.event_type == 'Keyset')
+
+
+def _walk(query, forward=True):
+    """Event IDs of every page, following next (or, from the last page, previous) cursors"""
+    from app.services.core.keyset_pagination import KeysetPagination
+
+    pages = []
+    page, cursor = 1, None
+    if not forward:
+        page = KeysetPagination.paginate(query, page=1, per_page=PER_PAGE).pages
+    while True:
+        pagination = KeysetPagination.paginate(query, page=page, per_page=PER_PAGE, cursor=cursor)
+        pages.append([event.id for event in pagination.items])
+        if forward:
+            if not pagination.has_next:
+                return pages
+            page, cursor = page + 1, pagination.next_cursor
+            assert cursor is not None
+        else:
+            if page == 1:
+                return list(reversed(pages))
+            page, cursor = page - 1, pagination.prev_cursor
+
+
+@pytest.mark.parametrize('descending', [True, False])
+@pytest.mark.parametrize('forward', [True, False])
+def test_cursor_walk_reaches_null_sort_keys(app, event_query, descending, forward):
+    """Every row is reached once, in order, when the sort column contains NULLs"""
+    from app.data.core.event_info.event import Event
+
+    with app.app_context():
+        events = event_query().all()
+        # NULL is the lowest value; ties go by ascending primary key in both directions
+        tie_break = (lambda event: -event.id) if descending else (lambda event: event.id)
+        expected = sorted(events, key=lambda event: (event.status is not None, event.status or '', tie_break(event)),
+                          reverse=descending)
+        order = Event.status.desc() if descending else Event.status.asc()
+
+        pages = _walk(event_query().order_by(order), forward=forward)
+
+        assert [event_id for page in pages for event_id in page] == [event.id for event in expected]
+        assert all(len(page) == PER_PAGE for page in pages[:-1])
@@ -0,0 +1,55 @@
+"""
+Lazy route group tests
+Outside debug mode every route group is registered at startup. In debug mode
+groups stay pending and must still load after the first request, both for a
+request under their prefix and for url_for() into one of their blueprints.
+"""
+
+import pytest
+from flask import url_for
+
+
+@pytest.fixture
+def debug_app(app, monkeypatch):
+    """Debug-mode app on the module database, with route groups left pending"""
+    from app import create_app
+
+    monkeypatch.setenv('FLASK_DEBUG', '1')
+    monkeypatch.delenv('PRELOAD_BLUEPRINTS', raising=False)
+    debug_app = create_app()
+    debug_app.config['TESTING'] = True
+    return debug_app
+
+
+def test_groups_preloaded_outside_debug(app):
+    """The default (non-debug) app has no pending route groups"""
+    assert not app.debug
+    assert app.config['PRELOAD_BLUEPRINTS']
+    assert app.extensions['lazy_blueprints'].pending == []
+
+
+def test_deferred_groups_load_after_first_request(debug_app):
+    """A deferred prefix and a url_for() into a deferred group work after the first request"""
+    from app.data.core.user_info.user import User
+
+    lazy = debug_app.extensions['lazy_blueprints']
+    assert {group.name for group in lazy.pending} == {'assets', 'dispatching', 'maintenance', 'supply'}
+
+    client = debug_app.test_client()
+    # First request: the login redirect renders no template, so nothing loads
+    assert client.get('/core/assets').status_code == 302
+    assert debug_app._got_first_request
+    assert {group.name for group in lazy.pending} == {'assets', 'dispatching', 'maintenance', 'supply'}
+
+    with debug_app.test_request_context():
+        assert url_for('dispatching.index') == '/dispatching/'
+    assert lazy.groups['dispatching'].loaded
+    assert 'maintenance' in {group.name for group in lazy.pending}
+
+    with debug_app.app_context():
+        user_id = User.query.first().id
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+        session['_fresh'] = True
+    assert client.get('/maintenance/').status_code == 200
+    assert lazy.groups['maintenance'].loaded
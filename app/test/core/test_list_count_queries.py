@@ -0,0 +1,155 @@
+"""
+Query count tests for the make/model, location and asset type list pages
+Per-row counts come from CountAnnotation's grouped queries, so the number of
+queries per page must not grow with the number of rows or children shown.
+"""
+
+import pytest
+from sqlalchemy import event, insert
+
+# Rows added per growth step (all fit on the first page of 20)
+GROWTH_ROWS = 6
+ASSETS_PER_ROW = 3
+
+
+def _insert_assets(prefix, user_id, **columns):
+    """Insert ASSETS_PER_ROW bare assets with the given foreign keys"""
+    from app import db
+    from app.data.core.asset_info.asset import Asset
+
+    db.session.execute(insert(Asset.__table__), [
+        {'name': f'{prefix} {index}', 'serial_number': f'{prefix}-{index}', 'status': 'Active',
+         'created_by_id': user_id, 'updated_by_id': user_id, **columns}
+        for index in range(ASSETS_PER_ROW)
+    ])
+
+
+def _grow_make_models(step):
+    """Add make/models of an existing asset type, each with assets"""
+    from app import db
+    from app.data.core.asset_info.asset_type import AssetType
+    from app.data.core.asset_info.make_model import MakeModel
+    from app.data.core.user_info.user import User
+
+    user_id = User.query.first().id
+    asset_type_id = AssetType.query.first().id
+    for index in range(GROWTH_ROWS):
+        make_model = MakeModel(make=f'AAA Count {step}', model=f'Model {index}', year=2000 + index,
+                               asset_type_id=asset_type_id, created_by_id=user_id, updated_by_id=user_id)
+        db.session.add(make_model)
+        db.session.flush()
+        _insert_assets(f'CQ-MM-{step}-{index}', user_id, make_model_id=make_model.id)
+    db.session.commit()
+
+
+def _grow_locations(step):
+    """Add locations, each with assets"""
+    from app import db
+    from app.data.core.major_location import MajorLocation
+    from app.data.core.user_info.user import User
+
+    user_id = User.query.first().id
+    for index in range(GROWTH_ROWS):
+        location = MajorLocation(name=f'AAA Count {step}-{index}', created_by_id=user_id, updated_by_id=user_id)
+        db.session.add(location)
+        db.session.flush()
+        _insert_assets(f'CQ-LOC-{step}-{index}', user_id, major_location_id=location.id)
+    db.session.commit()
+
+
+def _grow_asset_types(step):
+    """Add asset types, each with a make/model that has assets"""
+    from app import db
+    from app.data.core.asset_info.asset_type import AssetType
+    from app.data.core.asset_info.make_model import MakeModel
+    from app.data.core.user_info.user import User
+
+    user_id = User.query.first().id
+    for index in range(GROWTH_ROWS):
+        asset_type = AssetType(name=f'AAA Count {step}-{index}', created_by_id=user_id, updated_by_id=user_id)
+        db.session.add(asset_type)
+        db.session.flush()
+        make_model = MakeModel(make=f'Count type {step}', model=f'Model {index}', asset_type_id=asset_type.id,
+                               created_by_id=user_id, updated_by_id=user_id)
+        db.session.add(make_model)
+        db.session.flush()
+        _insert_assets(f'CQ-AT-{step}-{index}', user_id, make_model_id=make_model.id)
+    db.session.commit()
+
+
+@pytest.mark.parametrize('url, grow', [
+    ('/core/make-models', _grow_make_models),
+    ('/core/locations', _grow_locations),
+    ('/core/asset-types', _grow_asset_types),
+])
+def test_list_page_query_count_does_not_grow(app, count_queries, url, grow):
+    """Adding rows with children to the page leaves the query count unchanged"""
+    # Warm the reference data cache used for the filter dropdowns
+    count_queries(url)
+    with app.app_context():
+        grow(1)
+    status, small_count = count_queries(url)
+    assert status == 200
+
+    with app.app_context():
+        grow(2)
+    status, large_count = count_queries(url)
+    assert status == 200
+    assert large_count == small_count
+
+
+def test_grouped_counts_match_per_row_counts(app):
+    """CountAnnotation returns the same counts as counting row by row"""
+    from app import db
+    from app.data.core.asset_info.asset import Asset
+    from app.data.core.asset_info.asset_type import AssetType
+    from app.data.core.asset_info.make_model import MakeModel
+    from app.data.core.major_location import MajorLocation
+    from app.services.core.count_annotation import CountAnnotation
+
+    with app.app_context():
+        make_models = MakeModel.query.all()
+        assert CountAnnotation.for_page(make_models, MakeModel.assets) == {
+            make_model.id: Asset.query.filter_by(make_model_id=make_model.id).count()
+            for make_model in make_models
+        }
+
+        locations = MajorLocation.query.all()
+        assert CountAnnotation.for_page(locations, MajorLocation.assets) == {
+            location.id: Asset.query.filter_by(major_location_id=location.id).count()
+            for location in locations
+        }
+
+        asset_types = AssetType.query.all()
+        assert CountAnnotation.for_page(asset_types, AssetType.make_models) == {
+            asset_type.id: MakeModel.query.filter_by(asset_type_id=asset_type.id).count()
+            for asset_type in asset_types
+        }
+        assert CountAnnotation.for_page(asset_types, AssetType.make_models, MakeModel.assets) == {
+            asset_type.id: db.session.query(Asset).join(MakeModel).filter(
+                MakeModel.asset_type_id == asset_type.id
+            ).count()
+            for asset_type in asset_types
+        }
+
+
+def test_grouped_count_is_one_query(app):
+    """Counts for a page cost one query regardless of the number of rows"""
+    from app import db
+    from app.data.core.asset_info.asset_type import AssetType
+    from app.data.core.asset_info.make_model import MakeModel
+    from app.services.core.count_annotation import CountAnnotation
+
+    with app.app_context():
+        asset_types = AssetType.query.all()
+        statements = []
+
+        def _before_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', _before_execute)
+        try:
+            CountAnnotation.for_page(asset_types, AssetType.make_models, MakeModel.assets)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _before_execute)
+        assert len(statements) == 1
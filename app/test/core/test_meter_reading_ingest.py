@@ -0,0 +1,43 @@
+"""
+Meter reading ingest tests
+Batch ingest writes readings for any asset, so it is limited to admins.
+"""
+
+import pytest
+
+
+def _login(client, username):
+    """Log the client in as the named user"""
+    from app.data.core.user_info.user import User
+
+    user_id = User.query.filter_by(username=username).first().id
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+        session['_fresh'] = True
+
+
+def _ingest(client, asset_id):
+    return client.post('/core/assets/meter-readings', json={
+        'readings': [{'asset_id': asset_id, 'meter': 1, 'recorded_at': '2025-01-01T08:00:00', 'value': 1234.5}]
+    })
+
+
+@pytest.mark.parametrize('username, status, inserted', [
+    ('Generic_User', 403, 0),
+    ('admin', 200, 1),
+])
+def test_ingest_requires_admin(app, client, username, status, inserted):
+    """Non-admins are refused without writing; admins ingest the batch"""
+    from app.data.core.asset_info.asset import Asset
+    from app.data.core.asset_info.meter_reading import MeterReading
+
+    with app.app_context():
+        _login(client, username)
+        asset_id = Asset.query.first().id
+        before = MeterReading.query.filter_by(asset_id=asset_id).count()
+
+    response = _ingest(client, asset_id)
+
+    assert response.status_code == status
+    with app.app_context():
+        assert MeterReading.query.filter_by(asset_id=asset_id).count() == before + inserted
@@ -0,0 +1,23 @@
+"""
+Typeahead option tests
+Cached option lists must pick up new rows, including rows written by Core bulk
+inserts that do not pass through the ORM flush.
+"""
+
+
+def test_bulk_created_assets_appear_in_cached_options(app):
+    """Assets from AssetContext.create_bulk show up in an already cached prefix"""
+    from app.buisness.core.asset_context import AssetContext
+    from app.data.core.user_info.user import User
+    from app.services.core.typeahead_service import TypeaheadService
+
+    with app.app_context():
+        before = TypeaheadService.search(TypeaheadService.ASSETS, 'bulkta').total
+
+        AssetContext.create_bulk(
+            [{'name': f'BulkTA {index}', 'serial_number': f'BULKTA-{index}'} for index in range(3)],
+            created_by_id=User.query.first().id,
+            enable_detail_insertion=False
+        )
+
+        assert TypeaheadService.search(TypeaheadService.ASSETS, 'bulkta').total == before + 3
@@ -0,0 +1,38 @@
+"""
+Action position tests
+Positions computed once per action set must match Action.sequence_order, both
+when the sibling actions are loaded and when they are counted in SQL.
+"""
+
+
+def test_struct_positions_match_sequence_order(app):
+    """action_positions/action_structs follow (order_key, id) and agree with the hybrid"""
+    from sqlalchemy import inspect
+    from app import db
+    from app.buisness.maintenance.base.maintenance_action_set_struct import MaintenanceActionSetStruct
+    from app.data.maintenance.base.actions import Action
+    from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
+
+    with app.app_context():
+        maintenance_action_set = MaintenanceActionSet.query.filter(MaintenanceActionSet.actions.any()).first()
+        # Tie two keys so the id tie-break matters
+        first, second = sorted(maintenance_action_set.actions, key=lambda action: action.id)[:2]
+        second.order_key = first.order_key
+        db.session.commit()
+        maintenance_action_set_id = maintenance_action_set.id
+        db.session.expunge_all()
+
+        struct = MaintenanceActionSetStruct(MaintenanceActionSet.query.get(maintenance_action_set_id))
+        expected = [
+            action.id for action in sorted(struct.maintenance_action_set.actions, key=lambda a: (a.order_key, a.id))
+        ]
+        assert [action_struct.action_id for action_struct in struct.action_structs] == expected
+        assert [action_struct.sequence_order for action_struct in struct.action_structs] == list(range(1, len(expected) + 1))
+        assert all(struct.action_positions[action.id] == action.sequence_order for action in struct.actions)
+
+        # Without the siblings loaded, the hybrid counts them in SQL
+        for action_id in expected:
+            db.session.expunge_all()
+            action = Action.query.get(action_id)
+            assert action.sequence_order == expected.index(action_id) + 1
+            assert 'maintenance_action_set' in inspect(action).unloaded
@@ -0,0 +1,73 @@
+"""
+Query budget tests for the maintenance event view/work pages
+The pages load the event graph through MaintenanceEventGraph, so the number of
+queries per page must stay fixed as actions, part demands and tools are added.
+"""
+
+import pytest
+
+# MaintenanceEventGraph.QUERY_BUDGET (5) + current user; the work page adds the parts/users dropdowns
+VIEW_PAGE_MAX_QUERIES = 6
+WORK_PAGE_MAX_QUERIES = 8
+
+
+def _grow_event(maintenance_action_set, count):
+    """Add actions, each with part demands and a tool, to a maintenance action set"""
+    from app import db
+    from app.data.core.supply.part import Part
+    from app.data.core.supply.tool import Tool
+    from app.data.core.user_info.user import User
+    from app.data.maintenance.base.actions import Action
+    from app.data.maintenance.base.part_demands import PartDemand
+    from app.data.maintenance.base.action_tools import ActionTool
+
+    user_ids = [user.id for user in User.query.all()]
+    start = len(maintenance_action_set.actions) + 1
+    for index in range(start, start + count):
+        part = Part(part_number=f'QB-{maintenance_action_set.id}-{index}', part_name=f'Query budget part {index}',
+                    status='Active', created_by_id=user_ids[0], updated_by_id=user_ids[0])
+        tool = Tool(tool_name=f'Query budget tool {maintenance_action_set.id}-{index}',
+                    created_by_id=user_ids[0], updated_by_id=user_ids[0])
+        action = Action(maintenance_action_set_id=maintenance_action_set.id, sequence_order=index,
+                        action_name=f'Query budget step {index}', assigned_user_id=user_ids[index % len(user_ids)],
+                        created_by_id=user_ids[0], updated_by_id=user_ids[0])
+        db.session.add_all([part, tool, action])
+        db.session.flush()
+        db.session.add_all([
+            PartDemand(action_id=action.id, part_id=part.id, quantity_required=1,
+                       requested_by_id=user_ids[index % len(user_ids)],
+                       created_by_id=user_ids[0], updated_by_id=user_ids[0]),
+            ActionTool(action_id=action.id, tool_id=tool.id, quantity_required=1,
+                       assigned_to_user_id=user_ids[index % len(user_ids)],
+                       created_by_id=user_ids[0], updated_by_id=user_ids[0]),
+        ])
+    db.session.commit()
+
+
+@pytest.mark.parametrize('page, max_queries', [
+    ('view', VIEW_PAGE_MAX_QUERIES),
+    ('work', WORK_PAGE_MAX_QUERIES),
+])
+def test_maintenance_event_page_query_budget(app, count_queries, page, max_queries):
+    """Page query count stays within budget and does not grow with the event"""
+    from app.data.maintenance.base.maintenance_action_sets import MaintenanceActionSet
+
+    with app.app_context():
+        maintenance_action_set = MaintenanceActionSet.query.filter(
+            MaintenanceActionSet.status != 'Delayed'
+        ).first()
+        assert maintenance_action_set is not None
+        event_id = maintenance_action_set.event_id
+    url = f'/maintenance/maintenance-event/{event_id}/{page}'
+
+    status, small_count = count_queries(url)
+    assert status == 200
+    assert small_count <= max_queries
+
+    with app.app_context():
+        _grow_event(MaintenanceActionSet.query.filter_by(event_id=event_id).first(), 25)
+
+    status, large_count = count_queries(url)
+    assert status == 200
+    assert large_count <= max_queries
+    assert large_count == small_count
@@ -0,0 +1,117 @@
+"""
+KPI rollup tests for maintenance event edits
+Status, asset and delay edits made outside start/complete/cancel must keep the
+incrementally maintained rollups equal to a full rebuild.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+
+def _rollups():
+    """{(dimension, dimension_id, period): {counter: value}} without all-zero rows"""
+    from app.buisness.maintenance.kpi.maintenance_kpi_rollup_manager import MaintenanceKpiRollupManager
+    from app.data.maintenance.base.maintenance_kpi_rollups import MaintenanceKpiRollup
+
+    rows = {}
+    for row in MaintenanceKpiRollup.query.all():
+        counters = {
+            column: round(getattr(row, column) or 0, 3)
+            for column in MaintenanceKpiRollupManager.COUNTER_COLUMNS
+        }
+        if any(counters.values()):
+            rows[(row.dimension, row.dimension_id, row.period)] = counters
+    return rows
+
+
+def _new_event(asset_id=None):
+    """MaintenanceContext of a new Planned event created from the first template"""
+    from app.buisness.maintenance.base.maintenance_context import MaintenanceContext
+    from app.buisness.maintenance.factories.maintenance_factory import MaintenanceFactory
+    from app.data.core.asset_info.asset import Asset
+    from app.data.core.user_info.user import User
+    from app.data.maintenance.templates.template_action_sets import TemplateActionSet
+
+    maintenance_action_set = MaintenanceFactory.create_from_template(
+        template_action_set_id=TemplateActionSet.query.first().id,
+        asset_id=asset_id or Asset.query.first().id,
+        user_id=User.query.first().id
+    )
+    return MaintenanceContext.from_maintenance_action_set(maintenance_action_set)
+
+
+@pytest.fixture
+def rebuilt(app):
+    """App context with rollups rebuilt from the source tables"""
+    from app import db
+    from app.buisness.maintenance.kpi.maintenance_kpi_rollup_manager import MaintenanceKpiRollupManager
+
+    with app.app_context():
+        MaintenanceKpiRollupManager.rebuild()
+        yield
+        db.session.remove()
+
+
+def test_edit_status_to_complete_closes_backlog(rebuilt):
+    """Completing from the edit page moves the event out of the open backlog"""
+    from app.buisness.maintenance.kpi.maintenance_kpi_rollup_manager import MaintenanceKpiRollupManager
+    from app.data.core.user_info.user import User
+
+    context = _new_event()
+    context.start()
+    fleet_open = ('fleet', MaintenanceKpiRollupManager.FLEET_ID, MaintenanceKpiRollupManager.OPEN_PERIOD)
+    before = _rollups()
+
+    context.update_action_set_details(status='Complete', user_id=User.query.first().id)
+
+    after = _rollups()
+    period = MaintenanceKpiRollupManager.period_for(context.maintenance_action_set.end_date)
+    fleet_period = ('fleet', MaintenanceKpiRollupManager.FLEET_ID, period)
+    assert after[fleet_open]['backlog_count'] == before[fleet_open]['backlog_count'] - 1
+    assert after[fleet_period]['completed_count'] == before.get(fleet_period, {}).get('completed_count', 0) + 1
+    assert _matches_rebuild(after)
+
+
+def test_edits_match_rebuild(rebuilt):
+    """Status, reopen, asset and delay (including ended delay) edits leave the same rollups as a rebuild"""
+    from app.data.core.asset_info.asset import Asset
+    from app.data.core.user_info.user import User
+
+    user_id = User.query.first().id
+
+    context = _new_event()
+    context.update_action_set_details(status='In Progress', user_id=user_id)
+    context.update_action_set_details(status='Cancelled', user_id=user_id)
+    context.update_action_set_details(status='In Progress', user_id=user_id)
+    other_asset = Asset.query.filter(
+        Asset.id != context.maintenance_action_set.asset_id,
+        Asset.major_location_id != Asset.query.get(context.maintenance_action_set.asset_id).major_location_id
+    ).first()
+    context.update_action_set_details(asset_id=other_asset.id, status='Complete', user_id=user_id)
+    assert _matches_rebuild(_rollups())
+
+    context = _new_event()
+    delay = context.add_delay('Parts', 'Waiting on parts', user_id=user_id)
+    context.update_delay(delay.id, delay_end_date=delay.delay_start_date.replace(year=delay.delay_start_date.year + 1),
+                         user_id=user_id)
+    assert context.maintenance_action_set.status == 'In Progress'
+    assert _matches_rebuild(_rollups())
+
+    # Editing an ended delay changes its duration
+    context.update_delay(delay.id, delay_end_date=delay.delay_end_date + timedelta(days=40), user_id=user_id)
+    assert _matches_rebuild(_rollups())
+    context.update_delay(delay.id, delay_start_date=delay.delay_start_date - timedelta(hours=5), user_id=user_id)
+    assert _matches_rebuild(_rollups())
+
+
+def _matches_rebuild(rows):
+    """True when the rollups equal a full rebuild (leaves the rebuilt rollups in place)"""
+    from app.buisness.maintenance.kpi.maintenance_kpi_rollup_manager import MaintenanceKpiRollupManager
+
+    MaintenanceKpiRollupManager.rebuild()
+    rebuilt_rows = _rollups()
+    assert rows.keys() == rebuilt_rows.keys()
+    for key, counters in rows.items():
+        assert counters == pytest.approx(rebuilt_rows[key]), key
+    return True
@@ -0,0 +1,85 @@
+"""
+Template builder operation log tests
+Saves from a context whose base is stale must not append patches against the
+wrong items, and ops that no longer replay must be compacted away, not lost
+silently on every load.
+"""
+
+import json
+
+
+def _new_builder(action_names):
+    """TemplateBuilderContext of a new blank builder with one custom action per name"""
+    from app.buisness.maintenance.builders.template_builder_context import TemplateBuilderContext
+    from app.data.core.user_info.user import User
+
+    context = TemplateBuilderContext.create_blank('Op log test', user_id=User.query.first().id)
+    for name in action_names:
+        context.add_action_from_dict({'action_name': name})
+    return context
+
+
+def _stored_state(builder_id):
+    """Build state replayed from a fresh load of the stored snapshot and ops"""
+    from app import db
+    from app.data.maintenance.builders.template_builder_memory import TemplateBuilderMemory
+
+    db.session.expunge_all()
+    return TemplateBuilderMemory.query.get(builder_id).get_build_state_dict()
+
+
+def test_stale_context_saves_snapshot(app):
+    """A save after another editor's save writes the saver's full state"""
+    from app.buisness.maintenance.builders.template_builder_context import TemplateBuilderContext
+    from app.data.maintenance.builders.template_builder_memory import TemplateBuilderMemory
+
+    with app.app_context():
+        builder_id = _new_builder(['first', 'second']).builder_id
+
+        editor_a = TemplateBuilderContext(builder_id)
+        editor_b = TemplateBuilderContext(builder_id)
+        editor_a.remove_action(0)
+        # Diffed against the two-action base, this patch targets /actions/1
+        editor_b.add_part_demand_to_action(1, {'quantity_required': 2})
+
+        expected = editor_b._serialize_state()
+        assert _stored_state(builder_id) == expected
+        assert TemplateBuilderMemory.query.get(builder_id).ops == []
+
+        # The saving context is current again, so it goes back to appending ops
+        editor_b = TemplateBuilderContext(builder_id)
+        editor_b.remove_action(0)
+        assert len(TemplateBuilderMemory.query.get(builder_id).ops) == 1
+        assert _stored_state(builder_id) == editor_b._serialize_state()
+
+
+def test_failed_op_is_compacted_on_load(app, caplog):
+    """An op that no longer applies is logged and compacted with the ops after it"""
+    from app import db
+    from app.buisness.maintenance.builders.template_builder_context import TemplateBuilderContext
+    from app.data.maintenance.builders.template_builder_memory import TemplateBuilderMemory
+    from app.data.maintenance.builders.template_builder_op import TemplateBuilderOp
+
+    with app.app_context():
+        context = _new_builder(['only'])
+        builder_id = context.builder_id
+        good_state = context._serialize_state()
+
+        memory = TemplateBuilderMemory.query.get(builder_id)
+        for patch in (
+            [{'op': 'remove', 'path': '/actions/3'}],
+            [{'op': 'remove', 'path': '/actions/0'}],
+        ):
+            memory.ops.append(TemplateBuilderOp(patch=json.dumps(patch)))
+        db.session.commit()
+        db.session.expunge_all()
+
+        with caplog.at_level('WARNING'):
+            context = TemplateBuilderContext(builder_id)
+        assert context._serialize_state() == good_state
+        assert 'no longer applies' in caplog.text
+
+        db.session.expunge_all()
+        memory = TemplateBuilderMemory.query.get(builder_id)
+        assert memory.ops == []
+        assert memory.get_build_state_dict() == good_state
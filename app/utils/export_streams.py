@@ -0,0 +1,101 @@
+"""
+Streaming export helpers
+Turn an iterator of Core result rows into chunked CSV or JSONL text without
+materializing the whole result set.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+
+# Rows buffered per yielded chunk
+DEFAULT_CHUNK_ROWS = 500
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+}
+
+
+def _json_default(value):
+    """JSON encoder fallback for dates and datetimes"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def iter_csv_chunks(columns, rows, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Yield CSV text in chunks, header first
+
+    Args:
+        columns: List of column names
+        rows: Iterable of row tuples in column order
+        chunk_rows: Rows per yielded chunk
+
+    Yields:
+        str chunks of CSV text
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    pending = 1
+    for row in rows:
+        writer.writerow(
+            value.isoformat() if isinstance(value, (datetime, date)) else value
+            for value in row
+        )
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+
+    if pending:
+        yield buffer.getvalue()
+
+
+def iter_jsonl_chunks(columns, rows, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Yield JSON Lines text in chunks, one object per row
+
+    Args:
+        columns: List of column names (object keys)
+        rows: Iterable of row tuples in column order
+        chunk_rows: Rows per yielded chunk
+
+    Yields:
+        str chunks of JSONL text
+    """
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(columns, row)), default=_json_default))
+        if len(lines) >= chunk_rows:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+def iter_export_chunks(export_format, columns, rows, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Dispatch to the CSV or JSONL chunk generator
+
+    Args:
+        export_format: 'csv' or 'jsonl'
+        columns: List of column names
+        rows: Iterable of row tuples in column order
+        chunk_rows: Rows per yielded chunk
+
+    Raises:
+        ValueError: If export_format is not supported
+    """
+    if export_format == 'csv':
+        return iter_csv_chunks(columns, rows, chunk_rows)
+    if export_format == 'jsonl':
+        return iter_jsonl_chunks(columns, rows, chunk_rows)
+    raise ValueError(f"Unsupported export format: {export_format}")
@@ -0,0 +1,77 @@
+"""
+Flush Hooks
+One Session after_flush listener shared by every cache and index that reacts
+to ORM writes.
+
+Handlers register for the model classes they care about. The dispatcher walks
+the flushed instances once, groups them by class, and calls each handler only
+when one of its classes (or a subclass) was written, with just those
+instances.
+"""
+
+from typing import Callable, Dict, List, Tuple, Type
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class FlushChanges:
+    """Instances written in one flush, restricted to a handler's models"""
+
+    __slots__ = ('new', 'dirty', 'deleted')
+
+    def __init__(self):
+        self.new: List = []
+        self.dirty: List = []
+        self.deleted: List = []
+
+    def __bool__(self):
+        return bool(self.new or self.dirty or self.deleted)
+
+    @property
+    def all(self) -> Tuple:
+        """New, dirty and deleted instances"""
+        return (*self.new, *self.dirty, *self.deleted)
+
+    @property
+    def classes(self) -> set:
+        """Classes of the written instances"""
+        return {type(instance) for instance in self.all}
+
+
+# (models, handler); an empty models tuple receives every flushed instance
+_handlers: List[Tuple[Tuple[Type, ...], Callable]] = []
+
+
+def on_flush(*models: Type):
+    """
+    Decorator registering handler(session, changes) to run after a flush that
+    wrote instances of the given classes (any mapped class when none given).
+    """
+    def decorator(handler):
+        _handlers.append((models, handler))
+        return handler
+    return decorator
+
+
+@event.listens_for(Session, 'after_flush')
+def _dispatch_flush(session, flush_context):
+    """Group the flushed instances by class once and call the matching handlers"""
+    by_class: Dict[Type, FlushChanges] = {}
+    for bucket, instances in (('new', session.new), ('dirty', session.dirty), ('deleted', session.deleted)):
+        for instance in instances:
+            changes = by_class.get(type(instance))
+            if changes is None:
+                changes = by_class[type(instance)] = FlushChanges()
+            getattr(changes, bucket).append(instance)
+    if not by_class:
+        return
+
+    for models, handler in _handlers:
+        selected = FlushChanges()
+        for cls, changes in by_class.items():
+            if not models or issubclass(cls, models):
+                selected.new.extend(changes.new)
+                selected.dirty.extend(changes.dirty)
+                selected.deleted.extend(changes.deleted)
+        if selected:
+            handler(session, selected)
@@ -0,0 +1,142 @@
+"""
+JSON Patch helpers
+Minimal RFC 6902 diff/apply (add, remove, replace) for plain JSON documents
+made of dicts, lists and scalars.
+"""
+
+import copy
+
+
+def _escape(token):
+    """Escape a key for use in a JSON pointer"""
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token):
+    """Unescape a JSON pointer token"""
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def make_patch(old, new, path=''):
+    """
+    Build a list of patch operations that turn old into new
+
+    Dicts are diffed key by key. Lists keep their common prefix and suffix,
+    diff the overlapping middle element by element, then remove or append
+    the rest, so inserting or removing one item produces a short patch.
+
+    Args:
+        old: Original document
+        new: Updated document
+        path: JSON pointer of the current node (internal)
+
+    Returns:
+        List of operation dicts ({'op', 'path'[, 'value']})
+    """
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'remove', 'path': f'{path}/{_escape(key)}'})
+        for key, value in new.items():
+            child = f'{path}/{_escape(key)}'
+            if key not in old:
+                ops.append({'op': 'add', 'path': child, 'value': value})
+            else:
+                ops.extend(make_patch(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        prefix = 0
+        limit = min(len(old), len(new))
+        while prefix < limit and old[prefix] == new[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+            suffix += 1
+
+        old_middle = old[prefix:len(old) - suffix]
+        new_middle = new[prefix:len(new) - suffix]
+        shared = min(len(old_middle), len(new_middle))
+
+        ops = []
+        for offset in range(shared):
+            ops.extend(make_patch(old_middle[offset], new_middle[offset], f'{path}/{prefix + offset}'))
+        # Remove from the end so earlier indexes stay valid
+        for index in range(prefix + len(old_middle) - 1, prefix + shared - 1, -1):
+            ops.append({'op': 'remove', 'path': f'{path}/{index}'})
+        for offset in range(shared, len(new_middle)):
+            ops.append({'op': 'add', 'path': f'{path}/{prefix + offset}', 'value': new_middle[offset]})
+        return ops
+
+    return [{'op': 'replace', 'path': path, 'value': new}]
+
+
+def apply_patch(document, ops, in_place=False):
+    """
+    Apply patch operations to a document
+
+    Args:
+        document: Document to patch
+        ops: List of operation dicts from make_patch()
+        in_place: Mutate document instead of patching a deep copy
+
+    Returns:
+        Patched document
+
+    Raises:
+        ValueError: If an operation is unsupported or its path does not exist
+    """
+    if not in_place:
+        document = copy.deepcopy(document)
+
+    for op in ops:
+        kind = op.get('op')
+        path = op.get('path', '')
+        value = copy.deepcopy(op.get('value'))
+
+        if path == '':
+            if kind in ('add', 'replace'):
+                document = value
+                continue
+            raise ValueError(f"Cannot {kind} the document root")
+
+        tokens = [_unescape(token) for token in path.split('/')[1:]]
+        parent = document
+        try:
+            for token in tokens[:-1]:
+                parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            raise ValueError(f"Invalid patch path {path}") from e
+
+        last = tokens[-1]
+        if isinstance(parent, list):
+            try:
+                index = len(parent) if last == '-' else int(last)
+            except ValueError as e:
+                raise ValueError(f"Invalid patch path {path}") from e
+            # add may append at len(parent); remove and replace need an existing item
+            if not 0 <= index <= (len(parent) if kind == 'add' else len(parent) - 1):
+                raise ValueError(f"Invalid patch path {path}")
+            if kind == 'add':
+                parent.insert(index, value)
+            elif kind == 'remove':
+                parent.pop(index)
+            elif kind == 'replace':
+                parent[index] = value
+            else:
+                raise ValueError(f"Unsupported patch op: {kind}")
+        elif isinstance(parent, dict):
+            if kind in ('add', 'replace'):
+                parent[last] = value
+            elif kind == 'remove':
+                parent.pop(last, None)
+            else:
+                raise ValueError(f"Unsupported patch op: {kind}")
+        else:
+            raise ValueError(f"Invalid patch path {path}")
+
+    return document
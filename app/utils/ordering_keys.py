@@ -0,0 +1,89 @@
+"""
+Sparse ordering keys
+Gap-based integer keys for ordered siblings. New and moved items take the
+midpoint of their neighbours' keys so a move writes one row; keys are only
+respaced when two neighbours have no integer left between them.
+"""
+
+# Distance between neighbouring keys after (re)spacing
+ORDER_KEY_GAP = 1024
+
+
+def key_for_position(position):
+    """
+    Spaced key for a 1-based position in a freshly (re)spaced list
+
+    Args:
+        position: 1-based position
+
+    Returns:
+        int key
+    """
+    return int(position) * ORDER_KEY_GAP
+
+
+def position_for_key(key):
+    """
+    Approximate 1-based position of a key, assuming spaced keys
+
+    Args:
+        key: Order key
+
+    Returns:
+        int position (at least 1)
+    """
+    if not key or key < 1:
+        return 1
+    return max(1, -(-int(key) // ORDER_KEY_GAP))
+
+
+def spaced_keys(count):
+    """
+    Evenly spaced keys for count items
+
+    Args:
+        count: Number of items
+
+    Returns:
+        List of int keys in ascending order
+    """
+    return [key_for_position(position) for position in range(1, count + 1)]
+
+
+def key_between(before, after):
+    """
+    Key strictly between two neighbouring keys
+
+    Args:
+        before: Key of the previous item, or None when inserting first
+        after: Key of the next item, or None when inserting last
+
+    Returns:
+        int key, or None if there is no free key between the neighbours
+        (the caller should respace with spaced_keys())
+    """
+    if before is None and after is None:
+        return ORDER_KEY_GAP
+    if after is None:
+        return before + ORDER_KEY_GAP
+    if before is None:
+        before = 0
+    if after - before < 2:
+        return None
+    return before + (after - before) // 2
+
+
+def key_for_insert(keys, index):
+    """
+    Key for inserting at index in an ordered key list
+
+    Args:
+        keys: Ascending keys of the existing items (without the inserted one)
+        index: 0-based insert index (0..len(keys))
+
+    Returns:
+        int key, or None if the neighbours have no free key between them
+    """
+    before = keys[index - 1] if index > 0 else None
+    after = keys[index] if index < len(keys) else None
+    return key_between(before, after)
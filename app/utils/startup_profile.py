@@ -0,0 +1,136 @@
+"""
+Startup profile
+Per-module import timing for application startup.
+
+ImportProfiler hooks the import system while active and records how long
+each module took to execute, both inclusive (with the modules it imported)
+and self (its own body only). Enable it for create_app() with
+STARTUP_PROFILE=1, or from the CLI with app.py --profile-startup, which also
+covers the framework imports made before create_app() runs.
+"""
+
+import importlib.abc
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class _TimedLoader:
+    """Loader proxy that times exec_module of the wrapped loader"""
+
+    def __init__(self, loader, name: str, profiler: 'ImportProfiler'):
+        self._loader = loader
+        self._name = name
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Point the module back at its real loader so importlib.resources,
+        # pkgutil and friends see the loader they expect
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        self._profiler._enter(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(self._name)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder that defers to the other finders and wraps their loaders"""
+
+    def __init__(self, profiler: 'ImportProfiler'):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimedLoader(spec.loader, fullname, self._profiler)
+            return spec
+        return None
+
+
+class ImportProfiler:
+    """
+    Records per-module import times while started.
+
+    Usage:
+        with ImportProfiler() as profiler:
+            from app import create_app
+            create_app()
+        print(profiler.format_report())
+    """
+
+    def __init__(self):
+        self._finder = _TimingFinder(self)
+        # (name, started_at, child time)
+        self._stack: List[Tuple[str, float, float]] = []
+        # name -> (inclusive seconds, self seconds)
+        self.modules: Dict[str, Tuple[float, float]] = {}
+        self.started_at: Optional[float] = None
+        self.elapsed = 0.0
+
+    def start(self) -> 'ImportProfiler':
+        if self._finder not in sys.meta_path:
+            sys.meta_path.insert(0, self._finder)
+            self.started_at = time.perf_counter()
+        return self
+
+    def stop(self) -> 'ImportProfiler':
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+            self.elapsed += time.perf_counter() - self.started_at
+        return self
+
+    def __enter__(self) -> 'ImportProfiler':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _enter(self, name: str):
+        self._stack.append((name, time.perf_counter(), 0.0))
+
+    def _exit(self, name: str):
+        _, started_at, child_time = self._stack.pop()
+        inclusive = time.perf_counter() - started_at
+        self.modules[name] = (inclusive, inclusive - child_time)
+        if self._stack:
+            parent, parent_started_at, parent_child_time = self._stack[-1]
+            self._stack[-1] = (parent, parent_started_at, parent_child_time + inclusive)
+
+    def top(self, limit: int = 25, by: str = 'self') -> List[Tuple[str, float, float]]:
+        """(module, inclusive seconds, self seconds) of the slowest modules"""
+        index = 1 if by == 'self' else 0
+        ranked = sorted(self.modules.items(), key=lambda item: item[1][index], reverse=True)
+        return [(name, inclusive, own) for name, (inclusive, own) in ranked[:limit]]
+
+    def package_totals(self, depth: int = 2) -> List[Tuple[str, float]]:
+        """Self time summed per package prefix (e.g. app.presentation), slowest first"""
+        totals: Dict[str, float] = {}
+        for name, (_, own) in self.modules.items():
+            package = '.'.join(name.split('.')[:depth])
+            totals[package] = totals.get(package, 0.0) + own
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+    def format_report(self, limit: int = 25) -> str:
+        """Plain-text report: totals, slowest packages and slowest modules"""
+        lines = [f"Startup imports: {len(self.modules)} modules, {self.elapsed:.3f}s"]
+        lines.append("Slowest packages (self time):")
+        for package, own in self.package_totals()[:limit]:
+            lines.append(f"  {own * 1000:9.1f} ms  {package}")
+        lines.append("Slowest modules (inclusive / self):")
+        for name, inclusive, own in self.top(limit, by='inclusive'):
+            lines.append(f"  {inclusive * 1000:9.1f} ms  {own * 1000:9.1f} ms  {name}")
+        return '\n'.join(lines)
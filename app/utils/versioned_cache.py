@@ -0,0 +1,128 @@
+"""
+Versioned Cache
+Process-level LRU whose entries are tagged with the versions of the data they
+were built from.
+
+A cache has named namespaces (a table, a typeahead kind, ...). Each entry
+records the versions of the namespaces it depends on; bump() moves those
+versions (usually from a flush hook, see app.utils.flush_hooks), which makes
+the dependent entries stale. Entries also expire after ttl_seconds, which is
+how writes made by other worker processes show up.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Sequence, Tuple
+
+
+class VersionedCache:
+    """
+    Thread-safe versioned TTL LRU.
+
+    Usage:
+        versions = cache.versions(namespaces)
+        value = cache.get(key)
+        if value is None:
+            value = load()
+            cache.put(key, value, namespaces, versions)
+
+    Taking the versions before loading means a flush during the load leaves
+    the new entry stale instead of caching data that is already outdated.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # key -> (namespaces, versions, stored_at, value)
+        self._entries: 'OrderedDict[Hashable, Tuple[Tuple[str, ...], Tuple[int, ...], float, Any]]' = OrderedDict()
+        self._versions: Dict[str, int] = {}
+
+    def versions(self, namespaces: Iterable[str]) -> Tuple[int, ...]:
+        """Current versions of the given namespaces"""
+        return tuple(self._versions.get(namespace, 0) for namespace in namespaces)
+
+    def lookup(self, key: Hashable) -> Optional[Tuple[Any, bool]]:
+        """
+        (value, current) for a key, or None when missing or expired.
+        current is False when one of the entry's namespaces moved since it was
+        stored; the entry is kept so callers can serve it as an estimate.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            namespaces, versions, stored_at, value = entry
+            if now - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value, versions == self.versions(namespaces)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Value for a key if cached and current (stale entries are dropped)"""
+        found = self.lookup(key)
+        if found is None:
+            return None
+        value, current = found
+        if not current:
+            self.discard(key)
+            return None
+        return value
+
+    def longest_prefix(
+        self,
+        scope: Hashable,
+        text: str,
+        usable: Callable[[Any], bool] = lambda value: True
+    ) -> Optional[Tuple[str, Any]]:
+        """
+        (prefix, value) of the longest cached, current prefix of text, for
+        caches keyed by (scope, prefix). Shorter prefixes are tried while
+        usable(value) is False for the longer ones (e.g. truncated match lists).
+        """
+        for length in range(len(text), -1, -1):
+            value = self.get((scope, text[:length]))
+            if value is not None and (length == len(text) or usable(value)):
+                return text[:length], value
+        return None
+
+    def put(self, key: Hashable, value: Any, namespaces: Sequence[str], versions: Optional[Tuple[int, ...]] = None):
+        """
+        Store a value built from the given namespaces.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            namespaces: Namespaces the value depends on
+            versions: Namespace versions taken before the value was built (default: current)
+        """
+        namespaces = tuple(namespaces)
+        with self._lock:
+            for namespace in namespaces:
+                self._versions.setdefault(namespace, 0)
+            if versions is None:
+                versions = self.versions(namespaces)
+            self._entries[key] = (namespaces, tuple(versions), time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def bump(self, *namespaces: str):
+        """Make entries depending on the given namespaces stale (clear() drops everything)"""
+        with self._lock:
+            for namespace in namespaces:
+                self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+    def clear(self):
+        """Drop every entry (bumping every namespace, so values being built now are not kept)"""
+        with self._lock:
+            for namespace in list(self._versions):
+                self._versions[namespace] += 1
+            self._entries.clear()